@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name
+"""Add an index on the `_aiida_hash` extra of the `DbNode` table, used to look up cached nodes."""
+from django.db import migrations
+
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.50'
+DOWN_REVISION = '1.0.49'
+
+
+class Migration(migrations.Migration):
+    """Add an index on the `_aiida_hash` extra of the `DbNode` table, used to look up cached nodes."""
+
+    dependencies = [
+        ('db', '0049_entry_point_core_prefix'),
+    ]
+
+    operations = [
+        # We use the RunSQL command because the Django interface does not support expression indexes
+        migrations.RunSQL(
+            sql="CREATE INDEX ix_db_dbnode_extras_aiida_hash ON db_dbnode ((extras #>> '{_aiida_hash}'::text[]));",
+            reverse_sql='DROP INDEX IF EXISTS ix_db_dbnode_extras_aiida_hash;'
+        ),
+        upgrade_schema_version(REVISION, DOWN_REVISION),
+    ]
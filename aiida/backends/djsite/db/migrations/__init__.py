@@ -25,7 +25,7 @@ class DeserializationException(AiidaException):
     pass
 
 
-LATEST_MIGRATION = '0049_entry_point_core_prefix'
+LATEST_MIGRATION = '0050_dbnode_aiida_hash_index'
 
 
 def _update_schema_version(version, apps, _):
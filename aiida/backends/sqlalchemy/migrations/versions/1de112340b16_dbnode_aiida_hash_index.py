@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add an index on the `_aiida_hash` extra of the `DbNode` table, used to look up cached nodes.
+
+This migration corresponds to the 0050_dbnode_aiida_hash_index Django migration.
+
+Revision ID: 1de112340b16
+Revises: 34a831f4286d
+Create Date: 2021-09-14 10:12:31.612504
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+from alembic import op
+from sqlalchemy.sql import text
+
+# revision identifiers, used by Alembic.
+revision = '1de112340b16'
+down_revision = '34a831f4286d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index(
+        'ix_db_dbnode_extras_aiida_hash', 'db_dbnode', [text("(extras #>> '{_aiida_hash}'::text[])")], unique=False
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_extras_aiida_hash', table_name='db_dbnode')
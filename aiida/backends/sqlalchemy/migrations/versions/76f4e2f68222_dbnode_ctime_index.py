@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add an index on the `ctime` column of the `DbNode` table, used to order and paginate nodes by creation time.
+
+The Django backend already defines this index since its 0005_add_cmtime_indices migration.
+
+Revision ID: 76f4e2f68222
+Revises: 1de112340b16
+Create Date: 2021-10-05 15:21:09.824571
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '76f4e2f68222'
+down_revision = '1de112340b16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index('ix_db_dbnode_ctime', 'db_dbnode', ['ctime'], unique=False)
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_ctime', table_name='db_dbnode')
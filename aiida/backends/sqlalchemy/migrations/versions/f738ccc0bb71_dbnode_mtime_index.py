@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add an index on the `mtime` column of the `DbNode` table, used to look up the most recently modified node.
+
+The Django backend already defines this index since its 0005_add_cmtime_indices migration.
+
+Revision ID: f738ccc0bb71
+Revises: 76f4e2f68222
+Create Date: 2021-10-12 09:42:17.315246
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f738ccc0bb71'
+down_revision = '76f4e2f68222'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index('ix_db_dbnode_mtime', 'db_dbnode', ['mtime'], unique=False)
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_mtime', table_name='db_dbnode')
@@ -16,7 +16,8 @@ from sqlalchemy import ForeignKey
 # Or maybe rely on sqlalchemy-utils UUID type
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import backref, relationship
-from sqlalchemy.schema import Column
+from sqlalchemy.schema import Column, Index
+from sqlalchemy.sql import text
 from sqlalchemy.types import DateTime, Integer, String, Text
 
 from aiida.backends.sqlalchemy.models.base import Base
@@ -37,12 +38,15 @@ class DbNode(Base):
         String(255), index=True, nullable=True, default=''
     )  # Does it make sense to be nullable and have a default?
     description = Column(Text(), nullable=True, default='')
-    ctime = Column(DateTime(timezone=True), default=timezone.now)
-    mtime = Column(DateTime(timezone=True), default=timezone.now, onupdate=timezone.now)
+    ctime = Column(DateTime(timezone=True), default=timezone.now, index=True)
+    mtime = Column(DateTime(timezone=True), default=timezone.now, onupdate=timezone.now, index=True)
     attributes = Column(JSONB)
     extras = Column(JSONB)
     repository_metadata = Column(JSONB, nullable=False, default=dict, server_default='{}')
 
+    # Expression index on the hash that is stored in the extras, used to look up identical nodes for caching
+    __table_args__ = (Index('ix_db_dbnode_extras_aiida_hash', text("(extras #>> '{_aiida_hash}'::text[])")),)
+
     dbcomputer_id = Column(
         Integer,
         ForeignKey('db_dbcomputer.id', deferrable=True, initially='DEFERRED', ondelete='RESTRICT'),
@@ -54,7 +54,7 @@ class DbSetting(Base):
         setting.time = timezone.datetime.now(tz=UTC)
         if 'description' in other_attribs.keys():
             setting.description = other_attribs['description']
-        setting.save()
+        setting.save(commit=not sa.get_scoped_session().in_nested_transaction())
 
     def getvalue(self):
         """This can be called on a given row and will get the corresponding value."""
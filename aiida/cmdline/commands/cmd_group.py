@@ -23,44 +23,81 @@ def verdi_group():
     """Create, inspect and manage groups of nodes."""
 
 
+FROM_QUERY = click.option(
+    '--from-query',
+    'query',
+    type=click.File('r'),
+    help='JSON file with the dictionary representation of a `QueryBuilder`, as returned by its `as_dict` method, that '
+    'projects the nodes or their ids. The nodes are selected by the database without being loaded, which is much '
+    'faster for large numbers of nodes. Pass `-` to read the query from stdin.'
+)
+
+
+def load_query(handle):
+    """Load a `QueryBuilder` from its JSON dictionary representation read from the given file handle."""
+    from aiida.common import json
+    from aiida.orm import QueryBuilder
+
+    try:
+        return QueryBuilder.from_dict(json.load(handle))
+    except (TypeError, ValueError) as exception:
+        echo.echo_critical(f'invalid query: {exception}')
+
+
 @verdi_group.command('add-nodes')
 @options.GROUP(required=True)
 @options.FORCE()
+@FROM_QUERY
 @arguments.NODES()
 @with_dbenv()
-def group_add_nodes(group, force, nodes):
+def group_add_nodes(group, force, query, nodes):
     """Add nodes to a group."""
+    if query is not None:
+        query = load_query(query)
+
     if not force:
-        click.confirm(f'Do you really want to add {len(nodes)} nodes to {group}?', abort=True)
+        num_nodes = len(nodes) + (query.count() if query is not None else 0)
+        click.confirm(f'Do you really want to add {num_nodes} nodes to {group}?', abort=True)
+
+    if nodes:
+        group.add_nodes(nodes)
 
-    group.add_nodes(nodes)
+    if query is not None:
+        try:
+            group.add_nodes(query)
+        except ValueError as exception:
+            echo.echo_critical(str(exception))
 
 
 @verdi_group.command('remove-nodes')
 @options.GROUP(required=True)
 @arguments.NODES()
 @options.GROUP_CLEAR()
+@FROM_QUERY
 @options.FORCE()
 @with_dbenv()
-def group_remove_nodes(group, nodes, clear, force):
+def group_remove_nodes(group, nodes, clear, query, force):
     """Remove nodes from a group."""
     from aiida.orm import Group, Node, QueryBuilder
 
-    if nodes and clear:
+    if (nodes or query is not None) and clear:
         echo.echo_critical(
             'Specify either the `--clear` flag to remove all nodes or the identifiers of the nodes you want to remove.'
         )
 
+    if query is not None:
+        query = load_query(query)
+
     if not force:
 
         if nodes:
             node_pks = [node.pk for node in nodes]
 
-            query = QueryBuilder()
-            query.append(Group, filters={'id': group.pk}, tag='group')
-            query.append(Node, with_group='group', filters={'id': {'in': node_pks}}, project='id')
+            builder = QueryBuilder()
+            builder.append(Group, filters={'id': group.pk}, tag='group')
+            builder.append(Node, with_group='group', filters={'id': {'in': node_pks}}, project='id')
 
-            group_node_pks = query.all(flat=True)
+            group_node_pks = builder.all(flat=True)
 
             if not group_node_pks:
                 echo.echo_critical(f'None of the specified nodes are in {group}.')
@@ -71,6 +108,8 @@ def group_remove_nodes(group, nodes, clear, force):
 
             message = f'Are you sure you want to remove {len(group_node_pks)} nodes from {group}?'
 
+        elif query is not None:
+            message = f'Are you sure you want to remove the nodes selected by the query from {group}?'
         elif clear:
             message = f'Are you sure you want to remove ALL the nodes from {group}?'
         else:
@@ -81,7 +120,14 @@ def group_remove_nodes(group, nodes, clear, force):
     if clear:
         group.clear()
     else:
-        group.remove_nodes(nodes)
+        if nodes:
+            group.remove_nodes(nodes)
+
+        if query is not None:
+            try:
+                group.remove_nodes(query)
+            except ValueError as exception:
+                echo.echo_critical(str(exception))
 
 
 @verdi_group.command('delete')
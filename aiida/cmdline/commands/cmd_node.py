@@ -322,14 +322,39 @@ def node_delete(identifier, dry_run, force, **traversal_rules):
     default=None,
     help='Only include nodes that are class or sub class of the class identified by this entry point.'
 )
+@click.option(
+    '-n',
+    '--num-processes',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='The number of worker processes that compute the hashes in parallel.'
+)
+@click.option(
+    '-b',
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help='The number of nodes that are rehashed and written to the database at once.'
+)
+@click.option(
+    '--checkpoint',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='File in which the progress is recorded. If the file exists, the command resumes from where it was '
+    'interrupted. The file is removed once all nodes have been rehashed.'
+)
 @options.FORCE()
 @with_dbenv()
-def rehash(nodes, entry_point, force):
+def rehash(nodes, entry_point, num_processes, batch_size, checkpoint, force):
     """Recompute the hash for nodes in the database.
 
     The set of nodes that will be rehashed can be filtered by their identifier and/or based on their class.
     """
-    from aiida.orm import Data, ProcessNode, QueryBuilder
+    from aiida.common.progress_reporter import set_progress_bar_tqdm
+    from aiida.orm import Data, ProcessNode
+    from aiida.tools import rehash_nodes
 
     if not force:
         echo.echo_warning('This command will recompute and overwrite the hashes of all nodes.')
@@ -349,21 +374,22 @@ def rehash(nodes, entry_point, force):
     if entry_point is None:
         entry_point = (Data, ProcessNode)
 
+    pks = None
+
     if nodes:
-        to_hash = [(node,) for node in nodes if isinstance(node, entry_point)]
-        num_nodes = len(to_hash)
-    else:
-        builder = QueryBuilder()
-        builder.append(entry_point, tag='node')
-        to_hash = builder.all()
-        num_nodes = builder.count()
+        pks = [node.pk for node in nodes if isinstance(node, entry_point)]
 
-    if not to_hash:
-        echo.echo_critical('no matching nodes found')
+        if not pks:
+            echo.echo_critical('no matching nodes found')
+
+    set_progress_bar_tqdm()
 
-    with click.progressbar(to_hash, label='Rehashing Nodes:') as iter_hash:
-        for node, in iter_hash:
-            node.rehash()
+    num_nodes = rehash_nodes(
+        entry_point, pks, num_processes=num_processes, batch_size=batch_size, checkpoint=checkpoint
+    )
+
+    if not num_nodes:
+        echo.echo_critical('no matching nodes found')
 
     echo.echo_success(f'{num_nodes} nodes re-hashed.')
 
@@ -54,6 +54,7 @@ __all__ = (
     'InternalError',
     'InvalidEntryPointTypeError',
     'InvalidOperation',
+    'LazyAttributeDict',
     'LicensingException',
     'LinkType',
     'LoadingEntryPointError',
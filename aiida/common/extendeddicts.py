@@ -12,7 +12,7 @@ from collections.abc import Mapping
 
 from . import exceptions
 
-__all__ = ('AttributeDict', 'FixedFieldsAttributeDict', 'DefaultFieldsAttributeDict')
+__all__ = ('AttributeDict', 'FixedFieldsAttributeDict', 'DefaultFieldsAttributeDict', 'LazyAttributeDict')
 
 
 class AttributeDict(dict):  # pylint: disable=too-many-instance-attributes
@@ -255,3 +255,127 @@ class DefaultFieldsAttributeDict(AttributeDict):
         Return the extra keys defined in the instance.
         """
         return [_ for _ in self.keys() if _ not in self._default_fields]
+
+
+class _Unloaded:
+    """Placeholder for the value of a `LazyAttributeDict` that has not yet been loaded."""
+
+    __slots__ = ('serialized',)
+
+    def __init__(self, serialized):
+        self.serialized = serialized
+
+
+class LazyAttributeDict(AttributeDict):
+    """
+    An `AttributeDict` whose values are only loaded from their serialized representation when they are accessed.
+
+    Accessing a single key, through `[]`, `get`, `pop`, `setdefault` or as an attribute, only loads the value of that
+    key. Any other operation that accesses the values, such as `items`, `values` or comparisons, loads all values.
+    """
+
+    def __init__(self, serialized, loader):
+        """Construct the dictionary from serialized values.
+
+        :param serialized: a mapping of keys onto the serialized representation of their values
+        :param loader: a callable that takes a list of serialized representations and returns the list of values
+        """
+        super().__init__()
+        object.__setattr__(self, '_loader', loader)
+        for key, value in serialized.items():
+            dict.__setitem__(self, key, _Unloaded(value))
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, _Unloaded):
+            value = self._loader([value.serialized])[0]
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __iter__(self):
+        # Overriding this method forces `dict(self)` and `dict.update(self)` to retrieve the values through
+        # `__getitem__` instead of copying the placeholders of unloaded values.
+        return super().__iter__()
+
+    def __eq__(self, other):
+        self.load()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self.load()
+        return super().__ne__(other)
+
+    def __or__(self, other):
+        self.load()
+        return super().__or__(other)
+
+    def __repr__(self):
+        self.load()
+        return super().__repr__()
+
+    def __deepcopy__(self, memo=None):
+        """Deep copy, which is a plain `AttributeDict`."""
+        from copy import deepcopy
+
+        self.load()
+        return AttributeDict(deepcopy(dict(self), memo))
+
+    def __reduce__(self):
+        self.load()
+        return AttributeDict, (dict(self),)
+
+    __hash__ = None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *args)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def popitem(self):
+        self.load()
+        return super().popitem()
+
+    def items(self):
+        self.load()
+        return super().items()
+
+    def values(self):
+        self.load()
+        return super().values()
+
+    def copy(self):
+        self.load()
+        return super().copy()
+
+    def get_serialized(self, key):
+        """Return the serialized representation of the value of the given key, if it has not yet been loaded.
+
+        :param key: the key
+        :return: the serialized representation or `None` if the value has already been loaded
+        :raises KeyError: if the key does not exist
+        """
+        value = super().__getitem__(key)
+        return value.serialized if isinstance(value, _Unloaded) else None
+
+    def load(self):
+        """Load all values that have not yet been loaded at once."""
+        unloaded = [(key, value) for key, value in super().items() if isinstance(value, _Unloaded)]
+
+        if unloaded:
+            values = self._loader([value.serialized for _, value in unloaded])
+            for (key, _), value in zip(unloaded, values):
+                dict.__setitem__(self, key, value)
@@ -147,16 +147,33 @@ def make_hash(object_to_hash, **kwargs):
 
 
 @singledispatch
-def _make_hash(object_to_hash, **_):
+def _make_hash(object_to_hash, **kwargs):
     """
     Implementation of the ``make_hash`` function. The hash is created as a
     28 byte integer, and only later converted to a string.
     """
+    # NumPy arrays and scalars are hashed as their equivalent (nested) lists and Python scalars. The check is done on the
+    # module name of the type, such that ``numpy`` does not have to be imported just to be able to register the type.
+    if type(object_to_hash).__module__ == 'numpy' and hasattr(object_to_hash, 'tolist'):
+        return _make_hash(object_to_hash.tolist(), **kwargs)
+
     raise HashingError(f'Value of type {type(object_to_hash)} cannot be hashed')
 
 
+# Cache of hash objects with the personalization for each object type, which are copied to compute the single digests,
+# since that is a lot faster than initialising a new hash object with the same parameters every time.
+_DIGEST_PROTOTYPES: typing.Dict[str, typing.Any] = {}
+
+
 def _single_digest(obj_type, obj_bytes=b''):
-    return hashlib.blake2b(obj_bytes, person=obj_type.encode('ascii'), node_depth=0, **BLAKE2B_OPTIONS).digest()
+    try:
+        hasher = _DIGEST_PROTOTYPES[obj_type].copy()
+    except KeyError:
+        prototype = hashlib.blake2b(person=obj_type.encode('ascii'), node_depth=0, **BLAKE2B_OPTIONS)
+        hasher = _DIGEST_PROTOTYPES.setdefault(obj_type, prototype).copy()
+
+    hasher.update(obj_bytes)
+    return hasher.digest()
 
 
 _END_DIGEST = _single_digest(')')
@@ -174,11 +191,34 @@ def _(val, **kwargs):
     return [_single_digest('str', val.encode('utf-8'))]
 
 
+def _make_hash_homogeneous_sequence(sequence_obj):
+    """Return the digests of the elements of a sequence if they are all of the same basic type, or ``None`` otherwise.
+
+    This is a fast path for long lists of numbers or strings, which skips the dispatching of ``_make_hash`` for every
+    single element, but returns exactly the same digests.
+    """
+    if not sequence_obj:
+        return None
+
+    item_type = type(sequence_obj[0])
+
+    if item_type not in (str, int, float, bool) or any(type(item) is not item_type for item in sequence_obj):  # pylint: disable=unidiomatic-typecheck
+        return None
+
+    make_item_hash = _make_hash.dispatch(item_type)
+
+    return list(chain.from_iterable(make_item_hash(item) for item in sequence_obj))
+
+
 @_make_hash.register(abc.Sequence)
 def _(sequence_obj, **kwargs):
     # unpack the list and use the elements
-    return [_single_digest('list(')] + list(chain.from_iterable(_make_hash(i, **kwargs) for i in sequence_obj)
-                                            ) + [_END_DIGEST]
+    digests = _make_hash_homogeneous_sequence(sequence_obj)
+
+    if digests is None:
+        digests = list(chain.from_iterable(_make_hash(i, **kwargs) for i in sequence_obj))
+
+    return [_single_digest('list(')] + digests + [_END_DIGEST]
 
 
 @_make_hash.register(abc.Set)
@@ -341,5 +381,4 @@ def float_to_text(value, sig):
     """
     if value == 0:
         value = 0.  # Identify value of -0. and overwrite with 0.
-    fmt = f'{{:.{sig}g}}'
-    return fmt.format(value)
+    return format(value, f'.{sig}g')
@@ -207,6 +207,8 @@ def configure_logging(with_orm=False, daemon=False, daemon_log_file=None):
         config['handlers'][handler_dblogger] = {
             'level': get_config_option('logging.db_loglevel'),
             'class': 'aiida.orm.utils.log.DBLogHandler',
+            'capacity': get_config_option('logging.db_log_buffer_size'),
+            'rate_limit': get_config_option('logging.db_log_rate_limit'),
         }
         config['loggers']['aiida']['handlers'].append(handler_dblogger)
 
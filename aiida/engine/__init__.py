@@ -32,6 +32,7 @@ __all__ = (
     'CalcJobImporter',
     'CalcJobOutputPort',
     'CalcJobProcessSpec',
+    'CheckpointCodec',
     'DaemonClient',
     'ExitCode',
     'ExitCodesNamespace',
@@ -53,6 +54,7 @@ __all__ = (
     'ProcessSpec',
     'ProcessState',
     'Runner',
+    'SharedJobsCache',
     'ToContext',
     'WithNonDb',
     'WithSerialize',
@@ -61,16 +63,19 @@ __all__ = (
     'assign_',
     'calcfunction',
     'construct_awaitable',
+    'get_checkpoint_codec',
     'get_object_loader',
     'if_',
     'interruptable_task',
     'is_process_function',
+    'map_process_function',
     'process_handler',
     'return_',
     'run',
     'run_get_node',
     'run_get_pk',
     'submit',
+    'submit_many',
     'while_',
     'workfunction',
 )
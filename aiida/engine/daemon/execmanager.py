@@ -14,19 +14,27 @@ the routines make reference to the suitable plugins for all
 plugin-specific operations.
 """
 from collections.abc import Mapping
+import hashlib
 from logging import LoggerAdapter
 import os
 import pathlib
+import re
 import shutil
+import tarfile
 from tempfile import NamedTemporaryFile
-from typing import Any, List
+import time
+from typing import Any, Dict, List
 from typing import Mapping as MappingType
 from typing import Optional, Tuple, Union
+import weakref
 
 from aiida.common import AIIDA_LOGGER, exceptions
 from aiida.common.datastructures import CalcInfo
+from aiida.common.escaping import escape_for_bash
 from aiida.common.folders import SandboxFolder
+from aiida.common.hashing import chunked_file_hash
 from aiida.common.links import LinkType
+from aiida.manage.configuration import get_config_option
 from aiida.orm import CalcJobNode, Code, FolderData, Node, RemoteData, load_node
 from aiida.orm.utils.log import get_dblogger_extra
 from aiida.repository.common import FileType
@@ -37,6 +45,25 @@ REMOTE_WORK_DIRECTORY_LOST_FOUND = 'lost+found'
 
 EXEC_LOGGER = AIIDA_LOGGER.getChild('execmanager')
 
+RETRIEVE_ARCHIVE_OPTION = 'transport.retrieve_archive'
+UPLOAD_CONCURRENCY_OPTION = 'transport.upload_concurrency'
+
+# Files of at least this size are copied on the remote, if a file with the same content was uploaded before, instead of
+# being uploaded again
+UPLOAD_DEDUPLICATION_MINIMUM_SIZE = 1024 * 1024
+
+# Name of the archive that is created in the remote working directory to retrieve the files of a calculation at once
+_RETRIEVE_ARCHIVE_NAME = '.aiida_retrieve.tar.gz'
+
+# Wildcards and bracket expressions of glob patterns that are left unquoted when passing the pattern to the shell
+_GLOB_TOKEN_REGEX = re.compile(r'(\*|\?|\[[^\]/]*\])')
+_GLOB_BRACKET_REGEX = re.compile(r'\[[!^]?[\w.\-]+\]')
+
+# Mapping of open transports onto the files of at least ``UPLOAD_DEDUPLICATION_MINIMUM_SIZE`` uploaded with them, from the
+# sha256 checksum of the content of the file onto its absolute remote path and its size and modification time after the
+# upload. This is used to deduplicate the files uploaded for calculations that share the same transport.
+_UPLOADED_FILES: 'weakref.WeakKeyDictionary[Transport, Dict[str, Tuple[str, int, int]]]' = weakref.WeakKeyDictionary()
+
 
 def _find_data_node(inputs: MappingType[str, Any], uuid: str) -> Optional[Node]:
     """Find and return the node with the given UUID from a nested mapping of input nodes.
@@ -226,9 +253,7 @@ def upload_calculation(
 
     # In a dry_run, the working directory is the raw input folder, which will already contain these resources
     if not dry_run:
-        for filename in folder.get_content_list():
-            logger.debug(f'[submission of calculation {node.pk}] copying file/folder {filename}...')
-            transport.put(folder.get_abs_path(filename), filename)
+        _upload_folder(node, transport, folder, logger)
 
         for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_copy_list:
             if remote_computer_uuid == computer.uuid:
@@ -336,6 +361,94 @@ def upload_calculation(
         remotedata.store()
 
 
+def _upload_folder(node: CalcJobNode, transport: Transport, folder: SandboxFolder, logger: LoggerAdapter) -> None:
+    """Upload the contents of the sandbox folder to the current working directory of the transport.
+
+    The files are transferred with ``Transport.putfiles``, with the concurrency set by the ``transport.upload_concurrency``
+    option. Files of at least ``UPLOAD_DEDUPLICATION_MINIMUM_SIZE`` bytes, whose content was already uploaded for another
+    calculation with the same open transport, are copied from the working directory of that calculation instead, as long
+    as the size and modification time of that copy did not change since it was uploaded.
+
+    :param node: the `CalcJobNode` whose inputs are uploaded.
+    :param transport: an already opened transport, whose working directory is the working directory of the calculation.
+    :param folder: the sandbox folder containing the inputs of the calculation.
+    :param logger: logger to report the amount of data transferred and the upload rate to.
+    """
+    uploaded = _UPLOADED_FILES.setdefault(transport, {})
+    files = []
+    deduplicated = []
+    bytes_uploaded = 0
+    bytes_copied = 0
+    start = time.time()
+
+    for dirpath, dirnames, filenames in os.walk(folder.abspath):
+        relpath = os.path.relpath(dirpath, folder.abspath)
+
+        for dirname in dirnames:
+            transport.mkdir(os.path.normpath(os.path.join(relpath, dirname)), ignore_existing=True)
+
+        for filename in filenames:
+            localpath = os.path.join(dirpath, filename)
+            remotepath = os.path.normpath(os.path.join(relpath, filename))
+            size = os.path.getsize(localpath)
+
+            if size < UPLOAD_DEDUPLICATION_MINIMUM_SIZE:
+                files.append((localpath, remotepath))
+                bytes_uploaded += size
+                continue
+
+            with open(localpath, 'rb') as handle:
+                checksum = chunked_file_hash(handle, hashlib.sha256)
+
+            if _copy_uploaded_file(transport, uploaded.get(checksum, None), remotepath):
+                bytes_copied += size
+            else:
+                files.append((localpath, remotepath))
+                deduplicated.append((checksum, remotepath))
+                bytes_uploaded += size
+
+    logger.debug(f'[submission of calculation {node.pk}] uploading {len(files)} files...')
+    transport.putfiles(files, concurrency=get_config_option(UPLOAD_CONCURRENCY_OPTION))
+
+    workdir = transport.getcwd()
+
+    for checksum, remotepath in deduplicated:
+        attributes = transport.get_attribute(remotepath)
+        uploaded[checksum] = (os.path.join(workdir, remotepath), attributes.st_size, attributes.st_mtime)
+
+    elapsed = time.time() - start
+    logger.info(
+        f'[submission of calculation {node.pk}] uploaded {bytes_uploaded} bytes in {elapsed:.3f} s '
+        f'({bytes_uploaded / elapsed if elapsed else 0:.0f} bytes/s) and copied {bytes_copied} bytes on the remote'
+    )
+
+
+def _copy_uploaded_file(transport: Transport, uploaded: Optional[Tuple[str, int, int]], remotepath: str) -> bool:
+    """Copy a previously uploaded file to the given remote path, if it did not change since it was uploaded.
+
+    :param transport: an already opened transport.
+    :param uploaded: tuple of the absolute remote path, size and modification time of the uploaded file, or ``None``.
+    :param remotepath: the remote path to copy the file to.
+    :return: whether the file was copied.
+    """
+    if uploaded is None:
+        return False
+
+    path, size, mtime = uploaded
+
+    try:
+        attributes = transport.get_attribute(path)
+
+        if attributes.st_size != size or attributes.st_mtime != mtime:
+            return False
+
+        transport.copyfile(path, remotepath)
+    except (IOError, OSError):
+        return False
+
+    return True
+
+
 def submit_calculation(calculation: CalcJobNode, transport: Transport) -> str:
     """Submit a previously uploaded `CalcJob` to the scheduler.
 
@@ -460,15 +573,19 @@ def retrieve_calculation(calculation: CalcJobNode, transport: Transport, retriev
         retrieve_list = calculation.get_retrieve_list()
         retrieve_temporary_list = calculation.get_retrieve_temporary_list()
 
+        archive = get_config_option(RETRIEVE_ARCHIVE_OPTION)
+
         with SandboxFolder() as folder:
-            retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list)
+            retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list, archive=archive)
             # Here I retrieved everything; now I store them inside the calculation
             retrieved_files.put_object_from_tree(folder.abspath)
 
         # Retrieve the temporary files in the retrieved_temporary_folder if any files were
         # specified in the 'retrieve_temporary_list' key
         if retrieve_temporary_list:
-            retrieve_files_from_list(calculation, transport, retrieved_temporary_folder, retrieve_temporary_list)
+            retrieve_files_from_list(
+                calculation, transport, retrieved_temporary_folder, retrieve_temporary_list, archive=archive
+            )
 
             # Log the files that were retrieved in the temporary folder
             for filename in os.listdir(retrieved_temporary_folder):
@@ -525,8 +642,11 @@ def kill_calculation(calculation: CalcJobNode, transport: Transport) -> None:
 
 
 def retrieve_files_from_list(
-    calculation: CalcJobNode, transport: Transport, folder: str, retrieve_list: List[Union[str, Tuple[str, str, int],
-                                                                                           list]]
+    calculation: CalcJobNode,
+    transport: Transport,
+    folder: str,
+    retrieve_list: List[Union[str, Tuple[str, str, int], list]],
+    archive: bool = False
 ) -> None:
     """
     Retrieve all the files in the retrieve_list from the remote into the
@@ -550,7 +670,13 @@ def retrieve_files_from_list(
     :param transport: the Transport instance.
     :param folder: an absolute path to a folder that contains the files to copy.
     :param retrieve_list: the list of files to retrieve.
+    :param archive: if True, first try to retrieve all files at once, as a single archive that is created on the remote
+        with ``tar``. If that is not possible, for example because ``tar`` is not available on the remote, the files are
+        retrieved one by one.
     """
+    if archive and _retrieve_files_as_archive(calculation, transport, folder, retrieve_list):
+        return
+
     for item in retrieve_list:
         if isinstance(item, (list, tuple)):
             tmp_rname, tmp_lname, depth = item
@@ -581,3 +707,95 @@ def retrieve_files_from_list(
         for rem, loc in zip(remote_names, local_names):
             transport.logger.debug(f"[retrieval of calc {calculation.pk}] Trying to retrieve remote item '{rem}'")
             transport.get(rem, os.path.join(folder, loc), ignore_nonexisting=True)
+
+
+def _retrieve_files_as_archive(
+    calculation: CalcJobNode, transport: Transport, folder: str, retrieve_list: List[Union[str, Tuple[str, str, int],
+                                                                                           list]]
+) -> bool:
+    """Retrieve all the files in the retrieve_list as a single archive that is created on the remote with ``tar``.
+
+    The archive is unpacked in a local sandbox folder, from which the files are copied into the folder following the
+    same rules as :func:`retrieve_files_from_list`. Entries with absolute paths, paths that go up in the hierarchy or
+    glob patterns that cannot be passed safely to the shell are not supported.
+
+    :return: True if the files were retrieved, False if the archive could not be created, in which case nothing is
+        retrieved.
+    """
+    patterns = []
+
+    for item in retrieve_list:
+        remote_path = item[0] if isinstance(item, (list, tuple)) else item
+        pattern = _escape_glob_for_bash(remote_path)
+
+        if pattern is None or os.path.isabs(remote_path) or '..' in pathlib.PurePosixPath(remote_path).parts:
+            return False
+
+        patterns.append(pattern)
+
+    if not patterns:
+        return True
+
+    # Glob patterns that do not match anything are dropped and missing files are ignored, such that only the files that
+    # exist are archived, equivalent to the `ignore_nonexisting` flag of `Transport.get`. A partial archive of a failed
+    # command is removed straight away, such that it does not require another round trip.
+    command = (
+        f'shopt -s nullglob; tar -chzf {_RETRIEVE_ARCHIVE_NAME} --ignore-failed-read -- {" ".join(patterns)}; '
+        f'retval=$?; [ $retval -eq 0 ] || rm -f {_RETRIEVE_ARCHIVE_NAME}; exit $retval'
+    )
+    retval, _, stderr = transport.exec_command_wait(command)
+
+    if retval != 0:
+        transport.logger.debug(
+            f'[retrieval of calc {calculation.pk}] Creating the retrieve archive failed with exit status {retval}, '
+            f'retrieving files one by one: {stderr}'
+        )
+        return False
+
+    from aiida.transports.plugins.local import LocalTransport
+
+    try:
+        with SandboxFolder() as sandbox:
+            local_archive = os.path.join(sandbox.abspath, _RETRIEVE_ARCHIVE_NAME)
+            extracted = os.path.join(sandbox.abspath, 'extracted')
+            transport.logger.debug(f'[retrieval of calc {calculation.pk}] Retrieving archive of the retrieve list')
+            transport.get(_RETRIEVE_ARCHIVE_NAME, local_archive)
+
+            with tarfile.open(local_archive, 'r:gz') as handle:
+                members = [member for member in handle.getmembers() if _is_safe_archive_member(member)]
+                handle.extractall(extracted, members=members)
+
+            os.makedirs(extracted, exist_ok=True)
+
+            with LocalTransport() as local_transport:
+                local_transport.chdir(extracted)
+                retrieve_files_from_list(calculation, local_transport, folder, retrieve_list)
+    finally:
+        transport.remove(_RETRIEVE_ARCHIVE_NAME)
+
+    return True
+
+
+def _escape_glob_for_bash(pattern: str) -> Optional[str]:
+    """Escape a path that may contain glob patterns such that bash expands the wildcards but nothing else.
+
+    :return: the escaped pattern or None if the pattern contains a bracket expression that cannot be passed safely.
+    """
+    escaped = []
+
+    for index, part in enumerate(_GLOB_TOKEN_REGEX.split(pattern)):
+        if index % 2 == 0:
+            if part:
+                escaped.append(escape_for_bash(part))
+        elif part.startswith('[') and _GLOB_BRACKET_REGEX.fullmatch(part) is None:
+            return None
+        else:
+            escaped.append(part)
+
+    return ''.join(escaped)
+
+
+def _is_safe_archive_member(member: tarfile.TarInfo) -> bool:
+    """Return whether the member of a retrieve archive is a file or directory that stays inside the extraction folder."""
+    path = pathlib.PurePosixPath(member.name)
+    return (member.isfile() or member.isdir()) and not path.is_absolute() and '..' not in path.parts
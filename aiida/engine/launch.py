@@ -8,7 +8,7 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Top level functions that can be used to launch a Process."""
-from typing import Any, Dict, Tuple, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from aiida.common import InvalidOperation
 from aiida.manage import manager
@@ -18,7 +18,7 @@ from .processes.functions import FunctionProcess
 from .processes.process import Process, ProcessBuilder
 from .utils import instantiate_process, is_process_scoped
 
-__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit')
+__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit', 'submit_many')
 
 TYPE_RUN_PROCESS = Union[Process, Type[Process], ProcessBuilder]  # pylint: disable=invalid-name
 # run can also be process function, but it is not clear what type this should be
@@ -120,6 +120,41 @@ def submit(process: TYPE_SUBMIT_PROCESS, **inputs: Any) -> ProcessNode:
     return process_inited.node
 
 
+def submit_many(
+    process: Union[Type[Process], ProcessBuilder],
+    inputs_iterable: Iterable[Dict[str, Any]],
+    batch_size: Optional[int] = None
+) -> List[ProcessNode]:
+    """Submit the process to the daemon once for each dictionary of inputs, immediately returning control.
+
+    This is equivalent to calling :func:`submit` for each dictionary of inputs, but considerably faster for large
+    numbers of processes: the processes are instantiated in batches, where the nodes, links and checkpoints of all
+    processes of a batch are stored in a single database transaction and their continue tasks are sent to RabbitMQ
+    concurrently. If instantiating one of the processes of a batch fails, none of the processes of that batch are
+    submitted, but those of the preceding batches have already been.
+
+    .. warning: this should not be used within another process. Instead, there one should use the `submit_many` method
+        of the wrapping process itself, i.e. use `self.submit_many`.
+
+    :param process: the process class or builder to submit
+    :param inputs_iterable: iterable of dictionaries with the inputs of each process, which are merged with the inputs
+        defined in the builder if one is passed
+    :param batch_size: maximum number of processes that are instantiated in a single database transaction, defaults
+        to :data:`aiida.engine.runners.SUBMIT_BATCH_SIZE`
+
+    :return: the calculation nodes of the processes, in the order of the inputs
+
+    """
+    if is_process_scoped() and not isinstance(Process.current(), FunctionProcess):
+        raise InvalidOperation(
+            'Cannot use top-level `submit_many` from within another process, use `self.submit_many` instead'
+        )
+
+    runner = manager.get_manager().get_runner()
+
+    return runner._submit_many(process, inputs_iterable, batch_size, rmq_submit=True)  # pylint: disable=protected-access
+
+
 # Allow one to also use run.get_node and run.get_pk as a shortcut, without having to import the functions themselves
 run.get_node = run_get_node  # type: ignore[attr-defined]
 run.get_pk = run_get_pk  # type: ignore[attr-defined]
@@ -10,21 +10,25 @@
 # pylint: disable=global-statement
 """Definition of AiiDA's process persister and the necessary object loaders."""
 
+import abc
 import importlib
 import logging
 import traceback
-from typing import TYPE_CHECKING, Any, Hashable, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, NamedTuple, Optional, Tuple, Type, Union
+import weakref
 
 from plumpy.exceptions import PersistenceError
 import plumpy.loaders
 import plumpy.persistence
 
+from aiida.common.extendeddicts import LazyAttributeDict
 from aiida.orm.utils import serialize
 
 if TYPE_CHECKING:
     from aiida.engine.processes.process import Process
+    from aiida.orm import ProcessNode
 
-__all__ = ('AiiDAPersister', 'ObjectLoader', 'get_object_loader')
+__all__ = ('AiiDAPersister', 'ObjectLoader', 'get_object_loader', 'CheckpointCodec', 'get_checkpoint_codec')
 
 LOGGER = logging.getLogger(__name__)
 OBJECT_LOADER = None
@@ -67,10 +71,162 @@ def get_object_loader() -> ObjectLoader:
     return OBJECT_LOADER
 
 
+class CheckpointCodec(abc.ABC):
+    """Codec that encodes the bundle of a process checkpoint into the string that is stored on its node and back.
+
+    The codec with which checkpoints are saved is selected by the ``runner.checkpoint_codec`` option. Checkpoints are
+    always loaded with the codec that can decode them, such that checkpoints that were saved with another codec, for
+    example before the option was changed, can still be loaded.
+    """
+
+    @abc.abstractmethod
+    def encode(self, bundle: plumpy.persistence.Bundle) -> str:
+        """Encode the checkpoint bundle into a string.
+
+        :param bundle: the checkpoint bundle
+        :return: the encoded checkpoint
+        """
+
+    @abc.abstractmethod
+    def decode(self, checkpoint: str) -> plumpy.persistence.Bundle:
+        """Decode the checkpoint bundle from the encoded string.
+
+        :param checkpoint: the encoded checkpoint
+        :return: the checkpoint bundle
+        """
+
+    @abc.abstractmethod
+    def can_decode(self, checkpoint: str) -> bool:
+        """Return whether the encoded checkpoint can be decoded by this codec.
+
+        :param checkpoint: the encoded checkpoint
+        """
+
+    def decode_many(self, checkpoints: List[str]) -> List[Any]:
+        """Decode multiple encoded objects at once.
+
+        :param checkpoints: the encoded objects
+        :return: the list of decoded objects
+        """
+        return [self.decode(checkpoint) for checkpoint in checkpoints]
+
+
+class YamlCheckpointCodec(CheckpointCodec):
+    """Codec that encodes checkpoints as a yaml dump."""
+
+    def encode(self, bundle: plumpy.persistence.Bundle) -> str:
+        return serialize.serialize(bundle)
+
+    def decode(self, checkpoint: str) -> plumpy.persistence.Bundle:
+        return serialize.deserialize_unsafe(checkpoint)
+
+    def can_decode(self, checkpoint: str) -> bool:
+        return not serialize.is_compact(checkpoint)
+
+
+class CompactCheckpointCodec(CheckpointCodec):
+    """Codec that encodes checkpoints in the compact representation of :mod:`aiida.orm.utils.serialize`.
+
+    If the bundle contains an object that is not supported by the compact representation, the checkpoint is encoded as
+    a yaml dump instead.
+    """
+
+    def encode(self, bundle: plumpy.persistence.Bundle) -> str:
+        try:
+            return serialize.serialize_compact(bundle)
+        except TypeError as exception:
+            LOGGER.debug('falling back onto yaml to encode the checkpoint: %s', exception)
+            return serialize.serialize(bundle)
+
+    def decode(self, checkpoint: str) -> plumpy.persistence.Bundle:
+        return serialize.deserialize_compact(checkpoint)
+
+    def can_decode(self, checkpoint: str) -> bool:
+        return serialize.is_compact(checkpoint)
+
+    def decode_many(self, checkpoints: List[str]) -> List[Any]:
+        """Decode multiple encoded objects at once, loading all nodes they reference with a single query."""
+        return serialize.deserialize_compact_many(checkpoints)
+
+
+CHECKPOINT_CODECS: Dict[str, Type[CheckpointCodec]] = {
+    'compact': CompactCheckpointCodec,
+    'yaml': YamlCheckpointCodec,
+}
+
+
+def get_checkpoint_codec(name: Optional[str] = None) -> CheckpointCodec:
+    """Return the checkpoint codec with the given name.
+
+    :param name: the name of the codec, defaults to the value of the ``runner.checkpoint_codec`` option
+    :return: instance of the checkpoint codec
+    :raises ValueError: if no codec with the given name exists
+    """
+    if name is None:
+        from aiida.manage.configuration import get_config_option
+        name = get_config_option('runner.checkpoint_codec')
+
+    try:
+        return CHECKPOINT_CODECS[name]()
+    except KeyError:
+        raise ValueError(f'unknown checkpoint codec `{name}`, choose from: {", ".join(CHECKPOINT_CODECS)}')
+
+
+# The encoded entry of a context value: a single encoded string, or a list of encoded strings for the items of a list
+ContextEntry = Union[str, List[str]]
+
+
+class ContextCheckpoint(NamedTuple):
+    """The encoded context of a work chain at the time it was last saved in full in a checkpoint.
+
+    Since the encoding of a node only depends on its UUID, the encoding of the nodes in the context is kept in
+    ``nodes``, keyed on their ``id``, such that they do not have to be encoded again with every checkpoint.
+    """
+
+    entries: Dict[str, ContextEntry]
+    count: int
+    nodes: Dict[int, Tuple[Any, str]]
+
+
 class AiiDAPersister(plumpy.persistence.Persister):
-    """Persister to take saved process instance states and persisting them to the database."""
+    """Persister to take saved process instance states and persisting them to the database.
 
-    def save_checkpoint(self, process: 'Process', tag: Optional[str] = None):  # type: ignore[override] # pylint: disable=no-self-use
+    The context of a ``WorkChain`` is saved incrementally: each top-level entry of the context is encoded separately and
+    only the entries that changed since the context was last saved in full are written with each checkpoint. If the
+    value of an entry is a list to which items were only appended, only the new items are written. After a number of
+    checkpoints that is set by the ``runner.checkpoint_compaction_interval`` option, the context is saved in full again.
+
+    When a work chain is loaded from its checkpoint, the entries of its context are only decoded when they are accessed.
+    """
+
+    def __init__(self, codec: Optional[CheckpointCodec] = None, compaction_interval: Optional[int] = None):
+        """Construct a new persister.
+
+        :param codec: the codec with which checkpoints are encoded, defaults to the one configured by the
+            ``runner.checkpoint_codec`` option
+        :param compaction_interval: the number of checkpoints of a work chain after which its context is saved in full,
+            defaults to the value of the ``runner.checkpoint_compaction_interval`` option
+        """
+        self._codec = codec
+        self._compaction_interval = compaction_interval
+        self._context_checkpoints: 'weakref.WeakKeyDictionary[Process, ContextCheckpoint]' = weakref.WeakKeyDictionary()
+
+    @property
+    def codec(self) -> CheckpointCodec:
+        """Return the codec with which checkpoints are encoded."""
+        if self._codec is None:
+            self._codec = get_checkpoint_codec()
+        return self._codec
+
+    @property
+    def compaction_interval(self) -> int:
+        """Return the number of checkpoints of a work chain after which its context is saved in full."""
+        if self._compaction_interval is None:
+            from aiida.manage.configuration import get_config_option
+            self._compaction_interval = get_config_option('runner.checkpoint_compaction_interval')
+        return self._compaction_interval
+
+    def save_checkpoint(self, process: 'Process', tag: Optional[str] = None):  # type: ignore[override]
         """Persist a Process instance.
 
         :param process: :class:`aiida.engine.Process`
@@ -89,13 +245,160 @@ class AiiDAPersister(plumpy.persistence.Persister):
             raise PersistenceError(f"Failed to create a bundle for '{process}': {traceback.format_exc()}")
 
         try:
-            process.node.set_checkpoint(serialize.serialize(bundle))
+            self._save_bundle(process, bundle)
         except Exception:
             raise PersistenceError(f"Failed to store a checkpoint for '{process}': {traceback.format_exc()}")
 
         return bundle
 
-    def load_checkpoint(self, pid: Hashable, tag: Optional[str] = None) -> plumpy.persistence.Bundle:  # pylint: disable=no-self-use
+    def _save_bundle(self, process: 'Process', bundle: plumpy.persistence.Bundle) -> None:
+        """Encode the checkpoint bundle of the process and store it on its node.
+
+        The context of a work chain is encoded separately and, unless it is compacted, only its changes are stored.
+
+        :param process: the process
+        :param bundle: the checkpoint bundle of the process
+        """
+        from aiida.engine.processes.workchains.workchain import WorkChain
+        key = WorkChain._CONTEXT  # pylint: disable=protected-access
+
+        if not isinstance(process, WorkChain) or not all(isinstance(name, str) for name in bundle[key]):
+            process.node.set_checkpoint(self.codec.encode(bundle))
+            return
+
+        previous = self._context_checkpoints.get(process, None)
+        nodes: Dict[int, Tuple[Any, str]] = {}
+        entries = self._encode_context(bundle[key], previous.nodes if previous else {}, nodes)
+        base = plumpy.persistence.Bundle.__new__(plumpy.persistence.Bundle)
+        base.update((name, value) for name, value in bundle.items() if name != key)
+        checkpoint = self.codec.encode(base)
+
+        if previous is None or previous.count >= self.compaction_interval:
+            process.node.set_checkpoint(checkpoint, context=entries, context_delta={})
+            self._context_checkpoints[process] = ContextCheckpoint(entries, 1, nodes)
+        else:
+            delta = self._get_context_delta(previous.entries, entries)
+            process.node.set_checkpoint(checkpoint, context_delta=delta)
+            self._context_checkpoints[process] = previous._replace(count=previous.count + 1, nodes=nodes)
+
+    def _encode_context(
+        self, context: Dict[str, Any], nodes_previous: Dict[int, Tuple[Any, str]], nodes: Dict[int, Tuple[Any, str]]
+    ) -> Dict[str, ContextEntry]:
+        """Encode each entry of the context of a work chain separately.
+
+        Entries of a lazily loaded context that have not been accessed are not decoded, but their encoding is reused.
+
+        :param context: the context
+        :param nodes_previous: the encoded nodes of the previous checkpoint, keyed on their ``id``
+        :param nodes: the encoded nodes of this checkpoint, which are added by this method
+        :return: the encoded entries
+        """
+        from aiida.orm import Node
+
+        def encode(value):
+            if not isinstance(value, Node):
+                return self.codec.encode(value)
+
+            node, encoded = nodes_previous.get(id(value), (None, None))
+
+            if node is not value:
+                encoded = self.codec.encode(value)
+
+            nodes[id(value)] = (value, encoded)
+
+            return encoded
+
+        entries: Dict[str, ContextEntry] = {}
+
+        for name in context.keys():
+            if isinstance(context, LazyAttributeDict):
+                entry = context.get_serialized(name)
+                if entry is not None:
+                    entries[name] = entry
+                    continue
+
+            value = context[name]
+
+            if type(value) is list:  # pylint: disable=unidiomatic-typecheck
+                entries[name] = [encode(item) for item in value]
+            else:
+                entries[name] = encode(value)
+
+        return entries
+
+    @staticmethod
+    def _get_context_delta(previous: Dict[str, ContextEntry], current: Dict[str, ContextEntry]) -> Dict[str, Any]:
+        """Return the changes of the encoded context entries with respect to the previous ones.
+
+        :param previous: the previous encoded context entries
+        :param current: the current encoded context entries
+        :return: mapping of the name of each changed entry onto its new encoded entry, ``None`` if it was removed, or a
+            dictionary ``{'extend': items}`` if the value is a list to which only the given encoded items were appended
+        """
+        delta: Dict[str, Any] = {name: None for name in previous if name not in current}
+
+        for name, entry in current.items():
+            entry_previous = previous.get(name, None)
+
+            if entry == entry_previous:
+                continue
+
+            if (
+                isinstance(entry, list) and isinstance(entry_previous, list) and
+                entry[:len(entry_previous)] == entry_previous
+            ):
+                delta[name] = {'extend': entry[len(entry_previous):]}
+            else:
+                delta[name] = entry
+
+        return delta
+
+    @staticmethod
+    def _apply_context_delta(entries: Dict[str, ContextEntry], delta: Dict[str, Any]) -> Dict[str, ContextEntry]:
+        """Apply the changes returned by ``_get_context_delta`` to the encoded context entries.
+
+        :param entries: the encoded context entries
+        :param delta: the changes to the entries
+        :return: the changed encoded context entries
+        """
+        entries = dict(entries)
+
+        for name, change in delta.items():
+            if change is None:
+                entries.pop(name, None)
+            elif isinstance(change, dict):
+                entries[name] = entries[name] + change['extend']
+            else:
+                entries[name] = change
+
+        return entries
+
+    def _decode_context_entries(self, entries: List[ContextEntry]) -> List[Any]:
+        """Decode the given encoded context entries at once.
+
+        :param entries: the encoded context entries
+        :return: the decoded values of the entries
+        """
+        encoded = [item for entry in entries for item in (entry if isinstance(entry, list) else [entry])]
+        decoded: List[Any] = [None] * len(encoded)
+        remaining = list(range(len(encoded)))
+
+        for codec in self._get_codecs():
+            indices = [index for index in remaining if codec.can_decode(encoded[index])]
+            remaining = [index for index in remaining if not codec.can_decode(encoded[index])]
+
+            for index, value in zip(indices, codec.decode_many([encoded[index] for index in indices])):
+                decoded[index] = value
+
+        items = iter(decoded)
+
+        return [[next(items) for _ in entry] if isinstance(entry, list) else next(items) for entry in entries]
+
+    def _get_codecs(self) -> List[CheckpointCodec]:
+        """Return the codec with which checkpoints are encoded, followed by all other available codecs."""
+        return [self.codec] + [codec() for codec in CHECKPOINT_CODECS.values() if not isinstance(self.codec, codec)]
+
+    def load_checkpoint(self, pid: Hashable, tag: Optional[str] = None) -> plumpy.persistence.Bundle:
         """Load a process from a persisted checkpoint by its process id.
 
         :param pid: the process id of the :class:`plumpy.Process`
@@ -121,12 +424,34 @@ class AiiDAPersister(plumpy.persistence.Persister):
             raise PersistenceError(f'Calculation<{calculation.pk}> does not have a saved checkpoint')
 
         try:
-            bundle = serialize.deserialize_unsafe(checkpoint)
+            codec = next(codec for codec in self._get_codecs() if codec.can_decode(checkpoint))
+            bundle = codec.decode(checkpoint)
+            self._load_context(calculation, bundle)
         except Exception:
             raise PersistenceError(f'Failed to load the checkpoint for process<{pid}>: {traceback.format_exc()}')
 
         return bundle
 
+    def _load_context(self, node: 'ProcessNode', bundle: plumpy.persistence.Bundle) -> None:
+        """Add the context of a work chain to the checkpoint bundle if it is stored separately.
+
+        The context is a ``LazyAttributeDict`` whose entries are only decoded when they are accessed.
+
+        :param node: the process node
+        :param bundle: the checkpoint bundle
+        """
+        from aiida.engine.processes.workchains.workchain import WorkChain
+        key = WorkChain._CONTEXT  # pylint: disable=protected-access
+
+        if key in bundle:
+            return
+
+        checkpoint_context = node.checkpoint_context
+
+        if checkpoint_context is not None:
+            entries = self._apply_context_delta(*checkpoint_context)
+            bundle[key] = LazyAttributeDict(entries, self._decode_context_entries)
+
     def get_checkpoints(self):
         """Return a list of all the current persisted process checkpoints
 
@@ -49,6 +49,7 @@ __all__ = (
     'ProcessHandlerReport',
     'ProcessSpec',
     'ProcessState',
+    'SharedJobsCache',
     'ToContext',
     'WithNonDb',
     'WithSerialize',
@@ -58,6 +59,7 @@ __all__ = (
     'calcfunction',
     'construct_awaitable',
     'if_',
+    'map_process_function',
     'process_handler',
     'return_',
     'while_',
@@ -23,6 +23,7 @@ __all__ = (
     'CalcJobImporter',
     'JobManager',
     'JobsList',
+    'SharedJobsCache',
 )
 
 # yapf: enable
@@ -12,17 +12,125 @@ import asyncio
 import contextlib
 import contextvars
 import logging
+import os
+import pathlib
+import tempfile
 import time
-from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
 
 from aiida.common import lang
 from aiida.orm import AuthInfo
 
 if TYPE_CHECKING:
     from aiida.engine.transports import TransportQueue
+    from aiida.schedulers import Scheduler
     from aiida.schedulers.datastructures import JobInfo
 
-__all__ = ('JobsList', 'JobManager')
+__all__ = ('JobsList', 'JobManager', 'SharedJobsCache')
+
+
+class SharedJobs(NamedTuple):
+    """The job infos read from a :py:class:`~aiida.engine.processes.calcjobs.manager.SharedJobsCache`."""
+
+    polled: float  #: the time, as produced by ``time.time()``, before which the scheduler was polled
+    queried: Optional[Set[str]]  #: the ids of the queried jobs, or ``None`` if all jobs of the user were queried
+    jobs: Dict[Hashable, 'JobInfo']  #: mapping of job ids to the job infos returned by the scheduler
+
+
+class SharedJobsCache:
+    """Cache of the job infos polled from the scheduler for a specific ``AuthInfo``, shared through the file system.
+
+    All runners of a profile on the same machine, e.g. the workers of its daemon, maintain their own ``JobsList`` and
+    would each poll the scheduler independently. Instead, the runner that polls the scheduler writes the response to
+    this cache, from which the other runners can read it, as long as it is recent enough. To make sure that only a single
+    runner polls the scheduler at a time, the runners first have to acquire the lease of the cache, which is implemented
+    with an exclusive ``flock`` on a lock file, such that it is automatically released if the runner dies.
+
+    For schedulers that cannot query all jobs of a user, the ids of the queried jobs are cached as well, since only for
+    those jobs the absence from the response means that they are no longer with the scheduler.
+    """
+
+    LEASE_RETRY_INTERVAL = 0.1
+
+    def __init__(self, authinfo: AuthInfo, dirpath: Union[str, pathlib.Path]):
+        """Construct an instance for the given authinfo.
+
+        :param authinfo: the authinfo whose job infos are cached
+        :param dirpath: the directory in which the cache and lock files are written
+        """
+        self._dirpath = pathlib.Path(dirpath)
+        self._filepath = self._dirpath / f'{authinfo.pk}.json'
+        self._lockpath = self._dirpath / f'{authinfo.pk}.lock'
+
+    def read(self) -> Optional[SharedJobs]:
+        """Read the job infos from the cache.
+
+        :return: the cached job infos, or ``None`` if the cache does not exist or cannot be read
+        """
+        from aiida.common import json
+        from aiida.schedulers.datastructures import JobInfo
+
+        try:
+            with self._filepath.open('rb') as handle:
+                content = json.load(handle)
+            jobs = {job_id: JobInfo.load_from_dict(job_info) for job_id, job_info in content['jobs'].items()}
+            queried = None if content['queried'] is None else set(content['queried'])
+            return SharedJobs(content['polled'], queried, jobs)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def write(self, shared_jobs: SharedJobs) -> None:
+        """Write the job infos to the cache, replacing its current content atomically.
+
+        :param shared_jobs: the job infos to write
+        """
+        from aiida.common import json
+
+        self._dirpath.mkdir(parents=True, exist_ok=True)
+        content = {
+            'polled': shared_jobs.polled,
+            'queried': None if shared_jobs.queried is None else sorted(shared_jobs.queried),
+            'jobs': {str(job_id): job_info.get_dict() for job_id, job_info in shared_jobs.jobs.items()},
+        }
+
+        with tempfile.NamedTemporaryFile('wb', dir=self._dirpath, delete=False) as handle:
+            json.dump(content, handle)
+
+        os.replace(handle.name, self._filepath)
+
+    @contextlib.asynccontextmanager
+    async def lease(self) -> AsyncIterator[None]:
+        """Acquire the lease to poll the scheduler, waiting for as long as it is held by another runner."""
+        import fcntl
+
+        self._dirpath.mkdir(parents=True, exist_ok=True)
+
+        with self._lockpath.open('a') as handle:
+            while True:
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    await asyncio.sleep(self.LEASE_RETRY_INTERVAL)
+                else:
+                    break
+
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
 
 
 class JobsList:
@@ -35,6 +143,22 @@ class JobsList:
     is configured, can define a minimum polling interval. This class will guarantee that the time between update calls
     to the scheduler is larger or equal to that minimum interval.
 
+    The polling interval is adaptive: a request for a job update is only resolved once the state of the job has changed
+    with respect to the job info that was last returned for it. As long as the state of none of the jobs changes, the
+    interval between updates is multiplied by ``UPDATE_INTERVAL_BACKOFF_FACTOR`` after each update, up to the maximum
+    polling interval of the computer. As soon as a job changes state, or the update of a new job is requested, the
+    interval is reset to the minimum. In addition, the next update is brought forward to when the first running job is
+    expected to reach its requested wallclock time, as long as the minimum interval is respected.
+
+    If the ``runner.share_job_status`` option is enabled, the response of the scheduler is shared with the ``JobsList``
+    instances of the same authinfo in other runners of the profile, e.g. other daemon workers, through a
+    :py:class:`~aiida.engine.processes.calcjobs.manager.SharedJobsCache`. An update first reads the shared cache, and
+    only polls the scheduler itself if the cache is older than the minimum polling interval or than the last request for
+    a new job, or if it does not contain all the jobs for which an update is requested. Once the transport is open, the
+    lease of the cache is acquired and the cache is read again, before polling the scheduler while holding the lease. For
+    schedulers that cannot query all jobs of a user, the poll includes the jobs of the previous response, such that the
+    jobs of the other runners remain in the shared cache.
+
     Note that since each instance operates on a specific authinfo, the guarantees of batching scheduler update calls
     and the limiting of number of calls per unit time, through the minimum polling interval, is only applicable for jobs
     launched with that particular authinfo. If multiple authinfo instances with the same computer, have active jobs
@@ -42,6 +166,8 @@ class JobsList:
     See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
     """
 
+    UPDATE_INTERVAL_BACKOFF_FACTOR = 2.
+
     def __init__(self, authinfo: AuthInfo, transport_queue: 'TransportQueue', last_updated: Optional[float] = None):
         """Construct an instance for the given authinfo and transport queue.
 
@@ -59,8 +185,17 @@ class JobsList:
 
         self._jobs_cache: Dict[Hashable, 'JobInfo'] = {}
         self._job_update_requests: Dict[Hashable, asyncio.Future] = {}  # Mapping: {job_id: Future}
+        self._returned_job_info: Dict[Hashable, 'JobInfo'] = {}  # Mapping: {job_id: last job info returned}
+        self._job_info_callbacks: Dict[Hashable, List[Callable[['JobInfo'], None]]] = {}  # Mapping: {job_id: callbacks}
         self._last_updated = last_updated
+        self._last_new_request: Optional[float] = None
         self._update_handle: Optional[asyncio.TimerHandle] = None
+        self._update_interval: Optional[float] = None
+        self._num_polls = 0
+        self._num_failed_polls = 0
+        self._poll_time = 0.
+        self._last_poll_time = 0.
+        self._num_shared_cache_hits = 0
 
     @property
     def logger(self) -> logging.Logger:
@@ -78,6 +213,31 @@ class JobsList:
         """
         return self._authinfo.computer.get_minimum_job_poll_interval()
 
+    def get_maximum_update_interval(self) -> float:
+        """Get the maximum interval between updates of the list, as long as none of the jobs change state.
+
+        :return: the maximum interval, which is never smaller than the minimum interval
+
+        """
+        return max(self._authinfo.computer.get_maximum_job_poll_interval(), self.get_minimum_update_interval())
+
+    def get_metrics(self) -> Dict[str, Union[int, float]]:
+        """Return metrics on the updates of the jobs list from the scheduler.
+
+        :return: dictionary with the number of times the scheduler was polled (``polls``), how many of those failed
+            (``failed_polls``), the total and last number of seconds it took to poll the scheduler (``poll_time`` and
+            ``last_poll_time``), the number of updates that were read from the shared jobs cache instead
+            (``shared_cache_hits``) and the current interval between updates in seconds (``update_interval``)
+        """
+        return {
+            'polls': self._num_polls,
+            'failed_polls': self._num_failed_polls,
+            'poll_time': self._poll_time,
+            'last_poll_time': self._last_poll_time,
+            'shared_cache_hits': self._num_shared_cache_hits,
+            'update_interval': self._get_update_interval(),
+        }
+
     @property
     def last_updated(self) -> Optional[float]:
         """Get the timestamp of when the list was last updated as produced by `time.time()`
@@ -87,42 +247,136 @@ class JobsList:
         """
         return self._last_updated
 
+    def _get_shared_cache(self) -> Optional[SharedJobsCache]:
+        """Return the cache through which the jobs polled from the scheduler are shared with other runners.
+
+        :return: the shared jobs cache, or ``None`` if sharing the status of jobs is disabled
+        """
+        from aiida.manage.configuration import get_config_option
+        from aiida.manage.manager import get_manager
+
+        if not get_config_option('runner.share_job_status'):
+            return None
+
+        return SharedJobsCache(self._authinfo, get_manager().get_profile().filepaths['daemon']['jobs'])
+
+    def _is_shared_cache_valid(self, shared_jobs: SharedJobs) -> bool:
+        """Return whether the jobs in the shared cache can be used instead of polling the scheduler.
+
+        The jobs were polled by another runner. They can only be used if that was less than the minimum polling interval
+        ago, since this runner would otherwise be allowed to poll itself, and after the last request for a new job, since
+        that job may not have been with the scheduler yet. In addition, all jobs for which an update is requested should
+        have been queried.
+
+        :param shared_jobs: the jobs read from the shared cache
+        """
+        if self._last_new_request is not None and shared_jobs.polled < self._last_new_request:
+            return False
+
+        if shared_jobs.queried is not None and not shared_jobs.queried.issuperset(self._get_jobs_with_scheduler()):
+            return False
+
+        return time.time() - shared_jobs.polled < self.get_minimum_update_interval()
+
     async def _get_jobs_from_scheduler(self) -> Dict[Hashable, 'JobInfo']:
-        """Get the current jobs list from the scheduler.
+        """Get the current jobs list from the scheduler, or from the shared jobs cache if it has recently been polled.
+
+        The lease of the shared jobs cache is only acquired once the transport is open, and it is only held while polling
+        the scheduler and writing its response to the cache, such that other runners do not wait for this transport.
 
         :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
 
         """
+        scheduler = self._authinfo.computer.get_scheduler()
+        shared_cache = self._get_shared_cache()
+
+        if shared_cache is not None:
+            shared_jobs = shared_cache.read()
+
+            if shared_jobs is not None and self._is_shared_cache_valid(shared_jobs):
+                return self._read_shared_jobs(shared_jobs)
+
         with self._transport_queue.request_transport(self._authinfo) as request:
             self.logger.info('waiting for transport')
             transport = await request
 
-            scheduler = self._authinfo.computer.get_scheduler()
             scheduler.set_transport(transport)
 
-            kwargs: Dict[str, Any] = {'as_dict': True}
-            if scheduler.get_feature('can_query_by_user'):
-                kwargs['user'] = '$USER'
-            else:
-                kwargs['jobs'] = self._get_jobs_with_scheduler()
+            if shared_cache is None:
+                return self._poll_scheduler(scheduler, self._get_jobs_with_scheduler())
+
+            async with shared_cache.lease():
+                # Another runner may have polled the scheduler while this one was waiting for the transport or lease
+                shared_jobs = shared_cache.read()
+
+                if shared_jobs is not None and self._is_shared_cache_valid(shared_jobs):
+                    return self._read_shared_jobs(shared_jobs)
+
+                # Also query the jobs of other runners that were still with the scheduler at the previous poll
+                jobs = set(self._get_jobs_with_scheduler())
+
+                if shared_jobs is not None:
+                    jobs.update(str(job_id) for job_id in shared_jobs.jobs)
+
+                polled = time.time()
+                jobs_cache = self._poll_scheduler(scheduler, sorted(jobs))
+                queried = None if scheduler.get_feature('can_query_by_user') else jobs
+                shared_cache.write(SharedJobs(polled, queried, jobs_cache))
+
+                return jobs_cache
+
+    def _read_shared_jobs(self, shared_jobs: SharedJobs) -> Dict[Hashable, 'JobInfo']:
+        """Return the jobs of the shared jobs cache as the current jobs list.
+
+        :param shared_jobs: the jobs read from the shared cache, which should be valid
+        :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
+        """
+        self._last_updated = shared_jobs.polled
+        self._num_shared_cache_hits += 1
+        self.logger.info(f'AuthInfo<{self._authinfo.pk}>: read status of active jobs from the shared cache')
+        return shared_jobs.jobs
+
+    def _poll_scheduler(self, scheduler: 'Scheduler', jobs: List[str]) -> Dict[Hashable, 'JobInfo']:
+        """Poll the scheduler for the current jobs list.
+
+        :param scheduler: the scheduler of the computer of the authinfo, whose transport is set and open
+        :param jobs: the ids of the jobs to query, if the scheduler cannot query all jobs of the user
+        :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
+
+        """
+        kwargs: Dict[str, Any] = {'as_dict': True}
+        if scheduler.get_feature('can_query_by_user'):
+            kwargs['user'] = '$USER'
+        else:
+            kwargs['jobs'] = jobs
+
+        self._num_polls += 1
+        start = time.time()
 
+        try:
             scheduler_response = scheduler.get_jobs(**kwargs)
+        except Exception:
+            self._num_failed_polls += 1
+            raise
+        finally:
+            self._last_poll_time = time.time() - start
+            self._poll_time += self._last_poll_time
 
-            # Update the last update time and clear the jobs cache
-            self._last_updated = time.time()
-            jobs_cache = {}
-            self.logger.info(f'AuthInfo<{self._authinfo.pk}>: successfully retrieved status of active jobs')
+        # Update the last update time and clear the jobs cache
+        self._last_updated = time.time()
+        jobs_cache = {}
+        self.logger.info(f'AuthInfo<{self._authinfo.pk}>: successfully retrieved status of active jobs')
 
-            for job_id, job_info in scheduler_response.items():
-                jobs_cache[job_id] = job_info
+        for job_id, job_info in scheduler_response.items():
+            jobs_cache[job_id] = job_info
 
-            return jobs_cache
+        return jobs_cache
 
     async def _update_job_info(self) -> None:
         """Update all of the job information objects.
 
         This will set the futures for all pending update requests where the corresponding job has a new status compared
-        to the last update.
+        to the job info that was last returned for it. The other requests remain pending until the next update.
         """
         try:
             if not self._update_requests_outstanding():
@@ -144,59 +398,136 @@ class JobsList:
 
             raise
         else:
+            changed = False
+
             for job_id, future in self._job_update_requests.items():
-                if not future.done():
-                    future.set_result(self._jobs_cache.get(job_id, None))
+                job_info = self._jobs_cache.get(job_id, None)
+
+                if future.done():
+                    continue
+
+                if job_id in self._returned_job_info and not self._has_job_state_changed(
+                    self._returned_job_info[job_id], job_info
+                ):
+                    self._call_job_info_callbacks(job_id, job_info)
+                    continue
+
+                future.set_result(job_info)
+                changed = True
+
+                if job_info is not None:
+                    self._returned_job_info[job_id] = job_info
+
+            # Forget jobs that are no longer with the scheduler, such that their next request is resolved straight away
+            self._returned_job_info = {
+                job_id: job_info for job_id, job_info in self._returned_job_info.items() if job_id in self._jobs_cache
+            }
+
+            if changed or self._update_interval is None:
+                self._update_interval = self.get_minimum_update_interval()
+            else:
+                self._update_interval = min(
+                    self._update_interval * self.UPDATE_INTERVAL_BACKOFF_FACTOR, self.get_maximum_update_interval()
+                )
         finally:
-            self._job_update_requests = {}
+            self._job_update_requests = {
+                job_id: future for job_id, future in self._job_update_requests.items() if not future.done()
+            }
+
+    def _call_job_info_callbacks(self, job_id: Hashable, job_info: 'JobInfo') -> None:
+        """Call the callbacks of the pending request of a job with job info in which the job state did not change.
+
+        :param job_id: job identifier
+        :param job_info: the job info of the last update
+        """
+        for callback in self._job_info_callbacks.get(job_id, []):
+            try:
+                callback(job_info)
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(f'callback with the job info of job<{job_id}> excepted')
 
     @contextlib.contextmanager
-    def request_job_info_update(self, job_id: Hashable) -> Iterator['asyncio.Future[JobInfo]']:
+    def request_job_info_update(
+        self,
+        job_id: Hashable,
+        callback: Optional[Callable[['JobInfo'], None]] = None
+    ) -> Iterator['asyncio.Future[JobInfo]']:
         """Request job info about a job when the job next changes state.
 
         If the job is not found in the jobs list at the update, the future will resolve to `None`.
 
         :param job_id: job identifier
+        :param callback: optional callable that is called with the job info of every update, in which the job state did
+            not change, as long as the request is pending. The job info other than the state, such as the wallclock
+            time, can change with every update.
         :return: future that will resolve to a `JobInfo` object when the job changes state
         """
         # Get or create the future
         request = self._job_update_requests.setdefault(job_id, asyncio.Future())
         assert not request.done(), 'Expected pending job info future, found in done state.'
 
+        # The state of a new job should be returned as soon as possible, so go back to polling at the minimum interval
+        if job_id not in self._returned_job_info:
+            self._last_new_request = time.time()
+
+            if self._update_interval is not None:
+                self._update_interval = None
+                self._reschedule_update()
+
+        if callback is not None:
+            self._job_info_callbacks.setdefault(job_id, []).append(callback)
+
         try:
             self._ensure_updating()
             yield request
         finally:
-            pass
+            if callback is not None:
+                callbacks = self._job_info_callbacks[job_id]
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._job_info_callbacks[job_id]
 
     def _ensure_updating(self) -> None:
         """Ensure that we are updating the job list from the remote resource.
 
         This will automatically stop if there are no outstanding requests.
         """
+        # Check if we're already updating
+        if self._update_handle is None:
+            self._schedule_update()
+
+    def _schedule_update(self) -> None:
+        """Schedule the next update of the job list after the delay returned by ``_get_next_update_delay``."""
+        self._update_handle = self._loop.call_later(
+            self._get_next_update_delay(),
+            self._start_update,
+            context=contextvars.Context(),  #  type: ignore[call-arg]
+        )
+
+    def _reschedule_update(self) -> None:
+        """Reschedule the next update if it is pending and it can be done earlier than currently scheduled."""
+        handle = self._update_handle
+
+        if handle is None or handle.cancelled() or handle.when() <= self._loop.time():
+            return
+
+        if self._loop.time() + self._get_next_update_delay() < handle.when():
+            handle.cancel()
+            self._schedule_update()
+
+    def _start_update(self) -> None:
+        """Start the actual update, which will schedule the next update if any requests are left."""
 
         async def updating():
             """Do the actual update, stop if not requests left."""
             await self._update_job_info()
             # Any outstanding requests?
             if self._update_requests_outstanding():
-                self._update_handle = self._loop.call_later(
-                    self._get_next_update_delay(),
-                    asyncio.ensure_future,
-                    updating(),
-                    context=contextvars.Context(),  #  type: ignore[call-arg]
-                )
+                self._schedule_update()
             else:
                 self._update_handle = None
 
-        # Check if we're already updating
-        if self._update_handle is None:
-            self._update_handle = self._loop.call_later(
-                self._get_next_update_delay(),
-                asyncio.ensure_future,
-                updating(),
-                context=contextvars.Context(),  #  type: ignore[call-arg]
-            )
+        asyncio.ensure_future(updating())
 
     @staticmethod
     def _has_job_state_changed(old: Optional['JobInfo'], new: Optional['JobInfo']) -> bool:
@@ -213,11 +544,50 @@ class JobsList:
 
         return old.job_state != new.job_state or old.job_substate != new.job_substate
 
+    def _get_update_interval(self) -> float:
+        """Return the current interval between updates, which lies between the minimum and maximum update interval.
+
+        :return: the interval in seconds
+        """
+        # Make sure to actually 'get' the minimum and maximum interval here, in case the user changed since last time
+        minimum_interval = self.get_minimum_update_interval()
+
+        if self._update_interval is None:
+            return minimum_interval
+
+        return min(max(self._update_interval, minimum_interval), self.get_maximum_update_interval())
+
+    def _get_next_job_end(self) -> Optional[float]:
+        """Return the number of seconds after the last update at which the first running job reaches its walltime.
+
+        Only jobs for which an update is requested and that report both their requested and their used wallclock time
+        are taken into account.
+
+        :return: the number of seconds, or ``None`` if no job end can be expected
+        """
+        from aiida.schedulers.datastructures import JobState
+
+        remaining = []
+
+        for job_id in self._job_update_requests:
+            job_info = self._jobs_cache.get(job_id, None)
+
+            if job_info is None or job_info.job_state != JobState.RUNNING:
+                continue
+
+            if job_info.requested_wallclock_time_seconds is None or job_info.wallclock_time_seconds is None:
+                continue
+
+            remaining.append(max(job_info.requested_wallclock_time_seconds - job_info.wallclock_time_seconds, 0.))
+
+        return min(remaining, default=None)
+
     def _get_next_update_delay(self) -> float:
         """Calculate when we are next allowed to poll the scheduler.
 
-        This delay is calculated as the minimum polling interval defined by the authentication info for this instance,
-        minus time elapsed since the last update.
+        This delay is calculated as the current update interval, brought forward to when the first running job is
+        expected to end but never below the minimum polling interval defined by the authentication info for this
+        instance, minus time elapsed since the last update.
 
         :return: delay (in seconds) after which the scheduler may be polled again
 
@@ -226,11 +596,15 @@ class JobsList:
             # Never updated, so do it straight away
             return 0.
 
-        # Make sure to actually 'get' the minimum interval here, in case the user changed since last time
-        minimum_interval = self.get_minimum_update_interval()
+        interval = self._get_update_interval()
+        next_job_end = self._get_next_job_end()
+
+        if next_job_end is not None:
+            interval = min(interval, max(next_job_end, self.get_minimum_update_interval()))
+
         elapsed = time.time() - self.last_updated
 
-        delay = max(minimum_interval - elapsed, 0.)
+        delay = max(interval - elapsed, 0.)
 
         return delay
 
@@ -258,12 +632,19 @@ class JobManager:
     As long as a :py:class:`~aiida.engine.runners.Runner` will create a single ``JobManager`` instance and use that for
     its lifetime, the guarantees made by the ``JobsList`` about respecting the minimum polling interval of the scheduler
     will be maintained. Note, however, that since each ``Runner`` will create its own job manager, these guarantees
-    only hold per runner.
+    only hold per runner, unless the runners share the status of the jobs through the ``SharedJobsCache``.
     """
 
     def __init__(self, transport_queue: 'TransportQueue') -> None:
         self._transport_queue = transport_queue
-        self._job_lists: Dict[Hashable, 'JobInfo'] = {}
+        self._job_lists: Dict[Hashable, JobsList] = {}
+
+    def get_metrics(self) -> Dict[Hashable, Dict[str, Union[int, float]]]:
+        """Return the metrics on the updates from the scheduler of each jobs list.
+
+        :return: mapping of authinfo pk onto the metrics returned by ``JobsList.get_metrics``
+        """
+        return {authinfo_id: jobs_list.get_metrics() for authinfo_id, jobs_list in self._job_lists.items()}
 
     def get_jobs_list(self, authinfo: AuthInfo) -> JobsList:
         """Get or create a new `JobLists` instance for the given authinfo.
@@ -277,13 +658,22 @@ class JobManager:
         return self._job_lists[authinfo.id]
 
     @contextlib.contextmanager
-    def request_job_info_update(self, authinfo: AuthInfo, job_id: Hashable) -> Iterator['asyncio.Future[JobInfo]']:
+    def request_job_info_update(
+        self,
+        authinfo: AuthInfo,
+        job_id: Hashable,
+        callback: Optional[Callable[['JobInfo'], None]] = None
+    ) -> Iterator['asyncio.Future[JobInfo]']:
         """Get a future that will resolve to information about a given job.
 
         This is a context manager so that if the user leaves the context the request is automatically cancelled.
 
+        :param authinfo: the `AuthInfo`
+        :param job_id: job identifier
+        :param callback: optional callable that is called with the job info of every update in which the job state did
+            not change, see :meth:`~aiida.engine.processes.calcjobs.manager.JobsList.request_job_info_update`
         """
-        with self.get_jobs_list(authinfo).request_job_info_update(job_id) as request:
+        with self.get_jobs_list(authinfo).request_job_info_update(job_id, callback) as request:
             try:
                 yield request
             finally:
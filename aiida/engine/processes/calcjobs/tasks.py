@@ -185,8 +185,9 @@ async def task_update_job(node: CalcJobNode, job_manager, cancellable: Interrupt
     job_id = node.get_job_id()
 
     async def do_update():
-        # Get the update request
-        with job_manager.request_job_info_update(authinfo, job_id) as update_request:
+        # Get the update request, which only resolves once the job state changes. The last job info is still updated
+        # with every poll of the scheduler, since the other job info, such as the wallclock time, changes in between.
+        with job_manager.request_job_info_update(authinfo, job_id, node.set_last_job_info) as update_request:
             job_info = await cancellable.with_interrupt(update_request)
 
         if job_info is None:
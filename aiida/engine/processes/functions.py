@@ -9,15 +9,21 @@
 ###########################################################################
 """Class and decorators to generate processes out of simple python functions."""
 import collections
+import concurrent.futures
 import functools
+import importlib
 import inspect
+import io
+import itertools
 import logging
+import multiprocessing
 import signal
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type
 
+from aiida.common import exceptions
 from aiida.common.lang import override
 from aiida.manage.manager import get_manager
-from aiida.orm import CalcFunctionNode, Data, ProcessNode, WorkFunctionNode
+from aiida.orm import CalcFunctionNode, Data, Node, ProcessNode, WorkFunctionNode, load_node
 from aiida.orm.utils.mixins import FunctionCalculationMixin
 
 from .process import Process
@@ -25,10 +31,12 @@ from .process import Process
 if TYPE_CHECKING:
     from .exit_code import ExitCode
 
-__all__ = ('calcfunction', 'workfunction', 'FunctionProcess')
+__all__ = ('calcfunction', 'workfunction', 'FunctionProcess', 'map_process_function')
 
 LOGGER = logging.getLogger(__name__)
 
+MAP_BATCH_SIZE = 100
+
 
 def calcfunction(function: Callable[..., Any]) -> Callable[..., Any]:
     """
@@ -51,6 +59,13 @@ def calcfunction(function: Callable[..., Any]) -> Callable[..., Any]:
     >>> r.get_incoming().get_node_by_label('result').get_incoming().all_nodes()
     [4, 5]
 
+    The decorated function can also be mapped over iterables of arguments, in which case the functions are evaluated in
+    parallel in a pool of worker processes, while the provenance is stored by the calling process:
+
+    >>> results = sum.map([Int(1), Int(2)], [Int(3), Int(4)])
+    >>> [result.value for result in results]
+    [4, 6]
+
     :param function: The function to decorate.
     :type function: callable
 
@@ -173,6 +188,23 @@ def process_function(node_class: Type['ProcessNode']) -> Callable[[Callable[...,
             result, node = run_get_node(*args, **kwargs)
             return result, node.pk
 
+        def map_function(
+            *iterables: Iterable[Any],
+            max_workers: Optional[int] = None,
+            batch_size: Optional[int] = None
+        ) -> List[Optional[Dict[str, Any]]]:
+            """Run the FunctionProcess for each set of positional arguments taken from the iterables.
+
+            This is the equivalent of the builtin ``map``, except that the functions are evaluated in parallel in a pool
+            of worker processes. See :py:func:`~aiida.engine.processes.functions.map_process_function` for details.
+
+            :param iterables: iterables of the positional arguments of the function
+            :param max_workers: the number of worker processes, by default the number of processors of the machine
+            :param batch_size: the number of processes whose provenance is stored in a single transaction
+            :return: the results of the function, in the order of the arguments
+            """
+            return map_process_function(process_class, *iterables, max_workers=max_workers, batch_size=batch_size)
+
         @functools.wraps(function)
         def decorated_function(*args, **kwargs):
             """This wrapper function is the actual function that is called."""
@@ -180,6 +212,7 @@ def process_function(node_class: Type['ProcessNode']) -> Callable[[Callable[...,
             return result
 
         decorated_function.run = decorated_function  # type: ignore[attr-defined]
+        decorated_function.map = map_function  # type: ignore[attr-defined]
         decorated_function.run_get_pk = run_get_pk  # type: ignore[attr-defined]
         decorated_function.run_get_node = run_get_node  # type: ignore[attr-defined]
         decorated_function.is_process_function = True  # type: ignore[attr-defined]
@@ -193,6 +226,251 @@ def process_function(node_class: Type['ProcessNode']) -> Callable[[Callable[...,
     return decorator
 
 
+class _NodeReference(NamedTuple):
+    """Reference to a stored node, with which nodes are passed between the processes of a ``map_process_function`` pool."""
+
+    pk: int
+
+
+class _UnstoredNode(NamedTuple):
+    """Content of an unstored node returned by a function evaluated by a worker of a ``map_process_function`` pool."""
+
+    cls: Type[Node]
+    attributes: Dict[str, Any]
+    extras: Dict[str, Any]
+    label: str
+    description: str
+    directories: List[str]
+    files: Dict[str, bytes]
+
+
+def _to_references(value: Any) -> Any:
+    """Replace the nodes in the given value, which can be a (nested) mapping or list, with references to them."""
+    if isinstance(value, Node):
+        return _NodeReference(value.pk)
+
+    if isinstance(value, collections.abc.Mapping):
+        return {key: _to_references(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_to_references(item) for item in value]
+
+    return value
+
+
+def _from_references(value: Any) -> Any:
+    """Replace the node references in the given value, which can be a (nested) mapping or list, with the nodes."""
+    if isinstance(value, _NodeReference):
+        return load_node(value.pk)
+
+    if isinstance(value, _UnstoredNode):
+        return _restore_node(value)
+
+    if isinstance(value, collections.abc.Mapping):
+        return {key: _from_references(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_from_references(item) for item in value]
+
+    return value
+
+
+def _dump_outputs(value: Any) -> Any:
+    """Replace the nodes in the given value, which can be a (nested) mapping, with a picklable representation of them.
+
+    Unstored nodes are replaced with their content, such that they can be recreated by ``_from_references`` and stored by
+    the parent process. Stored nodes are replaced with a reference to them.
+    """
+    if isinstance(value, Node):
+        if value.is_stored:
+            return _NodeReference(value.pk)
+
+        directories = []
+        files = {}
+
+        for dirpath, dirnames, filenames in value.walk():
+            directories.extend(str(dirpath / dirname) for dirname in dirnames)
+            files.update({
+                str(dirpath / name): value.get_object_content(str(dirpath / name), 'rb') for name in filenames
+            })
+
+        return _UnstoredNode(
+            value.__class__, value.attributes, value.extras, value.label, value.description, directories, files
+        )
+
+    if isinstance(value, collections.abc.Mapping):
+        return {key: _dump_outputs(item) for key, item in value.items()}
+
+    return value
+
+
+def _restore_node(dump: _UnstoredNode) -> Node:
+    """Recreate an unstored node from the content dumped by ``_dump_outputs``.
+
+    The node is constructed from a new backend entity, in the same way as nodes that are loaded from the database, such
+    that the constructor of its class, which may require arguments, is not called.
+    """
+    from aiida.orm import User
+
+    backend = get_manager().get_backend()
+    backend_entity = backend.nodes.create(
+        node_type=dump.cls.class_node_type,
+        user=User.objects(backend).get_default().backend_entity,
+        label=dump.label,
+        description=dump.description
+    )
+    node = dump.cls.from_backend_entity(backend_entity)
+    node.set_attribute_many(dump.attributes)
+
+    if dump.extras:
+        node.set_extra_many(dump.extras)
+
+    for directory in dump.directories:
+        node._repository.create_directory(directory)  # pylint: disable=protected-access
+
+    for path, content in dump.files.items():
+        node.put_object_from_filelike(io.BytesIO(content), path)
+
+    return node
+
+
+def _initialize_worker(profile_name: str) -> None:
+    """Load the profile of the parent process in a worker process of the pool of ``map_process_function``."""
+    from aiida.manage.configuration import load_profile
+
+    load_profile(profile_name)
+
+
+def _evaluate_function(module: str, qualname: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> Any:
+    """Evaluate the function of a process function in a worker process of the pool of ``map_process_function``.
+
+    The function is imported through the name of its module and its qualified name, since it is not picklable itself.
+    The nodes returned by the function are replaced by their content, from which the parent process recreates them.
+
+    :param module: the name of the module of the process function
+    :param qualname: the qualified name of the process function in its module
+    :param args: the positional arguments of the function, with node references instead of nodes
+    :param kwargs: the keyword arguments of the function, with node references instead of nodes
+    :return: the result of the function, with the content of the nodes instead of the nodes
+    """
+    function = importlib.import_module(module)
+
+    for name in qualname.split('.'):
+        function = getattr(function, name)
+
+    result = function.process_class._func(*_from_references(args), **_from_references(kwargs))  # pylint: disable=protected-access
+
+    return _dump_outputs(result)
+
+
+def map_process_function(
+    process_class: Type['FunctionProcess'],
+    *iterables: Iterable[Any],
+    max_workers: Optional[int] = None,
+    batch_size: Optional[int] = None
+) -> List[Optional[Dict[str, Any]]]:
+    """Run the process function once for each set of positional arguments taken from the iterables.
+
+    The functions are evaluated in parallel in a pool of worker processes, which load the profile of the current
+    process. The current process instantiates the processes, storing their nodes and input links in a single transaction
+    per batch, and finalizes them with the result of their function, storing and linking the outputs. The resulting
+    provenance graph is therefore the same as when running the process functions one by one. Only the function of the
+    process function is evaluated by the worker processes, so it has to be importable, i.e. be defined at the top level
+    of a module, and the nodes it returns are passed to the current process by their class, attributes, extras, label,
+    description and repository content. While the worker processes evaluate the functions of a batch, the next batch is
+    instantiated.
+
+    If any of the process functions excepts, its exception is raised once all process functions have terminated.
+
+    :param process_class: the class of the process function
+    :param iterables: iterables of the positional arguments of the function
+    :param max_workers: the number of worker processes, by default the number of processors of the machine
+    :param batch_size: the number of processes that are instantiated in a single transaction, by default equal to
+        ``MAP_BATCH_SIZE``
+    :return: the results of the process functions, in the order of the arguments
+    :raises `~aiida.common.exceptions.InvalidOperation`: if the process function is not a calcfunction, or if it is
+        run with ``store_provenance=False``
+    :raises ValueError: if the function of the process function is not defined at the top level of a module
+    """
+    # pylint: disable=too-many-locals
+    if not issubclass(process_class._node_class, CalcFunctionNode):  # pylint: disable=protected-access
+        raise exceptions.InvalidOperation('only calcfunctions can be mapped, since workfunctions call other processes')
+
+    function = process_class._func  # pylint: disable=protected-access
+
+    if '<locals>' in function.__qualname__:
+        raise ValueError(f'{function.__name__} cannot be mapped since it is not defined at the top level of a module')
+
+    manager = get_manager()
+    runner = manager.get_runner()
+    backend = manager.get_backend()
+    batch_size = batch_size or MAP_BATCH_SIZE
+    arguments = zip(*iterables)
+    results: List[Optional[Dict[str, Any]]] = []
+    exception = None
+
+    def instantiate(batch):
+        """Instantiate the processes of a batch of arguments and submit their functions to the pool."""
+        processes = []
+
+        with backend.transaction():
+            for args in batch:
+                process = process_class(inputs=process_class.create_inputs(*args), runner=runner)
+
+                if not process.metadata.store_provenance:
+                    raise exceptions.InvalidOperation('cannot map a process function with `store_provenance=False`')
+
+                processes.append(process)
+
+        # The functions can only be submitted once the transaction is committed, or the workers cannot load the inputs
+        for process in processes:
+            # A process whose node was taken from the cache already finished, so its function is not evaluated
+            if process.node.exit_status is None:
+                function_args, function_kwargs = process._get_function_arguments()  # pylint: disable=protected-access
+                process._function_result = executor.submit(  # pylint: disable=protected-access
+                    _evaluate_function, function.__module__, function.__qualname__, _to_references(function_args),
+                    _to_references(function_kwargs)
+                )
+
+        return processes
+
+    def finalize(processes):
+        """Execute the processes of a batch, which wait for the results of their functions."""
+        nonlocal exception
+
+        for process in processes:
+            try:
+                results.append(process.execute())
+            except Exception as exc:  # pylint: disable=broad-except
+                results.append(None)
+                exception = exception or exc
+
+    context = multiprocessing.get_context('spawn')
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers, mp_context=context, initializer=_initialize_worker, initargs=(manager.get_profile().name,)
+    ) as executor:
+        pending: List[FunctionProcess] = []
+
+        try:
+            while True:
+                batch = list(itertools.islice(arguments, batch_size))
+
+                if not batch:
+                    break
+
+                processes = instantiate(batch)
+                finalize(pending)
+                pending = processes
+        finally:
+            finalize(pending)
+
+    if exception is not None:
+        raise exception
+
+    return results
+
+
 class FunctionProcess(Process):
     """Function process class used for turning functions into a Process"""
 
@@ -331,6 +609,8 @@ class FunctionProcess(Process):
         if kwargs.get('enable_persistence', False):
             raise RuntimeError('Cannot persist a function process')
         super().__init__(enable_persistence=False, *args, **kwargs)  # type: ignore
+        # Result of the function evaluated by another process, which is awaited instead of calling the function
+        self._function_result: Optional[concurrent.futures.Future] = None
 
     @property
     def process_class(self) -> Callable[..., Any]:
@@ -362,20 +642,12 @@ class FunctionProcess(Process):
         super()._setup_db_record()
         self.node.store_source_info(self._func)
 
-    @override
-    def run(self) -> Optional['ExitCode']:
-        """Run the process."""
-        from .exit_code import ExitCode
-
-        # The following conditional is required for the caching to properly work. Even if the source node has a process
-        # state of `Finished` the cached process will still enter the running state. The process state will have then
-        # been overridden by the engine to `Running` so we cannot check that, but if the `exit_status` is anything other
-        # than `None`, it should mean this node was taken from the cache, so the process should not be rerun.
-        if self.node.exit_status is not None:
-            return self.node.exit_status
+    def _get_function_arguments(self) -> Tuple[List[Any], Dict[str, Any]]:
+        """Split the inputs of the process into the positional and keyword arguments of the function.
 
-        # Split the inputs into positional and keyword arguments
-        args = [None] * len(self._func_args)
+        :return: tuple of the positional and keyword arguments
+        """
+        args: List[Any] = [None] * len(self._func_args)
         kwargs = {}
 
         for name, value in (self.inputs or {}).items():
@@ -392,7 +664,25 @@ class FunctionProcess(Process):
             except ValueError:
                 kwargs[name] = value
 
-        result = self._func(*args, **kwargs)
+        return args, kwargs
+
+    @override
+    def run(self) -> Optional['ExitCode']:
+        """Run the process."""
+        from .exit_code import ExitCode
+
+        # The following conditional is required for the caching to properly work. Even if the source node has a process
+        # state of `Finished` the cached process will still enter the running state. The process state will have then
+        # been overridden by the engine to `Running` so we cannot check that, but if the `exit_status` is anything other
+        # than `None`, it should mean this node was taken from the cache, so the process should not be rerun.
+        if self.node.exit_status is not None:
+            return self.node.exit_status
+
+        if self._function_result is None:
+            args, kwargs = self._get_function_arguments()
+            result = self._func(*args, **kwargs)
+        else:
+            result = _from_references(self._function_result.result())
 
         if result is None or isinstance(result, ExitCode):
             return result
@@ -25,6 +25,7 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -47,6 +48,7 @@ from aiida.common.lang import classproperty, override
 from aiida.common.links import LinkType
 from aiida.common.log import LOG_LEVEL_REPORT
 from aiida.orm.utils import serialize
+from aiida.orm.utils.log import get_dblog_handlers
 
 from .builder import ProcessBuilder
 from .exit_code import ExitCode, ExitCodesNamespace
@@ -161,6 +163,7 @@ class Process(plumpy.processes.Process):
 
         self._node: Optional[orm.ProcessNode] = None
         self._parent_pid = parent_pid
+        self._linked_output_labels: Optional[Set[str]] = None
         self._enable_persistence = enable_persistence
         if self._enable_persistence and self.runner.persister is None:
             self.logger.warning('Disabling persistence, runner does not have a persister')
@@ -294,6 +297,8 @@ class Process(plumpy.processes.Process):
         load_context = load_context.copyextend(loop=self._runner.loop, communicator=self._runner.communicator)
         super().load_instance_state(saved_state, load_context)
 
+        self._linked_output_labels = None
+
         if self.SaveKeys.CALC_ID.value in saved_state:
             self._node = orm.load_node(saved_state[self.SaveKeys.CALC_ID.value])
             self._pid = self.node.pk  # pylint: disable=attribute-defined-outside-init
@@ -392,7 +397,11 @@ class Process(plumpy.processes.Process):
         # Update the node attributes every time we enter a new state
 
     def on_entered(self, from_state: Optional[plumpy.process_states.State]) -> None:
-        """After entering a new state, save a checkpoint and update the latest process state change timestamp."""
+        """After entering a new state, save a checkpoint and update the latest process state change timestamp.
+
+        The log records of the process node are buffered by the database log handlers until the next state transition,
+        when they are written to the database in a single batch.
+        """
         # pylint: disable=cyclic-import
         from aiida.engine.utils import set_process_state_change_timestamp
         self.update_node_state(self._state)
@@ -400,21 +409,30 @@ class Process(plumpy.processes.Process):
         set_process_state_change_timestamp(self)
         super().on_entered(from_state)
 
+        for handler in get_dblog_handlers():
+            handler.start_buffering(self.node.pk)
+            handler.flush()
+
     @override
     def on_terminated(self) -> None:
         """Called when a Process enters a terminal state."""
-        super().on_terminated()
-        if self._enable_persistence:
-            try:
-                assert self.runner.persister is not None
-                self.runner.persister.delete_checkpoint(self.pid)
-            except Exception as error:  # pylint: disable=broad-except
-                self.logger.exception('Failed to delete checkpoint: %s', error)
-
         try:
-            self.node.seal()
-        except exceptions.ModificationNotAllowed:
-            pass
+            super().on_terminated()
+            if self._enable_persistence:
+                try:
+                    assert self.runner.persister is not None
+                    self.runner.persister.delete_checkpoint(self.pid)
+                except Exception as error:  # pylint: disable=broad-except
+                    self.logger.exception('Failed to delete checkpoint: %s', error)
+
+            try:
+                self.node.seal()
+            except exceptions.ModificationNotAllowed:
+                pass
+        finally:
+            # Make sure that all log records of the process are written to the database once it has terminated
+            for handler in get_dblog_handlers():
+                handler.stop_buffering(self.node.pk)
 
     @override
     def on_except(self, exc_info: Tuple[Any, Exception, TracebackType]) -> None:
@@ -508,6 +526,21 @@ class Process(plumpy.processes.Process):
         """
         return self.runner.submit(process, *args, **kwargs)
 
+    def submit_many(
+        self,
+        process: Union[Type['Process'], ProcessBuilder],
+        inputs_iterable: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> List[orm.ProcessNode]:
+        """Submit the process once for each dictionary of inputs.
+
+        :param process: the process class or builder to submit
+        :param inputs_iterable: iterable of dictionaries with the inputs of each process
+        :param batch_size: maximum number of processes that are instantiated in a single database transaction
+        :return: the calculation nodes of the processes, in the order of the inputs
+        """
+        return self.runner.submit_many(process, inputs_iterable, batch_size=batch_size)
+
     @property
     def runner(self) -> 'Runner':
         """Get process runner."""
@@ -598,24 +631,30 @@ class Process(plumpy.processes.Process):
         return UUID(self.node.uuid)
 
     @override
-    def encode_input_args(self, inputs: Dict[str, Any]) -> str:  # pylint: disable=no-self-use
+    def encode_input_args(self, inputs: Dict[str, Any]) -> Dict[str, Any]:  # pylint: disable=no-self-use
         """
         Encode input arguments such that they may be saved in a Bundle
 
+        The inputs are returned as a plain dictionary, such that they are encoded together with the rest of the bundle
+        by the codec of the persister that saves the checkpoint.
+
         :param inputs: A mapping of the inputs as passed to the process
-        :return: The encoded (serialized) inputs
+        :return: The encoded inputs
         """
-        return serialize.serialize(inputs)
+        return dict(inputs)
 
     @override
-    def decode_input_args(self, encoded: str) -> Dict[str, Any]:  # pylint: disable=no-self-use
+    def decode_input_args(self, encoded: Union[str, Dict[str, Any]]) -> Dict[str, Any]:  # pylint: disable=no-self-use
         """
         Decode saved input arguments as they came from the saved instance state Bundle
 
-        :param encoded: encoded (serialized) inputs
+        :param encoded: encoded inputs, or the inputs serialized as a yaml dump for checkpoints of older versions
         :return: The decoded input args
         """
-        return serialize.deserialize_unsafe(encoded)
+        if isinstance(encoded, str):
+            return serialize.deserialize_unsafe(encoded)
+
+        return encoded
 
     def update_node_state(self, state: plumpy.process_states.State) -> None:
         self.update_outputs()
@@ -624,26 +663,77 @@ class Process(plumpy.processes.Process):
     def update_outputs(self) -> None:
         """Attach new outputs to the node since the last call.
 
+        The labels of the outputs that have already been linked are kept in memory, such that only the first call has
+        to query the database for them. The new outputs are then stored, together with their links, in bulk.
+
         Does nothing, if self.metadata.store_provenance is False.
         """
+        # pylint: disable=protected-access
         if self.metadata.store_provenance is False:
             return
 
-        outputs_flat = self._flat_outputs()
-        outputs_stored = self.node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN)).all_link_labels()
-        outputs_new = set(outputs_flat.keys()) - set(outputs_stored)
+        if self._linked_output_labels is None:
+            self._linked_output_labels = set(
+                self.node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN)).all_link_labels()
+            )
 
-        for link_label, output in outputs_flat.items():
+        outputs_new = {
+            link_label: output
+            for link_label, output in self._flat_outputs().items()
+            if link_label not in self._linked_output_labels
+        }
+
+        link_type = LinkType.CREATE if isinstance(self.node, orm.CalculationNode) else LinkType.RETURN
+
+        # A stored output of a calculation is typically already linked directly by the engine, for example the remote
+        # folder and retrieved outputs of a ``CalcJob``, and otherwise has to be fully validated, since it could already
+        # have been created by another process.
+        for link_label, output in list(outputs_new.items()):
+            if link_type is LinkType.CREATE and isinstance(output, orm.Data) and output.is_stored:
+                creator = output.get_incoming(link_type=LinkType.CREATE).first()
+                if creator is not None and creator.node.pk == self.node.pk and creator.link_label == link_label:
+                    self._linked_output_labels.add(link_label)
+                    del outputs_new[link_label]
+                else:
+                    output.validate_incoming(self.node, link_type, link_label)
 
-            if link_label not in outputs_new:
-                continue
+        if not outputs_new:
+            return
 
-            if isinstance(self.node, orm.CalculationNode):
-                output.add_incoming(self.node, LinkType.CREATE, link_label)
-            elif isinstance(self.node, orm.WorkflowNode):
-                output.add_incoming(self.node, LinkType.RETURN, link_label)
+        outputs_unstored = []
+        links = []
+        # The ``id`` of the unstored outputs that were already validated, since a node can be attached to multiple labels
+        outputs_created = set()
+
+        # The links are validated here instead of through ``Node.add_incoming``, which queries the database for each
+        # link. The uniqueness of the labels is guaranteed by ``_linked_output_labels`` and an unstored output cannot
+        # have any stored incoming links, nor introduce a cycle in the graph.
+        for link_label, output in outputs_new.items():
+            if not isinstance(output, orm.Data):
+                raise ValueError(f'cannot add a {link_type} link from {type(self.node)} to {type(output)}')
+
+            if not output.is_stored:
+                if id(output) in outputs_created or any(
+                    link.link_type is LinkType.CREATE for link in output._incoming_cache
+                ):
+                    raise ValueError(f'node<{output.uuid}> already has an incoming {LinkType.CREATE} link')
+                outputs_created.add(id(output))
+
+            self.node.validate_outgoing(output, link_type, link_label)
+
+        for link_label, output in outputs_new.items():
+            if output.is_stored:
+                links.append((self.node.backend_entity, output.backend_entity, link_type, link_label))
+            else:
+                output._add_incoming_cache(self.node, link_type, link_label)
+                outputs_unstored.append(output)
+
+        orm.store_many(outputs_unstored)
+
+        if links:
+            self.node.backend.nodes.bulk_store([], links)
 
-            output.store()
+        self._linked_output_labels.update(outputs_new)
 
     def _setup_db_record(self) -> None:
         """
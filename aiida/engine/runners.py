@@ -10,11 +10,11 @@
 # pylint: disable=global-statement
 """Runners that can run and submit processes."""
 import asyncio
-import functools
+import concurrent.futures
+import itertools
 import logging
 import signal
-import threading
-from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
 import uuid
 
 import kiwipy
@@ -24,7 +24,7 @@ from plumpy.persistence import Persister
 from plumpy.process_comms import RemoteProcessThreadController
 
 from aiida.common import exceptions
-from aiida.orm import ProcessNode, load_node
+from aiida.orm import ProcessNode, QueryBuilder
 from aiida.plugins.utils import PluginVersionProvider
 
 from . import transports, utils
@@ -50,6 +50,9 @@ TYPE_RUN_PROCESS = Union[Process, Type[Process], ProcessBuilder]  # pylint: disa
 # run can also be process function, but it is not clear what type this should be
 TYPE_SUBMIT_PROCESS = Union[Process, Type[Process], ProcessBuilder]  # pylint: disable=invalid-name
 
+#: Default number of processes that are instantiated in a single database transaction by ``Runner.submit_many``
+SUBMIT_BATCH_SIZE = 100
+
 
 class Runner:  # pylint: disable=too-many-public-methods
     """Class that can launch processes by running in the current interpreter or by submitting them to the daemon."""
@@ -58,6 +61,8 @@ class Runner:  # pylint: disable=too-many-public-methods
     _communicator: Optional[kiwipy.Communicator] = None
     _controller: Optional[RemoteProcessThreadController] = None
     _closed: bool = False
+    _process_subscriber: Optional[str] = None
+    _process_poll_handle: Optional[asyncio.Handle] = None
 
     def __init__(
         self,
@@ -65,7 +70,8 @@ class Runner:  # pylint: disable=too-many-public-methods
         loop: Optional[asyncio.AbstractEventLoop] = None,
         communicator: Optional[kiwipy.Communicator] = None,
         rmq_submit: bool = False,
-        persister: Optional[Persister] = None
+        persister: Optional[Persister] = None,
+        transport_keep_alive: Union[int, float] = 0
     ):
         """Construct a new runner.
 
@@ -74,6 +80,7 @@ class Runner:  # pylint: disable=too-many-public-methods
         :param communicator: the communicator to use
         :param rmq_submit: if True, processes will be submitted to RabbitMQ, otherwise they will be scheduled here
         :param persister: the persister to use to persist processes
+        :param transport_keep_alive: number of seconds that idle transports are kept open for reuse
 
         """
         assert not (rmq_submit and persister is None), \
@@ -83,10 +90,11 @@ class Runner:  # pylint: disable=too-many-public-methods
         self._loop = loop if loop is not None else asyncio.get_event_loop()
         self._poll_interval = poll_interval
         self._rmq_submit = rmq_submit
-        self._transport = transports.TransportQueue(self._loop)
+        self._transport = transports.TransportQueue(self._loop, keep_alive=transport_keep_alive)
         self._job_manager = manager.JobManager(self._transport)
         self._persister = persister
         self._plugin_version_provider = PluginVersionProvider()
+        self._process_callbacks: Dict[int, List[Callable[[], Any]]] = {}
 
         if communicator is not None:
             self._communicator = wrap_communicator(communicator, self._loop)
@@ -161,6 +169,9 @@ class Runner:  # pylint: disable=too-many-public-methods
         """Close the runner by stopping the loop."""
         assert not self._closed
         self.stop()
+        if self._process_poll_handle is not None:
+            self._process_poll_handle.cancel()
+        self._transport.close()
         reset_event_loop_policy()
         self._closed = True
 
@@ -199,6 +210,108 @@ class Runner:  # pylint: disable=too-many-public-methods
 
         return process_inited.node
 
+    def submit_many(
+        self,
+        process: Union[Type[Process], ProcessBuilder],
+        inputs_iterable: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None
+    ) -> List[ProcessNode]:
+        """Submit the process once for each dictionary of inputs, immediately returning control to the interpreter.
+
+        The processes are submitted in batches: the nodes, links and checkpoints of all processes in a batch are stored
+        in a single database transaction, after which the continue tasks of the batch are sent to RabbitMQ concurrently.
+
+        :param process: the process class or builder to submit
+        :param inputs_iterable: iterable of dictionaries with the inputs of each process
+        :param batch_size: maximum number of processes that are instantiated in a single database transaction, defaults
+            to ``SUBMIT_BATCH_SIZE``
+        :return: the nodes of the submitted processes, in the order of the inputs
+        """
+        return self._submit_many(process, inputs_iterable, batch_size, self._rmq_submit)
+
+    def _submit_many(
+        self, process: Union[Type[Process], ProcessBuilder], inputs_iterable: Iterable[Dict[str, Any]],
+        batch_size: Optional[int], rmq_submit: bool
+    ) -> List[ProcessNode]:
+        """Submit the process once for each dictionary of inputs.
+
+        :param rmq_submit: if True, processes will be submitted to RabbitMQ, otherwise they will be scheduled here
+        """
+        from aiida.manage.manager import get_manager
+
+        assert not utils.is_process_function(process), 'Cannot submit a process function'
+        assert not self._closed
+
+        if rmq_submit:
+            assert self.persister is not None, 'runner does not have a persister'
+            assert self.controller is not None, 'runner does not have a controller'
+
+        backend = get_manager().get_backend()
+        batch_size = batch_size or SUBMIT_BATCH_SIZE
+        inputs_iterator = iter(inputs_iterable)
+        nodes = []
+
+        while True:
+            batch = list(itertools.islice(inputs_iterator, batch_size))
+
+            if not batch:
+                break
+
+            processes = []
+
+            try:
+                with backend.transaction():
+                    for inputs in batch:
+                        process_inited = self.instantiate_process(process, **inputs)
+                        processes.append(process_inited)
+
+                        if not process_inited.metadata.store_provenance:
+                            raise exceptions.InvalidOperation('cannot submit a process with `store_provenance=False`')
+
+                        if process_inited.metadata.get('dry_run', False):
+                            raise exceptions.InvalidOperation('cannot submit a process with `dry_run=True`')
+
+                        if rmq_submit:
+                            self.persister.save_checkpoint(process_inited)  # type: ignore[union-attr]
+            except Exception:
+                # The transaction was rolled back, so close the processes of the batch that were already instantiated,
+                # such that they stop listening to the communicator, since they will never be run.
+                for process_inited in processes:
+                    process_inited.close()
+                raise
+
+            # The continue tasks can only be sent once the transaction is committed, or the workers might not find the
+            # checkpoints of the processes.
+            if rmq_submit:
+                for process_inited in processes:
+                    process_inited.close()
+                self._continue_processes([process_inited.pid for process_inited in processes])
+            else:
+                for process_inited in processes:
+                    self.loop.create_task(process_inited.step_until_terminated())
+
+            nodes.extend(process_inited.node for process_inited in processes)
+
+        return nodes
+
+    def _continue_processes(self, pids: List[Union[int, uuid.UUID]]) -> None:
+        """Send the continue tasks for the processes with the given pids to RabbitMQ.
+
+        The tasks are sent concurrently, such that the confirmations of the broker are awaited for all tasks at once
+        instead of one at a time.
+
+        :param pids: the pids of the processes to continue
+        """
+        assert self.controller is not None, 'runner does not have a controller'
+
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(self.controller.continue_process, pid, nowait=False, no_reply=True) for pid in pids
+            ]
+
+        for future in futures:
+            future.result()
+
     def schedule(self, process: TYPE_SUBMIT_PROCESS, *args: Any, **inputs: Any) -> ProcessNode:
         """
         Schedule a process to be executed by this runner
@@ -292,41 +405,33 @@ class Runner:  # pylint: disable=too-many-public-methods
     def call_on_process_finish(self, pk: int, callback: Callable[[], Any]) -> None:
         """Schedule a callback when the process of the given pk is terminated.
 
-        This method will add a broadcast subscriber that will listen for state changes of the target process to be
-        terminated. As a fail-safe, a polling-mechanism is used to check the state of the process, should the broadcast
-        message be missed by the subscriber, in order to prevent the caller to wait indefinitely.
+        The runner keeps a single broadcast subscriber that listens for state changes of any of the awaited processes to
+        be terminated. As a fail-safe, should the broadcast message be missed by the subscriber, the states of all the
+        awaited processes are polled with a single query every ``poll_interval``, in order to prevent the caller to wait
+        indefinitely. The callback is called exactly once.
 
         :param pk: pk of the process
         :param callback: function to be called upon process termination
         """
         assert self.communicator is not None, 'communicator not set for runner'
 
-        node = load_node(pk=pk)
-        subscriber_identifier = str(uuid.uuid4())
-        event = threading.Event()
-
-        def inline_callback(event, *args, **kwargs):  # pylint: disable=unused-argument
-            """Callback to wrap the actual callback, that will always remove the subscriber that will be registered.
-
-            As soon as the callback is called successfully once, the `event` instance is toggled, such that if this
-            inline callback is called a second time, the actual callback is not called again.
-            """
-            if event.is_set():
-                return
+        self._process_callbacks.setdefault(pk, []).append(callback)
 
-            try:
-                callback()
-            finally:
-                event.set()
-                self.communicator.remove_broadcast_subscriber(subscriber_identifier)  # type: ignore[union-attr]
+        if self._process_subscriber is None:
+            broadcast_filter = kiwipy.BroadcastFilter(self._on_process_terminated_broadcast)
+            for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
+                broadcast_filter.add_subject_filter(f'state_changed.*.{state.value}')
 
-        broadcast_filter = kiwipy.BroadcastFilter(functools.partial(inline_callback, event), sender=pk)
-        for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
-            broadcast_filter.add_subject_filter(f'state_changed.*.{state.value}')
+            LOGGER.info('adding subscriber for broadcasts of terminated processes')
+            self._process_subscriber = str(uuid.uuid4())
+            self.communicator.add_broadcast_subscriber(broadcast_filter, self._process_subscriber)
 
-        LOGGER.info('adding subscriber for broadcasts of %d', pk)
-        self.communicator.add_broadcast_subscriber(broadcast_filter, subscriber_identifier)
-        self._poll_process(node, functools.partial(inline_callback, event))
+        # Poll as soon as the current task yields control, such that processes that have already terminated are picked
+        # up immediately. Any other processes that are registered before that, are resolved by the same query.
+        if self._process_poll_handle is None or isinstance(self._process_poll_handle, asyncio.TimerHandle):
+            if self._process_poll_handle is not None:
+                self._process_poll_handle.cancel()
+            self._process_poll_handle = self._loop.call_soon(self._poll_processes)
 
     def get_process_future(self, pk: int) -> futures.ProcessFuture:
         """Return a future for a process.
@@ -337,15 +442,51 @@ class Runner:  # pylint: disable=too-many-public-methods
         """
         return futures.ProcessFuture(pk, self._loop, self._poll_interval, self._communicator)
 
-    def _poll_process(self, node, callback):
-        """Check whether the process state of the node is terminated and call the callback or reschedule it.
+    def _on_process_terminated_broadcast(self, _communicator, _body, sender, _subject, _correlation_id) -> None:
+        """Call the callbacks of the process that sent the broadcast of its termination, if it is being awaited."""
+        self._dispatch_process_callbacks(sender)
+
+    def _poll_processes(self) -> None:
+        """Check which of the awaited processes are terminated with a single query and call their callbacks.
 
-        :param node: the process node
-        :param callback: callback to be called when process is terminated
+        If processes are still being awaited afterwards, the next poll is scheduled after ``poll_interval``.
         """
-        if node.is_terminated:
-            args = [node.__class__.__name__, node.pk]
-            LOGGER.info('%s<%d> confirmed to be terminated by backup polling mechanism', *args)
+        self._process_poll_handle = None
+
+        if not self._process_callbacks:
+            return
+
+        filters = {
+            'id': {
+                'in': list(self._process_callbacks)
+            },
+            f'attributes.{ProcessNode.PROCESS_STATE_KEY}': {
+                'in': [state.value for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]]
+            },
+        }
+
+        for pk in QueryBuilder().append(ProcessNode, filters=filters, project='id').all(flat=True):
+            LOGGER.info('Process<%d> confirmed to be terminated by backup polling mechanism', pk)
+            self._dispatch_process_callbacks(pk)
+
+        if self._process_callbacks:
+            self._process_poll_handle = self._loop.call_later(self._poll_interval, self._poll_processes)
+
+    def _dispatch_process_callbacks(self, pk: int) -> None:
+        """Schedule the callbacks of the process with the given pk and stop awaiting it.
+
+        Once no processes are awaited anymore, the broadcast subscriber is removed and polling stops.
+
+        :param pk: pk of the terminated process
+        """
+        for callback in self._process_callbacks.pop(pk, []):
             self._loop.call_soon(callback)
-        else:
-            self._loop.call_later(self._poll_interval, self._poll_process, node, callback)
+
+        if not self._process_callbacks:
+            if self._process_subscriber is not None:
+                self.communicator.remove_broadcast_subscriber(self._process_subscriber)  # type: ignore[union-attr]
+                self._process_subscriber = None
+
+            if self._process_poll_handle is not None:
+                self._process_poll_handle.cancel()
+                self._process_poll_handle = None
@@ -13,7 +13,7 @@ import contextlib
 import contextvars
 import logging
 import traceback
-from typing import Awaitable, Dict, Hashable, Iterator, Optional
+from typing import Awaitable, Dict, Hashable, Iterator, Optional, Union
 
 from aiida.orm import AuthInfo
 from aiida.transports import Transport
@@ -28,6 +28,11 @@ class TransportRequest:
         super().__init__()
         self.future: asyncio.Future = asyncio.Future()
         self.count = 0
+        self.close_handle: Optional[asyncio.TimerHandle] = None
+
+    def is_open(self) -> bool:
+        """Return whether the transport of this request has been opened successfully."""
+        return self.future.done() and not self.future.cancelled() and self.future.exception() is None
 
 
 class TransportQueue:
@@ -40,20 +45,90 @@ class TransportQueue:
     it will open the transport and give it to all the clients that asked for it
     up to that point.  This way opening of transports (a costly operation) can
     be minimised.
+
+    If a keep-alive interval is defined, a transport is not closed as soon as
+    the last client releases it, but only once it has been idle for that long.
+    A request that comes in before then is given the open transport straight
+    away, as long as it is still alive, instead of having to wait for a new
+    connection to be opened.
     """
 
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None, keep_alive: Union[int, float] = 0):
         """
         :param loop: An asyncio event, will use `asyncio.get_event_loop()` if not supplied
+        :param keep_alive: number of seconds an idle transport is kept open for reuse, by default it is closed
+            immediately
         """
         self._loop = loop if loop is not None else asyncio.get_event_loop()
+        self._keep_alive = keep_alive
         self._transport_requests: Dict[Hashable, TransportRequest] = {}
+        self._num_opened = 0
+        self._num_reused = 0
+        self._wait_time = 0.
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
         """ Get the loop being used by this transport queue """
         return self._loop
 
+    def get_metrics(self) -> Dict[str, Union[int, float]]:
+        """Return metrics on the usage of the transports of this queue.
+
+        :return: dictionary with the number of currently open transports (``open``), the total number of transports
+            that have been opened (``opened``), the number of requests that were given an already open transport
+            (``reused``) and the total number of seconds that requests have waited for their transport (``wait_time``)
+        """
+        return {
+            'open': sum(transport_request.is_open() for transport_request in self._transport_requests.values()),
+            'opened': self._num_opened,
+            'reused': self._num_reused,
+            'wait_time': self._wait_time,
+        }
+
+    def close(self) -> None:
+        """Close all transports that are being kept alive while no longer being used."""
+        for authinfo_id, transport_request in list(self._transport_requests.items()):
+            if transport_request.close_handle is not None:
+                transport_request.close_handle.cancel()
+                self._close_idle_transport(authinfo_id, transport_request)
+
+    def _close_idle_transport(self, authinfo_id: Hashable, transport_request: TransportRequest) -> None:
+        """Close the transport of the given request if it is still being kept alive and no client is using it."""
+        transport_request.close_handle = None
+
+        if transport_request.count > 0 or self._transport_requests.get(authinfo_id) is not transport_request:
+            return
+
+        self._transport_requests.pop(authinfo_id, None)
+        transport = transport_request.future.result()
+
+        _LOGGER.debug('Transport request closing idle transport for authinfo<%s>', authinfo_id)
+        try:
+            transport.close()
+        except Exception as exception:  # pylint: disable=broad-except
+            _LOGGER.warning('exception occurred while trying to close idle transport:\n %s', exception)
+
+    def _reuse_idle_transport(self, authinfo_id: Hashable) -> None:
+        """Check whether the transport that is being kept alive for the given authinfo is still usable.
+
+        If the transport is still alive, the pending close is cancelled such that it can be reused, otherwise the
+        transport is closed and discarded, such that a new one will be opened.
+        """
+        transport_request = self._transport_requests[authinfo_id]
+        transport_request.close_handle.cancel()  # type: ignore[union-attr]
+        transport = transport_request.future.result()
+
+        try:
+            is_alive = transport.is_alive()
+        except Exception:  # pylint: disable=broad-except
+            is_alive = False
+
+        if is_alive:
+            transport_request.close_handle = None
+        else:
+            _LOGGER.debug('Transport kept alive for authinfo<%s> is no longer alive, discarding it', authinfo_id)
+            self._close_idle_transport(authinfo_id, transport_request)
+
     @contextlib.contextmanager
     def request_transport(self, authinfo: AuthInfo) -> Iterator[Awaitable[Transport]]:
         """
@@ -72,6 +147,11 @@ class TransportQueue:
         open_callback_handle = None
         transport_request = self._transport_requests.get(authinfo.id, None)
 
+        if transport_request is not None and transport_request.close_handle is not None:
+            # The transport has been released by all clients, but is being kept alive: check it can be reused
+            self._reuse_idle_transport(authinfo.id)
+            transport_request = self._transport_requests.get(authinfo.id, None)
+
         if transport_request is None:
             # There is no existing request for this transport (i.e. on this authinfo)
             transport_request = TransportRequest()
@@ -94,6 +174,7 @@ class TransportQueue:
                         # Cleanup of the stale TransportRequest with the excepted transport future
                         self._transport_requests.pop(authinfo.id, None)
                     else:
+                        self._num_opened += 1
                         transport_request.future.set_result(transport)
 
             # Save the handle so that we can cancel the callback if the user no longer wants it
@@ -105,6 +186,17 @@ class TransportQueue:
                 safe_open_interval, do_open, context=contextvars.Context()
             )  #  type: ignore[call-arg]
 
+        elif transport_request.future.done():
+            self._num_reused += 1
+
+        if not transport_request.future.done():
+            time_requested = self._loop.time()
+
+            def add_wait_time(_):
+                self._wait_time += self._loop.time() - time_requested
+
+            transport_request.future.add_done_callback(add_wait_time)
+
         try:
             transport_request.count += 1
             yield transport_request.future
@@ -121,10 +213,21 @@ class TransportQueue:
             assert transport_request.count >= 0, 'Transport request count dropped below 0!'
             # Check if there are no longer any users that want the transport
             if transport_request.count == 0:
-                if transport_request.future.done():
-                    _LOGGER.debug('Transport request closing transport for %s', authinfo)
-                    transport_request.future.result().close()
-                elif open_callback_handle is not None:
-                    open_callback_handle.cancel()
-
-                self._transport_requests.pop(authinfo.id, None)
+                if self._keep_alive > 0 and transport_request.is_open():
+                    # Keep the transport alive for a while in case another client requests it
+                    _LOGGER.debug('Transport request keeping transport alive for %s', authinfo)
+                    transport_request.close_handle = self._loop.call_later(
+                        self._keep_alive,
+                        self._close_idle_transport,
+                        authinfo.id,
+                        transport_request,
+                        context=contextvars.Context()
+                    )  #  type: ignore[call-arg]
+                else:
+                    if transport_request.future.done():
+                        _LOGGER.debug('Transport request closing transport for %s', authinfo)
+                        transport_request.future.result().close()
+                    elif open_callback_handle is not None:
+                        open_callback_handle.cancel()
+
+                    self._transport_requests.pop(authinfo.id, None)
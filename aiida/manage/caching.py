@@ -8,7 +8,7 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Definition of caching mechanism and configuration for calculations."""
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from contextlib import contextmanager, suppress
 from enum import Enum
 import keyword
@@ -28,6 +28,7 @@ class ConfigKeys(Enum):
     DEFAULT = 'caching.default_enabled'
     ENABLED = 'caching.enabled_for'
     DISABLED = 'caching.disabled_for'
+    LOOKUP_CACHE_SIZE = 'caching.lookup_cache_size'
 
 
 class _ContextCache:
@@ -94,6 +95,68 @@ class _ContextCache:
 _CONTEXT_CACHE = _ContextCache()
 
 
+class _LookupCache:
+    """Least-recently-used mapping of a node class and hash onto the pk of the last node found to be a valid cache.
+
+    This allows to skip the database query for repeated lookups of the same hash in the current interpreter. Since
+    entries can go stale, for example when the node is deleted or rehashed, the caller is responsible for verifying
+    the node that is returned and calling ``discard`` if it is no longer valid. The maximum number of entries is
+    controlled by the ``caching.lookup_cache_size`` option, where a size of zero disables the cache altogether.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def get_maxsize():
+        """Return the maximum number of entries, as defined by the configuration."""
+        return get_config_option(ConfigKeys.LOOKUP_CACHE_SIZE.value)
+
+    def get(self, key):
+        """Return the pk stored for the given key, marking it as most recently used, or ``None`` if absent."""
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return None
+        return self._entries[key]
+
+    def add(self, key, pk):
+        """Store the pk for the given key, evicting the least recently used entries if the cache is full."""
+        maxsize = self.get_maxsize()
+
+        if maxsize <= 0:
+            self._entries.clear()
+            return
+
+        self._entries[key] = pk
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key):
+        """Remove the entry for the given key if it exists."""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_LOOKUP_CACHE = _LookupCache()
+
+
+def get_lookup_cache():
+    """Return the in-process cache of recent cache hits, mapping a tuple of node class and hash onto a node pk.
+
+    :return: the `_LookupCache` instance of the current interpreter
+    """
+    return _LOOKUP_CACHE
+
+
 @contextmanager
 def enable_caching(*, identifier=None):
     """Context manager to enable caching, either for a specific node class, or globally.
@@ -354,7 +354,11 @@ class Manager:
             )
         poll_interval = 0.0 if profile.is_test_profile else config.get_option('runner.poll.interval', profile.name)
 
-        settings = {'rmq_submit': False, 'poll_interval': poll_interval}
+        settings = {
+            'rmq_submit': False,
+            'poll_interval': poll_interval,
+            'transport_keep_alive': config.get_option('transport.keep_alive', profile.name),
+        }
         settings.update(kwargs)
 
         if 'communicator' not in settings:
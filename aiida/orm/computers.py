@@ -31,6 +31,8 @@ class Computer(entities.Entity):
 
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL = 'minimum_scheduler_poll_interval'  # pylint: disable=invalid-name
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT = 10.  # pylint: disable=invalid-name
+    PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL = 'maximum_scheduler_poll_interval'  # pylint: disable=invalid-name
+    PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT = 120.  # pylint: disable=invalid-name
     PROPERTY_WORKDIR = 'workdir'
     PROPERTY_SHEBANG = 'shebang'
 
@@ -471,6 +473,32 @@ class Computer(entities.Entity):
         """
         self.set_property(self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL, interval)
 
+    def get_maximum_job_poll_interval(self):
+        """
+        Get the maximum interval between subsequent requests to update the list
+        of jobs currently running on this computer.
+
+        The interval between updates is increased up to this maximum as long as
+        none of the jobs change state. If it is smaller than the minimum interval,
+        the minimum interval is used.
+
+        :return: The maximum interval (in seconds)
+        :rtype: float
+        """
+        return self.get_property(
+            self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL, self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT
+        )
+
+    def set_maximum_job_poll_interval(self, interval):
+        """
+        Set the maximum interval between subsequent requests to update the list
+        of jobs currently running on this computer.
+
+        :param interval: The maximum interval in seconds
+        :type interval: float
+        """
+        self.set_property(self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL, interval)
+
     def get_workdir(self):
         """
         Get the working directory for this computer
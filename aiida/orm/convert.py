@@ -108,6 +108,47 @@ def _(backend_entity):
     return node_class.from_backend_entity(backend_entity)
 
 
+def get_orm_entities(backend_entities):
+    """Convert all values of the given iterable to ORM entities if they are backend ORM instances.
+
+    This is equivalent to calling :func:`get_orm_entity` on each value, but the ORM classes of nodes and groups, which
+    are loaded through their entry point from the type string, are resolved only once for each distinct type string.
+    This dominates the cost of converting a large number of entities, e.g. the batches of results of a query.
+
+    :param backend_entities: an iterable of backend entities or other values, which are returned unaltered
+    :return: a list of the converted values
+    """
+    from .groups import load_group_class
+    from .utils.node import load_node_class
+
+    node_classes = {}
+    group_classes = {}
+    converted = []
+
+    for value in backend_entities:
+        if isinstance(value, BackendNode):
+            node_type = value.node_type
+            try:
+                node_class = node_classes[node_type]
+            except KeyError:
+                node_class = node_classes[node_type] = load_node_class(node_type)
+            converted.append(node_class.from_backend_entity(value))
+        elif isinstance(value, BackendGroup):
+            type_string = value.type_string
+            try:
+                group_class = group_classes[type_string]
+            except KeyError:
+                group_class = group_classes[type_string] = load_group_class(type_string)
+            converted.append(group_class.from_backend_entity(value))
+        else:
+            try:
+                converted.append(get_orm_entity(value))
+            except TypeError:
+                converted.append(value)
+
+    return converted
+
+
 class ConvertIterator(Iterator, Sized):
     """
     Iterator that converts backend entities into frontend ORM entities as needed
@@ -17,6 +17,7 @@ from plumpy.base.utils import call_with_super_check, super_check
 from aiida.common import datastructures, exceptions
 from aiida.common.lang import classproperty, type_check
 from aiida.manage.manager import get_manager
+from aiida.orm.implementation.utils import clean_value
 
 __all__ = ('Entity', 'Collection', 'EntityAttributesMixin', 'EntityExtrasMixin')
 
@@ -323,7 +324,7 @@ class EntityAttributesMixin(abc.ABC):
         attributes = self.backend_entity.attributes
 
         if self.is_stored:
-            attributes = copy.deepcopy(attributes)
+            attributes = clean_value(attributes, trusted=True)
 
         return attributes
 
@@ -346,10 +347,10 @@ class EntityAttributesMixin(abc.ABC):
         except AttributeError:
             if default is _NO_DEFAULT:
                 raise
-            attribute = default
+            return copy.deepcopy(default) if self.is_stored else default
 
         if self.is_stored:
-            attribute = copy.deepcopy(attribute)
+            attribute = clean_value(attribute, trusted=True)
 
         return attribute
 
@@ -371,7 +372,7 @@ class EntityAttributesMixin(abc.ABC):
         attributes = self.backend_entity.get_attribute_many(keys)
 
         if self.is_stored:
-            attributes = copy.deepcopy(attributes)
+            attributes = clean_value(attributes, trusted=True)
 
         return attributes
 
@@ -482,7 +483,7 @@ class EntityExtrasMixin(abc.ABC):
         extras = self.backend_entity.extras
 
         if self.is_stored:
-            extras = copy.deepcopy(extras)
+            extras = clean_value(extras, trusted=True)
 
         return extras
 
@@ -505,10 +506,10 @@ class EntityExtrasMixin(abc.ABC):
         except AttributeError:
             if default is _NO_DEFAULT:
                 raise
-            extra = default
+            return copy.deepcopy(default) if self.is_stored else default
 
         if self.is_stored:
-            extra = copy.deepcopy(extra)
+            extra = clean_value(extra, trusted=True)
 
         return extra
 
@@ -530,7 +531,7 @@ class EntityExtrasMixin(abc.ABC):
         extras = self.backend_entity.get_extra_many(keys)
 
         if self.is_stored:
-            extras = copy.deepcopy(extras)
+            extras = clean_value(extras, trusted=True)
 
         return extras
 
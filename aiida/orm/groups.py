@@ -263,46 +263,107 @@ class Group(entities.Entity, entities.EntityExtrasMixin, metaclass=GroupMeta):
     def add_nodes(self, nodes):
         """Add a node or a set of nodes to the group.
 
+        Besides nodes, the pks of nodes or a ``QueryBuilder`` whose results are nodes (or their pks) can be passed.
+        The nodes are added with a single statement that is executed by the database, without loading the nodes
+        selected by pk or query. Nodes that are already contained in the group are ignored, as are pks that do not
+        correspond to any node.
+
         :note: all the nodes *and* the group itself have to be stored.
 
-        :param nodes: a single `Node` or a list of `Nodes`
-        :type nodes: :class:`aiida.orm.Node` or list
+        :param nodes: a single `Node` or pk, a list of `Nodes` or pks, or a `QueryBuilder` that projects a single node
+            vertex, either as the entity itself or its ``id``.
+        :type nodes: :class:`aiida.orm.Node`, int, list or :class:`aiida.orm.QueryBuilder`
         """
-        from .nodes import Node
-
         if not self.is_stored:
             raise exceptions.ModificationNotAllowed('cannot add nodes to an unstored group')
 
-        # Cannot use `collections.Iterable` here, because that would also match iterable `Node` sub classes like `List`
-        if not isinstance(nodes, (list, tuple)):
-            nodes = [nodes]
-
-        for node in nodes:
-            type_check(node, Node)
+        query = self._get_node_query(nodes)
 
-        self._backend_entity.add_nodes([node.backend_entity for node in nodes])
+        if query is not None:
+            self._backend_entity.add_nodes_from_query(*query)
 
     def remove_nodes(self, nodes):
         """Remove a node or a set of nodes to the group.
 
+        Besides nodes, the pks of nodes or a ``QueryBuilder`` whose results are nodes (or their pks) can be passed.
+        The nodes are removed with a single statement that is executed by the database. Nodes that are not contained in
+        the group are ignored.
+
         :note: all the nodes *and* the group itself have to be stored.
 
-        :param nodes: a single `Node` or a list of `Nodes`
-        :type nodes: :class:`aiida.orm.Node` or list
+        :param nodes: a single `Node` or pk, a list of `Nodes` or pks, or a `QueryBuilder` that projects a single node
+            vertex, either as the entity itself or its ``id``.
+        :type nodes: :class:`aiida.orm.Node`, int, list or :class:`aiida.orm.QueryBuilder`
         """
-        from .nodes import Node
-
         if not self.is_stored:
             raise exceptions.ModificationNotAllowed('cannot add nodes to an unstored group')
 
+        query = self._get_node_query(nodes)
+
+        if query is not None:
+            self._backend_entity.remove_nodes_from_query(*query)
+
+    @staticmethod
+    def _get_node_query(nodes):
+        """Return the query that selects the ids of the nodes passed to ``add_nodes`` or ``remove_nodes``.
+
+        :param nodes: a single `Node` or pk, a list of `Nodes` or pks, or a `QueryBuilder`
+        :return: tuple of the dictionary representation of the query and the tag of the node vertex whose ids it
+            selects, or ``None`` if no nodes were passed.
+        :raises TypeError: if any of the elements is neither a `Node` nor an integer
+        :raises ValueError: if any of the nodes is not stored or the query does not project a single node vertex
+        """
+        from .nodes import Node
+        from .querybuilder import QueryBuilder
+
+        if isinstance(nodes, QueryBuilder):
+            return nodes.as_dict(), Group._get_projected_node_tag(nodes)
+
         # Cannot use `collections.Iterable` here, because that would also match iterable `Node` sub classes like `List`
         if not isinstance(nodes, (list, tuple)):
             nodes = [nodes]
 
+        pks = []
+
         for node in nodes:
+            if isinstance(node, int) and not isinstance(node, bool):
+                pks.append(node)
+                continue
+
             type_check(node, Node)
 
-        self._backend_entity.remove_nodes([node.backend_entity for node in nodes])
+            if not node.is_stored:
+                raise ValueError('At least one of the provided nodes is unstored, stopping...')
+
+            pks.append(node.pk)
+
+        if not pks:
+            return None
+
+        builder = QueryBuilder().append(Node, filters={'id': {'in': pks}}, project='id', tag='node')
+
+        return builder.as_dict(), 'node'
+
+    @staticmethod
+    def _get_projected_node_tag(builder):
+        """Return the tag of the node vertex that is the single projection of the given query.
+
+        :raises ValueError: if the query does not project a single node vertex or its ``id``
+        """
+        data = builder.as_dict(copy=False)
+        projections = [(tag, projection) for tag, projected in data['project'].items() for projection in projected]
+
+        # Without explicit projections, the query builder projects the last vertex of the path
+        if not projections and data['path']:
+            projections = [(data['path'][-1]['tag'], {'*': {}})]
+
+        if len(projections) == 1:
+            tag, projection = projections[0]
+            orm_bases = {vertex['tag']: vertex['orm_base'] for vertex in data['path']}
+            if orm_bases.get(tag) == 'node' and list(projection) in (['id'], ['*']):
+                return tag
+
+        raise ValueError('the query should project exactly one node vertex, either as `*` or its `id`')
 
     def is_user_defined(self):
         """
@@ -184,6 +184,73 @@ class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], BackendGroup):  #
 
         self._dbmodel.dbnodes.remove(*node_pks)
 
+    def add_nodes_from_query(self, data, tag):
+        """Add the nodes selected by a query to the group with a single statement executed by the database.
+
+        The nodes are added with an ``INSERT ... SELECT ... ON CONFLICT DO NOTHING`` statement, such that nodes that are
+        already contained in the group are ignored. The statement is built with SqlAlchemy, like the query, but executed
+        through the connection of the Django ORM, see ``_execute_statement``.
+
+        :param data: the dictionary representation of a query, as returned by ``QueryBuilder.as_dict``
+        :param tag: the tag of the node vertex of the query whose ids are selected
+        """
+        from sqlalchemy import literal, select
+        from sqlalchemy.dialects.postgresql import insert
+
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        builder = self._backend.query()
+        table = builder.table_groups_nodes
+        subquery = builder.get_id_query(data, tag).subquery()
+        statement = insert(table).from_select(['dbgroup_id', 'dbnode_id'], select(literal(self.id), *subquery.c))
+        self._execute_statement(builder.get_session(), statement.on_conflict_do_nothing())
+
+    def remove_nodes_from_query(self, data, tag):
+        """Remove the nodes selected by a query from the group with a single statement executed by the database.
+
+        :param data: the dictionary representation of a query, as returned by ``QueryBuilder.as_dict``
+        :param tag: the tag of the node vertex of the query whose ids are selected
+        """
+        from sqlalchemy import and_
+
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be removed')
+
+        builder = self._backend.query()
+        table = builder.table_groups_nodes
+        query = builder.get_id_query(data, tag)
+        clause = and_(table.c.dbgroup_id == self.id, table.c.dbnode_id.in_(query.statement))
+        self._execute_statement(builder.get_session(), table.delete().where(clause))
+
+    @staticmethod
+    def _execute_statement(session, statement):
+        """Execute a SqlAlchemy statement through the connection of the Django ORM.
+
+        The statement is compiled for the dialect of the SqlAlchemy session of the query builder, but not executed in
+        that session, since it uses a different database connection. That connection would neither see the entities
+        created in a transaction that is open in the Django ORM, e.g. through ``backend.transaction()``, nor would the
+        statement be rolled back with it.
+
+        :param session: the SqlAlchemy session of the query builder
+        :param statement: the SqlAlchemy statement to execute
+        """
+        from django.db import connection, transaction
+
+        dialect = session.bind.dialect
+        compiled = statement.compile(dialect=dialect, compile_kwargs={'render_postcompile': True})
+        params = compiled.construct_params()
+
+        # Convert the values of the parameters as SqlAlchemy does when executing the statement, e.g. serialize JSON
+        for key, value in params.items():
+            processor = compiled.binds[key].type.dialect_impl(dialect).bind_processor(dialect)
+            if processor is not None:
+                params[key] = processor(value)
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(str(compiled), params)
+
 
 class DjangoGroupCollection(BackendGroupCollection):
     """The Django Group collection"""
@@ -91,6 +91,44 @@ class DjangoLogCollection(BackendLogCollection):
 
     ENTITY_CLASS = DjangoLog
 
+    def bulk_store(self, logs, batch_size=None):
+        """Store a list of unstored log entries in bulk.
+
+        The entries are created with ``bulk_create``, which on PostgreSQL uses a multi-row ``INSERT ... RETURNING``
+        statement per batch such that the primary keys are set on the model instances.
+
+        :param logs: list of unstored `DjangoLog` instances to store
+        :param batch_size: maximum number of rows to insert per database statement. Defaults to ``db.batch_size``.
+        :return: the list of stored log entries
+
+        :raises `~aiida.common.exceptions.IntegrityError`: if the entries could not be stored, e.g. because a node
+            that they refer to does not exist
+        """
+        from django.db import IntegrityError, transaction
+
+        from aiida.common.lang import type_check
+        from aiida.manage.configuration import get_config_option
+
+        batch_size = batch_size or get_config_option('db.batch_size')
+
+        for log in logs:
+            type_check(log, DjangoLog)
+            if log.is_stored:
+                raise exceptions.ModificationNotAllowed(f'log<{log.id}> is already stored')
+
+        dbmodels = [log.dbmodel for log in logs]
+
+        try:
+            with transaction.atomic():
+                models.DbLog.objects.bulk_create(dbmodels, batch_size=batch_size)
+        except IntegrityError as exception:
+            for dbmodel in dbmodels:
+                dbmodel.pk = None
+                dbmodel._state.adding = True  # pylint: disable=protected-access
+            raise exceptions.IntegrityError(f'failed to store the logs: {exception}') from exception
+
+        return logs
+
     def delete(self, log_id):
         """
         Remove a Log entry from the collection with the given id
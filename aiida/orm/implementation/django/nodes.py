@@ -241,3 +241,76 @@ class DjangoNodeCollection(BackendNodeCollection):
             models.DbNode.objects.filter(pk=pk).delete()  # pylint: disable=no-member
         except ObjectDoesNotExist:
             raise exceptions.NotExistent(f"Node with pk '{pk}' not found") from ObjectDoesNotExist
+
+    def bulk_store(self, nodes, links=None, with_transaction=True, clean=True, batch_size=None):
+        """Store a list of unstored nodes, and links between them or to already stored nodes, in bulk.
+
+        The nodes and links are created with ``bulk_create``, which on PostgreSQL uses a multi-row ``INSERT ...
+        RETURNING`` statement per batch such that the primary keys are set on the model instances.
+
+        :param nodes: list of unstored `DjangoNode` instances to store
+        :param links: optional list of tuples ``(source, target, link_type, link_label)`` where ``source`` and
+            ``target`` are `DjangoNode` instances, that are either already stored or part of ``nodes``
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        :param batch_size: maximum number of rows to insert per database statement. Defaults to ``db.batch_size``.
+        :return: the list of stored nodes
+        """
+        import contextlib
+
+        from aiida.manage.configuration import get_config_option
+
+        batch_size = batch_size or get_config_option('db.batch_size')
+
+        for node in nodes:
+            type_check(node, DjangoNode)
+            if node.is_stored:
+                raise exceptions.ModificationNotAllowed(f'node<{node.id}> is already stored')
+            if clean:
+                node.clean_values()
+
+        dbmodels = [node.dbmodel for node in nodes]
+
+        try:
+            with transaction.atomic() if with_transaction else contextlib.nullcontext():
+                models.DbNode.objects.bulk_create(dbmodels, batch_size=batch_size)
+                dblinks = [
+                    models.DbLink(input_id=source.id, output_id=target.id, label=link_label, type=link_type.value)
+                    for source, target, link_type, link_label in links or []
+                ]
+                models.DbLink.objects.bulk_create(dblinks, batch_size=batch_size)
+        except IntegrityError as exception:
+            for dbmodel in dbmodels:
+                dbmodel.pk = None
+                dbmodel._state.adding = True  # pylint: disable=protected-access
+            raise exceptions.IntegrityError(f'failed to store the nodes: {exception}') from exception
+
+        return nodes
+
+    def bulk_set_extra(self, key, values, batch_size=None):
+        """Set the extra with the given key on many stored nodes at once, without loading the nodes.
+
+        The values are written with an ``UPDATE ... FROM (VALUES ...)`` statement per batch.
+
+        :param key: key of the extra to set
+        :param values: dictionary mapping the pk of each node onto the value of the extra for that node
+        :param batch_size: maximum number of rows to update per database statement. Defaults to ``db.batch_size``.
+        """
+        from django.db import connection
+
+        from aiida.common import json
+        from aiida.manage.configuration import get_config_option
+
+        batch_size = batch_size or get_config_option('db.batch_size')
+        rows = [(pk, json.dumps(clean_value(value))) for pk, value in values.items()]
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for index in range(0, len(rows), batch_size):
+                    batch = rows[index:index + batch_size]
+                    placeholders = ', '.join(['(%s, %s::jsonb)'] * len(batch))
+                    cursor.execute(
+                        'UPDATE db_dbnode SET extras = jsonb_set(coalesce(extras, \'{}\'::jsonb), %s, new_values.value) '
+                        f'FROM (VALUES {placeholders}) AS new_values (id, value) WHERE db_dbnode.id = new_values.id',
+                        [[key]] + [param for row in batch for param in row]
+                    )
@@ -191,6 +191,26 @@ class BackendGroup(BackendEntity, BackendEntityExtrasMixin):
         if any(not isinstance(node, BackendNode) for node in nodes):
             raise TypeError(f'nodes have to be of type {BackendNode}')
 
+    @abc.abstractmethod
+    def add_nodes_from_query(self, data, tag):
+        """Add the nodes selected by a query to the group with a single statement executed by the database.
+
+        Nodes that are already contained in the group are ignored.
+
+        :param data: the dictionary representation of a query, as returned by ``QueryBuilder.as_dict``
+        :param tag: the tag of the node vertex of the query whose ids are selected
+        """
+
+    @abc.abstractmethod
+    def remove_nodes_from_query(self, data, tag):
+        """Remove the nodes selected by a query from the group with a single statement executed by the database.
+
+        Nodes that are not contained in the group are ignored.
+
+        :param data: the dictionary representation of a query, as returned by ``QueryBuilder.as_dict``
+        :param tag: the tag of the node vertex of the query whose ids are selected
+        """
+
     def __repr__(self):
         return f'<{self.__class__.__name__}: {str(self)}>'
 
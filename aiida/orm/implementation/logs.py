@@ -96,6 +96,20 @@ class BackendLogCollection(BackendCollection[BackendLog]):
 
     ENTITY_CLASS = BackendLog
 
+    @abc.abstractmethod
+    def bulk_store(self, logs, batch_size=None):
+        """Store a list of unstored log entries in bulk.
+
+        The entries are inserted with a limited number of database statements, instead of one per entry.
+
+        :param logs: list of unstored `BackendLog` instances to store
+        :param batch_size: maximum number of rows to insert per database statement. Defaults to ``db.batch_size``.
+        :return: the list of stored log entries
+
+        :raises `~aiida.common.exceptions.IntegrityError`: if the entries could not be stored, e.g. because a node
+            that they refer to does not exist
+        """
+
     @abc.abstractmethod
     def delete(self, log_id):
         """
@@ -202,3 +202,29 @@ class BackendNodeCollection(BackendCollection[BackendNode]):
 
         :param pk: id of the node to delete
         """
+
+    @abc.abstractmethod
+    def bulk_store(self, nodes, links=None, with_transaction=True, clean=True, batch_size=None):
+        """Store a list of unstored nodes, and links between them or to already stored nodes, in bulk.
+
+        The nodes and links are inserted with a limited number of database statements, instead of one per entity.
+
+        :param nodes: list of unstored `BackendNode` instances to store
+        :param links: optional list of tuples ``(source, target, link_type, link_label)`` where ``source`` and
+            ``target`` are `BackendNode` instances, that are either already stored or part of ``nodes``
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        :param batch_size: maximum number of rows to insert per database statement. Defaults to ``db.batch_size``.
+        :return: the list of stored nodes
+        """
+
+    @abc.abstractmethod
+    def bulk_set_extra(self, key, values, batch_size=None):
+        """Set the extra with the given key on many stored nodes at once, without loading the nodes.
+
+        The values are written with a limited number of database statements, instead of one per node.
+
+        :param key: key of the extra to set
+        :param values: dictionary mapping the pk of each node onto the value of the extra for that node
+        :param batch_size: maximum number of rows to update per database statement. Defaults to ``db.batch_size``.
+        """
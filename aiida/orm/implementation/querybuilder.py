@@ -124,6 +124,24 @@ class BackendQueryBuilder(abc.ABC):
     def iterdict(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, Dict[str, Any]]]:
         """Return an iterator over all the results of a list of dictionaries."""
 
+    @abc.abstractmethod
+    def itercolumns(self, data: QueryDictType, batch_size: int) -> Iterable[Dict[str, Dict[str, List[Any]]]]:
+        """Return an iterator over the results in batches of columns.
+
+        Each batch is a dictionary of the values of the projections, keyed by tag and projection as for `iterdict`,
+        which is more efficient to convert to arrays than the rows of results.
+
+        :param batch_size: the maximum number of results in each batch, which are fetched from the database at once
+        """
+
+    @abc.abstractmethod
+    def get_column_types(self, data: QueryDictType) -> Dict[str, Dict[str, Optional[type]]]:
+        """Return the types of the values of the projections, keyed by tag and projection as for `iterdict`.
+
+        :return: ``int``, ``float`` or ``bool`` for projections of numerical or boolean columns, including the
+            attributes that are cast to these types, or ``None`` for any other type
+        """
+
     def as_sql(self, data: QueryDictType, inline: bool = False) -> str:
         """Convert the query to an SQL string representation.
 
@@ -281,6 +281,51 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], BackendGroup):  # pylint: dis
 
             session.commit()
 
+    def add_nodes_from_query(self, data, tag):
+        """Add the nodes selected by a query to the group with a single statement executed by the database.
+
+        The nodes are added with an ``INSERT ... SELECT ... ON CONFLICT DO NOTHING`` statement, such that nodes that are
+        already contained in the group are ignored.
+
+        :param data: the dictionary representation of a query, as returned by ``QueryBuilder.as_dict``
+        :param tag: the tag of the node vertex of the query whose ids are selected
+        """
+        from sqlalchemy import literal, select
+        from sqlalchemy.dialects.postgresql import insert  # pylint: disable=import-error, no-name-in-module
+
+        from aiida.backends.sqlalchemy import get_scoped_session
+
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        subquery = self._backend.query().get_id_query(data, tag).subquery()
+        statement = insert(table_groups_nodes).from_select(['dbgroup_id', 'dbnode_id'],
+                                                           select(literal(self.id), *subquery.c))
+
+        with utils.disable_expire_on_commit(get_scoped_session()) as session:
+            session.execute(statement.on_conflict_do_nothing(index_elements=['dbnode_id', 'dbgroup_id']))
+            session.commit()
+
+    def remove_nodes_from_query(self, data, tag):
+        """Remove the nodes selected by a query from the group with a single statement executed by the database.
+
+        :param data: the dictionary representation of a query, as returned by ``QueryBuilder.as_dict``
+        :param tag: the tag of the node vertex of the query whose ids are selected
+        """
+        from sqlalchemy import and_
+
+        from aiida.backends.sqlalchemy import get_scoped_session
+
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be removed')
+
+        query = self._backend.query().get_id_query(data, tag)
+        clause = and_(table_groups_nodes.c.dbgroup_id == self.id, table_groups_nodes.c.dbnode_id.in_(query.statement))
+
+        with utils.disable_expire_on_commit(get_scoped_session()) as session:
+            session.execute(table_groups_nodes.delete().where(clause))
+            session.commit()
+
 
 class SqlaGroupCollection(BackendGroupCollection):
     """The SLQA collection of groups"""
@@ -94,6 +94,81 @@ class SqlaLogCollection(BackendLogCollection):
 
     ENTITY_CLASS = SqlaLog
 
+    def bulk_store(self, logs, batch_size=None):
+        """Store a list of unstored log entries in bulk.
+
+        The entries are inserted with a multi-row ``INSERT ... RETURNING`` statement per batch, after which the existing
+        model instances are attached to the session as persistent instances, such that no additional query is needed.
+        As for storing a single entry, the changes are only committed if not within an open transaction.
+
+        :param logs: list of unstored `SqlaLog` instances to store
+        :param batch_size: maximum number of rows to insert per database statement. Defaults to ``db.batch_size``.
+        :return: the list of stored log entries
+
+        :raises `~aiida.common.exceptions.IntegrityError`: if the entries could not be stored, e.g. because a node
+            that they refer to does not exist
+        """
+        from sqlalchemy import insert
+        from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+        from sqlalchemy.orm import make_transient, make_transient_to_detached
+
+        from aiida.common import timezone
+        from aiida.common.lang import type_check
+        from aiida.common.utils import get_new_uuid
+        from aiida.manage.configuration import get_config_option
+
+        session = get_scoped_session()
+        batch_size = batch_size or get_config_option('db.batch_size')
+        table_log = models.DbLog.__table__
+
+        for log in logs:
+            type_check(log, SqlaLog)
+            if log.is_stored:
+                raise exceptions.ModificationNotAllowed(f'log<{log.id}> is already stored')
+
+        try:
+            for index in range(0, len(logs), batch_size):
+                batch = [log.dbmodel for log in logs[index:index + batch_size]]
+                rows = []
+
+                for dbmodel in batch:
+                    dbmodel.uuid = dbmodel.uuid or get_new_uuid()
+                    dbmodel.time = dbmodel.time or timezone.now()
+                    rows.append({
+                        'uuid': dbmodel.uuid,
+                        'time': dbmodel.time,
+                        'loggername': dbmodel.loggername,
+                        'levelname': dbmodel.levelname,
+                        'dbnode_id': dbmodel.dbnode_id,
+                        'message': dbmodel.message,
+                        'metadata': dbmodel._metadata,  # pylint: disable=protected-access
+                    })
+
+                statement = insert(table_log).values(rows).returning(table_log.c.uuid, table_log.c.id)
+                pks = {str(uuid): pk for uuid, pk in session.execute(statement)}
+
+                for dbmodel in batch:
+                    dbmodel.id = pks[str(dbmodel.uuid)]
+                    make_transient_to_detached(dbmodel)
+                    session.add(dbmodel)
+
+            if not utils.ModelWrapper._in_transaction():  # pylint: disable=protected-access
+                session.commit()
+        except SQLAlchemyError as exception:
+            # Detach the models before rolling back, such that they are not expired and retain their unstored state
+            for log in logs:
+                dbmodel = log.dbmodel
+                if dbmodel in session:
+                    session.expunge(dbmodel)
+                    make_transient(dbmodel)
+                dbmodel.id = None
+            session.rollback()
+            if isinstance(exception, IntegrityError):
+                raise exceptions.IntegrityError(f'failed to store the logs: {exception}') from exception
+            raise
+
+        return logs
+
     def delete(self, log_id):
         """
         Remove a Log entry from the collection with the given id
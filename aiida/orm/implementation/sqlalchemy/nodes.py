@@ -12,14 +12,14 @@
 # pylint: disable=no-name-in-module,import-error
 from datetime import datetime
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm.exc import NoResultFound
 
 from aiida.backends.sqlalchemy import get_scoped_session
 from aiida.backends.sqlalchemy.models import node as models
 from aiida.common import exceptions
 from aiida.common.lang import type_check
-from aiida.orm.implementation.utils import clean_value
+from aiida.orm.implementation.utils import clean_value, validate_attribute_extra_key
 
 from . import entities
 from . import utils as sqla_utils
@@ -169,7 +169,9 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
             raise exceptions.ModificationNotAllowed('source node has to be stored when adding a link from it')
 
         self._add_link(source, link_type, link_label)
-        session.commit()
+
+        if not sqla_utils.ModelWrapper._in_transaction():  # pylint: disable=protected-access
+            session.commit()
 
     def _add_link(self, source, link_type, link_label):
         """Add a link of the given type from a given node to ourself.
@@ -189,6 +191,56 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         except SQLAlchemyError as exception:
             raise exceptions.UniquenessError(f'failed to create the link: {exception}') from exception
 
+    def set_attribute(self, key, value):
+        """Set an attribute to the given value.
+
+        :param key: name of the attribute
+        :param value: value of the attribute
+        """
+        if not self.is_stored:
+            super().set_attribute(key, value)
+        else:
+            self.set_attribute_many({key: value})
+
+    def set_attribute_many(self, attributes):
+        """Set multiple attributes.
+
+        .. note:: This will override any existing attributes that are present in the new dictionary.
+
+        If the node is stored, only the given attributes are sent to the database, where they are merged into the
+        existing attributes, instead of all attributes of the node being written.
+
+        :param attributes: a dictionary with the attributes to set
+        """
+        # pylint: disable=import-error,no-name-in-module
+        from sqlalchemy import cast, func, inspect, update
+        from sqlalchemy.dialects.postgresql import JSONB
+
+        if not self.is_stored:
+            super().set_attribute_many(attributes)
+            return
+
+        for key in attributes:
+            validate_attribute_extra_key(key)
+
+        attributes = {key: clean_value(value) for key, value in attributes.items()}
+        session = get_scoped_session()
+        table_node = models.DbNode.__table__
+        merged = func.coalesce(table_node.c.attributes, cast({}, JSONB)).op('||')(cast(attributes, JSONB))
+
+        try:
+            session.execute(update(table_node).where(table_node.c.id == self.id).values(attributes=merged))
+        except SQLAlchemyError:
+            session.rollback()
+            raise
+
+        if sqla_utils.ModelWrapper._in_transaction():  # pylint: disable=protected-access
+            # The attributes of the model are not refreshed from the database within a transaction
+            if 'attributes' not in inspect(self.dbmodel).unloaded:
+                self.dbmodel.attributes.update(attributes)
+        else:
+            session.commit()
+
     def clean_values(self):
         self._dbmodel.attributes = clean_value(self._dbmodel.attributes)
         self._dbmodel.extras = clean_value(self._dbmodel.extras)
@@ -211,7 +263,10 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
             for link_triple in links:
                 self._add_link(*link_triple)
 
-        if with_transaction:
+        if with_transaction and sqla_utils.ModelWrapper._in_transaction():  # pylint: disable=protected-access
+            # Leave the commit to the transaction that is already open, but flush to have the node assigned its pk
+            session.flush()
+        elif with_transaction:
             try:
                 session.commit()
             except SQLAlchemyError:
@@ -250,3 +305,129 @@ class SqlaNodeCollection(BackendNodeCollection):
             session.commit()
         except NoResultFound:
             raise exceptions.NotExistent(f"Node with pk '{pk}' not found") from NoResultFound
+
+    def bulk_store(self, nodes, links=None, with_transaction=True, clean=True, batch_size=None):
+        """Store a list of unstored nodes, and links between them or to already stored nodes, in bulk.
+
+        The nodes are inserted with a multi-row ``INSERT ... RETURNING`` statement per batch, after which the existing
+        model instances are attached to the session as persistent instances, such that no additional query is needed.
+        The links are subsequently inserted with a multi-row ``INSERT`` statement per batch.
+
+        :param nodes: list of unstored `SqlaNode` instances to store
+        :param links: optional list of tuples ``(source, target, link_type, link_label)`` where ``source`` and
+            ``target`` are `SqlaNode` instances, that are either already stored or part of ``nodes``
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        :param batch_size: maximum number of rows to insert per database statement. Defaults to ``db.batch_size``.
+        :return: the list of stored nodes
+        """
+        # pylint: disable=too-many-locals
+        from sqlalchemy import insert
+        from sqlalchemy.orm import make_transient, make_transient_to_detached
+
+        from aiida.common import timezone
+        from aiida.manage.configuration import get_config_option
+
+        session = get_scoped_session()
+        batch_size = batch_size or get_config_option('db.batch_size')
+        table_node = models.DbNode.__table__
+        table_link = models.DbLink.__table__
+
+        for node in nodes:
+            type_check(node, SqlaNode)
+            if node.is_stored:
+                raise exceptions.ModificationNotAllowed(f'node<{node.id}> is already stored')
+            if clean:
+                node.clean_values()
+
+        try:
+            for index in range(0, len(nodes), batch_size):
+                batch = [node.dbmodel for node in nodes[index:index + batch_size]]
+                rows = []
+
+                for dbmodel in batch:
+                    dbmodel.mtime = dbmodel.mtime or timezone.now()
+                    rows.append({
+                        'uuid': dbmodel.uuid,
+                        'node_type': dbmodel.node_type,
+                        'process_type': dbmodel.process_type,
+                        'label': dbmodel.label,
+                        'description': dbmodel.description,
+                        'ctime': dbmodel.ctime,
+                        'mtime': dbmodel.mtime,
+                        'attributes': dbmodel.attributes,
+                        'extras': dbmodel.extras,
+                        'repository_metadata': dbmodel.repository_metadata or {},
+                        'dbcomputer_id': dbmodel.dbcomputer.id if dbmodel.dbcomputer is not None else None,
+                        'user_id': dbmodel.user.id,
+                    })
+
+                statement = insert(table_node).values(rows).returning(table_node.c.uuid, table_node.c.id)
+                pks = {str(uuid): pk for uuid, pk in session.execute(statement)}
+
+                for dbmodel in batch:
+                    dbmodel.id = pks[str(dbmodel.uuid)]
+                    make_transient_to_detached(dbmodel)
+                    session.add(dbmodel)
+
+            links = links or []
+
+            for index in range(0, len(links), batch_size):
+                rows = [{
+                    'input_id': source.id,
+                    'output_id': target.id,
+                    'label': link_label,
+                    'type': link_type.value
+                } for source, target, link_type, link_label in links[index:index + batch_size]]
+                session.execute(insert(table_link).values(rows))
+
+            if with_transaction:
+                session.commit()
+        except SQLAlchemyError as exception:
+            # Detach the models before rolling back, such that they are not expired and retain their unstored state
+            for node in nodes:
+                dbmodel = node.dbmodel
+                if dbmodel in session:
+                    session.expunge(dbmodel)
+                    make_transient(dbmodel)
+                dbmodel.id = None
+            session.rollback()
+            if isinstance(exception, IntegrityError):
+                raise exceptions.IntegrityError(f'failed to store the nodes: {exception}') from exception
+            raise
+
+        return nodes
+
+    def bulk_set_extra(self, key, values, batch_size=None):
+        """Set the extra with the given key on many stored nodes at once, without loading the nodes.
+
+        The values are written with an ``UPDATE ... FROM (VALUES ...)`` statement per batch.
+
+        :param key: key of the extra to set
+        :param values: dictionary mapping the pk of each node onto the value of the extra for that node
+        :param batch_size: maximum number of rows to update per database statement. Defaults to ``db.batch_size``.
+        """
+        from sqlalchemy import Integer, Text, cast, column, func, update
+        from sqlalchemy import values as values_clause
+        from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+        from aiida.manage.configuration import get_config_option
+
+        session = get_scoped_session()
+        batch_size = batch_size or get_config_option('db.batch_size')
+        table_node = models.DbNode.__table__
+        rows = [(pk, clean_value(value)) for pk, value in values.items()]
+
+        try:
+            for index in range(0, len(rows), batch_size):
+                new_values = values_clause(column('id', Integer), column('value', JSONB), name='new_values')
+                new_values = new_values.data(rows[index:index + batch_size])
+                extras = func.jsonb_set(
+                    func.coalesce(table_node.c.extras, cast({}, JSONB)), cast([key], ARRAY(Text)),
+                    cast(new_values.c.value, JSONB)
+                )
+                session.execute(update(table_node).where(table_node.c.id == new_values.c.id).values(extras=extras))
+            session.commit()
+        except SQLAlchemyError:
+            session.rollback()
+            raise
@@ -9,16 +9,19 @@
 ###########################################################################
 # pylint: disable=too-many-lines
 """Sqla query builder implementation"""
+from collections import OrderedDict
 from contextlib import contextmanager
+from datetime import date, datetime
 from functools import partial
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 import uuid
 import warnings
 
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam
 from sqlalchemy import func as sa_func
-from sqlalchemy import not_, or_
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import not_, or_, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.exc import SAWarning
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import aliased
@@ -30,6 +33,7 @@ from sqlalchemy.sql.compiler import SQLCompiler, TypeCompiler
 from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList, Cast, ColumnClause, ColumnElement, Label
 from sqlalchemy.sql.expression import case, text
 from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.selectable import Select
 from sqlalchemy.types import Boolean, DateTime, Float, Integer, String
 
 from aiida.common.exceptions import NotExistent
@@ -37,8 +41,37 @@ from aiida.orm.implementation.querybuilder import QUERYBUILD_LOGGER, BackendQuer
 
 from .joiner import SqlaJoiner
 
+# Operators of filters whose value does not affect the built query, such that it can be passed as a bound parameter
+PARAMETER_OPERATORS = ('==', '>', '<', '>=', '=>', '<=', '=<', 'like', 'ilike', 'in')
+# Types of the values of filters that can be passed as a bound parameter
+PARAMETER_TYPES = (bool, int, float, str, date, datetime)
+
+
+class CachedQuery(NamedTuple):
+    """A built query, whose filter values are bound parameters, and the mappings required to process its results."""
+    query: Query
+    statement: Select
+    tag_to_alias: Dict[str, Optional[AliasedClass]]
+    tag_to_projected_fields: Dict[str, Dict[str, int]]
+    requested_projections: int
+
+
+# Built queries keyed on the class of the query builder and the structure of the query specification, in which the
+# values of the filters are replaced by bound parameters. Queries that only differ in those values, e.g. the same query
+# for different pks executed in a loop, therefore only have to be built once, see ``SqlaQueryBuilder._update_query``.
+_QUERY_CACHE: 'OrderedDict[Tuple[type, str], CachedQuery]' = OrderedDict()
+_QUERY_CACHE_MAXSIZE = 1000
+# The cache is shared by all threads, e.g. those serving the requests of the REST API
+_QUERY_CACHE_LOCK = threading.Lock()
+
+
+def _copy_projected_fields(tag_to_projected_fields: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """Return a copy of the mapping of tags onto their projected fields, copying the mapping of each tag."""
+    return {tag: dict(projected_fields) for tag, projected_fields in tag_to_projected_fields.items()}
+
 
 class jsonb_array_length(FunctionElement):  # pylint: disable=abstract-method,invalid-name
+    inherit_cache = True
     name = 'jsonb_array_len'
 
 
@@ -51,6 +84,7 @@ def compile(element, compiler: TypeCompiler, **kwargs):  # pylint: disable=funct
 
 
 class array_length(FunctionElement):  # pylint: disable=abstract-method,invalid-name
+    inherit_cache = True
     name = 'array_len'
 
 
@@ -63,6 +97,7 @@ def compile(element, compiler: TypeCompiler, **kwargs):  # pylint: disable=funct
 
 
 class jsonb_typeof(FunctionElement):  # pylint: disable=abstract-method,invalid-name
+    inherit_cache = True
     name = 'jsonb_typeof'
 
 
@@ -112,8 +147,13 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             'distinct': False
         }
         self._query: 'Query' = Query([])
-        # Hashing the internal query representation avoids rebuilding a query
-        self._hash: Optional[str] = None
+        # The statement of the query without the values of its bound parameters, which are passed on execution instead
+        self._statement: Select = select()
+        # The key of the built query in the cache and the values of its bound parameters, to avoid rebinding a query
+        self._key: Optional[Tuple[type, str]] = None
+        self._parameters: Dict[str, Any] = {}
+        # mapping of (id of filter dictionary, key of the value) -> name of bound parameter, used when building a query
+        self._filter_parameters: Dict[Tuple[int, str], str] = {}
 
     def set_field_mappings(self):
         """Set conversions between the field names in the database and used by the `QueryBuilder`"""
@@ -175,13 +215,14 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         return self._backend.get_session()
 
     def count(self, data: QueryDictType) -> int:
-        with self.use_query(data) as query:
-            result = query.count()
+        with self.use_query(data):
+            statement = select(sa_func.count()).select_from(self._statement.subquery())
+            result = self.get_session().execute(statement, self._parameters).scalar()
         return result
 
     def first(self, data: QueryDictType) -> Optional[List[Any]]:
-        with self.use_query(data) as query:
-            result = query.first()
+        with self.use_query(data):
+            result = self.get_session().execute(self._statement.limit(1), self._parameters).first()
 
         if result is None:
             return result
@@ -202,63 +243,290 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         """Return an iterator over all the results of a list of lists."""
         with self.use_query(data) as query:
 
-            stmt = query.statement.execution_options(yield_per=batch_size)
+            # The execution options are not set on the statement itself, such that its cache key is only generated once
+            result = self.get_session().execute(
+                self._statement, self._parameters, execution_options={'yield_per': batch_size}
+            )
+            # we discard the first item of the result row,
+            # which is what the query was initialised with
+            # and not one of the requested projection (see self._build)
+            converters = [self._get_column_converter(description) for description in query.column_descriptions][1:]
 
-            for resultrow in self.get_session().execute(stmt):
-                # we discard the first item of the result row,
-                # which is what the query was initialised with
-                # and not one of the requested projection (see self._build)
-                resultrow = resultrow[1:]
-                yield [self.to_backend(rowitem) for rowitem in resultrow]
+            for resultrow in result:
+                yield [
+                    rowitem if converter is None else converter(rowitem)
+                    for converter, rowitem in zip(converters, resultrow[1:])
+                ]
 
     def iterdict(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, Dict[str, Any]]]:
         """Return an iterator over all the results of a list of dictionaries."""
         with self.use_query(data) as query:
 
-            stmt = query.statement.execution_options(yield_per=batch_size)
+            result = self.get_session().execute(
+                self._statement, self._parameters, execution_options={'yield_per': batch_size}
+            )
+            projected_fields = self._get_projected_fields()
+            converters = [self._get_column_converter(description) for description in query.column_descriptions]
 
-            for row in self.get_session().execute(stmt):
+            for row in result:
                 # build the yield result
                 yield_result: Dict[str, Dict[str, Any]] = {}
-                for tag, projected_entities_dict in self._tag_to_projected_fields.items():
+                for tag, fields in projected_fields.items():
+                    yield_result[tag] = {}
+                    for field_name, project_index in fields.items():
+                        converter = converters[project_index]
+                        value = row[project_index]
+                        yield_result[tag][field_name] = value if converter is None else converter(value)
+                yield yield_result
+
+    def itercolumns(self, data: QueryDictType, batch_size: int) -> Iterable[Dict[str, Dict[str, List[Any]]]]:
+        with self.use_query(data) as query:
+
+            result = self.get_session().execute(
+                self._statement, self._parameters, execution_options={'yield_per': batch_size}
+            )
+            projected_fields = self._get_projected_fields()
+            converters = [self._get_column_converter(description) for description in query.column_descriptions]
+
+            for rows in result.partitions():
+                columns = list(zip(*rows))
+                yield_result: Dict[str, Dict[str, List[Any]]] = {}
+                for tag, fields in projected_fields.items():
                     yield_result[tag] = {}
-                    for attrkey, project_index in projected_entities_dict.items():
-                        field_name = self.get_corresponding_property(
-                            self.get_table_name(self._get_tag_alias(tag)), attrkey, self.inner_to_outer_schema
+                    for field_name, project_index in fields.items():
+                        converter = converters[project_index]
+                        column = columns[project_index]
+                        yield_result[tag][field_name] = list(column) if converter is None else list(
+                            map(converter, column)
                         )
-                        yield_result[tag][field_name] = self.to_backend(row[project_index])
                 yield yield_result
 
+    def get_column_types(self, data: QueryDictType) -> Dict[str, Dict[str, Optional[type]]]:
+        with self.use_query(data) as query:
+            descriptions = query.column_descriptions
+            projected_fields = self._get_projected_fields()
+
+        column_types: Dict[str, Dict[str, Optional[type]]] = {}
+        for tag, fields in projected_fields.items():
+            column_types[tag] = {}
+            for field_name, project_index in fields.items():
+                column_type = descriptions[project_index]['type']
+                # Note that `Boolean` has to be checked before `Integer`
+                for sqla_type, python_type in ((Boolean, bool), (Integer, int), (Float, float)):
+                    if isinstance(column_type, sqla_type):
+                        column_types[tag][field_name] = python_type
+                        break
+                else:
+                    column_types[tag][field_name] = None
+
+        return column_types
+
+    def _get_projected_fields(self) -> Dict[str, Dict[str, int]]:
+        """Return the mapping of tag -> name of the projected property -> index of the projection in a result row."""
+        return {
+            tag: {
+                self.get_corresponding_property(
+                    self.get_table_name(self._get_tag_alias(tag)), attrkey, self.inner_to_outer_schema
+                ): project_index for attrkey, project_index in projected_entities_dict.items()
+            } for tag, projected_entities_dict in self._tag_to_projected_fields.items()
+        }
+
+    def _get_column_converter(self, description: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """Return the function that converts the values of a projection to backend specific objects.
+
+        :param description: the description of the projection by `Query.column_descriptions`
+        :return: the function or ``None`` if the values do not need to be converted
+        """
+        column_type = description['type']
+
+        # The projection of an entire entity, i.e. ``*``, for which the type is the ORM class
+        if isinstance(column_type, type):
+            return self.to_backend
+
+        if isinstance(column_type, UUID):
+            return lambda value: value if value is None else str(value)
+
+        return None
+
     @contextmanager
-    def use_query(self, data: QueryDictType) -> Iterator[Query]:
-        """Yield the built query."""
-        query = self._update_query(data)
+    def use_query(self, data: QueryDictType, parameters: bool = True) -> Iterator[Query]:
+        """Yield the built query.
+
+        :param parameters: whether the values of the filters are bound parameters, whose values have to be passed when
+            executing the query, see ``_update_query``
+        """
+        query = self._update_query(data, parameters)
         try:
             yield query
         except Exception:
             self.get_session().close()
             raise
 
-    def _update_query(self, data: QueryDictType) -> Query:
+    def get_id_query(self, data: QueryDictType, tag: str) -> Query:
+        """Return the query that selects only the ``id`` column of the vertex with the given tag.
+
+        The joins, filters, ordering, limit and offset of the query specification are retained, such that the returned
+        query can be used as a sub query of other statements, which are then executed entirely by the database.
+
+        :param tag: the tag of the vertex whose ``id`` column to select
+        """
+        with self.use_query(data, parameters=False) as query:
+            return query.with_entities(self._get_tag_alias(tag).id)
+
+    def _update_query(self, data: QueryDictType, parameters: bool = True) -> Query:
         """Return the sqlalchemy.orm.Query instance for the current query specification.
 
-        To avoid unnecessary re-builds of the query, the hashed dictionary representation of this instance
-        is compared to the last query returned, which is cached by its hash.
+        To avoid unnecessary re-builds of the query, queries are cached by the structure of their specification, where
+        the values of the filters are replaced by bound parameters. A query that only differs in these values from one
+        that was built before is therefore not built again, but the cached query is used with the new values, which
+        have to be passed when executing its statement: ``session.execute(self._statement, self._parameters)``.
+
+        :param parameters: whether to use bound parameters for the values of the filters. If ``False``, the query is
+            built with the values themselves and not cached, such that it can also be embedded in other statements.
         """
-        from aiida.common.hashing import make_hash
+        if not parameters:
+            self._data = data
+            self._build()
+            self._statement = self._query.statement
+            self._key = None
+            self._parameters = {}
+            return self._query
 
-        query_hash = make_hash(data)
+        key, filter_parameters, values = self._get_query_key(data)
+        cache_key = (type(self), key)
 
-        if self._query and self._hash and self._hash == query_hash:
+        if self._key == cache_key and self._parameters == values:
             # query is up-to-date
             return self._query
 
         self._data = data
-        self._build()
-        self._hash = query_hash
+
+        with _QUERY_CACHE_LOCK:
+            cached = _QUERY_CACHE.get(cache_key, None)
+            if cached is not None:
+                # Mark the query as the most recently used one
+                _QUERY_CACHE.move_to_end(cache_key)
+
+        if cached is None:
+            self._filter_parameters = filter_parameters
+            try:
+                self._build()
+            finally:
+                self._filter_parameters = {}
+
+            # The session is not cached, since it can change between queries. The mappings are copied, such that they
+            # are not shared with this instance, which could modify them.
+            cached = CachedQuery(
+                self._query.with_session(None), self._query.statement, dict(self._tag_to_alias),
+                _copy_projected_fields(self._tag_to_projected_fields), self._requested_projections
+            )
+
+            with _QUERY_CACHE_LOCK:
+                _QUERY_CACHE[cache_key] = cached
+                while len(_QUERY_CACHE) > _QUERY_CACHE_MAXSIZE:
+                    _QUERY_CACHE.popitem(last=False)
+        else:
+            self._query = cached.query.with_session(self.get_session())
+            self._tag_to_alias = dict(cached.tag_to_alias)
+            self._tag_to_projected_fields = _copy_projected_fields(cached.tag_to_projected_fields)
+            self._requested_projections = cached.requested_projections
+
+        self._statement = cached.statement
+        self._key = cache_key
+        self._parameters = values
 
         return self._query
 
+    def _get_query_key(self, data: QueryDictType) -> Tuple[str, Dict[Tuple[int, str], str], Dict[str, Any]]:
+        """Return the key of the query specification in the cache of built queries and the values of its filters.
+
+        The key is the representation of the query specification, in which the values of filters that are passed as
+        bound parameters are replaced by the name of the parameter and their type. Only values that do not affect the
+        built query are replaced, see ``PARAMETER_OPERATORS`` and ``PARAMETER_TYPES``, such that all queries with the
+        same key are built the same.
+
+        :returns: the key, the mapping of (id of filter dictionary, key of the value) -> name of the bound parameter as
+            used by ``build_filters`` and the mapping of name of the bound parameter -> value
+        """
+        filter_parameters: Dict[Tuple[int, str], str] = {}
+        parameters: Dict[str, Any] = {}
+
+        def get_value_key(container: dict, key: str, operator: str, value: Any) -> Any:
+            """Return the value, or the name of the bound parameter and the type of the value if it is passed as one."""
+            value_type = self._get_parameter_type(operator, value)
+            if value_type is None:
+                return value
+            # A filter dictionary that is used more than once in the specification uses the same bound parameter
+            name = filter_parameters.get((id(container), key))
+            if name is None:
+                name = f'filter_value_{len(parameters)}'
+                filter_parameters[(id(container), key)] = name
+                parameters[name] = value
+            return name, value_type
+
+        def get_operations_key(operations: dict) -> dict:
+            """Return the key of the operations on a field, mirroring ``get_filter_expr``."""
+            return {
+                operator: [get_operations_key(item) if isinstance(item, dict) else item for item in value]
+                if operator.lstrip('~!') in ('and', 'or') and isinstance(value, list) else
+                get_value_key(operations, operator, operator, value) for operator, value in operations.items()
+            }
+
+        def get_filters_key(filter_spec: dict) -> dict:
+            """Return the key of a filter specification, mirroring ``build_filters``."""
+            filters_key = {}
+            for path_spec, value in filter_spec.items():
+                if path_spec in ('and', 'or', '~or', '~and', '!and', '!or') and isinstance(value, list):
+                    filters_key[path_spec] = [
+                        get_filters_key(item) if isinstance(item, dict) else item for item in value
+                    ]
+                elif isinstance(value, dict):
+                    filters_key[path_spec] = get_operations_key(value)
+                else:
+                    filters_key[path_spec] = get_value_key(filter_spec, path_spec, '==', value)
+            return filters_key
+
+        filters = {tag: get_filters_key(filter_spec) for tag, filter_spec in data['filters'].items()}
+        key = repr(
+            (data['path'], filters, data['project'], data['order_by'], data['limit'], data['offset'], data['distinct'])
+        )
+
+        return key, filter_parameters, parameters
+
+    @staticmethod
+    def _get_parameter_type(operator: str, value: Any) -> Any:
+        """Return the type of the value of a filter if it can be passed as a bound parameter, or ``None`` otherwise.
+
+        :returns: the type of the value, or a tuple of the type of the value and of its items for the ``in`` operator
+        """
+        operator = operator.lstrip('~!')
+
+        if operator not in PARAMETER_OPERATORS:
+            return None
+
+        if operator == 'in':
+            if not isinstance(value, (list, tuple)) or not value:
+                return None
+            item_types = {type(item) for item in value}
+            if len(item_types) != 1 or not item_types <= set(PARAMETER_TYPES):
+                return None
+            return type(value), item_types.pop()
+
+        if type(value) not in PARAMETER_TYPES:
+            return None
+
+        return type(value)
+
+    @staticmethod
+    def _get_filter_parameter(operator: str, value: Any, parameter: Optional[str]) -> Any:
+        """Return the bound parameter to use for the value of a filter, or the value itself if there is none.
+
+        :param parameter: the name of the bound parameter or ``None``
+        """
+        if parameter is None:
+            return value
+        return bindparam(parameter, expanding=operator == 'in')
+
     def rebuild_aliases(self) -> None:
         """Rebuild the mapping of `tag` -> `alias`"""
         cls_map = {
@@ -611,7 +879,13 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                     else:
                         raise
                 if not isinstance(filter_operation_dict, dict):
+                    parameters = {'==': self._filter_parameters.get((id(filter_spec), path_spec))}
                     filter_operation_dict = {'==': filter_operation_dict}
+                else:
+                    parameters = {
+                        operator: self._filter_parameters.get((id(filter_operation_dict), operator))
+                        for operator in filter_operation_dict
+                    }
                 for operator, value in filter_operation_dict.items():
                     expressions.append(
                         self.get_filter_expr(
@@ -621,7 +895,8 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                             is_jsonb=is_jsonb,
                             column=column,
                             column_name=column_name,
-                            alias=alias
+                            alias=alias,
+                            parameter=parameters[operator]
                         )
                     )
         return and_(*expressions) if expressions else None
@@ -688,7 +963,8 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         is_jsonb: bool,
         alias=None,
         column=None,
-        column_name=None
+        column_name=None,
+        parameter: Optional[str] = None
     ):
         """Applies a filter on the alias given.
 
@@ -705,6 +981,8 @@ class SqlaQueryBuilder(BackendQueryBuilder):
 
         :param is_jsonb: Whether the value is in a json-column, or in an attribute like table.
 
+        :param parameter: The name of the bound parameter to use for the value, or ``None`` to use the value itself.
+
 
         Implemented and valid operators:
 
@@ -801,7 +1079,8 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                             is_jsonb=is_jsonb,
                             alias=alias,
                             column=column,
-                            column_name=column_name
+                            column_name=column_name,
+                            parameter=self._filter_parameters.get((id(filter_operation_dict), newoperator))
                         )
                     )
             if operator == 'and':
@@ -812,23 +1091,35 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         if expr is None:
             if is_jsonb:
                 expr = self.get_filter_expr_from_jsonb(
-                    operator, value, attr_key, column=column, column_name=column_name, alias=alias
+                    operator, value, attr_key, column=column, column_name=column_name, alias=alias, parameter=parameter
                 )
             else:
                 if column is None:
                     if (alias is None) and (column_name is None):
                         raise RuntimeError('I need to get the column but do not know the alias and the column name')
                     column = self.get_column(column_name, alias)
-                expr = self.get_filter_expr_from_column(operator, value, column)
+                expr = self.get_filter_expr_from_column(
+                    operator, self._get_filter_parameter(operator, value, parameter), column
+                )
 
         if negation:
             return not_(expr)
         return expr
 
     def get_filter_expr_from_jsonb(
-        self, operator: str, value, attr_key: List[str], column=None, column_name=None, alias=None
+        self,
+        operator: str,
+        value,
+        attr_key: List[str],
+        column=None,
+        column_name=None,
+        alias=None,
+        parameter: Optional[str] = None
     ):
-        """Return a filter expression"""
+        """Return a filter expression
+
+        :param parameter: the name of the bound parameter to use for the value, or ``None`` to use the value itself
+        """
 
         # pylint: disable=too-many-branches, too-many-arguments, too-many-statements
 
@@ -860,22 +1151,30 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             column = self.get_column(column_name, alias)
 
         database_entity = column[tuple(attr_key)]
+        # The value as used in the expression, which is the bound parameter if there is one. The type of the value
+        # itself is still used to determine the cast of the database entity.
+        bound_value = self._get_filter_parameter(operator, value, parameter)
         expr: Any
         if operator == '==':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity == value), else_=False)
+            expr = case((type_filter, casted_entity == bound_value), else_=False)
+            if isinstance(value, str):
+                # Repeat the comparison outside of the ``CASE`` such that an expression index on the text value of the
+                # key, e.g. the one on the ``_aiida_hash`` extra of nodes, can be used. The ``CASE`` still guarantees
+                # that only string values can match, so the result is the same, also when negated.
+                expr = and_(casted_entity == bound_value, expr)
         elif operator == '>':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity > value), else_=False)
+            expr = case((type_filter, casted_entity > bound_value), else_=False)
         elif operator == '<':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity < value), else_=False)
+            expr = case((type_filter, casted_entity < bound_value), else_=False)
         elif operator in ('>=', '=>'):
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity >= value), else_=False)
+            expr = case((type_filter, casted_entity >= bound_value), else_=False)
         elif operator in ('<=', '=<'):
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity <= value), else_=False)
+            expr = case((type_filter, casted_entity <= bound_value), else_=False)
         elif operator == 'of_type':
             # http://www.postgresql.org/docs/9.5/static/functions-json.html
             #  Possible types are object, array, string, number, boolean, and null.
@@ -885,13 +1184,13 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             expr = jsonb_typeof(database_entity) == value
         elif operator == 'like':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity.like(value)), else_=False)
+            expr = case((type_filter, casted_entity.like(bound_value)), else_=False)
         elif operator == 'ilike':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity.ilike(value)), else_=False)
+            expr = case((type_filter, casted_entity.ilike(bound_value)), else_=False)
         elif operator == 'in':
             type_filter, casted_entity = cast_according_to_type(database_entity, value[0])
-            expr = case((type_filter, casted_entity.in_(value)), else_=False)
+            expr = case((type_filter, casted_entity.in_(bound_value)), else_=False)
         elif operator == 'contains':
             expr = database_entity.cast(JSONB).contains(value)
         elif operator == 'has_key':
@@ -1015,14 +1314,14 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         return _Compiler(dialect, query.statement, compile_kwargs=dict(literal_binds=literal_binds))
 
     def as_sql(self, data: QueryDictType, inline: bool = False) -> str:
-        with self.use_query(data) as query:
+        with self.use_query(data, parameters=False) as query:
             compiled = self._compile_query(query, literal_binds=inline)
         if inline:
             return compiled.string + '\n'
         return f'{compiled.string!r} % {compiled.params!r}\n'
 
     def analyze_query(self, data: QueryDictType, execute: bool = True, verbose: bool = False) -> str:
-        with self.use_query(data) as query:
+        with self.use_query(data, parameters=False) as query:
             if query.session.bind.dialect.name != 'postgresql':  # type: ignore[union-attr]
                 raise NotImplementedError('Only PostgreSQL is supported for this method')
             compiled = self._compile_query(query, literal_binds=True)
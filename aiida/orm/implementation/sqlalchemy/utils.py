@@ -61,7 +61,7 @@ class ModelWrapper:
         if item == '_model':
             raise AttributeError()
 
-        if self.is_saved() and self._is_mutable_model_field(item) and not self._in_transaction():
+        if self._is_mutable_model_field(item) and self.is_saved() and not self._in_transaction():
             self._ensure_model_uptodate(fields=(item,))
 
         return getattr(self._model, item)
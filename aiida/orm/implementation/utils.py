@@ -14,6 +14,8 @@ from decimal import Decimal
 import math
 import numbers
 
+import numpy
+
 from aiida.common import exceptions
 from aiida.common.constants import AIIDA_FLOAT_PRECISION
 
@@ -21,6 +23,9 @@ from aiida.common.constants import AIIDA_FLOAT_PRECISION
 # therefore is not allowed in individual attribute or extra keys.
 FIELD_SEPARATOR = '.'
 
+# The format of the string representation of floats to which they are rounded when cleaned
+FLOAT_FORMAT = f'{{:.{AIIDA_FLOAT_PRECISION}g}}'
+
 __all__ = ('validate_attribute_extra_key', 'clean_value')
 
 
@@ -38,7 +43,7 @@ def validate_attribute_extra_key(key):
         )
 
 
-def clean_value(value):
+def clean_value(value, trusted=False):
     """
     Get value from input and (recursively) replace, if needed, all occurrences
     of BaseType AiiDA data nodes with their value, and List with a standard list.
@@ -46,78 +51,157 @@ def clean_value(value):
     The purpose of this function is to convert data to a type which can be serialized and deserialized
     for storage in the DB without its value changing.
 
+    Lists and tuples whose items are all strings, integers, booleans or ``None``, or all floats, as well as NumPy arrays
+    of integers, floats or booleans, are validated and converted in bulk, which is much faster for large payloads than
+    cleaning each item separately, but produces exactly the same result.
+
     Note however that there is no logic to avoid infinite loops when the
     user passes some perverse recursive dictionary or list.
     In any case, however, this would not be storable by AiiDA...
 
     :param value: A value to be set as an attribute or an extra
+    :param trusted: if True, the value is assumed to already be clean, i.e. to only consist of dictionaries, lists and
+        the JSON-serializable values returned by this function, such as the attributes and extras of a stored entity.
+        It is then only deep copied, without validating or converting its values.
     :return: a "cleaned" value, potentially identical to value, but with
         values replaced where needed.
     """
+    if trusted:
+        return _copy_value(value)
+
+    return _clean_value(value)
+
+
+# The types of values that are returned unaltered by `_clean_builtin`, except for a conversion of integer subclasses
+SCALAR_TYPES = frozenset((str, int, bool, type(None)))
+JSON_SCALAR_TYPES = SCALAR_TYPES | {float}
+
+
+def _clean_value(value):
+    """Clean a value that is not trusted, see `clean_value`."""
+    value_type = type(value)
+
+    # The most common types are checked first, which avoids the relatively expensive checks against abstract classes
+    if value_type is dict:
+        return {key: _clean_value(val) for key, val in value.items()}
+
+    if value_type is list or value_type is tuple:
+        item_types = set(map(type, value))
+
+        if item_types <= SCALAR_TYPES:
+            return list(value)
+
+        if item_types == {float}:
+            return _clean_floats(value)
+
+        return [_clean_value(val) for val in value]
+
+    if value_type in SCALAR_TYPES:
+        return value
+
+    if value_type is float:
+        return _clean_builtin(value)
+
+    if value_type is numpy.ndarray and value.dtype.kind in 'biuf' and value.dtype.itemsize <= 8:
+        # Converts the array into (nested) lists of builtin values, which can then be cleaned in bulk
+        return _clean_value(value.tolist())
+
     # Must be imported in here to avoid recursive imports
     from aiida.orm import BaseType
 
-    def clean_builtin(val):
-        """
-        A function to clean build-in python values (`BaseType`).
-
-        It mainly checks that we don't store NaN or Inf.
-        """
-        # This is a whitelist of all the things we understand currently
-        if val is None or isinstance(val, (bool, str, Decimal)):
-            return val
-
-        # This fixes #2773 - in python3, ``numpy.int64(-1)`` cannot be json-serialized
-        # Note that `numbers.Integral` also match booleans but they are already returned above
-        if isinstance(val, numbers.Integral):
-            return int(val)
-
-        if isinstance(val, numbers.Real) and (math.isnan(val) or math.isinf(val)):
-            # see https://www.postgresql.org/docs/current/static/datatype-json.html#JSON-TYPE-MAPPING-TABLE
-            raise exceptions.ValidationError('nan and inf/-inf can not be serialized to the database')
-
-        # This fixes an error that occurs when aiida.gaussian passes the output from '_parse_log_cclib'
-        # It contains a datetime.timedelta instance which is not json-serializable
-        if isinstance(val, (datetime.timedelta)):
-            return int(val.total_seconds())
-
-        # This is for float-like types, like ``numpy.float128`` that are not json-serializable
-        # Note that `numbers.Real` also match booleans but they are already returned above
-        if isinstance(val, numbers.Real):
-            string_representation = f'{{:.{AIIDA_FLOAT_PRECISION}g}}'.format(val)
-            new_val = float(string_representation)
-            if 'e' in string_representation and new_val.is_integer():
-                # This is indeed often quite unexpected, because it is going to change the type of the data
-                # from float to int. But anyway clean_value is changing some types, and we are also bound to what
-                # our current backends do.
-                # Currently, in both Django and SQLA (with JSONB attributes), if we store 1.e1, ..., 1.e14, 1.e15,
-                # they will be stored as floats; instead 1.e16, 1.e17, ... will all be stored as integer anyway,
-                # even if we don't run this clean_value step.
-                # So, for consistency, it's better if we do the conversion ourselves here, and we do it for a bit
-                # smaller numbers than python+[SQL+JSONB] would do (the AiiDA float precision is here 14), so the
-                # results are consistent, and the hashing will work also after a round trip as expected.
-                return int(new_val)
-            return new_val
-
-        # Anything else we do not understand and we refuse
-        raise exceptions.ValidationError(f'type `{type(val)}` is not supported as it is not json-serializable')
-
     if isinstance(value, BaseType):
-        return clean_builtin(value.value)
+        return _clean_builtin(value.value)
 
     if isinstance(value, Mapping):
         # Check dictionary before iterables
-        return {k: clean_value(v) for k, v in value.items()}
+        return {k: _clean_value(v) for k, v in value.items()}
 
     if (isinstance(value, Iterable) and not isinstance(value, str)):
         # list, tuple, ... but not a string
         # This should also properly take care of dealing with the
         # basedatatypes.List object
-        return [clean_value(v) for v in value]
+        return [_clean_value(v) for v in value]
 
     # If I don't know what to do I just return the value
     # itself - it's not super robust, but relies on duck typing
     # (e.g. if there is something that behaves like an integer
     # but is not an integer, I still accept it)
 
-    return clean_builtin(value)
+    return _clean_builtin(value)
+
+
+def _clean_floats(values):
+    """Clean a sequence of floats in bulk, returning the same list as calling `_clean_builtin` on each of them."""
+    strings = list(map(FLOAT_FORMAT.format, values))
+    joined = ''.join(strings)
+
+    # Only the string representations of nan and inf contain an ``n`` and only those in exponential notation an ``e``,
+    # which may have to be converted to integers. These are rare and left to `_clean_builtin`, which also raises.
+    if 'n' in joined or 'e' in joined:
+        return [
+            _clean_builtin(value) if 'n' in string or 'e' in string else float(string)
+            for value, string in zip(values, strings)
+        ]
+
+    return list(map(float, strings))
+
+
+def _clean_builtin(val):
+    """
+    A function to clean build-in python values (`BaseType`).
+
+    It mainly checks that we don't store NaN or Inf.
+    """
+    # This is a whitelist of all the things we understand currently
+    if val is None or isinstance(val, (bool, str, Decimal)):
+        return val
+
+    # This fixes #2773 - in python3, ``numpy.int64(-1)`` cannot be json-serialized
+    # Note that `numbers.Integral` also match booleans but they are already returned above
+    if isinstance(val, numbers.Integral):
+        return int(val)
+
+    if isinstance(val, numbers.Real) and (math.isnan(val) or math.isinf(val)):
+        # see https://www.postgresql.org/docs/current/static/datatype-json.html#JSON-TYPE-MAPPING-TABLE
+        raise exceptions.ValidationError('nan and inf/-inf can not be serialized to the database')
+
+    # This fixes an error that occurs when aiida.gaussian passes the output from '_parse_log_cclib'
+    # It contains a datetime.timedelta instance which is not json-serializable
+    if isinstance(val, (datetime.timedelta)):
+        return int(val.total_seconds())
+
+    # This is for float-like types, like ``numpy.float128`` that are not json-serializable
+    # Note that `numbers.Real` also match booleans but they are already returned above
+    if isinstance(val, numbers.Real):
+        string_representation = FLOAT_FORMAT.format(val)
+        new_val = float(string_representation)
+        if 'e' in string_representation and new_val.is_integer():
+            # This is indeed often quite unexpected, because it is going to change the type of the data
+            # from float to int. But anyway clean_value is changing some types, and we are also bound to what
+            # our current backends do.
+            # Currently, in both Django and SQLA (with JSONB attributes), if we store 1.e1, ..., 1.e14, 1.e15,
+            # they will be stored as floats; instead 1.e16, 1.e17, ... will all be stored as integer anyway,
+            # even if we don't run this clean_value step.
+            # So, for consistency, it's better if we do the conversion ourselves here, and we do it for a bit
+            # smaller numbers than python+[SQL+JSONB] would do (the AiiDA float precision is here 14), so the
+            # results are consistent, and the hashing will work also after a round trip as expected.
+            return int(new_val)
+        return new_val
+
+    # Anything else we do not understand and we refuse
+    raise exceptions.ValidationError(f'type `{type(val)}` is not supported as it is not json-serializable')
+
+
+def _copy_value(value):
+    """Deep copy a value that is trusted to be clean, see `clean_value`."""
+    value_type = type(value)
+
+    if value_type is dict:
+        return {key: _copy_value(val) for key, val in value.items()}
+
+    if value_type is list or value_type is tuple:
+        if set(map(type, value)) <= JSON_SCALAR_TYPES:
+            return list(value)
+        return [_copy_value(val) for val in value]
+
+    return value
@@ -46,11 +46,56 @@ class Log(entities.Entity):
             :return: An object implementing the log entry interface
             :rtype: :class:`aiida.orm.logs.Log`
             """
+            arguments = Log.Collection._get_entry_arguments(record)
+
+            # Do not store if dbnode_id is not set
+            if arguments is None:
+                return None
+
+            return Log(**arguments)
+
+        def create_entries_from_records(self, records, batch_size=None):
+            """Create log entries from records created by the python logging library in bulk.
+
+            The entries are stored with a limited number of database statements, instead of one per entry. Records that
+            are not attached to a node, i.e. that do not define a ``dbnode_id``, are skipped.
+
+            :param records: the records created by the logging module
+            :type records: list of :class:`logging.LogRecord`
+            :param batch_size: maximum number of entries to insert per database statement, defaults to the
+                ``db.batch_size`` option.
+
+            :return: the list of created log entries
+            :rtype: list of :class:`aiida.orm.logs.Log`
+
+            :raises `~aiida.common.exceptions.IntegrityError`: if the entries could not be stored, e.g. because a node
+                that they refer to does not exist, in which case none of the entries are stored
+            """
+            backend_logs = []
+
+            for record in records:
+                arguments = self._get_entry_arguments(record)
+                if arguments is not None:
+                    backend_logs.append(self.backend.logs.create(**arguments))
+
+            self.backend.logs.bulk_store(backend_logs, batch_size=batch_size)
+
+            return [Log.from_backend_entity(backend_log) for backend_log in backend_logs]
+
+        @staticmethod
+        def _get_entry_arguments(record):
+            """Return the arguments to construct a log entry from a record created by the python logging library.
+
+            :param record: The record created by the logging module
+            :type record: :class:`logging.LogRecord`
+
+            :return: the arguments, or ``None`` if the record is not attached to a node and should not be stored
+            :rtype: dict
+            """
             from datetime import datetime
 
             dbnode_id = record.__dict__.get('dbnode_id', None)
 
-            # Do not store if dbnode_id is not set
             if dbnode_id is None:
                 return None
 
@@ -69,14 +114,14 @@ class Log(entities.Entity):
                 if key in metadata:
                     metadata[key] = str(metadata[key])
 
-            return Log(
-                time=timezone.make_aware(datetime.fromtimestamp(record.created)),
-                loggername=record.name,
-                levelname=record.levelname,
-                dbnode_id=dbnode_id,
-                message=message,
-                metadata=metadata
-            )
+            return {
+                'time': timezone.make_aware(datetime.fromtimestamp(record.created)),
+                'loggername': record.name,
+                'levelname': record.levelname,
+                'dbnode_id': dbnode_id,
+                'message': message,
+                'metadata': metadata
+            }
 
         def get_logs_for(self, entity, order_by=None):
             """
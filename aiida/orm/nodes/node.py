@@ -14,7 +14,7 @@ import datetime
 import importlib
 from logging import Logger
 import typing
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
 from uuid import UUID
 
 from aiida.common import exceptions
@@ -39,7 +39,7 @@ if TYPE_CHECKING:
     from ..implementation import Backend
     from ..implementation.nodes import BackendNode
 
-__all__ = ('Node',)
+__all__ = ('Node', 'store_many')
 
 _NO_DEFAULT = tuple()  # type: ignore[var-annotated]
 
@@ -684,7 +684,7 @@ class Node(Entity, NodeRepositoryMixin, EntityAttributesMixin, EntityExtrasMixin
             if same_node is not None:
                 self._store_from_cache(same_node, with_transaction=with_transaction)
             else:
-                self._store(with_transaction=with_transaction, clean=True)
+                self._store(with_transaction=with_transaction, clean=False)
 
             # Set up autogrouping used by verdi run
             if autogroup.CURRENT_AUTOGROUP is not None and autogroup.CURRENT_AUTOGROUP.is_to_be_grouped(self):
@@ -854,12 +854,44 @@ class Node(Entity, NodeRepositoryMixin, EntityAttributesMixin, EntityExtrasMixin
 
         Note: this should be only called on stored nodes, or internally from .store() since it first calls
         clean_value() on the attributes to normalise them.
+
+        If the ``caching.lookup_cache_size`` option is non-zero, the pk of the last match for a given hash is kept in
+        memory, such that the database query can be skipped on subsequent lookups, as long as that node is still valid.
         """
+        from aiida.manage.caching import get_lookup_cache
+
+        node_hash = self._get_hash()
+
+        if not node_hash or not self._cachable:
+            return None
+
+        lookup_cache = get_lookup_cache()
+        key = (self.__class__, node_hash)
+        pk = lookup_cache.get(key)
+
+        if pk is not None:
+            try:
+                node = self.objects.get(id=pk)
+            except exceptions.NotExistent:
+                node = None
+
+            if (
+                node is not None and node.__class__ is self.__class__ and
+                node.get_extra(_HASH_EXTRA_KEY, None) == node_hash and node.is_valid_cache
+            ):
+                return node
+
+            lookup_cache.discard(key)
+
         try:
-            return next(self._iter_all_same_nodes(allow_before_store=True))
+            node = next(self._iter_nodes_with_hash(node_hash))
         except StopIteration:
             return None
 
+        lookup_cache.add(key, node.pk)
+
+        return node
+
     def get_all_same_nodes(self) -> List['Node']:
         """Return a list of stored nodes which match the type and hash of the current node.
 
@@ -884,6 +916,10 @@ class Node(Entity, NodeRepositoryMixin, EntityAttributesMixin, EntityExtrasMixin
         if not node_hash or not self._cachable:
             return iter(())
 
+        return self._iter_nodes_with_hash(node_hash)
+
+    def _iter_nodes_with_hash(self, node_hash: str) -> Iterator['Node']:
+        """Return an iterator of all stored nodes of the same class with the given hash that are a valid cache."""
         builder = QueryBuilder()
         builder.append(self.__class__, filters={'extras._aiida_hash': node_hash}, project='*', subclassing=False)
         nodes_identical = (n[0] for n in builder.iterall())
@@ -903,3 +939,149 @@ class Node(Entity, NodeRepositoryMixin, EntityAttributesMixin, EntityExtrasMixin
         """
         # pylint: disable=no-self-use
         return ''
+
+
+def store_many(nodes: Iterable[Node], batch_size: Optional[int] = None) -> List[Node]:
+    """Store multiple nodes, including their cached incoming links and repository objects, in bulk.
+
+    This is equivalent to calling :meth:`Node.store` on each of the nodes, except that all nodes are first validated and
+    then stored in a single transaction with a limited number of database statements, instead of a number of statements
+    per node. The repository objects of the nodes are written to the repository in a single operation per batch.
+
+    The source of each cached incoming link has to be either already stored, or be one of the nodes that are passed.
+
+    .. note:: nodes for which caching is enabled, or whose class overrides :meth:`Node.store`, are stored one by one
+        through their ``store`` method as soon as the sources of their cached incoming links are stored. The other nodes
+        are stored in bulk, such that the nodes are stored in the order of their links.
+
+    .. warning:: the repository objects are written directly to the packs of the repository, which is not safe to be
+        done concurrently with maintenance operations on the repository that write to packs.
+
+    :param nodes: the nodes to store. Nodes that are already stored are ignored.
+    :param batch_size: maximum number of nodes whose repository objects and database rows are written in one go.
+        Defaults to the ``db.batch_size`` configuration option.
+    :return: the list of nodes that were passed.
+    :raise aiida.common.ModificationNotAllowed: if the source of a cached incoming link is not stored nor passed.
+    """
+    # pylint: disable=protected-access
+    from aiida.manage.caching import get_use_cache
+
+    nodes = list(nodes)
+    unstored = list({id(node): node for node in nodes if not node.is_stored}.values())
+
+    if not unstored:
+        return nodes
+
+    identifiers = {id(node) for node in unstored}
+    # The nodes that are stored one by one through their ``store`` method, which validates them itself
+    individual = {
+        id(node)
+        for node in unstored
+        if type(node).store is not Node.store or (node._cachable and get_use_cache(identifier=node.process_type))
+    }
+
+    for node in unstored:
+        assert node._incoming_cache is not None, 'incoming_cache not initialised'
+
+        for link_triple in node._incoming_cache:
+            if not link_triple.node.is_stored and id(link_triple.node) not in identifiers:
+                raise exceptions.ModificationNotAllowed(
+                    f'Cannot store because source node of link triple {link_triple} is neither stored nor being stored'
+                )
+
+        if id(node) not in individual:
+            # Call `validate_storability` directly and not in `_validate` in case sub class forgets to call the super.
+            node.validate_storability()
+            node._validate()
+            node._backend_entity.clean_values()
+
+    while unstored:
+        # The nodes that can be stored in bulk, for which the unstored sources of their links are stored in bulk as well
+        batch = [node for node in unstored if id(node) not in individual]
+
+        while True:
+            batched = {id(node) for node in batch}
+            sourced = [
+                node for node in batch if all(
+                    link_triple.node.is_stored or id(link_triple.node) in batched
+                    for link_triple in node._incoming_cache
+                )
+            ]
+            if len(sourced) == len(batch):
+                break
+            batch = sourced
+
+        if batch:
+            _store_batch(batch, batch_size)
+
+        ready = [
+            node for node in unstored
+            if id(node) in individual and all(link_triple.node.is_stored for link_triple in node._incoming_cache)
+        ]
+
+        for node in ready:
+            node.store()
+
+        if not batch and not ready:
+            raise exceptions.ModificationNotAllowed('Cannot store because the cached incoming links form a cycle')
+
+        unstored = [node for node in unstored if not node.is_stored]
+
+    return nodes
+
+
+def _store_batch(batch: List[Node], batch_size: Optional[int] = None) -> None:
+    """Store validated nodes in bulk, whose unstored link sources are all part of the batch.
+
+    :param batch: the nodes to store.
+    :param batch_size: maximum number of nodes whose repository objects and database rows are written in one go.
+        Defaults to the ``db.batch_size`` configuration option.
+    """
+    # pylint: disable=protected-access
+    from aiida.manage.configuration import get_config_option
+    from aiida.repository import Repository
+    from aiida.repository.backend import SandboxRepositoryBackend
+
+    links = []
+    # Nodes with an incoming link from a node in the batch, whose hash can only be computed once that node is stored
+    deferred = set()
+
+    for node in batch:
+        for link_triple in node._incoming_cache:
+            if not link_triple.node.is_stored:
+                deferred.add(id(node))
+            source = link_triple.node.backend_entity
+            links.append((source, node.backend_entity, link_triple.link_type, link_triple.link_label))
+
+    profile = get_manager().get_profile()
+    assert profile is not None, 'profile not loaded'
+    repository_backend = profile.get_repository().backend
+    batch_size = batch_size or get_config_option('db.batch_size')
+
+    for index in range(0, len(batch), batch_size):
+        sandboxed = [
+            node for node in batch[index:index + batch_size]
+            if isinstance(node._repository.backend, SandboxRepositoryBackend)
+        ]
+        clones = Repository.clone_many([node._repository for node in sandboxed], repository_backend)
+
+        for node, clone in zip(sandboxed, clones):
+            node._repository = clone
+
+    for node in batch:
+        node.repository_metadata = node._repository.serialize()
+        if id(node) not in deferred:
+            node._backend_entity.set_extra(_HASH_EXTRA_KEY, node._get_hash())
+
+    backend_nodes = [node.backend_entity for node in batch]
+    batch[0].backend.nodes.bulk_store(backend_nodes, links, clean=False, batch_size=batch_size)
+
+    for node in batch:
+        node._incoming_cache = list()
+        if id(node) in deferred:
+            node._backend_entity.set_extra(_HASH_EXTRA_KEY, node.get_hash())
+
+    if autogroup.CURRENT_AUTOGROUP is not None:
+        grouped = [node for node in batch if autogroup.CURRENT_AUTOGROUP.is_to_be_grouped(node)]
+        if grouped:
+            autogroup.CURRENT_AUTOGROUP.get_or_create_group().add_nodes(grouped)
@@ -8,7 +8,7 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Module with `Node` sub class for processes."""
-
+from collections import OrderedDict
 import enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
@@ -26,6 +26,33 @@ if TYPE_CHECKING:
 
 __all__ = ('ProcessNode',)
 
+# Hashes of input nodes, keyed on their UUID. Inputs are stored ``Data`` nodes, which are immutable, so their hash can be
+# reused when computing the hash of every process node that uses them, instead of being recomputed each time.
+_INPUT_HASHES: 'OrderedDict[str, str]' = OrderedDict()
+_INPUT_HASHES_MAXSIZE = 10000
+
+
+def _get_input_hash(node: Node) -> Optional[str]:
+    """Return the hash of the given stored input node, reusing the result of a previous call for the same node.
+
+    :param node: a stored input node of a process node.
+    :return: the hash of the node, or ``None`` if it could not be computed.
+    """
+    try:
+        _INPUT_HASHES.move_to_end(node.uuid)
+    except KeyError:
+        node_hash = node.get_hash()
+
+        if node_hash is not None:
+            _INPUT_HASHES[node.uuid] = node_hash
+
+            while len(_INPUT_HASHES) > _INPUT_HASHES_MAXSIZE:
+                _INPUT_HASHES.popitem(last=False)
+
+        return node_hash
+
+    return _INPUT_HASHES[node.uuid]
+
 
 class ProcessNode(Sealable, Node):
     """
@@ -40,6 +67,8 @@ class ProcessNode(Sealable, Node):
     # pylint: disable=too-many-public-methods,abstract-method
 
     CHECKPOINT_KEY = 'checkpoints'
+    CHECKPOINT_CONTEXT_KEY = 'checkpoints_context'
+    CHECKPOINT_CONTEXT_DELTA_KEY = 'checkpoints_context_delta'
     EXCEPTION_KEY = 'exception'
     EXIT_MESSAGE_KEY = 'exit_message'
     EXIT_STATUS_KEY = 'exit_status'
@@ -66,6 +95,8 @@ class ProcessNode(Sealable, Node):
         return super()._updatable_attributes + (
             cls.PROCESS_PAUSED_KEY,
             cls.CHECKPOINT_KEY,
+            cls.CHECKPOINT_CONTEXT_KEY,
+            cls.CHECKPOINT_CONTEXT_DELTA_KEY,
             cls.EXCEPTION_KEY,
             cls.EXIT_MESSAGE_KEY,
             cls.EXIT_STATUS_KEY,
@@ -370,22 +401,55 @@ class ProcessNode(Sealable, Node):
         """
         return self.get_attribute(self.CHECKPOINT_KEY, None)
 
-    def set_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+    @property
+    def checkpoint_context(self) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Return the encoded context of the checkpoint, if it is stored separately from the checkpoint bundle
+
+        :returns: tuple of the encoded context entries and the changes to them since they were last stored in full, or
+            None if the context is not stored separately
+        """
+        context = self.get_attribute(self.CHECKPOINT_CONTEXT_KEY, None)
+
+        if context is None:
+            return None
+
+        return context, self.get_attribute(self.CHECKPOINT_CONTEXT_DELTA_KEY, {})
+
+    def set_checkpoint(
+        self,
+        checkpoint: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        context_delta: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Set the checkpoint bundle set for the process
 
-        :param state: string representation of the stepper state info
+        All values are set at once, such that the stored checkpoint is always consistent.
+
+        :param checkpoint: the encoded checkpoint bundle
+        :param context: optional encoded context entries that are stored separately from the checkpoint bundle
+        :param context_delta: optional changes to the context entries since they were last stored in full
         """
-        return self.set_attribute(self.CHECKPOINT_KEY, checkpoint)
+        attributes = {self.CHECKPOINT_KEY: checkpoint}
+
+        if context is not None:
+            attributes[self.CHECKPOINT_CONTEXT_KEY] = context
+
+        if context_delta is not None:
+            attributes[self.CHECKPOINT_CONTEXT_DELTA_KEY] = context_delta
+
+        return self.set_attribute_many(attributes)
 
     def delete_checkpoint(self) -> None:
         """
         Delete the checkpoint bundle set for the process
         """
-        try:
-            self.delete_attribute(self.CHECKPOINT_KEY)
-        except AttributeError:
-            pass
+        for key in (self.CHECKPOINT_KEY, self.CHECKPOINT_CONTEXT_KEY, self.CHECKPOINT_CONTEXT_DELTA_KEY):
+            try:
+                self.delete_attribute(key)
+            except AttributeError:
+                pass
 
     @property
     def paused(self) -> bool:
@@ -502,7 +566,7 @@ class ProcessNode(Sealable, Node):
         """
         res = super()._get_objects_to_hash()
         res.append({
-            entry.link_label: entry.node.get_hash()
+            entry.link_label: _get_input_hash(entry.node)
             for entry in self.get_incoming(link_type=(LinkType.INPUT_CALC, LinkType.INPUT_WORK))
             if entry.link_label not in self._hash_ignored_inputs
         })
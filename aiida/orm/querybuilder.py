@@ -21,6 +21,7 @@ when instantiated by the user.
 """
 from copy import deepcopy
 from inspect import isclass as inspect_isclass
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -33,6 +34,7 @@ from typing import (
     Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -52,11 +54,16 @@ from . import authinfos, comments, computers, convert, entities, groups, logs, n
 
 if TYPE_CHECKING:
     # pylint: disable=ungrouped-imports
+    import numpy
+    import pandas
+
     from aiida.engine import Process
     from aiida.orm.implementation import Backend
 
 __all__ = ('QueryBuilder',)
 
+T = TypeVar('T')
+
 # re-usable type annotations
 EntityClsType = Type[Union[entities.Entity, 'Process']]  # pylint: disable=invalid-name
 ProjectType = Union[str, dict, Sequence[Union[str, dict]]]  # pylint: disable=invalid-name
@@ -877,6 +884,80 @@ class QueryBuilder:
         self._offset = offset
         return self
 
+    def after(
+        self,
+        tagspec: Union[str, EntityClsType],
+        cursor: Optional[Sequence[Any]] = None,
+        keys: Sequence[str] = ('id',),
+        order: str = 'asc'
+    ) -> 'QueryBuilder':
+        """
+        Use keyset pagination: order by the given keys and only return the rows that come after the cursor.
+
+        Contrary to an offset, for which the database still has to go through all the rows that are skipped,
+        the cursor is applied as a filter that can be served by the index on the keys. Retrieving a page deep
+        into the results therefore costs as much as retrieving the first one.
+        The order set with :meth:`order_by` is replaced and the filter on the cursor is combined with the
+        existing filters of the given tag.
+
+        Usage::
+
+            qb = QueryBuilder()
+            qb.append(Node, tag='node', project=['ctime', 'id'])
+            qb.after('node', keys=('ctime', 'id')).limit(100)
+            page = qb.all()
+
+            # The next page consists of the rows after the last row of the previous page
+            qb = QueryBuilder()
+            qb.append(Node, tag='node', project=['ctime', 'id'])
+            qb.after('node', cursor=page[-1], keys=('ctime', 'id')).limit(100)
+
+        :param tagspec: A tag string or an ORM class which maps to an existing tag
+        :param cursor: the values of the keys of the last row of the previous page, or None for the first page
+        :param keys: the names of the columns to order by, the last of which has to be ``id`` or ``uuid``
+            such that the order is unique
+        :param order: the order of the rows, either ``asc`` or ``desc``
+        """
+        keys = list(keys)
+
+        if not keys or keys[-1] not in ('id', 'uuid'):
+            raise ValueError(f'the last key has to be `id` or `uuid` to make the order unique, got: {keys}')
+
+        if order not in ('asc', 'desc'):
+            raise ValueError(f'the order has to be `asc` or `desc`, got: {order}')
+
+        tag = self._tags.get(tagspec)
+        self.order_by({tag: [{key: order} for key in keys]})
+
+        if cursor is None:
+            return self
+
+        cursor = list(cursor)
+
+        if len(cursor) != len(keys):
+            raise ValueError(f'the cursor {cursor} does not have a value for each of the keys {keys}')
+
+        # The row comparison ``(k_1, ..., k_n) > (v_1, ..., v_n)`` is expanded into a disjunction of the clauses
+        # ``k_1 = v_1, ..., k_{i-1} = v_{i-1}, k_i > v_i`` for each key ``k_i``
+        operator = '>' if order == 'asc' else '<'
+        clauses = []
+
+        for index, key in enumerate(keys):
+            clause: Dict[str, Any] = {previous: {'==': value} for previous, value in zip(keys[:index], cursor)}
+            clause[key] = {operator: cursor[index]}
+            clauses.append(clause)
+
+        if len(clauses) == 1:
+            keyset = clauses[0]
+        else:
+            # The redundant bound on the first key allows the database to start scanning its index at the cursor
+            keyset = {'and': [{keys[0]: {f'{operator}=': cursor[0]}}, {'or': clauses}]}
+
+        filters = self._filters[tag]
+        self._filters[tag] = {'and': [filters, keyset]} if filters else keyset
+
+        return self
+
     def distinct(self, value: bool = True) -> 'QueryBuilder':
         """
         Asks for distinct rows, which is the same as asking the backend to remove
@@ -958,7 +1039,7 @@ class QueryBuilder:
 
         :params inline: Inline bound parameters (this is normally handled by the Python DB-API).
         """
-        return self._impl.as_sql(data=self.as_dict(), inline=inline)
+        return self._impl.as_sql(data=self.as_dict(copy=False), inline=inline)
 
     def analyze_query(self, execute: bool = True, verbose: bool = False) -> str:
         """Return the query plan, i.e. a list of SQL statements that will be executed.
@@ -968,7 +1049,7 @@ class QueryBuilder:
         :params execute: Carry out the command and show actual run times and other statistics.
         :params verbose: Display additional information regarding the plan.
         """
-        return self._impl.analyze_query(data=self.as_dict(), execute=execute, verbose=verbose)
+        return self._impl.analyze_query(data=self.as_dict(copy=False), execute=execute, verbose=verbose)
 
     @staticmethod
     def _get_aiida_entity_res(value) -> Any:
@@ -992,7 +1073,7 @@ class QueryBuilder:
 
         :returns: One row of results as a list, or None if no result returned.
         """
-        result = self._impl.first(self.as_dict())
+        result = self._impl.first(self.as_dict(copy=False))
 
         if result is None:
             return None
@@ -1005,7 +1086,7 @@ class QueryBuilder:
 
         :returns: the number of rows as an integer
         """
-        return self._impl.count(self.as_dict())
+        return self._impl.count(self.as_dict(copy=False))
 
     def iterall(self, batch_size: Optional[int] = 100) -> Iterable[List[Any]]:
         """
@@ -1020,12 +1101,12 @@ class QueryBuilder:
 
         :returns: a generator of lists
         """
-        for item in self._impl.iterall(self.as_dict(), batch_size):
-            # Convert to AiiDA frontend entities (if they are such)
-            for i, item_entry in enumerate(item):
-                item[i] = self._get_aiida_entity_res(item_entry)
+        for batch in self._iter_batches(self._impl.iterall(self.as_dict(copy=False), batch_size), batch_size):
+            # Convert to AiiDA frontend entities (if they are such) for the entire batch at once
+            values = iter(convert.get_orm_entities(item_entry for item in batch for item_entry in item))
 
-            yield item
+            for item in batch:
+                yield [next(values) for _ in item]
 
     def iterdict(self, batch_size: Optional[int] = 100) -> Iterable[Dict[str, Dict[str, Any]]]:
         """
@@ -1040,11 +1121,34 @@ class QueryBuilder:
 
         :returns: a generator of dictionaries
         """
-        for item in self._impl.iterdict(self.as_dict(), batch_size):
-            for key, value in item.items():
-                item[key] = self._get_aiida_entity_res(value)
+        for batch in self._iter_batches(self._impl.iterdict(self.as_dict(copy=False), batch_size), batch_size):
+            values = iter(
+                convert.get_orm_entities(
+                    value for item in batch for projections in item.values() for value in projections.values()
+                )
+            )
+
+            for item in batch:
+                for projections in item.values():
+                    for field in projections:
+                        projections[field] = next(values)
+
+                yield item
+
+    @staticmethod
+    def _iter_batches(iterable: Iterable[T], batch_size: Optional[int]) -> Iterable[List[T]]:
+        """Return an iterator over the items of the iterable in lists of at most ``batch_size`` items.
+
+        :param batch_size: the maximum number of items in a batch, if ``None``, the default batch size of
+            :meth:`.iterall` is used
+        """
+        iterator = iter(iterable)
 
-            yield item
+        while True:
+            batch = list(islice(iterator, batch_size or 100))
+            if not batch:
+                return
+            yield batch
 
     def all(self, batch_size: Optional[int] = None, flat: bool = False) -> Union[List[List[Any]], List[Any]]:
         """Executes the full query with the order of the rows as returned by the backend.
@@ -1134,6 +1238,141 @@ class QueryBuilder:
         """
         return list(self.iterdict(batch_size=batch_size))
 
+    def itercolumns(self, batch_size: int = 10000) -> Iterable[Dict[str, Dict[str, List[Any]]]]:
+        """
+        Same as :meth:`.to_columns`, but returns a generator over the results in batches of columns.
+
+        :param batch_size: the maximum number of results in each batch, which are fetched from the database at once
+
+        :returns: a generator of dictionaries of the values of all projected entities: tag -> field -> list of values
+        """
+        for batch in self._impl.itercolumns(self.as_dict(copy=False), batch_size):
+            for columns in batch.values():
+                for field, column in columns.items():
+                    # Only the columns of projected entities, e.g. ``*``, have to be converted to front end classes
+                    value = next((value for value in column if value is not None), None)
+                    if value is not None and self._get_aiida_entity_res(value) is not value:
+                        columns[field] = convert.get_orm_entities(column)
+
+            yield batch
+
+    def to_columns(self, batch_size: int = 10000) -> Dict[str, Dict[str, List[Any]]]:
+        """
+        Executes the full query and returns the results as columns, i.e. a list of values for each projection.
+
+        This avoids the overhead of building a list or dictionary for each row of the results, as done by :meth:`.all`
+        and :meth:`.dict`, which dominates the time to retrieve a large number of projected values.
+
+        :param batch_size: the maximum number of results that are fetched from the database at once
+
+        :returns: a dictionary of the values of all projected entities: tag -> field -> list of values
+
+        Usage::
+
+            qb = QueryBuilder()
+            qb.append(Dict, tag='dict', project=['id', 'attributes.energy'])
+            columns = qb.to_columns()
+            columns['dict']['attributes.energy']  # list of the energies
+        """
+        results: Dict[str, Dict[str, List[Any]]] = {}
+        for tag, fields in self._impl.get_column_types(self.as_dict(copy=False)).items():
+            results[tag] = {field: [] for field in fields}
+
+        for batch in self.itercolumns(batch_size=batch_size):
+            for tag, columns in batch.items():
+                for field, column in columns.items():
+                    results[tag][field].extend(column)
+
+        return results
+
+    def to_numpy(self, batch_size: int = 10000) -> Dict[str, Dict[str, 'numpy.ndarray']]:
+        """
+        Executes the full query and returns the results as a ``numpy`` array for each projection.
+
+        The type of an array is determined by the type of the projection: projections of integer, float and boolean
+        columns, including the attributes that are cast to these types, e.g. ``{'attributes.energy': {'cast': 'f'}}``,
+        are returned as arrays of ``int64``, ``float64`` and ``bool`` respectively. Missing values, e.g. of attributes
+        that not all nodes have, are returned as ``nan``, such that an array of integers is then returned as ``float64``
+        and an array of booleans as ``object``. Arrays of all other projections have the ``object`` type.
+
+        :param batch_size: the maximum number of results that are fetched from the database at once
+
+        :returns: a dictionary of the arrays of all projected entities: tag -> field -> array
+
+        Usage::
+
+            qb = QueryBuilder()
+            qb.append(Dict, tag='dict', project=['id', {'attributes.energy': {'cast': 'f'}}])
+            arrays = qb.to_numpy()
+            arrays['dict']['attributes.energy'].mean()
+        """
+        import numpy
+
+        column_types = self._impl.get_column_types(self.as_dict(copy=False))
+        arrays: Dict[str, Dict[str, List[numpy.ndarray]]] = {
+            tag: {field: [] for field in fields} for tag, fields in column_types.items()
+        }
+
+        for batch in self.itercolumns(batch_size=batch_size):
+            for tag, columns in batch.items():
+                for field, column in columns.items():
+                    arrays[tag][field].append(_get_column_array(column, column_types[tag][field]))
+
+        return {
+            tag: {
+                field: numpy.concatenate(chunks) if chunks else _get_column_array([], column_types[tag][field])
+                for field, chunks in fields.items()
+            } for tag, fields in arrays.items()
+        }
+
+    def to_dataframe(self, batch_size: int = 10000) -> 'pandas.DataFrame':
+        """
+        Executes the full query and returns the results as a ``pandas.DataFrame``.
+
+        The columns of the data frame are the arrays returned by :meth:`.to_numpy`, labelled by the tag and the field
+        of the projection. The data frame can be converted to other formats, such as an Apache Arrow table with
+        ``pyarrow.Table.from_pandas``.
+
+        .. note:: This requires the ``pandas`` package to be installed.
+
+        :param batch_size: the maximum number of results that are fetched from the database at once
+
+        :returns: a data frame with a column for each projected entity
+        """
+        try:
+            import pandas
+        except ImportError as exc:
+            raise ImportError('the `pandas` package is required to return the results as a data frame') from exc
+
+        arrays = self.to_numpy(batch_size=batch_size)
+        columns = {(tag, field): array for tag, fields in arrays.items() for field, array in fields.items()}
+
+        return pandas.DataFrame(columns)
+
+
+def _get_column_array(values: List[Any], column_type: Optional[type]) -> 'numpy.ndarray':
+    """Return the values of a projection as an array whose type is determined by the type of the projection.
+
+    :param values: the values of the projection
+    :param column_type: ``int``, ``float``, ``bool`` or ``None`` for any other type
+    """
+    import numpy
+
+    if column_type is float or (column_type is int and None in values):
+        return numpy.array(values, dtype=numpy.float64)
+
+    if column_type is int:
+        return numpy.array(values, dtype=numpy.int64)
+
+    if column_type is bool and None not in values:
+        return numpy.array(values, dtype=numpy.bool_)
+
+    # The array is filled after its creation, since ``numpy.array`` would create nested arrays for values that are lists
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+
+    return array
+
 
 def _get_ormclass(
     cls: Union[None, EntityClsType, Sequence[EntityClsType]], entity_type: Union[None, str, Sequence[str]]
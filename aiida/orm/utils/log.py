@@ -12,7 +12,53 @@ import logging
 
 
 class DBLogHandler(logging.Handler):
-    """A custom db log handler for writing logs tot he database"""
+    """A custom db log handler for writing logs to the database.
+
+    The records of the nodes that are registered with :meth:`start_buffering`, which the engine does for the nodes of
+    running processes, are not written one by one, but are buffered and written in a single batch when :meth:`flush` is
+    called. The engine flushes the buffer at every state transition of a process, and the buffer is also flushed when it
+    reaches its capacity, when a record of level ``WARNING`` or higher is emitted and when the handler is closed, e.g.
+    when the interpreter exits. The number of records per minute of each registered node can be limited, in which case
+    the number of discarded records is logged as a warning for that node when the buffer is flushed.
+    """
+
+    def __init__(self, level=logging.NOTSET, capacity=0, rate_limit=0):
+        """
+        :param level: the minimum level of the records to write to the database
+        :param capacity: the maximum number of buffered records, after which they are flushed; 0 disables buffering
+        :param rate_limit: the maximum number of records per minute that are written for each registered node, after
+            which they are discarded until the next minute; 0 for no limit
+        """
+        super().__init__(level)
+        self.capacity = capacity
+        self.rate_limit = rate_limit
+        self._buffered_nodes = set()
+        self._buffer = []
+        # Mapping of node pk onto the minute and the number of records in that minute, to apply the rate limit
+        self._rates = {}
+        # Mapping of node pk onto the backend, logger name and number of records that were discarded due to the limit
+        self._discarded = {}
+
+    def start_buffering(self, node_pk):
+        """Buffer the records of the node with the given pk, instead of writing them immediately.
+
+        :param node_pk: the pk of the node
+        """
+        if self.capacity > 0:
+            self._buffered_nodes.add(node_pk)
+
+    def stop_buffering(self, node_pk):
+        """Stop buffering the records of the node with the given pk, after flushing the buffer.
+
+        :param node_pk: the pk of the node
+        """
+        self.acquire()
+        try:
+            self.flush()
+            self._buffered_nodes.discard(node_pk)
+            self._rates.pop(node_pk, None)
+        finally:
+            self.release()
 
     def emit(self, record):
         if record.exc_info:
@@ -21,6 +67,10 @@ class DBLogHandler(logging.Handler):
             # https://github.com/python/cpython/blob/1c2cb516e49ceb56f76e90645e67e8df4e5df01a/Lib/logging/handlers.py#L590
             self.format(record)
 
+        if record.__dict__.get('dbnode_id', None) in self._buffered_nodes:
+            self._buffer_record(record)
+            return
+
         from django.core.exceptions import ImproperlyConfigured  # pylint: disable=no-name-in-module, import-error
 
         from aiida import orm
@@ -45,6 +95,89 @@ class DBLogHandler(logging.Handler):
             traceback.print_exc()
             raise
 
+    def flush(self):
+        """Write the buffered records to the database in a single batch per backend."""
+        from aiida import orm
+
+        self.acquire()
+        try:
+            records = self._buffer
+            self._buffer = []
+
+            for node_pk, (backend, name, count) in self._discarded.items():
+                message = f'{count} log messages were discarded, exceeding the limit of {self.rate_limit} per minute'
+                records.append((
+                    backend,
+                    logging.makeLogRecord({
+                        'name': name,
+                        'levelno': logging.WARNING,
+                        'levelname': logging.getLevelName(logging.WARNING),
+                        'msg': message,
+                        'dbnode_id': node_pk
+                    })
+                ))
+            self._discarded = {}
+
+            for backend in {backend for backend, _ in records}:
+                backend_records = [record for record_backend, record in records if record_backend is backend]
+                try:
+                    orm.Log.objects(backend).create_entries_from_records(backend_records)
+                except Exception:  # pylint: disable=broad-except
+                    # Write the records one by one, such that only those that cannot be written are lost, for example
+                    # because their node was deleted in the meantime
+                    for record in backend_records:
+                        try:
+                            orm.Log.objects(backend).create_entry_from_record(record)
+                        except Exception:  # pylint: disable=broad-except
+                            self.handleError(record)
+        finally:
+            self.release()
+
+    def close(self):
+        """Flush the buffered records before closing the handler."""
+        try:
+            self.flush()
+        finally:
+            super().close()
+
+    def _buffer_record(self, record):
+        """Add the record to the buffer, unless the rate limit of its node is exceeded, and flush if necessary.
+
+        :param record: the record of a node whose records are buffered
+        """
+        try:
+            backend = record.__dict__.pop('backend')
+        except KeyError:
+            # The backend should be set. We silently absorb this error
+            return
+
+        if self.rate_limit > 0:
+            node_pk = record.dbnode_id
+            minute = int(record.created // 60)
+            current_minute, count = self._rates.get(node_pk, (minute, 0))
+            count = count if current_minute == minute else 0
+            self._rates[node_pk] = (minute, count + 1)
+
+            if count >= self.rate_limit:
+                _, _, discarded = self._discarded.get(node_pk, (None, None, 0))
+                self._discarded[node_pk] = (backend, record.name, discarded + 1)
+                return
+
+        self._buffer.append((backend, record))
+
+        if len(self._buffer) >= self.capacity or record.levelno >= logging.WARNING:
+            self.flush()
+
+
+def get_dblog_handlers():
+    """Return the database log handlers that are attached to the ``aiida`` logger.
+
+    :return: list of :class:`DBLogHandler` instances
+    """
+    from aiida.common.log import AIIDA_LOGGER
+
+    return [handler for handler in AIIDA_LOGGER.handlers if isinstance(handler, DBLogHandler)]
+
 
 def get_dblogger_extra(node):
     """Return the additional information necessary to attach any log records to the given node instance.
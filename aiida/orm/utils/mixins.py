@@ -188,6 +188,26 @@ class Sealable:
 
         self.backend_entity.set_attribute(key, value)
 
+    @override
+    def set_attribute_many(self, attributes):
+        """Set multiple attributes.
+
+        .. note:: This will override any existing attributes that are present in the new dictionary.
+
+        :param attributes: a dictionary with the attributes to set
+        :raise aiida.common.exceptions.ModificationNotAllowed: if the node is already sealed or if the node
+            is already stored and any of the attributes is not updatable.
+        """
+        if self.is_sealed:
+            raise exceptions.ModificationNotAllowed('attributes of a sealed node are immutable')
+
+        if self.is_stored:
+            for key in attributes:
+                if key not in self._updatable_attributes:  # pylint: disable=unsupported-membership-test
+                    raise exceptions.ModificationNotAllowed(f'`{key}` is not an updatable attribute')
+
+        self.backend_entity.set_attribute_many(attributes)
+
     @override
     def delete_attribute(self, key):
         """Delete an attribute.
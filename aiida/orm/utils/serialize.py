@@ -13,15 +13,23 @@ Serialisation functions for AiiDA types
 WARNING: Changing the representation of things here may break people's current saved e.g. things like
 checkpoints and messages in the RabbitMQ queue so do so with caution.  It is fine to add representers
 for new types though.
+
+The data structures can be serialized either into a yaml dump, or into the compact representation, which is a zlib
+compressed and base64 encoded JSON document in which the types that JSON does not support natively are tagged. The
+compact representation is considerably smaller and faster to (de)serialize, and its nodes are loaded with a single query.
 """
+import base64
+from enum import Enum
 from functools import partial
+import zlib
 
 from plumpy import Bundle
-from plumpy.utils import AttributesFrozendict
+from plumpy.loaders import DefaultObjectLoader
+from plumpy.utils import AttributesDict, AttributesFrozendict
 import yaml
 
 from aiida import orm
-from aiida.common import AttributeDict
+from aiida.common import AttributeDict, LazyAttributeDict, json
 
 _NODE_TAG = '!aiida_node'
 _GROUP_TAG = '!aiida_group'
@@ -186,6 +194,7 @@ class AiiDALoader(yaml.Loader):
 
 yaml.add_representer(Bundle, represent_bundle, Dumper=AiiDADumper)
 yaml.add_representer(AttributeDict, partial(represent_mapping, _ATTRIBUTE_DICT_TAG), Dumper=AiiDADumper)
+yaml.add_representer(LazyAttributeDict, partial(represent_mapping, _ATTRIBUTE_DICT_TAG), Dumper=AiiDADumper)
 yaml.add_constructor(_ATTRIBUTE_DICT_TAG, partial(mapping_constructor, AttributeDict), Loader=AiiDALoader)
 yaml.add_representer(
     AttributesFrozendict, partial(represent_mapping, _PLUMPY_ATTRIBUTES_FROZENDICT_TAG), Dumper=AiiDADumper
@@ -226,3 +235,206 @@ def deserialize_unsafe(serialized):
     :return: the deserialized data structure
     """
     return yaml.load(serialized, Loader=AiiDALoader)
+
+
+COMPACT_PREFIX = 'aiida-compact-v1:'
+
+_TYPE_KEY = '!t'
+_VALUE_KEY = 'v'
+_CLASS_KEY = 'c'
+
+
+def serialize_compact(data):
+    """Serialize the given data structure into its compact representation.
+
+    Besides the types supported by JSON, the compact representation supports tuples, dictionaries with keys that are
+    not strings, enums, AiiDA nodes, groups and computers, and the mapping types that are supported by the yaml dump.
+
+    :param data: the general data to serialize
+    :return: string with the compact representation of the data structure, which starts with ``COMPACT_PREFIX``
+    :raises TypeError: if the data structure contains an object of a type that is not supported
+    :raises ValueError: if the data structure contains an unstored node, group or computer
+    """
+    encoded = json.dumps(_encode_compact(data), separators=(',', ':')).encode('utf-8')
+    return COMPACT_PREFIX + base64.b64encode(zlib.compress(encoded)).decode('ascii')
+
+
+def deserialize_compact(serialized):
+    """Deserialize the compact representation of a serialized data structure.
+
+    All nodes that are referenced in the data structure are loaded with a single query.
+
+    .. note:: This function should not be used on untrusted input, since it imports and instantiates the classes whose
+        identifiers are contained in the representation.
+
+    :param serialized: a compact representation as returned by ``serialize_compact``
+    :return: the deserialized data structure
+    :raises ValueError: if the serialized string is not a compact representation
+    :raises aiida.common.exceptions.NotExistent: if a referenced node, group or computer does not exist
+    """
+    return deserialize_compact_many([serialized])[0]
+
+
+def deserialize_compact_many(serialized_many):
+    """Deserialize multiple compact representations of serialized data structures.
+
+    All nodes that are referenced in any of the data structures are loaded with a single query.
+
+    :param serialized_many: a list of compact representations as returned by ``serialize_compact``
+    :return: list of the deserialized data structures
+    :raises ValueError: if one of the serialized strings is not a compact representation
+    :raises aiida.common.exceptions.NotExistent: if a referenced node, group or computer does not exist
+    """
+    from aiida.common.exceptions import NotExistent
+
+    node_uuids = set()
+
+    def collect_node_uuids(obj):
+        if obj.get(_TYPE_KEY) == 'node':
+            node_uuids.add(obj[_VALUE_KEY])
+        return obj
+
+    datas = []
+
+    for serialized in serialized_many:
+        if not is_compact(serialized):
+            raise ValueError('the serialized string is not a compact representation')
+
+        decoded = zlib.decompress(base64.b64decode(serialized[len(COMPACT_PREFIX):]))
+        datas.append(json.loads(decoded.decode('utf-8'), object_hook=collect_node_uuids))
+
+    nodes = {}
+
+    if node_uuids:
+        builder = orm.QueryBuilder().append(orm.Node, filters={'uuid': {'in': list(node_uuids)}})
+        nodes = {node.uuid: node for node, in builder.iterall()}
+
+        missing = node_uuids.difference(nodes)
+        if missing:
+            raise NotExistent(f'the nodes with the UUIDs {missing} do not exist')
+
+    loader = DefaultObjectLoader()
+
+    return [_decode_compact(data, nodes, loader) for data in datas]
+
+
+def is_compact(serialized):
+    """Return whether the given serialized string is a compact representation.
+
+    :param serialized: a serialized string representation
+    """
+    return isinstance(serialized, str) and serialized.startswith(COMPACT_PREFIX)
+
+
+def _encode_compact(data):
+    """Recursively encode the data structure into a JSON serializable structure, tagging all unsupported types."""
+    # pylint: disable=too-many-return-statements
+    if data is None or type(data) in (str, bool, int, float):
+        return data
+
+    if type(data) is list:  # pylint: disable=unidiomatic-typecheck
+        return [_encode_compact(value) for value in data]
+
+    if type(data) is dict:  # pylint: disable=unidiomatic-typecheck
+        if _TYPE_KEY not in data and all(type(key) is str for key in data):  # pylint: disable=unidiomatic-typecheck
+            return {key: _encode_compact(value) for key, value in data.items()}
+        return {_TYPE_KEY: 'dict', _VALUE_KEY: _encode_compact_items(data.items())}
+
+    if type(data) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return {_TYPE_KEY: 'tuple', _VALUE_KEY: [_encode_compact(value) for value in data]}
+
+    for entity_type, tag in ((orm.Node, 'node'), (orm.Group, 'group'), (orm.Computer, 'computer')):
+        if isinstance(data, entity_type):
+            if not data.is_stored:
+                raise ValueError(f'{tag} {type(data)}<{data.uuid}> cannot be represented because it is not stored')
+            return {_TYPE_KEY: tag, _VALUE_KEY: data.uuid}
+
+    if type(data) is Bundle:  # pylint: disable=unidiomatic-typecheck
+        return {_TYPE_KEY: 'bundle', _VALUE_KEY: _encode_compact_items(data.items())}
+
+    if type(data) is LazyAttributeDict:  # pylint: disable=unidiomatic-typecheck
+        return _encode_compact(AttributeDict(data))
+
+    if type(data) in (AttributeDict, AttributesFrozendict):
+        return {_TYPE_KEY: 'mapping', _CLASS_KEY: _identify(data), _VALUE_KEY: _encode_compact_items(data.items())}
+
+    if isinstance(data, AttributesDict):
+        return {_TYPE_KEY: 'namespace', _CLASS_KEY: _identify(data), _VALUE_KEY: _encode_compact(dict(vars(data)))}
+
+    if isinstance(data, Enum):
+        return {_TYPE_KEY: 'enum', _CLASS_KEY: _identify(data), _VALUE_KEY: _encode_compact(data.value)}
+
+    raise TypeError(f'objects of type {type(data)} are not supported by the compact representation')
+
+
+def _encode_compact_items(items):
+    """Encode the items of a mapping as a list of key-value pairs."""
+    return [[_encode_compact(key), _encode_compact(value)] for key, value in items]
+
+
+def _decode_compact(data, nodes, loader):
+    """Recursively decode the data structure that was encoded with ``_encode_compact``.
+
+    :param nodes: mapping of the UUIDs onto the loaded nodes that are referenced in the data structure
+    :param loader: the object loader used to load the classes of tagged objects
+    """
+    # pylint: disable=too-many-return-statements
+    if isinstance(data, list):
+        return [_decode_compact(value, nodes, loader) for value in data]
+
+    if not isinstance(data, dict):
+        return data
+
+    tag = data.get(_TYPE_KEY, None)
+
+    if tag is None:
+        return {key: _decode_compact(value, nodes, loader) for key, value in data.items()}
+
+    value = data[_VALUE_KEY]
+
+    if tag == 'node':
+        return nodes[value]
+
+    if tag == 'group':
+        return orm.load_group(uuid=value)
+
+    if tag == 'computer':
+        return orm.Computer.get(uuid=value)
+
+    if tag == 'enum':
+        return loader.load_object(data[_CLASS_KEY])(_decode_compact(value, nodes, loader))
+
+    if tag == 'tuple':
+        return tuple(_decode_compact(item, nodes, loader) for item in value)
+
+    if tag == 'namespace':
+        cls = loader.load_object(data[_CLASS_KEY])
+        namespace = cls.__new__(cls)
+        namespace.__dict__.update(_decode_compact(value, nodes, loader))
+        return namespace
+
+    mapping = {_decode_compact(key, nodes, loader): _decode_compact(item, nodes, loader) for key, item in value}
+
+    if tag == 'dict':
+        return mapping
+
+    if tag == 'bundle':
+        bundle = Bundle.__new__(Bundle)
+        bundle.update(mapping)
+        return bundle
+
+    if tag == 'mapping':
+        return loader.load_object(data[_CLASS_KEY])(mapping)
+
+    raise ValueError(f'unknown type tag `{tag}` in the compact representation')
+
+
+def _identify(obj):
+    """Return the identifier of the class of the given object, with which it can be loaded by an object loader.
+
+    :raises TypeError: if the class of the object cannot be loaded from its identifier
+    """
+    try:
+        return DefaultObjectLoader().identify_object(type(obj))
+    except ValueError as exception:
+        raise TypeError(f'the class of objects of type {type(obj)} cannot be loaded') from exception
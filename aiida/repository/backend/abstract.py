@@ -83,6 +83,18 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
     def _put_object_from_filelike(self, handle: BinaryIO) -> str:
         pass
 
+    def put_objects_from_filelikes(self, handles: List[BinaryIO]) -> List[str]:
+        """Store the byte contents of multiple files in the repository.
+
+        The default implementation simply stores the objects one by one. Backends that can store many objects more
+        efficiently in a single operation should override this method.
+
+        :param handles: list of filelike objects with the byte content to be stored.
+        :return: the generated fully qualified identifiers for the objects, in the same order as ``handles``.
+        :raises TypeError: if any of the handles is not a byte stream.
+        """
+        return [self.put_object_from_filelike(handle) for handle in handles]
+
     def put_object_from_file(self, filepath: Union[str, pathlib.Path]) -> str:
         """Store a new object with contents of the file located at `filepath` on this file system.
 
@@ -158,6 +170,19 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
         with self.open(key) as handle:  # pylint: disable=not-context-manager
             return chunked_file_hash(handle, hashlib.sha256)
 
+    def get_object_hashes(self, keys: List[str]) -> List[str]:
+        """Return the SHA-256 hashes of the objects stored under the given keys.
+
+        .. note:: implementations that already know the hashes, for example because the keys are SHA-256 hashes of the
+            content, should override this to avoid reading the content of every object.
+
+        :param keys: list of fully qualified identifiers for objects within the repository.
+        :return: list of hashes, in the same order as the keys provided.
+        :raise FileNotFoundError: if any of the files does not exist.
+        :raise OSError: if any of the files could not be opened.
+        """
+        return [self.get_object_hash(key) for key in keys]
+
     @abc.abstractmethod
     def delete_objects(self, keys: List[str]) -> None:
         """Delete the objects from the repository.
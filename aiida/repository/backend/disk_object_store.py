@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Implementation of the ``AbstractRepositoryBackend`` using the ``disk-objectstore`` as the backend."""
 import contextlib
+import io
 import shutil
 from typing import BinaryIO, Iterable, Iterator, List, Optional
 
@@ -69,6 +70,24 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
         """
         return self.container.add_streamed_object(handle)
 
+    def put_objects_from_filelikes(self, handles: List[BinaryIO]) -> List[str]:
+        """Store the byte contents of multiple files in the repository, writing them directly to a pack file.
+
+        All objects are written with a single call to the container, which is a lot more efficient than creating one
+        loose object per handle when storing large numbers of small objects.
+
+        .. warning:: writing directly to the packs of the container is not safe to be done concurrently with other
+            operations that write to packs, such as repacking or packing loose objects of the container.
+
+        :param handles: list of filelike objects with the byte content to be stored.
+        :return: the generated fully qualified identifiers for the objects, in the same order as ``handles``.
+        :raises TypeError: if any of the handles is not a byte stream.
+        """
+        for handle in handles:
+            if not isinstance(handle, io.BytesIO) and not self.is_readable_byte_stream(handle):
+                raise TypeError(f'handle does not seem to be a byte stream: {type(handle)}.')
+        return self.container.add_streamed_objects_to_pack(handles)
+
     def has_objects(self, keys: List[str]) -> List[bool]:
         return self.container.has_objects(keys)
 
@@ -112,3 +131,23 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
         if self.container.hash_type != 'sha256':
             return super().get_object_hash(key)
         return key
+
+    def get_object_hashes(self, keys: List[str]) -> List[str]:
+        """Return the SHA-256 hashes of the objects stored under the given keys.
+
+        If the container uses SHA-256 as its hash type, the keys are returned directly, without reading the content of
+        the objects, after checking that all of them exist with a single query.
+
+        :param keys: list of fully qualified identifiers for objects within the repository.
+        :return: list of hashes, in the same order as the keys provided.
+        :raise FileNotFoundError: if any of the files does not exist.
+        """
+        if self.container.hash_type != 'sha256':
+            return super().get_object_hashes(keys)
+
+        missing = [key for key, exists in zip(keys, self.has_objects(keys)) if not exists]
+
+        if missing:
+            raise FileNotFoundError(', '.join(missing))
+
+        return list(keys)
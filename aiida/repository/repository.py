@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Module for the implementation of a file repository."""
 import contextlib
+import io
 import pathlib
 from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
@@ -94,17 +95,25 @@ class Repository:
     def hash(self) -> str:
         """Generate a hash of the repository's contents.
 
-        .. warning:: this will read the content of all file objects contained within the virtual hierarchy into memory.
+        .. note:: the hashes of all file objects are retrieved from the backend in one go. Depending on the backend,
+            this may require reading the content of all file objects. The disk object store backend will simply return
+            the keys, which are already SHA-256 hashes of the content.
 
         :return: the hash representing the contents of the repository.
         """
         objects: Dict[str, Any] = {}
+        paths: List[str] = []
+        keys: List[str] = []
+
         for root, dirnames, filenames in self.walk():
             objects['__dirnames__'] = dirnames
             for filename in filenames:
                 key = self.get_file(root / filename).key
                 assert key is not None, 'Expected FileType.File to have a key'
-                objects[str(root / filename)] = self.backend.get_object_hash(key)
+                paths.append(str(root / filename))
+                keys.append(key)
+
+        objects.update(zip(paths, self.backend.get_object_hashes(keys)))
 
         return make_hash(objects)
 
@@ -451,6 +460,38 @@ class Repository:
                 with source.open(root / filename) as handle:
                     self.put_object_from_filelike(handle, root / filename)
 
+    @classmethod
+    def clone_many(cls, sources: List['Repository'], backend: AbstractRepositoryBackend) -> List['Repository']:
+        """Clone the contents of multiple repository instances into new instances with the given backend.
+
+        The file objects of all sources are stored with a single call to ``put_objects_from_filelikes`` of the backend,
+        which allows the backend to store them a lot more efficiently than one by one.
+
+        .. note:: the content of all file objects is read into memory, so the number and size of the sources that are
+            passed in a single call should be limited accordingly.
+
+        :param sources: the repository instances to clone.
+        :param backend: the backend to use for the cloned repository instances.
+        :return: the cloned repository instances, in the same order as ``sources``.
+        """
+        clones = [cls(backend=backend) for _ in sources]
+        targets: List[Tuple['Repository', pathlib.PurePosixPath]] = []
+        handles: List[BinaryIO] = []
+
+        for clone, source in zip(clones, sources):
+            for root, dirnames, filenames in source.walk():
+                for dirname in dirnames:
+                    clone.create_directory(root / dirname)
+                for filename in filenames:
+                    targets.append((clone, root / filename))
+                    handles.append(io.BytesIO(source.get_object_content(root / filename)))
+
+        if handles:
+            for (clone, path), key in zip(targets, backend.put_objects_from_filelikes(handles)):
+                clone._insert_file(path, key)  # pylint: disable=protected-access
+
+        return clones
+
     def walk(self, path: FilePath = None) -> Iterable[Tuple[pathlib.PurePosixPath, List[str], List[str]]]:
         """Walk over the directories and files contained within this repository.
 
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Cache of the responses of the REST API.
+
+A cached response is served without querying the database for as long as its timeout has not expired. After that, it is
+only served again if the ``token`` of the state of the database, as returned by the translator of the resource, is
+unchanged. The token is based on the maximum values of indexed columns, such as the ``id`` and ``mtime``, of the
+entities that determine the response. Each cached response has an ``etag``, with which clients can conditionally request
+a resource such that it is not sent again if it has not changed.
+"""
+import abc
+import collections
+import hashlib
+import os
+import pathlib
+import tempfile
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+
+class CachedResponse(NamedTuple):
+    """The headers and results of a response of the REST API, as stored in a ``ResponseCache``."""
+
+    token: Optional[str]  # the token of the state of the database with which the response was computed
+    etag: str  # the entity tag of the response
+    validated: float  # the time at which the response was last known to be valid
+    headers: Dict[str, Any]
+    results: Any
+
+
+class ResponseCache(abc.ABC):
+    """Base class for a cache of the responses of the REST API, keyed on the normalized url of the request."""
+
+    DEFAULT_TIMEOUT = 10
+
+    def __init__(self, timeouts: Optional[Dict[str, float]] = None):
+        """Construct a new cache.
+
+        :param timeouts: mapping of resource types onto the number of seconds during which their cached responses are
+            served without being validated against the database
+        """
+        self._timeouts = timeouts or {}
+
+    def get_timeout(self, resource_type: str) -> float:
+        """Return the number of seconds during which a cached response of the given resource type is not validated.
+
+        :param resource_type: the resource type, e.g. ``nodes``
+        """
+        return self._timeouts.get(resource_type, self.DEFAULT_TIMEOUT)
+
+    def is_fresh(self, response: CachedResponse, resource_type: str) -> bool:
+        """Return whether the cached response can be served without validating it against the database.
+
+        :param response: the cached response
+        :param resource_type: the resource type of the response
+        """
+        return time.time() - response.validated < self.get_timeout(resource_type)
+
+    @staticmethod
+    def get_etag(results: Any) -> str:
+        """Return the entity tag for the given results of a response.
+
+        :param results: the results
+        :raises TypeError: if the results cannot be serialized
+        """
+        from flask import json
+
+        return hashlib.md5(json.dumps(results, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for the given key.
+
+        :param key: the key of the response
+        :return: the cached response or ``None`` if it is not in the cache
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Store the response for the given key.
+
+        :param key: the key of the response
+        :param response: the response
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all responses from the cache."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """Cache that keeps the most recently used responses in memory."""
+
+    def __init__(self, maxsize: int = 256, timeouts: Optional[Dict[str, float]] = None):
+        """Construct a new cache.
+
+        :param maxsize: the maximum number of responses in the cache, after which the least recently used is removed
+        :param timeouts: mapping of resource types onto the number of seconds during which their cached responses are
+            served without being validated against the database
+        """
+        super().__init__(timeouts)
+        self._maxsize = maxsize
+        self._responses: 'collections.OrderedDict[str, CachedResponse]' = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            try:
+                self._responses.move_to_end(key)
+            except KeyError:
+                return None
+            return self._responses[key]
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._responses[key] = response
+            self._responses.move_to_end(key)
+            while len(self._responses) > self._maxsize:
+                self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+
+
+class FileResponseCache(ResponseCache):
+    """Cache that stores the responses as files in a directory, such that it is shared by multiple processes.
+
+    Responses are stored in their JSON serialized form and are removed in order of their last use.
+    """
+
+    def __init__(
+        self,
+        dirpath: Union[str, pathlib.Path],
+        maxsize: int = 256,
+        timeouts: Optional[Dict[str, float]] = None,
+    ):
+        """Construct a new cache.
+
+        :param dirpath: the directory in which the responses are stored
+        :param maxsize: the maximum number of responses in the cache, after which the least recently used is removed
+        :param timeouts: mapping of resource types onto the number of seconds during which their cached responses are
+            served without being validated against the database
+        """
+        super().__init__(timeouts)
+        self._dirpath = pathlib.Path(dirpath)
+        self._maxsize = maxsize
+
+    def _get_filepath(self, key: str) -> pathlib.Path:
+        return self._dirpath / f'{hashlib.sha256(key.encode("utf-8")).hexdigest()}.json'
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        from flask import json
+
+        filepath = self._get_filepath(key)
+
+        try:
+            with filepath.open('rb') as handle:
+                content = json.load(handle)
+            os.utime(filepath)
+        except (OSError, ValueError):
+            return None
+
+        if content.get('key') != key:
+            return None
+
+        try:
+            return CachedResponse(**{field: content[field] for field in CachedResponse._fields})
+        except KeyError:
+            return None
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        from flask import json
+
+        self._dirpath.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile('w', dir=self._dirpath, suffix='.tmp', delete=False) as handle:
+            json.dump({'key': key, **response._asdict()}, handle)
+
+        os.replace(handle.name, self._get_filepath(key))
+
+        filepaths = list(self._dirpath.glob('*.json'))
+
+        if len(filepaths) > self._maxsize:
+            filepaths.sort(key=self._get_last_used)
+            for filepath in filepaths[:len(filepaths) - self._maxsize]:
+                try:
+                    filepath.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _get_last_used(filepath: pathlib.Path) -> float:
+        try:
+            return filepath.stat().st_mtime
+        except OSError:
+            return 0
+
+    def clear(self) -> None:
+        for filepath in self._dirpath.glob('*.json'):
+            try:
+                filepath.unlink()
+            except OSError:
+                pass
+
+
+def get_response_cache(cache_config: Optional[Dict[str, Any]],
+                       timeouts: Optional[Dict[str, float]] = None) -> Optional[ResponseCache]:
+    """Return the response cache for the given configuration.
+
+    :param cache_config: the ``CACHE_CONFIG`` of the REST API configuration, with the type of the cache ``CACHE_TYPE``,
+        which is either ``memory``, ``file`` or ``None`` to disable the cache, the maximum number of responses in the
+        cache ``CACHE_MAXSIZE`` and, for the ``file`` cache, the directory ``CACHE_DIR`` in which the responses are
+        stored, which defaults to a directory of the current profile in the AiiDA configuration folder
+    :param timeouts: the ``CACHING_TIMEOUTS`` of the REST API configuration
+    :return: the response cache, or ``None`` if it is disabled
+    :raises ValueError: if the type of the cache is unknown
+    """
+    cache_config = cache_config or {}
+    cache_type = cache_config.get('CACHE_TYPE', None)
+    maxsize = cache_config.get('CACHE_MAXSIZE', 256)
+
+    if cache_type is None:
+        return None
+
+    if cache_type == 'memory':
+        return MemoryResponseCache(maxsize=maxsize, timeouts=timeouts)
+
+    if cache_type == 'file':
+        dirpath = cache_config.get('CACHE_DIR', None)
+
+        if dirpath is None:
+            from aiida.manage.configuration import get_profile
+            from aiida.manage.configuration.settings import AIIDA_CONFIG_FOLDER
+            dirpath = pathlib.Path(AIIDA_CONFIG_FOLDER) / 'restapi' / get_profile().name
+
+        return FileResponseCache(dirpath, maxsize=maxsize, timeouts=timeouts)
+
+    raise ValueError(f'unknown cache type `{cache_type}`, choose from: memory, file')
@@ -26,8 +26,12 @@ APP_CONFIG = {
 
 SERIALIZER_CONFIG = {'datetime_format': 'default'}  # use 'asinput' or 'default'
 
-CACHE_CONFIG = {'CACHE_TYPE': 'memcached'}
-CACHING_TIMEOUTS = {  # Caching timeouts in seconds
+CACHE_CONFIG = {
+    'CACHE_TYPE': 'memory',  # `memory`, `file` to share the cache between processes, or None to disable it
+    'CACHE_MAXSIZE': 256,  # maximum number of cached responses
+    'CACHE_DIR': None,  # directory of the `file` cache, defaults to one for the profile in the AiiDA config folder
+}
+CACHING_TIMEOUTS = {  # Seconds during which cached responses are served without validating them against the database
     'nodes': 10,
     'users': 10,
     'calculations': 10,
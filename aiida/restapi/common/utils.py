@@ -213,7 +213,14 @@ class Utils:
         return (resource_type, page, node_id, query_type)
 
     def validate_request(
-        self, limit=None, offset=None, perpage=None, page=None, query_type=None, is_querystring_defined=False
+        self,
+        limit=None,
+        offset=None,
+        perpage=None,
+        page=None,
+        query_type=None,
+        is_querystring_defined=False,
+        after=None
     ):
         # pylint: disable=fixme,no-self-use,too-many-arguments,too-many-branches
         """
@@ -240,6 +247,9 @@ class Utils:
         # 4. No querystring if query type = projectable_properties'
         if query_type in ('projectable_properties',) and is_querystring_defined:
             raise RestInputValidationError('projectable_properties requests do not allow specifying a query string')
+        # 5. after (keyset pagination) incompatible with offset and pages
+        if after is not None and (offset is not None or page is not None):
+            raise RestValidationError('after key is incompatible with offset and requesting a specific page')
 
     def paginate(self, page, perpage, total_count):
         """
@@ -306,13 +316,15 @@ class Utils:
 
         return (limit, offset, rel_pages)
 
-    def build_headers(self, rel_pages=None, url=None, total_count=None):
+    def build_headers(self, rel_pages=None, url=None, total_count=None, next_cursor=None):
         """
         Construct the header dictionary for an HTTP response. It includes related
-        pages, total count of results (before pagination).
+        pages, total count of results (before pagination) and the cursor of the
+        next page for keyset pagination.
 
         :param rel_pages: a dictionary defining related pages (first, prev, next, last)
         :param url: (string) the full url, i.e. the url that the client uses to get Rest resources
+        :param next_cursor: the value of the after key that requests the next page
         """
 
         ## Type validation
@@ -376,6 +388,21 @@ class Utils:
             else:
                 pass
 
+        # set the cursor of and the link to the next page of keyset pagination
+        if next_cursor is not None:
+            headers['X-Next-Cursor'] = next_cursor
+            expose_header.append('X-Next-Cursor')
+
+            if url is not None:
+                (path, query_string, _) = split_url(url)
+                parameters = [
+                    parameter for parameter in query_string.split('&')
+                    if parameter and not parameter.startswith('after=')
+                ]
+                parameters.append(f'after={next_cursor}')
+                headers['Link'] = f"<{path}?{'&'.join(parameters)}>; rel=next"
+                expose_header.append('Link')
+
         # to expose header access in cross-domain requests
         headers['Access-Control-Expose-Headers'] = ','.join(expose_header)
 
@@ -473,6 +500,7 @@ class Utils:
         orderby = []
         limit = None
         offset = None
+        after = None
         perpage = None
         filename = None
         download_format = None
@@ -511,6 +539,8 @@ class Utils:
             raise RestInputValidationError('You cannot specify limit more than once')
         if 'offset' in field_counts.keys() and field_counts['offset'] > 1:
             raise RestInputValidationError('You cannot specify offset more than once')
+        if 'after' in field_counts.keys() and field_counts['after'] > 1:
+            raise RestInputValidationError('You cannot specify after more than once')
         if 'perpage' in field_counts.keys() and field_counts['perpage'] > 1:
             raise RestInputValidationError('You cannot specify perpage more than once')
         if 'orderby' in field_counts.keys() and field_counts['orderby'] > 1:
@@ -548,6 +578,11 @@ class Utils:
                     offset = field[2]
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'offset'")
+            elif field[0] == 'after':
+                if field[1] == '=':
+                    after = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'after'")
             elif field[0] == 'perpage':
                 if field[1] == '=':
                     perpage = field[2]
@@ -654,7 +689,7 @@ class Utils:
 
         return (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, after
         )
 
     def parse_query_string(self, query_string):
@@ -8,12 +8,14 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """ Resources for REST API """
+import time
 from urllib.parse import unquote
 
 from flask import make_response, request
 from flask_restful import Resource
 
 from aiida.common.lang import classproperty
+from aiida.restapi.common.cache import CachedResponse
 from aiida.restapi.common.exceptions import RestInputValidationError
 from aiida.restapi.common.utils import Utils, close_session
 
@@ -100,8 +102,6 @@ class BaseResource(Resource):
 
     method_decorators = [close_session]  # Close SQLA session after any method call
 
-    ## TODO add the caching support. I cache total count, results, and possibly
-
     def __init__(self, **kwargs):
         self.trans = self._translator_class(**kwargs)
 
@@ -110,6 +110,9 @@ class BaseResource(Resource):
         self.utils_confs = {k: kwargs[k] for k in utils_conf_keys if k in kwargs}
         self.utils = Utils(**self.utils_confs)
 
+        # Cache of the responses, shared by all resources of the api
+        self.response_cache = kwargs.get('response_cache', None)
+
         # HTTP Request method decorators
         if 'get_decorators' in kwargs and isinstance(kwargs['get_decorators'], (tuple, list, set)):
             self.method_decorators = {'get': list(kwargs['get_decorators'])}
@@ -130,6 +133,88 @@ class BaseResource(Resource):
 
         return node
 
+    @staticmethod
+    def _get_cache_key():
+        """
+        Returns the key of the current request in the response cache, which
+        is its url, with the parameters of the query string in a normalized order.
+        """
+        query_string = unquote(request.query_string.decode('utf-8'))
+        parameters = '&'.join(sorted(parameter for parameter in query_string.split('&') if parameter))
+        return f'{unquote(request.base_url)}?{parameters}'
+
+    def _get_cached_response(self, key, resource_type):
+        """
+        Returns the cached response for the current request, if it is still valid.
+        A cached response is valid if its timeout has not expired, or otherwise if
+        the cache token of the translator did not change since it was computed.
+
+        :param key: the key of the request in the response cache
+        :param resource_type: the resource type of the request
+        :return: a tuple of the cached response, or None if it has to be computed,
+            and the current cache token of the translator
+        """
+        if self.response_cache is None or key is None:
+            return None, None
+
+        cached = self.response_cache.get(key)
+
+        if cached is not None and self.response_cache.is_fresh(cached, resource_type):
+            return cached, cached.token
+
+        token = self.trans.get_cache_token()
+
+        if cached is not None and cached.token is not None and cached.token == token:
+            cached = cached._replace(validated=time.time())
+            self.response_cache.set(key, cached)
+            return cached, token
+
+        return None, token
+
+    def _set_cached_response(self, key, token, headers, results):
+        """
+        Stores the headers and results of the response to the current request in the response cache.
+
+        :param key: the key of the request in the response cache
+        :param token: the cache token of the translator before the results were computed
+        :param headers: the headers of the response
+        :param results: the results of the response
+        :return: the cached response, or None if it cannot be cached
+        """
+        if self.response_cache is None or key is None:
+            return None
+
+        try:
+            etag = self.response_cache.get_etag(results)
+        except TypeError:
+            return None
+
+        cached = CachedResponse(token=token, etag=etag, validated=time.time(), headers=headers, results=results)
+        self.response_cache.set(key, cached)
+
+        return cached
+
+    def _build_cached_response(self, cached, headers, data):
+        """
+        Builds the response to the current request. If the response is cached and the
+        client already has it, as indicated by the `If-None-Match` header, the response
+        is `Not Modified` without any data.
+
+        :param cached: the cached response, or None if the response is not cached
+        :param headers: the headers of the response
+        :param data: the data of the response
+        :return: a Flask response object
+        """
+        if cached is not None and request.if_none_match.contains(cached.etag):
+            response = make_response('', 304)
+        else:
+            response = self.utils.build_response(status=200, headers=headers, data=data)
+
+        if cached is not None:
+            response.set_etag(cached.etag)
+
+        return response
+
     def get(self, id=None, page=None):  # pylint: disable=redefined-builtin,invalid-name,unused-argument
         # pylint: disable=too-many-locals
         """
@@ -151,7 +236,7 @@ class BaseResource(Resource):
         # pylint: disable=unused-variable
         (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, after
         ) = self.utils.parse_query_string(query_string)
 
         ## Validate request
@@ -161,11 +246,19 @@ class BaseResource(Resource):
             perpage=perpage,
             page=page,
             query_type=query_type,
-            is_querystring_defined=(bool(query_string))
+            is_querystring_defined=(bool(query_string)),
+            after=after
         )
 
+        ## Serve the response from the cache if it is still valid
+        cache_key = self._get_cache_key()
+        cached, cache_token = self._get_cached_response(cache_key, resource_type)
+
+        if cached is not None:
+            headers, results = cached.headers, cached.results
+
         ## Treat the projectable_properties case which does not imply access to the DataBase
-        if query_type == 'projectable_properties':
+        elif query_type == 'projectable_properties':
 
             ## Retrieve the projectable properties
             projectable_properties, ordering = self.trans.get_projectable_properties()
@@ -185,12 +278,23 @@ class BaseResource(Resource):
                 (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
                 self.trans.set_limit_offset(limit=limit, offset=offset)
                 headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
+
+                ## Retrieve results
+                results = self.trans.get_results()
             else:
                 self.trans.set_limit_offset(limit=limit, offset=offset)
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                if after is not None:
+                    self.trans.set_after(after)
+
+                ## Retrieve results
+                results = self.trans.get_results()
+
+                headers = self.utils.build_headers(
+                    url=request.url, total_count=total_count, next_cursor=self.trans.get_next_cursor(results)
+                )
 
-            ## Retrieve results
-            results = self.trans.get_results()
+        if cached is None:
+            cached = self._set_cached_response(cache_key, cache_token, headers, results)
 
         ## Build response and return it
         data = dict(
@@ -204,7 +308,7 @@ class BaseResource(Resource):
             data=results
         )
 
-        return self.utils.build_response(status=200, headers=headers, data=data)
+        return self._build_cached_response(cached, headers, data)
 
 
 class QueryBuilder(BaseResource):
@@ -365,7 +469,7 @@ class Node(BaseResource):
 
         (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, after
         ) = self.utils.parse_query_string(query_string)
 
         ## Validate request
@@ -375,11 +479,20 @@ class Node(BaseResource):
             perpage=perpage,
             page=page,
             query_type=query_type,
-            is_querystring_defined=(bool(query_string))
+            is_querystring_defined=(bool(query_string)),
+            after=after
         )
 
+        ## Serve the response from the cache if it is still valid, except for the contents of files and the comments,
+        ## whose modification is not reflected by the cache token
+        cache_key = self._get_cache_key() if query_type not in ('download', 'repo_contents', 'comments') else None
+        cached, cache_token = self._get_cached_response(cache_key, resource_type)
+
+        if cached is not None:
+            headers, results = cached.headers, cached.results
+
         ## Treat the projectable properties case which does not imply access to the DataBase
-        if query_type == 'projectable_properties':
+        elif query_type == 'projectable_properties':
 
             ## Retrieve the projectable properties
             projectable_properties, ordering = self.trans.get_projectable_properties()
@@ -450,6 +563,9 @@ class Node(BaseResource):
             else:
 
                 self.trans.set_limit_offset(limit=limit, offset=offset)
+                if after is not None:
+                    self.trans.set_after(after)
+
                 ## Retrieve results
                 results = self.trans.get_results()
 
@@ -471,7 +587,11 @@ class Node(BaseResource):
 
                     results = results['download']['data']
 
-                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                next_cursor = None
+                if query_type in ('default', 'incoming', 'outgoing'):
+                    next_cursor = self.trans.get_next_cursor(results)
+
+                headers = self.utils.build_headers(url=request.url, total_count=total_count, next_cursor=next_cursor)
 
             if attributes_filter is not None and attributes:
                 for node in results['nodes']:
@@ -491,6 +611,9 @@ class Node(BaseResource):
                         node['extras'][str(extra)] = node[f'extras.{str(extra)}']
                         del node[f'extras.{str(extra)}']
 
+        if cached is None:
+            cached = self._set_cached_response(cache_key, cache_token, headers, results)
+
         ## Build response
         data = dict(
             method=request.method,
@@ -503,7 +626,7 @@ class Node(BaseResource):
             data=results
         )
 
-        return self.utils.build_response(status=200, headers=headers, data=data)
+        return self._build_cached_response(cached, headers, data)
 
 
 class Computer(BaseResource):
@@ -105,5 +105,12 @@ def configure_api(flask_app=api_classes.App, flask_api=api_classes.AiidaApi, **k
         app.config['PROFILE'] = True
         app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[30])
 
+    # Set up the cache of the responses
+    from aiida.restapi.common.cache import get_response_cache
+
+    response_cache = get_response_cache(
+        getattr(config_module, 'CACHE_CONFIG', None), getattr(config_module, 'CACHING_TIMEOUTS', None)
+    )
+
     # Instantiate and return a Flask RESTful API by associating its app
-    return flask_api(app, posting=posting, **config_module.API_CONFIG)
+    return flask_api(app, posting=posting, response_cache=response_cache, **config_module.API_CONFIG)
@@ -36,9 +36,17 @@ class BaseTranslator:
 
     _default = _default_projections = ['**']
 
+    # The AiiDA classes whose state determines the validity of cached responses, mapped onto their indexed columns whose
+    # maximum value changes when an entity is created or modified
+    _cache_token_columns = {}
+
+    # The columns, besides the id, by which results can be ordered with keyset pagination
+    _keyset_columns = ()
+
     _is_qb_initialized = False
     _is_id_query = None
     _total_count = None
+    _limit = None
 
     def __init__(self, **kwargs):
         """
@@ -108,18 +116,49 @@ class BaseTranslator:
         else:
             raise InvalidOperation('query builder object has not been initialized.')
 
-            # def caching_method(self):
-            #     """
-            #     class method for caching. It is a wrapper of the
-            # flask_cache memoize
-            #     method. To be used as a decorator
-            #     :return: the flask_cache memoize method with the timeout kwarg
-            #     corrispondent to the class
-            #     """
-            #     return cache.memoize()
-            #
+    def get_cache_token(self):
+        """
+        Returns a token of the state of the database with respect to the entities
+        of this translator. A cached response of the REST API is valid as long as
+        the token is unchanged.
+
+        The token consists of the maximum value of each of the `_cache_token_columns`,
+        such as the id and the modification time, so that both the creation of new
+        entities and changes to existing ones invalidate the response. The maxima are
+        looked up through the indexes of the columns, rather than by scanning or
+        counting all the entities. As a consequence, the deletion of entities that are
+        not the most recently created ones does not change the token.
+
+        :return: the token, or None if the state cannot be determined, in which
+            case cached responses are only valid until their timeout expires
+        """
+        if not self._cache_token_columns:
+            return None
 
-            #    @cache.memoize(timeout=CACHING_TIMEOUTS[self.__label__])
+        tokens = []
+        for cls, columns in self._cache_token_columns.items():
+            for column in columns:
+                tokens.append(self.get_maximum(QueryBuilder().append(cls, tag='entity'), 'entity', column))
+
+        return ','.join(tokens)
+
+    @staticmethod
+    def get_maximum(qbobj, tag, column):
+        """
+        Returns the maximum value of a column of the given query as a string. The
+        query is ordered by the column and limited to one row, instead of projecting
+        the aggregate, such that the database can look it up through its index.
+
+        :param qbobj: the query builder object
+        :param tag: the tag of the entity or link in the query
+        :param column: the column
+        :return: the maximum value, or 'None' if the query has no results
+        """
+        qbobj.add_filter(tag, {column: {'!==': None}})
+        qbobj.add_projection(tag, column)
+        qbobj.order_by({tag: {column: 'desc'}}).limit(1)
+        result = qbobj.first()
+        return str(result[0] if result else None)
 
     def get_total_count(self):
         """
@@ -248,8 +287,10 @@ class BaseTranslator:
             return order_dict
 
         ## Assign orderby field query_help
-        if 'id' not in orders[self._result_type] and '-id' not in orders[self._result_type]:
-            orders[self._result_type].append('id')
+        # The id is added, in the direction of the last column, to make the order unique
+        result_columns = orders[self._result_type]
+        if 'id' not in result_columns and '-id' not in result_columns:
+            result_columns.append('-id' if result_columns and result_columns[-1][0] == '-' else 'id')
         for tag, columns in orders.items():
             self._query_help['order_by'][tag] = def_order(columns)
 
@@ -386,6 +427,7 @@ class BaseTranslator:
                 raise InputValidationError('Offset value must be an integer')
 
         if self._is_qb_initialized:
+            self._limit = limit
             if limit is not None:
                 self.qbobj.limit(limit)
             else:
@@ -397,6 +439,89 @@ class BaseTranslator:
         else:
             raise InvalidOperation('query builder object has not been initialized.')
 
+    def get_keyset_order(self):
+        """
+        Returns the order of the results if it is supported by keyset pagination,
+        i.e. by `id` only or by one of the `_keyset_columns` and `id`, all in the
+        same direction.
+
+        :return: a tuple of the list of ordered columns and the direction
+            (asc or desc), or None if the order is not supported
+        """
+        orders = self._query_help['order_by'].get(self._result_type) or {PK_DBSYNONYM: 'asc'}
+        columns = list(orders.keys())
+        # The query builder replaces the direction by an order specification when it is initialized
+        directions = {order['order'] if isinstance(order, dict) else order for order in orders.values()}
+
+        if len(directions) != 1 or columns[-1] != PK_DBSYNONYM:
+            return None
+
+        if len(columns) > 2 or (len(columns) == 2 and columns[0] not in self._keyset_columns):
+            return None
+
+        return columns, directions.pop()
+
+    def set_after(self, after):
+        """
+        Sets the cursor of keyset pagination directly to the query_builder object,
+        such that only the results that come after the entity with the given id,
+        in the order of the query, are returned. Contrary to an offset, the cost
+        of the query does not increase with the number of skipped results.
+
+        :param after: the id of the last result of the previous page
+        """
+        if not self._is_qb_initialized:
+            raise InvalidOperation('query builder object has not been initialized.')
+
+        try:
+            after = int(after)
+        except ValueError:
+            raise InputValidationError('after value must be an integer')
+
+        if self._is_id_query and self._result_type == self.__label__:
+            raise RestInputValidationError('the after key cannot be used when selecting a specific id')
+
+        keyset_order = self.get_keyset_order()
+
+        if keyset_order is None:
+            columns = ', '.join((PK_DBSYNONYM,) + self._keyset_columns)
+            raise RestInputValidationError(f'the after key requires the results to be ordered by one of: {columns}')
+
+        keys, order = keyset_order
+        cursor = [after]
+
+        # Look up the values of the other ordered columns of the entity of the cursor
+        if len(keys) > 1:
+            qbobj = QueryBuilder().append(self._aiida_class, filters={PK_DBSYNONYM: after}, project=keys[:-1])
+            values = qbobj.first()
+            if values is None:
+                raise RestInputValidationError(f'no entity found with id {after} given for the after key')
+            cursor = values + cursor
+
+        self.qbobj.after(self._result_type, cursor=cursor, keys=keys, order=order)
+
+    def get_next_cursor(self, results):
+        """
+        Returns the cursor of keyset pagination for the page that follows the given
+        results, which is the id of the last result. The cursor is only returned
+        if the results fill the page and their order supports keyset pagination.
+
+        :param results: the results of the query as returned by `get_results`
+        :return: the cursor or None
+        """
+        if self._limit is None or (self._is_id_query and self._result_type == self.__label__):
+            return None
+
+        if len(results) != 1 or self.get_keyset_order() is None:
+            return None
+
+        entities = list(results.values())[0]
+
+        if not isinstance(entities, list) or len(entities) != self._limit:
+            return None
+
+        return entities[-1].get(PK_DBSYNONYM)
+
     def get_formatted_result(self, label):
         """
         Runs the query and retrieves results tagged as "label".
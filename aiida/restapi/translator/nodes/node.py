@@ -57,6 +57,11 @@ class NodeTranslator(BaseTranslator):
 
     _result_type = __label__
 
+    # Log records are part of the state of process nodes, and they are never modified, only created
+    _cache_token_columns = {orm.Node: ('id', 'mtime'), orm.Log: ('id',)}
+
+    _keyset_columns = ('ctime',)
+
     _content_type = None
 
     _attributes_filter = None
@@ -95,6 +100,17 @@ class NodeTranslator(BaseTranslator):
         self._subclasses = self._get_subclasses()
         self._backend = get_manager().get_backend()
 
+    def get_cache_token(self):
+        """
+        Extends the token with the most recently created link, since links are never
+        modified and their creation does not modify the nodes that they connect.
+
+        :return: the token
+        """
+        qbobj = orm.QueryBuilder().append(orm.Node, tag='source')
+        qbobj.append(orm.Node, with_incoming='source', edge_tag='link')
+        return f"{super().get_cache_token()},{self.get_maximum(qbobj, 'link', 'id')}"
+
     def set_query_type(
         self,
         query_type,
@@ -30,6 +30,7 @@ from .data import *
 from .graph import *
 from .groups import *
 from .importexport import *
+from .rehash import *
 from .visualization import *
 
 __all__ = (
@@ -68,6 +69,7 @@ __all__ = (
     'NoGroupsInPathError',
     'Orbital',
     'ProgressBarError',
+    'REHASH_LOGGER',
     'ReaderJsonBase',
     'ReaderJsonFolder',
     'ReaderJsonTar',
@@ -91,6 +93,7 @@ __all__ = (
     'import_data',
     'null_callback',
     'pstate_node_styles',
+    'rehash_nodes',
     'spglib_tuple_to_structure',
     'structure_to_spglib_tuple',
 )
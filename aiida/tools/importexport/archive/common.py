@@ -25,6 +25,21 @@ __all__ = ('ArchiveMetadata', 'detect_archive_type', 'null_callback', 'CacheFold
 
 ARCHIVE_LOGGER = AIIDA_LOGGER.getChild('archive')
 
+# The database data is stored in this folder of the archive, as files of JSON lines that can be written and read lazily
+ARCHIVE_DATA_FOLDER = 'data'
+# Each line contains the dictionary of a single link
+ARCHIVE_LINKS_FILENAME = 'links.jsonl'
+# Each line contains a ``[group_uuid, [node_uuid, ...]]`` pair
+ARCHIVE_GROUP_NODES_FILENAME = 'group_nodes.jsonl'
+
+
+def get_entity_data_filename(name: str) -> str:
+    """Return the name of the file in the data folder that contains the ``[pk, fields]`` lines of an entity type.
+
+    :param name: the name of the entity (e.g. 'Node')
+    """
+    return f'{name}.jsonl'
+
 
 @dataclasses.dataclass
 class ArchiveMetadata:
@@ -24,6 +24,7 @@ from .v09_to_v10 import migrate_v9_to_v10
 from .v10_to_v11 import migrate_v10_to_v11
 from .v11_to_v12 import migrate_v11_to_v12
 from .v12_to_v13 import migrate_v12_to_v13
+from .v13_to_v14 import migrate_v13_to_v14
 
 # version from -> version to, function which acts on the cache folder
 _vtype = Dict[str, Tuple[str, Callable[[CacheFolder], None]]]
@@ -40,4 +41,5 @@ MIGRATE_FUNCTIONS: _vtype = {
     '0.10': ('0.11', migrate_v10_to_v11),
     '0.11': ('0.12', migrate_v11_to_v12),
     '0.12': ('0.13', migrate_v12_to_v13),
+    '0.13': ('0.14', migrate_v13_to_v14),
 }
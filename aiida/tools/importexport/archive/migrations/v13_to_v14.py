@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Migration from v0.13 to v0.14, used by ``verdi archive migrate`` command.
+
+The database data is no longer stored in a single ``data.json`` file, which has to be loaded in memory as a whole, but
+in a ``data`` folder with one file of JSON lines per entity type, plus one for the links and one for the group members.
+The attributes and extras of nodes are stored with the other fields of each node.
+"""
+from pathlib import Path
+from typing import Any, Iterable
+
+from aiida.common import json
+from aiida.tools.importexport.archive.common import CacheFolder
+
+from .utils import update_metadata, verify_metadata_version
+
+
+def _write_lines(path: Path, lines: Iterable[Any]):
+    """Write each item as a line of JSON to a file."""
+    with path.open('wb') as handle:
+        for line in lines:
+            handle.write(json.dumps(line).encode('utf8'))
+            handle.write(b'\n')
+
+
+def migrate_v13_to_v14(folder: CacheFolder):
+    """Migration of export files from v0.13 to v0.14."""
+    old_version = '0.13'
+    new_version = '0.14'
+
+    _, metadata = folder.load_json('metadata.json')
+
+    verify_metadata_version(metadata, old_version)
+    update_metadata(metadata, new_version)
+
+    _, data = folder.load_json('data.json')
+
+    data_path = folder.get_path(flush=False) / 'data'
+    data_path.mkdir(exist_ok=True)
+
+    node_attributes = data.get('node_attributes', {})
+    node_extras = data.get('node_extras', {})
+
+    for entity_name, entities in data.get('export_data', {}).items():
+        if entity_name == 'Node':
+            for pk, fields in entities.items():
+                fields['attributes'] = node_attributes.get(pk, {})
+                fields['extras'] = node_extras.get(pk, {})
+        _write_lines(data_path / f'{entity_name}.jsonl', ([int(pk), fields] for pk, fields in entities.items()))
+
+    _write_lines(data_path / 'links.jsonl', data.get('links_uuid', []))
+    groups_uuid = data.get('groups_uuid', {})
+    _write_lines(data_path / 'group_nodes.jsonl', ([uuid, nodes] for uuid, nodes in groups_uuid.items()))
+
+    folder.remove_file('data.json')
+    folder.write_json('metadata.json', metadata)
@@ -9,12 +9,13 @@
 ###########################################################################
 """Archive reader classes."""
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from distutils.version import StrictVersion
 import json
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 import tarfile
 from types import TracebackType
-from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type, cast
+from typing import IO, Any, Callable, ContextManager, Dict, Iterator, List, Optional, Set, Tuple, Type, cast
 import zipfile
 
 from archive_path import TarPath, ZipPath, read_file_in_tar, read_file_in_zip
@@ -23,7 +24,14 @@ from disk_objectstore import Container
 from aiida.common.exceptions import InvalidOperation
 from aiida.common.folders import SandboxFolder
 from aiida.common.log import AIIDA_LOGGER
-from aiida.tools.importexport.archive.common import ArchiveMetadata, null_callback
+from aiida.tools.importexport.archive.common import (
+    ARCHIVE_DATA_FOLDER,
+    ARCHIVE_GROUP_NODES_FILENAME,
+    ARCHIVE_LINKS_FILENAME,
+    ArchiveMetadata,
+    get_entity_data_filename,
+    null_callback,
+)
 from aiida.tools.importexport.common.config import EXPORT_VERSION, GROUP_ENTITY_NAME, NODE_ENTITY_NAME, ExportFileFormat
 from aiida.tools.importexport.common.exceptions import CorruptArchive, IncompatibleArchiveVersionError
 
@@ -187,9 +195,12 @@ class ArchiveReaderAbstract(ABC):
 
 
 class ReaderJsonBase(ArchiveReaderAbstract):
-    """A reader base for the JSON compressed formats."""
+    """A reader base for the JSON compressed formats.
+
+    The database data is stored as files of JSON lines, which are parsed lazily one line at a time, such that the
+    memory usage of reading an archive does not grow with the number of entities and links it contains.
+    """
 
-    FILENAME_DATA = 'data.json'
     FILENAME_METADATA = 'metadata.json'
 
     def __init__(self, filename: str, sandbox_in_repo: bool = False, **kwargs: Any):
@@ -202,7 +213,8 @@ class ReaderJsonBase(ArchiveReaderAbstract):
         """
         super().__init__(filename, **kwargs)
         self._metadata = None
-        self._data = None
+        # cache of the number of lines in each data file
+        self._line_counts: Dict[str, int] = {}
         # a temporary folder used to extract the file tree
         self._sandbox: Optional[SandboxFolder] = None
         self._sandbox_in_repo = sandbox_in_repo
@@ -226,17 +238,46 @@ class ReaderJsonBase(ArchiveReaderAbstract):
         self._sandbox.erase()  # type: ignore
         self._sandbox = None
         self._metadata = None
-        self._data = None
+        self._line_counts = {}
         super().__exit__(exctype, excinst, exctb)
 
     def _get_metadata(self):
         """Retrieve the metadata JSON."""
         raise NotImplementedError()
 
-    def _get_data(self):
-        """Retrieve the data JSON."""
+    def _open_data_file(self, path: str) -> ContextManager[IO[bytes]]:
+        """Open a file of the archive for reading in binary mode.
+
+        :param path: the path of the file, relative to the root of the archive
+        :raises FileNotFoundError: if the file is not contained in the archive
+        """
         raise NotImplementedError()
 
+    def _iter_data_lines(self, filename: str, required: bool = False) -> Iterator[bytes]:
+        """Iterate over the non-empty lines of a file in the data folder of the archive.
+
+        :param filename: the name of the file in the data folder
+        :param required: whether to raise if the file is not contained in the archive, otherwise nothing is yielded
+        :raises `~aiida.tools.importexport.common.exceptions.CorruptArchive`: if the file cannot be read
+        """
+        path = f'{ARCHIVE_DATA_FOLDER}/{filename}'
+        try:
+            with self._open_data_file(path) as handle:
+                for line in handle:
+                    if line.strip():
+                        yield line
+        except FileNotFoundError:
+            if required:
+                raise CorruptArchive(f'required file `{path}` is not included')
+        except IOError as error:
+            raise CorruptArchive(str(error))
+
+    def _count_data_lines(self, filename: str, required: bool = False) -> int:
+        """Return the number of entries in a file in the data folder of the archive, without parsing them."""
+        if filename not in self._line_counts:
+            self._line_counts[filename] = sum(1 for _ in self._iter_data_lines(filename, required))
+        return self._line_counts[filename]
+
     def _extract(self, *, path_prefix: str, callback: Callable[[str, Any], None] = null_callback):
         """Extract repository data to a temporary folder.
 
@@ -281,51 +322,41 @@ class ReaderJsonBase(ArchiveReaderAbstract):
             raise CorruptArchive(f'Metadata invalid: {error}')
 
     def entity_count(self, name: str) -> int:
-        data = self._get_data().get('export_data', {}).get(name, {})
-        return len(data)
+        return self._count_data_lines(get_entity_data_filename(name))
 
     @property
     def link_count(self) -> int:
-        return len(self._get_data()['links_uuid'])
+        return self._count_data_lines(ARCHIVE_LINKS_FILENAME, required=True)
 
     def iter_entity_fields(self,
                            name: str,
                            fields: Optional[Tuple[str, ...]] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
         if name not in self.entity_names:
             raise ValueError(f'Unknown entity name: {name}')
-        data = self._get_data()['export_data'].get(name, {})
-        if name == NODE_ENTITY_NAME:
-            # here we merge in the attributes and extras before yielding
-            attributes = self._get_data().get('node_attributes', {})
-            extras = self._get_data().get('node_extras', {})
-            for pk, all_fields in data.items():
-                if pk not in attributes:
-                    raise CorruptArchive(f'Unable to find attributes info for Node with Pk={pk}')
-                if pk not in extras:
-                    raise CorruptArchive(f'Unable to find extra info for Node with Pk={pk}')
-                all_fields = {**all_fields, **{'attributes': attributes[pk], 'extras': extras[pk]}}
-                if fields is not None:
-                    all_fields = {k: v for k, v in all_fields.items() if k in fields}
-                yield int(pk), all_fields
-        else:
-            for pk, all_fields in data.items():
-                if fields is not None:
-                    all_fields = {k: v for k, v in all_fields.items() if k in fields}
-                yield int(pk), all_fields
+        for line in self._iter_data_lines(get_entity_data_filename(name)):
+            pk, all_fields = json.loads(line)
+            if fields is not None:
+                all_fields = {k: v for k, v in all_fields.items() if k in fields}
+            yield int(pk), all_fields
 
     def iter_node_uuids(self) -> Iterator[str]:
         for _, fields in self.iter_entity_fields(NODE_ENTITY_NAME, fields=('uuid',)):
             yield fields['uuid']
 
     def iter_group_uuids(self) -> Iterator[Tuple[str, Set[str]]]:
-        group_uuids = self._get_data()['groups_uuid']
-        for _, fields in self.iter_entity_fields(GROUP_ENTITY_NAME, fields=('uuid',)):
-            key = fields['uuid']
-            yield key, set(group_uuids.get(key, set()))
+        group_uuids = {fields['uuid'] for _, fields in self.iter_entity_fields(GROUP_ENTITY_NAME, fields=('uuid',))}
+        for line in self._iter_data_lines(ARCHIVE_GROUP_NODES_FILENAME, required=True):
+            uuid, node_uuids = json.loads(line)
+            if uuid in group_uuids:
+                group_uuids.remove(uuid)
+                yield uuid, set(node_uuids)
+        # groups that do not contain any nodes
+        for uuid in group_uuids:
+            yield uuid, set()
 
     def iter_link_data(self) -> Iterator[dict]:
-        for value in self._get_data()['links_uuid']:
-            yield value
+        for line in self._iter_data_lines(ARCHIVE_LINKS_FILENAME, required=True):
+            yield json.loads(line)
 
     def get_repository_container(self) -> Container:
         """Return an instance mapped to the repository container."""
@@ -349,13 +380,19 @@ class ReaderJsonZip(ReaderJsonBase):
                 raise CorruptArchive(str(error))
         return self._metadata
 
-    def _get_data(self):
-        if self._data is None:
+    @contextmanager
+    def _open_data_file(self, path: str) -> Iterator[IO[bytes]]:
+        try:
+            archive = zipfile.ZipFile(self.filename, 'r', allowZip64=True)
+        except zipfile.BadZipfile as error:
+            raise IOError(f'The input file cannot be read: {error}')
+        with archive:
             try:
-                self._data = json.loads(read_file_in_zip(self.filename, self.FILENAME_DATA))
-            except (IOError, FileNotFoundError) as error:
-                raise CorruptArchive(str(error))
-        return self._data
+                handle = archive.open(path, 'r')
+            except KeyError:
+                raise FileNotFoundError(f'required file {path} is not included')
+            with handle:
+                yield handle
 
     def _extract(self, *, path_prefix: str, callback: Callable[[str, Any], None] = null_callback):
         self.assert_within_context()
@@ -385,13 +422,31 @@ class ReaderJsonTar(ReaderJsonBase):
                 raise CorruptArchive(str(error))
         return self._metadata
 
-    def _get_data(self):
-        if self._data is None:
-            try:
-                self._data = json.loads(read_file_in_tar(self.filename, self.FILENAME_DATA))
-            except (IOError, FileNotFoundError) as error:
-                raise CorruptArchive(str(error))
-        return self._data
+    def _open_data_file(self, path: str) -> ContextManager[IO[bytes]]:
+        return open(self._extract_data_folder() / path, 'rb')
+
+    def _extract_data_folder(self) -> Path:
+        """Extract the data folder of the archive to the sandbox on first access and return the path it was extracted to.
+
+        The members of a compressed tar file can only be read sequentially, so the data files are extracted in a single
+        pass rather than decompressing the archive up to the requested file every time one of them is read.
+        """
+        assert self._sandbox is not None  # required by mypy
+        outpath = Path(self._sandbox.abspath) / '.data'
+        if outpath.exists():
+            return outpath
+        outpath.mkdir()
+        try:
+            with tarfile.open(self.filename, 'r:*') as handle:
+                for member in handle:
+                    parts = PurePosixPath(member.name).parts
+                    if member.isfile() and parts[0] == ARCHIVE_DATA_FOLDER and '..' not in parts:
+                        handle.extract(member, outpath)
+                    # do not keep the members of the (possibly large) repository in memory
+                    handle.members = []
+        except tarfile.ReadError as error:
+            raise CorruptArchive(f'The input file cannot be read: {error}')
+        return outpath
 
     def _extract(self, *, path_prefix: str, callback: Callable[[str, Any], None] = null_callback):
         self.assert_within_context()
@@ -425,13 +480,8 @@ class ReaderJsonFolder(ReaderJsonBase):
             self._metadata = json.loads(path.read_text(encoding='utf8'))
         return self._metadata
 
-    def _get_data(self):
-        if self._data is None:
-            path = Path(self.filename) / self.FILENAME_DATA
-            if not path.exists():
-                raise CorruptArchive(f'required file `{self.FILENAME_DATA}` is not included')
-            self._data = json.loads(path.read_text(encoding='utf8'))
-        return self._data
+    def _open_data_file(self, path: str) -> ContextManager[IO[bytes]]:
+        return open(Path(self.filename) / path, 'rb')
 
     def _extract(self, *, path_prefix: str, callback: Callable[[str, Any], None] = null_callback):
         # pylint: disable=unused-argument
@@ -16,7 +16,7 @@ import shutil
 import tempfile
 import time
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Type, Union, cast
+from typing import Any, BinaryIO, Dict, List, Optional, Type, Union, cast
 import zipfile
 
 from archive_path import TarPath, ZipPath
@@ -25,8 +25,14 @@ from disk_objectstore import Container
 from aiida.common import json
 from aiida.common.exceptions import InvalidOperation
 from aiida.common.folders import Folder
-from aiida.tools.importexport.archive.common import ArchiveMetadata
-from aiida.tools.importexport.common.config import EXPORT_VERSION, NODE_ENTITY_NAME, ExportFileFormat
+from aiida.tools.importexport.archive.common import (
+    ARCHIVE_DATA_FOLDER,
+    ARCHIVE_GROUP_NODES_FILENAME,
+    ARCHIVE_LINKS_FILENAME,
+    ArchiveMetadata,
+    get_entity_data_filename,
+)
+from aiida.tools.importexport.common.config import EXPORT_VERSION, ExportFileFormat
 
 __all__ = ('ArchiveWriterAbstract', 'get_writer', 'WriterJsonZip', 'WriterJsonTar', 'WriterJsonFolder')
 
@@ -221,9 +227,59 @@ class WriterNull(ArchiveWriterAbstract):
         pass
 
 
+class JsonLinesDataWriter:
+    """Write the database data of an archive to a folder of JSON lines files.
+
+    Every entry is serialized and written to disk as soon as it is received, such that the memory usage of an export
+    does not grow with the number of entities and links it contains.
+    """
+
+    def __init__(self, dirpath: Path):
+        """Initiate the writer.
+
+        :param dirpath: the folder to write the data files to, which is created if it does not exist.
+        """
+        self._dirpath = dirpath
+        self._dirpath.mkdir(parents=True, exist_ok=True)
+        self._handles: Dict[str, BinaryIO] = {}
+        # these files are always created, such that a reader can distinguish an archive without links from a corrupt one
+        self._get_handle(ARCHIVE_LINKS_FILENAME)
+        self._get_handle(ARCHIVE_GROUP_NODES_FILENAME)
+
+    def _get_handle(self, filename: str) -> BinaryIO:
+        """Return the open handle of a data file, opening it on first use."""
+        if filename not in self._handles:
+            self._handles[filename] = (self._dirpath / filename).open('wb')
+        return self._handles[filename]
+
+    def _write_line(self, filename: str, data: Any):
+        """Serialize data to JSON and append it as a line to a data file."""
+        handle = self._get_handle(filename)
+        handle.write(json.dumps(data).encode('utf8'))
+        handle.write(b'\n')
+
+    def write_link(self, data: Dict[str, str]):
+        """Write a dictionary of information for a single provenance link."""
+        self._write_line(ARCHIVE_LINKS_FILENAME, data)
+
+    def write_group_nodes(self, uuid: str, node_uuids: List[str]):
+        """Write a mapping of a group to the nodes it contains."""
+        self._write_line(ARCHIVE_GROUP_NODES_FILENAME, [uuid, node_uuids])
+
+    def write_entity_data(self, name: str, pk: int, fields: Dict[str, Any]):
+        """Write the data for a single DB entity."""
+        self._write_line(get_entity_data_filename(name), [pk, fields])
+
+    def close(self):
+        """Close all data files."""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles = {}
+
+
 class WriterJsonZip(ArchiveWriterAbstract):
     """An archive writer,
-    which writes database data as a single JSON and repository data in a zipped folder system.
+    which writes database data as JSON lines files and repository data in a zipped folder system.
     """
 
     def __init__(
@@ -263,24 +319,18 @@ class WriterJsonZip(ArchiveWriterAbstract):
         self._archivepath: ZipPath = ZipPath(
             self._temp_path / 'export', mode='w', compression=self._compression, name_to_info=self._zipinfo_cache
         )
-        # setup data to store
-        self._data: Dict[str, Any] = {
-            'node_attributes': {},
-            'node_extras': {},
-            'export_data': {},
-            'links_uuid': [],
-            'groups_uuid': {},
-        }
+        # the database data is streamed to the temporary folder and only added to the archive on close
+        self._data_writer = JsonLinesDataWriter(self._temp_path / ARCHIVE_DATA_FOLDER)
 
     def close(self, excepted: bool):
         self.assert_within_context()
+        self._data_writer.close()
         if excepted:
             self._archivepath.close()
             shutil.rmtree(self._temp_path)
             return
-        # write data.json
-        with self._archivepath.joinpath('data.json').open('wb') as handle:
-            json.dump(self._data, handle)
+        # add the database data files
+        (self._archivepath / ARCHIVE_DATA_FOLDER).puttree(self._temp_path / ARCHIVE_DATA_FOLDER)
         # close the zipfile to finalise write
         self._archivepath.close()
         if getattr(self, '_zipinfo_cache', None) is not None:
@@ -310,17 +360,13 @@ class WriterJsonZip(ArchiveWriterAbstract):
             json.dump(metadata, handle)
 
     def write_link(self, data: Dict[str, str]):
-        self._data['links_uuid'].append(data)
+        self._data_writer.write_link(data)
 
     def write_group_nodes(self, uuid: str, node_uuids: List[str]):
-        self._data['groups_uuid'][uuid] = node_uuids
+        self._data_writer.write_group_nodes(uuid, node_uuids)
 
     def write_entity_data(self, name: str, pk: int, id_key: str, fields: Dict[str, Any]):
-        if name == NODE_ENTITY_NAME:
-            # perform translation to current internal format
-            self._data['node_attributes'][pk] = fields.pop('attributes')
-            self._data['node_extras'][pk] = fields.pop('extras')
-        self._data['export_data'].setdefault(name, {})[pk] = fields
+        self._data_writer.write_entity_data(name, pk, fields)
 
     def write_repository_container(self, container: Container):
         """Write a repository container to the archive.
@@ -333,7 +379,7 @@ class WriterJsonZip(ArchiveWriterAbstract):
 
 class WriterJsonTar(ArchiveWriterAbstract):
     """An archive writer,
-    which writes database data as a single JSON and repository data in a folder system.
+    which writes database data as JSON lines files and repository data in a folder system.
 
     The entire containing folder is then compressed as a tar file.
     """
@@ -353,24 +399,18 @@ class WriterJsonTar(ArchiveWriterAbstract):
         self._temp_path: Path = Path(tempfile.mkdtemp())
         # open a zipfile in in write mode to export to
         self._archivepath: TarPath = TarPath(self._temp_path / 'export', mode='w:gz', dereference=True)
-        # setup data to store
-        self._data: Dict[str, Any] = {
-            'node_attributes': {},
-            'node_extras': {},
-            'export_data': {},
-            'links_uuid': [],
-            'groups_uuid': {},
-        }
+        # the database data is streamed to the temporary folder and only added to the archive on close
+        self._data_writer = JsonLinesDataWriter(self._temp_path / ARCHIVE_DATA_FOLDER)
 
     def close(self, excepted: bool):
         self.assert_within_context()
+        self._data_writer.close()
         if excepted:
             self._archivepath.close()
             shutil.rmtree(self._temp_path)
             return
-        # write data.json
-        with self._archivepath.joinpath('data.json').open('wb') as handle:
-            json.dump(self._data, handle)
+        # add the database data files
+        (self._archivepath / ARCHIVE_DATA_FOLDER).puttree(self._temp_path / ARCHIVE_DATA_FOLDER)
         # compress
         # close the zipfile to finalise write
         self._archivepath.close()
@@ -398,17 +438,13 @@ class WriterJsonTar(ArchiveWriterAbstract):
             json.dump(metadata, handle)
 
     def write_link(self, data: Dict[str, str]):
-        self._data['links_uuid'].append(data)
+        self._data_writer.write_link(data)
 
     def write_group_nodes(self, uuid: str, node_uuids: List[str]):
-        self._data['groups_uuid'][uuid] = node_uuids
+        self._data_writer.write_group_nodes(uuid, node_uuids)
 
     def write_entity_data(self, name: str, pk: int, id_key: str, fields: Dict[str, Any]):
-        if name == NODE_ENTITY_NAME:
-            # perform translation to current internal format
-            self._data['node_attributes'][pk] = fields.pop('attributes')
-            self._data['node_extras'][pk] = fields.pop('extras')
-        self._data['export_data'].setdefault(name, {})[pk] = fields
+        self._data_writer.write_entity_data(name, pk, fields)
 
     def write_repository_container(self, container: Container):
         """Write a repository container to the archive.
@@ -421,7 +457,7 @@ class WriterJsonTar(ArchiveWriterAbstract):
 
 class WriterJsonFolder(ArchiveWriterAbstract):
     """An archive writer,
-    which writes database data as a single JSON and repository data in a folder system.
+    which writes database data as JSON lines files and repository data in a folder system.
 
     This writer is mainly intended for backward compatibility with `export_tree`.
     """
@@ -449,23 +485,14 @@ class WriterJsonFolder(ArchiveWriterAbstract):
     def open(self):
         # pylint: disable=attribute-defined-outside-init
         self.assert_within_context()
-        # setup data to store
-        self._data: Dict[str, Any] = {
-            'node_attributes': {},
-            'node_extras': {},
-            'export_data': {},
-            'links_uuid': [],
-            'groups_uuid': {},
-        }
         # ensure folder is created
         self._folder.create()
+        # the database data is streamed directly to the folder
+        self._data_writer = JsonLinesDataWriter(Path(self._folder.abspath) / ARCHIVE_DATA_FOLDER)
 
     def close(self, excepted: bool):
         self.assert_within_context()
-        if excepted:
-            return
-        with self._folder.open('data.json', 'wb') as handle:
-            json.dump(self._data, handle)
+        self._data_writer.close()
 
     def write_metadata(self, data: ArchiveMetadata):
         metadata = {
@@ -485,17 +512,13 @@ class WriterJsonFolder(ArchiveWriterAbstract):
             json.dump(metadata, handle)
 
     def write_link(self, data: Dict[str, str]):
-        self._data['links_uuid'].append(data)
+        self._data_writer.write_link(data)
 
     def write_group_nodes(self, uuid: str, node_uuids: List[str]):
-        self._data['groups_uuid'][uuid] = node_uuids
+        self._data_writer.write_group_nodes(uuid, node_uuids)
 
     def write_entity_data(self, name: str, pk: int, id_key: str, fields: Dict[str, Any]):
-        if name == NODE_ENTITY_NAME:
-            # perform translation to current internal format
-            self._data['node_attributes'][pk] = fields.pop('attributes')
-            self._data['node_extras'][pk] = fields.pop('extras')
-        self._data['export_data'].setdefault(name, {})[pk] = fields
+        self._data_writer.write_entity_data(name, pk, fields)
 
     def write_repository_container(self, container: Container):
         """Write a repository container to the archive.
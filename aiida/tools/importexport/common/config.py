@@ -16,7 +16,7 @@ from aiida.orm import Comment, Computer, Group, Log, Node, User
 __all__ = ('EXPORT_VERSION',)
 
 # Current export version
-EXPORT_VERSION = '0.13'
+EXPORT_VERSION = '0.14'
 
 
 class ExportFileFormat(str, Enum):
@@ -141,7 +141,8 @@ def _strip_checkpoints(fields: dict) -> dict:
     """
     if fields.get('node_type', '').startswith('process.'):
         fields = copy.copy(fields)
-        fields['attributes'] = {
-            key: value for key, value in fields['attributes'].items() if key != ProcessNode.CHECKPOINT_KEY
-        }
+        checkpoint_keys = (
+            ProcessNode.CHECKPOINT_KEY, ProcessNode.CHECKPOINT_CONTEXT_KEY, ProcessNode.CHECKPOINT_CONTEXT_DELTA_KEY
+        )
+        fields['attributes'] = {key: value for key, value in fields['attributes'].items() if key not in checkpoint_keys}
     return fields
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Functions to recompute the hashes of nodes stored in the database."""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import pathlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from aiida.common.hashing import _HASH_EXTRA_KEY
+from aiida.common.log import AIIDA_LOGGER
+from aiida.common.progress_reporter import get_progress_reporter
+from aiida.manage.manager import get_manager
+from aiida.orm import Data, Node, ProcessNode, QueryBuilder
+
+__all__ = ('REHASH_LOGGER', 'rehash_nodes')
+
+REHASH_LOGGER = AIIDA_LOGGER.getChild('rehash')
+
+
+def rehash_nodes(
+    node_classes: Union[Type[Node], Tuple[Type[Node], ...]] = (Data, ProcessNode),
+    pks: Optional[Iterable[int]] = None,
+    *,
+    num_processes: int = 1,
+    batch_size: int = 1000,
+    checkpoint: Optional[Union[str, pathlib.Path]] = None
+) -> int:
+    """Recompute the hash of nodes in the database and store it in their ``_aiida_hash`` extra.
+
+    The pks of the selected nodes are streamed from the database in batches of ascending pk. The hashes of each batch
+    are computed, optionally by a pool of worker processes, and written back to the database in a single statement.
+
+    :param node_classes: only rehash nodes that are an instance of (one of) these classes
+    :param pks: if specified, only rehash the nodes with these pks
+    :param num_processes: the number of worker processes that compute the hashes. If 1, the hashes are computed in
+        the current process.
+    :param batch_size: the number of nodes per batch
+    :param checkpoint: optional path of a file in which the pk of the last rehashed node is recorded after every
+        batch. If the file exists, only nodes with a larger pk are rehashed, such that an interrupted run can be
+        resumed. The file is removed once all nodes have been rehashed.
+    :return: the number of rehashed nodes
+    """
+    if num_processes < 1:
+        raise ValueError(f'`num_processes` should be a positive integer, got: {num_processes}')
+
+    if batch_size < 1:
+        raise ValueError(f'`batch_size` should be a positive integer, got: {batch_size}')
+
+    checkpoint = pathlib.Path(checkpoint) if checkpoint is not None else None
+    last_pk = -1
+
+    if checkpoint is not None and checkpoint.exists():
+        last_pk = int(checkpoint.read_text().strip())
+        REHASH_LOGGER.report(f'resuming from checkpoint `{checkpoint}`: skipping nodes with pk <= {last_pk}')
+
+    pks = list(pks) if pks is not None else None
+    builder = QueryBuilder().append(node_classes, filters=_get_filters(pks, last_pk))
+    total = builder.count()
+
+    if not total:
+        return 0
+
+    manager = get_manager()
+    backend = manager.get_backend()
+    num_rehashed = 0
+
+    def _store_hashes(batch: List[int], hashes: Dict[int, Optional[str]]) -> None:
+        nonlocal num_rehashed
+        backend.nodes.bulk_set_extra(_HASH_EXTRA_KEY, hashes)
+        num_rehashed += len(batch)
+        if checkpoint is not None:
+            checkpoint.write_text(str(batch[-1]))
+        progress.update(len(batch))
+
+    batches = _iter_pk_batches(node_classes, pks, last_pk, batch_size)
+
+    with get_progress_reporter()(total=total, desc='Rehashing nodes') as progress:
+        if num_processes == 1:
+            for batch in batches:
+                _store_hashes(batch, _compute_hashes(batch))
+        else:
+            context = multiprocessing.get_context('spawn')
+            profile_name = manager.get_profile().name
+            with ProcessPoolExecutor(
+                num_processes, mp_context=context, initializer=_initialize_worker, initargs=(profile_name,)
+            ) as executor:
+                # Keep a bounded number of batches in flight and store them in order, such that the checkpoint is
+                # always a pk below which all nodes have been rehashed.
+                pending: deque = deque()
+                for batch in batches:
+                    pending.append((batch, executor.submit(_compute_hashes, batch)))
+                    if len(pending) >= 2 * num_processes:
+                        batch, future = pending.popleft()
+                        _store_hashes(batch, future.result())
+                while pending:
+                    batch, future = pending.popleft()
+                    _store_hashes(batch, future.result())
+
+    if checkpoint is not None and checkpoint.exists():
+        checkpoint.unlink()
+
+    return num_rehashed
+
+
+def _get_filters(pks: Optional[List[int]], last_pk: int) -> dict:
+    """Return the query filters that select the nodes with a pk larger than ``last_pk``, optionally within ``pks``."""
+    filters = {'id': {'>': last_pk}}
+
+    if pks is not None:
+        filters = {'and': [filters, {'id': {'in': pks}}]}
+
+    return filters
+
+
+def _iter_pk_batches(node_classes, pks: Optional[List[int]], last_pk: int, batch_size: int) -> Iterator[List[int]]:
+    """Yield the pks of the selected nodes in batches of ascending pk.
+
+    Each batch is retrieved with a separate query that continues from the last pk of the previous batch, such that no
+    cursor is kept open while the hashes of the previous batches are being written.
+    """
+    while True:
+        builder = QueryBuilder().append(node_classes, filters=_get_filters(pks, last_pk), project='id', tag='node')
+        builder.order_by({'node': {'id': 'asc'}}).limit(batch_size)
+        batch = builder.all(flat=True)
+
+        if not batch:
+            return
+
+        yield batch
+        last_pk = batch[-1]
+
+
+def _compute_hashes(pks: List[int]) -> Dict[int, Optional[str]]:
+    """Return the hashes of the nodes with the given pks."""
+    builder = QueryBuilder().append(Node, filters={'id': {'in': pks}})
+    return {node.pk: node.get_hash() for node, in builder.iterall()}
+
+
+def _initialize_worker(profile_name: str) -> None:
+    """Load the profile in a worker process of the pool that computes the hashes."""
+    from aiida.manage.configuration import load_profile
+    load_profile(profile_name)
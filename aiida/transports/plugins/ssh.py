@@ -9,9 +9,11 @@
 ###########################################################################
 """Plugin for transport over SSH (and SFTP for file transfer)."""
 # pylint: disable=too-many-lines
+from concurrent.futures import ThreadPoolExecutor
 import glob
 import io
 import os
+import queue
 import re
 from stat import S_ISDIR, S_ISREG
 
@@ -577,6 +579,27 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
 
         self._is_open = False
 
+    def is_alive(self):
+        """Return whether the transport is open and the SSH connection is still active.
+
+        Besides checking that the underlying SSH session is active, this performs a round trip on the SFTP channel,
+        such that a connection that has been dropped by the remote is detected.
+        """
+        if not self._is_open:
+            return False
+
+        ssh_transport = self._client.get_transport()
+
+        if ssh_transport is None or not ssh_transport.is_active():
+            return False
+
+        try:
+            self._sftp.normalize('.')
+        except (OSError, EOFError):
+            return False
+
+        return True
+
     @property
     def sshclient(self):
         if not self._is_open:
@@ -931,6 +954,59 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
 
         return self.sftp.put(localpath, remotepath, callback=callback)
 
+    def putfiles(self, files, concurrency=1):
+        """
+        Put multiple files from local to remote, transferring up to ``concurrency`` files at the same time.
+
+        Each concurrent transfer uses its own SFTP channel of the SSH connection, such that the latency of the requests
+        of one transfer is overlapped with the others. If the server does not allow opening as many channels, the files
+        are transferred over the channels that could be opened.
+
+        :param files: iterable of tuples of the absolute path to a local file and the path to the remote file
+        :param int concurrency: maximum number of files to transfer at the same time
+
+        :raise ValueError: if a local path is not absolute
+        """
+        from paramiko.ssh_exception import SSHException
+
+        files = list(files)
+
+        for localpath, _ in files:
+            if not os.path.isabs(localpath):
+                raise ValueError('The localpath must be an absolute path')
+
+        if concurrency <= 1 or len(files) <= 1:
+            return super().putfiles(files)
+
+        channels = [self.sftp]
+
+        try:
+            for _ in range(min(concurrency, len(files)) - 1):
+                try:
+                    channel = self.sshclient.open_sftp()
+                except SSHException:
+                    break
+                channel.chdir(self.getcwd())
+                channels.append(channel)
+
+            idle_channels = queue.SimpleQueue()
+            for channel in channels:
+                idle_channels.put(channel)
+
+            def putfile(localpath, remotepath):
+                channel = idle_channels.get()
+                try:
+                    channel.put(localpath, remotepath)
+                finally:
+                    idle_channels.put(channel)
+
+            with ThreadPoolExecutor(max_workers=len(channels)) as executor:
+                for future in [executor.submit(putfile, localpath, remotepath) for localpath, remotepath in files]:
+                    future.result()
+        finally:
+            for channel in channels[1:]:
+                channel.close()
+
     def puttree(self, localpath, remotepath, callback=None, dereference=True, overwrite=True):  # pylint: disable=too-many-branches,arguments-differ,unused-argument
         """
         Put a folder recursively from local to remote.
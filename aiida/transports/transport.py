@@ -138,6 +138,16 @@ class Transport(abc.ABC):
     def is_open(self):
         return self._is_open
 
+    def is_alive(self):
+        """Return whether the transport is open and its connection can still be used.
+
+        This is used to check whether an open transport can be reused after having been idle for a while. Transports
+        whose connection can drop while open should override this to check the connection itself.
+
+        :return: boolean, True if the transport is open and usable
+        """
+        return self.is_open
+
     def open(self):
         """
         Opens a local transport channel
@@ -640,6 +650,20 @@ class Transport(abc.ABC):
         """
         raise NotImplementedError
 
+    def putfiles(self, files, concurrency=1):
+        """
+        Put multiple files from local to remote.
+
+        This implementation puts the files one by one with ``putfile``. Plugins that can transfer multiple files at the
+        same time over a single connection can override it to do so for up to ``concurrency`` files.
+
+        :param files: iterable of tuples of the absolute path to a local file and the path to the remote file
+        :param int concurrency: maximum number of files to transfer at the same time
+        """
+        # pylint: disable=unused-argument
+        for localpath, remotepath in files:
+            self.putfile(localpath, remotepath)
+
     def remove(self, path):
         """
         Remove the file at the given path. This only works on files;
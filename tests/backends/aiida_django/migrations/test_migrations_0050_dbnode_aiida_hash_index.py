@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=import-error,no-name-in-module,invalid-name
+"""Test migration that adds an index on the ``_aiida_hash`` extra of the ``DbNode`` table."""
+from django.db import connection
+
+from .test_migrations_common import TestMigrations
+
+
+class TestMigration(TestMigrations):
+    """Test migration that adds an index on the ``_aiida_hash`` extra of the ``DbNode`` table."""
+
+    migrate_from = '0049_entry_point_core_prefix'
+    migrate_to = '0050_dbnode_aiida_hash_index'
+
+    def test_migration(self):
+        """Test that the index was created."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE tablename = 'db_dbnode' "
+                "AND indexname = 'ix_db_dbnode_extras_aiida_hash'"
+            )
+            result = cursor.fetchall()
+
+        assert len(result) == 1
+        assert '_aiida_hash' in result[0][0]
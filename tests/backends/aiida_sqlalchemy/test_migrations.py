@@ -2048,3 +2048,60 @@ class TestEntryPointCorePrefixMigration(TestMigrationsSQLA):
 
             finally:
                 session.close()
+
+
+class TestDbNodeAiidaHashIndexMigration(TestMigrationsSQLA):
+    """Test migration that adds an index on the ``_aiida_hash`` extra of the ``DbNode`` table."""
+
+    migrate_from = '34a831f4286d'  # 34a831f4286d_entry_point_core_prefix
+    migrate_to = '1de112340b16'  # 1de112340b16_dbnode_aiida_hash_index
+
+    def test_migration(self):
+        """Verify that the index was created."""
+        from sqlalchemy.sql import text
+
+        with sa.ENGINE.begin() as connection:
+            result = connection.execute(
+                text(
+                    "SELECT indexdef FROM pg_indexes WHERE tablename = 'db_dbnode' "
+                    "AND indexname = 'ix_db_dbnode_extras_aiida_hash'"
+                )
+            ).fetchall()
+            assert len(result) == 1
+            assert '_aiida_hash' in result[0][0]
+
+
+class TestDbNodeCtimeIndexMigration(TestMigrationsSQLA):
+    """Test migration that adds an index on the ``ctime`` column of the ``DbNode`` table."""
+
+    migrate_from = '1de112340b16'  # 1de112340b16_dbnode_aiida_hash_index
+    migrate_to = '76f4e2f68222'  # 76f4e2f68222_dbnode_ctime_index
+
+    def test_migration(self):
+        """Verify that the index was created."""
+        from sqlalchemy.sql import text
+
+        with sa.ENGINE.begin() as connection:
+            result = connection.execute(
+                text("SELECT indexdef FROM pg_indexes WHERE tablename = 'db_dbnode' AND indexname = 'ix_db_dbnode_ctime'")
+            ).fetchall()
+            assert len(result) == 1
+            assert '(ctime)' in result[0][0]
+
+
+class TestDbNodeMtimeIndexMigration(TestMigrationsSQLA):
+    """Test migration that adds an index on the ``mtime`` column of the ``DbNode`` table."""
+
+    migrate_from = '76f4e2f68222'  # 76f4e2f68222_dbnode_ctime_index
+    migrate_to = 'f738ccc0bb71'  # f738ccc0bb71_dbnode_mtime_index
+
+    def test_migration(self):
+        """Verify that the index was created."""
+        from sqlalchemy.sql import text
+
+        with sa.ENGINE.begin() as connection:
+            result = connection.execute(
+                text("SELECT indexdef FROM pg_indexes WHERE tablename = 'db_dbnode' AND indexname = 'ix_db_dbnode_mtime'")
+            ).fetchall()
+            assert len(result) == 1
+            assert '(mtime)' in result[0][0]
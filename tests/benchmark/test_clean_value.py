@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for cleaning attribute values.
+
+The purpose of these tests is to benchmark ``clean_value`` for representative shapes of large attribute payloads, which
+is called on all attributes and extras of a node when it is stored, and to compare it with the deep copy of values that
+are trusted to be clean, as done when retrieving the attributes of a stored node.
+"""
+import numpy as np
+import pytest
+
+from aiida.orm.implementation.utils import clean_value
+
+GROUP_NAME = 'clean-value'
+
+
+def get_int_list():
+    """Return a long list of integers."""
+    return list(range(1000000))
+
+
+def get_float_list():
+    """Return a long list of floats."""
+    return [0.001 * index for index in range(1000000)]
+
+
+def get_string_list():
+    """Return a long list of strings."""
+    return [f'value_{index}' for index in range(1000000)]
+
+
+def get_numpy_array():
+    """Return a large two-dimensional NumPy array of floats."""
+    return np.linspace(0, 1, 1000000).reshape(1000, 1000)
+
+
+def get_structure():
+    """Return the attributes of a structure with a hundred thousand sites."""
+    return {
+        'cell': [[10.0, 0.0, 0.0], [0.0, 10.0, 0.0], [0.0, 0.0, 10.0]],
+        'kinds': [{
+            'name': 'Si',
+            'symbols': ['Si'],
+            'weights': [1.0],
+            'mass': 28.0855
+        }],
+        'sites': [{
+            'kind_name': 'Si',
+            'position': (0.01 * index, 0.02 * index, 0.03 * index)
+        } for index in range(100000)],
+    }
+
+
+def get_nested_dict():
+    """Return a nested dictionary, similar to the input parameters of a typical code."""
+    return {
+        f'namelist_{index}': {
+            'float': 0.5 * index,
+            'integer': index,
+            'string': f'value_{index}',
+            'list': [index, 2 * index, 3 * index],
+        } for index in range(10000)
+    }
+
+
+PAYLOADS = (get_int_list, get_float_list, get_string_list, get_numpy_array, get_structure, get_nested_dict)
+PAYLOAD_IDS = ('int-list', 'float-list', 'string-list', 'numpy-array', 'structure', 'nested-dict')
+
+
+@pytest.mark.parametrize('get_payload', PAYLOADS, ids=PAYLOAD_IDS)
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=5)
+def test_clean_value(benchmark, get_payload):
+    """Benchmark for cleaning large attribute payloads."""
+    payload = get_payload()
+    result = benchmark(clean_value, payload)
+    assert result is not payload
+
+
+@pytest.mark.parametrize('get_payload', (get_structure, get_nested_dict), ids=('structure', 'nested-dict'))
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=5)
+def test_clean_value_trusted(benchmark, get_payload):
+    """Benchmark for deep copying large attribute payloads that are trusted to be clean."""
+    payload = clean_value(get_payload())
+    result = benchmark(clean_value, payload, trusted=True)
+    assert result == payload
@@ -17,7 +17,7 @@ import asyncio
 
 import pytest
 
-from aiida.engine import WorkChain, run_get_node, submit, while_
+from aiida.engine import WorkChain, calcfunction, run_get_node, submit, submit_many, while_
 from aiida.manage.manager import get_manager
 from aiida.orm import Code, Int
 from aiida.plugins.factories import CalculationFactory
@@ -25,6 +25,12 @@ from aiida.plugins.factories import CalculationFactory
 ArithmeticAddCalculation = CalculationFactory('core.arithmetic.add')
 
 
+@calcfunction
+def sum_of_squares(number):
+    """Calcfunction with a body that takes some computation, defined at module level such that it can be mapped."""
+    return Int(sum(value**2 for value in range(number.value)))
+
+
 class WorkchainLoop(WorkChain):
     """A basic Workchain to run a looped step n times."""
 
@@ -73,6 +79,18 @@ class WorkchainLoopWcThreaded(WorkchainLoop):
         return self.to_context(**context)
 
 
+class WorkchainLoopWcMany(WorkchainLoop):
+    """A WorkChain that submits another WorkChain n times in the same step with a single call to `submit_many`."""
+
+    def init_loop(self):
+        super().init_loop()
+        self.ctx.iter = 1
+
+    def run_task(self):
+        nodes = self.submit_many(WorkchainLoop, [{'iterations': Int(1)}] * self.inputs.iterations.value)
+        return self.to_context(**{f'wkchain{str(i)}': node for i, node in enumerate(nodes)})
+
+
 class WorkchainLoopCalcSerial(WorkchainLoop):
     """A WorkChain that submits a CalcJob n times in different steps."""
 
@@ -109,6 +127,7 @@ WORKCHAINS = {
     'basic-loop': (WorkchainLoop, 4, 0),
     'serial-wc-loop': (WorkchainLoopWcSerial, 4, 4),
     'threaded-wc-loop': (WorkchainLoopWcThreaded, 4, 4),
+    'many-wc-loop': (WorkchainLoopWcMany, 4, 4),
     'serial-calcjob-loop': (WorkchainLoopCalcSerial, 4, 4),
     'threaded-calcjob-loop': (WorkchainLoopCalcThreaded, 4, 4),
 }
@@ -184,3 +203,44 @@ def test_workchain_daemon(benchmark, submit_get_node, aiida_localhost, workchain
 
     assert result.is_finished_ok, (result.exit_status, result.exit_message)
     assert len(result.get_outgoing().all()) == outgoing
+
+
+def submit_each(process, inputs_list):
+    return [submit(process, **inputs) for inputs in inputs_list]
+
+
+@pytest.mark.parametrize('number', (100, 1000))
+@pytest.mark.parametrize('launcher', (submit_each, submit_many), ids=('submit', 'submit_many'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group='engine-submit')
+def test_submit(benchmark, launcher, number):
+    """Benchmark for submitting a large number of processes, reporting the number of processes submitted per second."""
+    inputs_list = [{'iterations': Int(1)} for _ in range(number)]
+
+    nodes = benchmark.pedantic(launcher, args=(WorkchainLoop, inputs_list), iterations=1, rounds=3, warmup_rounds=0)
+    benchmark.extra_info['processes_per_second'] = number / benchmark.stats.stats.mean
+
+    assert len(nodes) == number
+    assert all(node.is_stored for node in nodes)
+
+
+def map_each(function, arguments):
+    return [function(argument) for argument in arguments]
+
+
+def map_parallel(function, arguments):
+    return function.map(arguments)
+
+
+@pytest.mark.parametrize('number', (10, 100))
+@pytest.mark.parametrize('mapper', (map_each, map_parallel), ids=('serial', 'map'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group='engine-map')
+def test_calcfunction_map(benchmark, mapper, number):
+    """Benchmark for running a calcfunction for many inputs, reporting the number of processes run per second."""
+    arguments = [Int(100000) for _ in range(number)]
+
+    results = benchmark.pedantic(mapper, args=(sum_of_squares, arguments), iterations=1, rounds=3, warmup_rounds=0)
+    benchmark.extra_info['processes_per_second'] = number / benchmark.stats.stats.mean
+
+    assert len(results) == number
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=unused-argument
+"""Performance benchmark tests for adding nodes to and removing nodes from groups.
+
+The purpose of these tests is to compare adding a large number of nodes to a group, and removing them, when passing
+loaded nodes, their pks or a query that selects them.
+"""
+import pytest
+
+from aiida.orm import Data, Group, QueryBuilder, store_many
+
+GROUP_NAME = 'group-nodes'
+
+
+def get_nodes(number):
+    """Return a list of ``number`` stored data nodes."""
+    return store_many([Data() for _ in range(number)])
+
+
+def as_nodes(nodes):
+    return nodes
+
+
+def as_pks(nodes):
+    return [node.pk for node in nodes]
+
+
+def as_query(nodes):
+    return QueryBuilder().append(Data, filters={'id': {'in': [node.pk for node in nodes]}}, project='id')
+
+
+@pytest.mark.parametrize('number', (1000, 10000))
+@pytest.mark.parametrize('convert', (as_nodes, as_pks, as_query), ids=('nodes', 'pks', 'query'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME)
+def test_add_nodes(benchmark, convert, number):
+    """Benchmark for adding a large number of nodes to a group, reporting the number of added nodes per second."""
+    nodes = convert(get_nodes(number))
+
+    def _setup():
+        return (Group(label=f'group-{len(Group.objects.find())}').store(),), {}
+
+    group = benchmark.pedantic(
+        lambda group: group.add_nodes(nodes) or group, setup=_setup, iterations=1, rounds=3, warmup_rounds=0
+    )
+    benchmark.extra_info['nodes_per_second'] = number / benchmark.stats.stats.mean
+    assert group.count() == number
+
+
+@pytest.mark.parametrize('number', (1000, 10000))
+@pytest.mark.parametrize('convert', (as_nodes, as_pks, as_query), ids=('nodes', 'pks', 'query'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME)
+def test_remove_nodes(benchmark, convert, number):
+    """Benchmark for removing a large number of nodes from a group, reporting the number of removed nodes per second."""
+    nodes = get_nodes(number)
+    converted = convert(nodes)
+
+    def _setup():
+        group = Group(label=f'group-{len(Group.objects.find())}').store()
+        group.add_nodes(as_pks(nodes))
+        return (group,), {}
+
+    group = benchmark.pedantic(
+        lambda group: group.remove_nodes(converted) or group, setup=_setup, iterations=1, rounds=3, warmup_rounds=0
+    )
+    benchmark.extra_info['nodes_per_second'] = number / benchmark.stats.stats.mean
+    assert group.count() == 0
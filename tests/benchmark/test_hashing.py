@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=unused-argument
+"""Performance benchmark tests for hashing.
+
+The purpose of these tests is to benchmark ``make_hash`` for typical payloads of node attributes, as well as the
+computation of the hash of stored nodes, including their repository content.
+"""
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+from aiida.common.hashing import make_hash
+from aiida.orm import Data, Dict, store_many
+from aiida.tools import rehash_nodes
+
+GROUP_NAME = 'hashing'
+
+
+def get_flat_dict():
+    """Return a flat dictionary with a thousand keys of mixed basic types."""
+    return {f'key_{index}': [index, float(index), str(index), bool(index % 2)][index % 4] for index in range(1000)}
+
+
+def get_nested_dict():
+    """Return a nested dictionary, similar to the input parameters of a typical code."""
+    return {
+        f'namelist_{index}': {
+            'float': 0.5 * index,
+            'integer': index,
+            'string': f'value_{index}',
+            'list': [index, 2 * index, 3 * index],
+        } for index in range(100)
+    }
+
+
+def get_structure():
+    """Return the attributes of a structure with a thousand sites."""
+    return {
+        'cell': [[10.0, 0.0, 0.0], [0.0, 10.0, 0.0], [0.0, 0.0, 10.0]],
+        'pbc1': True,
+        'pbc2': True,
+        'pbc3': True,
+        'kinds': [{
+            'name': 'Si',
+            'symbols': ['Si'],
+            'weights': [1.0],
+            'mass': 28.0855
+        }],
+        'sites': [{
+            'kind_name': 'Si',
+            'position': [0.01 * index, 0.02 * index, 0.03 * index]
+        } for index in range(1000)],
+    }
+
+
+def get_float_list():
+    """Return a long list of floats."""
+    return [0.001 * index for index in range(100000)]
+
+
+def get_numpy_array():
+    """Return a large two-dimensional NumPy array of floats."""
+    return np.linspace(0, 1, 100000).reshape(1000, 100)
+
+
+@pytest.mark.parametrize(
+    'get_payload', (get_flat_dict, get_nested_dict, get_structure, get_float_list, get_numpy_array),
+    ids=('flat-dict', 'nested-dict', 'structure', 'float-list', 'numpy-array')
+)
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=10)
+def test_make_hash(benchmark, get_payload):
+    """Benchmark for hashing typical payloads of node attributes."""
+    payload = get_payload()
+    result = benchmark(make_hash, payload)
+    assert isinstance(result, str)
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=10)
+def test_node_hash_attributes(benchmark):
+    """Benchmark for computing the hash of a stored node with many attributes."""
+    node = Dict(dict=get_nested_dict()).store()
+    result = benchmark(node.get_hash)
+    assert result == node.get_extra('_aiida_hash')
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=10)
+def test_node_hash_repository(benchmark):
+    """Benchmark for computing the hash of a stored node with many repository objects."""
+    node = Data()
+    for index in range(100):
+        node.put_object_from_filelike(BytesIO(b'a' * 10000 + str(index).encode()), f'file_{index}')
+    node.store()
+    result = benchmark(node.get_hash)
+    assert result == node.get_extra('_aiida_hash')
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.parametrize('num_processes', (1, 2, 4))
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=1)
+def test_rehash_nodes(benchmark, num_processes):
+    """Benchmark for rehashing all nodes in the database, with a varying number of worker processes."""
+    nodes = [Dict(dict=get_nested_dict()) for _ in range(500)]
+    store_many(nodes)
+    result = benchmark.pedantic(
+        rehash_nodes, kwargs={
+            'num_processes': num_processes,
+            'batch_size': 100
+        }, rounds=1, iterations=1
+    )
+    assert result == len(nodes)
@@ -14,13 +14,17 @@ The purpose of these tests is to benchmark and compare importing and exporting
 parts of the database.
 """
 from io import StringIO
+import tracemalloc
 
 import pytest
 
+from aiida import get_version
 from aiida.common.links import LinkType
+from aiida.common.utils import get_new_uuid
 from aiida.engine import ProcessState
 from aiida.orm import CalcFunctionNode, Dict, load_node
-from aiida.tools.importexport import export, import_data
+from aiida.tools.importexport import EXPORT_VERSION, export, import_data
+from aiida.tools.importexport.archive import ArchiveMetadata, get_reader, get_writer
 
 
 def recursive_provenance(in_node, depth, breadth, num_objects=0):
@@ -109,3 +113,70 @@ def test_import(aiida_profile, benchmark, tmp_path, depth, breadth, num_objects)
 
     benchmark.pedantic(_run, setup=_setup, iterations=1, rounds=12, warmup_rounds=1)
     load_node(root_uuid)
+
+
+def write_archive(filepath, num_nodes):
+    """Write an archive with a chain of ``num_nodes`` nodes directly with the archive writer."""
+    metadata = ArchiveMetadata(
+        export_version=EXPORT_VERSION,
+        aiida_version=get_version(),
+        unique_identifiers={'Node': 'uuid'},
+        all_fields_info={'Node': {}},
+    )
+    with get_writer('zip')(filepath) as writer:
+        writer.write_metadata(metadata)
+        previous_uuid = None
+        for pk in range(num_nodes):
+            uuid = get_new_uuid()
+            fields = {'uuid': uuid, 'node_type': 'data.core.dict.Dict.', 'attributes': {str(i): i for i in range(10)}}
+            writer.write_entity_data('Node', pk, 'uuid', {**fields, 'extras': {}})
+            if previous_uuid is not None:
+                writer.write_link({'input': previous_uuid, 'output': uuid, 'label': 'link', 'type': 'create'})
+            previous_uuid = uuid
+
+
+def read_archive(filepath):
+    """Read all the nodes and links of an archive with the archive reader."""
+    with get_reader('zip')(str(filepath)) as reader:
+        num_nodes = sum(1 for _ in reader.iter_entity_fields('Node'))
+        num_links = sum(1 for _ in reader.iter_link_data())
+    return num_nodes, num_links
+
+
+def trace_peak_memory(func, *args):
+    """Call a function and return the peak memory allocated during the call, in MB."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1] / 1024**2
+    finally:
+        tracemalloc.stop()
+
+
+ARCHIVE_SIZES = {'1k-nodes': 1000, '10k-nodes': 10000}
+
+
+@pytest.mark.parametrize('num_nodes', ARCHIVE_SIZES.values(), ids=ARCHIVE_SIZES.keys())
+@pytest.mark.benchmark(group='import-export-memory')
+def test_write_memory(benchmark, tmp_path, num_nodes):
+    """Benchmark the time and peak memory of writing the database data of an archive.
+
+    Since the data is streamed to disk, the peak memory should not depend on the number of nodes.
+    """
+    out_path = tmp_path / 'test.aiida'
+    peak_memory = benchmark.pedantic(trace_peak_memory, args=(write_archive, out_path, num_nodes), rounds=3)
+    benchmark.extra_info['peak_memory_mb'] = peak_memory
+    assert read_archive(out_path) == (num_nodes, num_nodes - 1)
+
+
+@pytest.mark.parametrize('num_nodes', ARCHIVE_SIZES.values(), ids=ARCHIVE_SIZES.keys())
+@pytest.mark.benchmark(group='import-export-memory')
+def test_read_memory(benchmark, tmp_path, num_nodes):
+    """Benchmark the time and peak memory of reading the database data of an archive.
+
+    Since the data is read lazily, the peak memory should not depend on the number of nodes.
+    """
+    out_path = tmp_path / 'test.aiida'
+    write_archive(out_path, num_nodes)
+    peak_memory = benchmark.pedantic(trace_peak_memory, args=(read_archive, out_path), rounds=3)
+    benchmark.extra_info['peak_memory_mb'] = peak_memory
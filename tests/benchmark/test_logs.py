@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for writing log records to the database.
+
+The purpose of these tests is to benchmark and compare writing the log records of a node, e.g. the reports of a running
+process, to the database one by one and buffered in batches by the :class:`~aiida.orm.utils.log.DBLogHandler`.
+"""
+import logging
+
+import pytest
+
+from aiida.orm import CalculationNode
+from aiida.orm.utils.log import DBLogHandler
+
+GROUP_NAME = 'logs'
+
+
+def emit_records(handler, node, number):
+    """Emit the given number of log records for the node through the handler and flush it."""
+    for index in range(number):
+        handler.handle(
+            logging.makeLogRecord({
+                'name': 'aiida.benchmark',
+                'levelno': logging.INFO,
+                'levelname': 'INFO',
+                'msg': f'log message {index}',
+                'dbnode_id': node.pk,
+                'backend': node.backend,
+            })
+        )
+    handler.flush()
+
+
+@pytest.mark.parametrize('capacity', (0, 100), ids=('unbuffered', 'buffered'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=5)
+def test_emit_records(benchmark, capacity):
+    """Benchmark for writing a thousand log records of a single node."""
+    node = CalculationNode().store()
+    handler = DBLogHandler(capacity=capacity)
+    handler.start_buffering(node.pk)
+    benchmark(emit_records, handler, node, 1000)
@@ -18,7 +18,7 @@ from io import StringIO
 import pytest
 
 from aiida.common import NotExistent
-from aiida.orm import Data, load_node
+from aiida.orm import Data, load_node, store_many
 
 GROUP_NAME = 'node'
 
@@ -128,3 +128,67 @@ def test_delete_with_object(benchmark):
     pk = benchmark.pedantic(_run, setup=get_data_node_and_object, iterations=1, rounds=100, warmup_rounds=1)
     with pytest.raises(NotExistent):
         load_node(pk)
+
+
+def get_data_nodes(number, with_object=False):
+    """A function to create a list of simple unstored data nodes, optionally with an object."""
+    nodes = []
+    for _ in range(number):
+        _, node_dict = get_data_node_and_object(store=False) if with_object else get_data_node(store=False)
+        nodes.append(node_dict['node'])
+    return (nodes,), {}
+
+
+def store_individually(nodes):
+    """A function to store a list of nodes one by one."""
+    for node in nodes:
+        node.store()
+    return nodes
+
+
+@pytest.mark.parametrize('with_object', (False, True), ids=('no-object', 'object'))
+@pytest.mark.parametrize('number', (1000, 10000, 100000))
+@pytest.mark.parametrize('function', (store_individually, store_many), ids=('store', 'store_many'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group='node-bulk')
+def test_store_bulk(benchmark, function, number, with_object):
+    """Benchmark for storing a large number of nodes one by one compared to in bulk,
+    reporting the number of stored nodes per second.
+    """
+    nodes = benchmark.pedantic(
+        function, setup=lambda: get_data_nodes(number, with_object), iterations=1, rounds=1, warmup_rounds=0
+    )
+    benchmark.extra_info['nodes_per_second'] = number / benchmark.stats.stats.mean
+    assert all(node.is_stored for node in nodes)
+
+
+@pytest.mark.parametrize('lookup_cache_size', (0, 100), ids=('query', 'lookup-cache'))
+@pytest.mark.parametrize('number', (1000, 10000, 100000))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group='node-cache-lookup', min_rounds=100)
+def test_cache_lookup(benchmark, isolated_config, monkeypatch, number, lookup_cache_size):
+    """Benchmark for looking up an identical node for caching, as a function of the number of nodes in the table."""
+    from aiida.manage.caching import get_lookup_cache
+
+    monkeypatch.setattr(Data, '_cachable', True)
+    isolated_config.set_option('caching.lookup_cache_size', lookup_cache_size)
+    get_lookup_cache().clear()
+
+    nodes = []
+    for index in range(number):
+        node = Data()
+        node.set_attribute('index', index)
+        nodes.append(node)
+    store_many(nodes)
+
+    # Only keep a reference to the source node, such that the lookup is not slowed down by garbage collection
+    source = nodes[number // 2]
+    clone = source.clone()
+    del nodes
+
+    try:
+        result = benchmark(clone._get_same_node)
+    finally:
+        get_lookup_cache().clear()
+
+    assert result.pk == source.pk
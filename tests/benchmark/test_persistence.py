@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=unused-argument
+"""Performance benchmark tests for the encoding of process checkpoints.
+
+The purpose of these tests is to compare the time it takes to save and load a checkpoint, and its size, for the
+available checkpoint codecs and work chain contexts with an increasing number of nodes. In addition, the number of bytes
+that are written per checkpoint of a work chain is compared for contexts that are saved in full and incrementally.
+"""
+import json
+
+import pytest
+
+from aiida.common.extendeddicts import AttributeDict
+from aiida.engine import WorkChain
+from aiida.engine.persistence import AiiDAPersister, get_checkpoint_codec
+from aiida.orm import Int, store_many
+
+GROUP_NAME = 'checkpoint'
+
+
+class ContextWorkChain(WorkChain):
+    """Work chain whose context is set directly by the benchmark."""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outline(cls.step)
+
+    def step(self):
+        pass
+
+
+def get_bundle(number):
+    """Return a checkpoint-like bundle whose context contains ``number`` stored nodes."""
+    nodes = store_many([Int(index) for index in range(number)])
+    context = AttributeDict({f'node_{index}': node for index, node in enumerate(nodes)})
+    return {'CLASS_NAME': 'aiida.workflows:WorkChain', 'CONTEXT': context, '_stepper_state': {'pos': [0, number]}}
+
+
+@pytest.mark.parametrize('number', (10, 100, 1000))
+@pytest.mark.parametrize('codec', ('yaml', 'compact'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME)
+def test_checkpoint_round_trip(benchmark, codec, number):
+    """Benchmark for saving and loading a checkpoint, reporting the size of the encoded checkpoint."""
+    codec = get_checkpoint_codec(codec)
+    bundle = get_bundle(number)
+
+    result = benchmark.pedantic(lambda: codec.decode(codec.encode(bundle)), iterations=1, rounds=5, warmup_rounds=1)
+    benchmark.extra_info['size'] = len(codec.encode(bundle))
+    assert len(result['CONTEXT']) == number
+
+
+@pytest.mark.parametrize('number', (10, 100, 1000))
+@pytest.mark.parametrize('compaction_interval', (1, 20), ids=('full', 'incremental'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME)
+def test_checkpoint_step(benchmark, compaction_interval, number):
+    """Benchmark for saving the checkpoint of a work chain step that adds a node to a context of ``number`` nodes.
+
+    The average number of bytes of attributes written per checkpoint is reported as ``bytes``.
+    """
+    process = ContextWorkChain()
+    persister = AiiDAPersister(compaction_interval=compaction_interval)
+    process.ctx.update(get_bundle(number)['CONTEXT'])
+    persister.save_checkpoint(process)
+
+    written = []
+    set_attribute_many = process.node.set_attribute_many
+
+    def set_attribute_many_counted(attributes):
+        written.append(len(json.dumps(attributes)))
+        set_attribute_many(attributes)
+
+    process.node.set_attribute_many = set_attribute_many_counted
+
+    def step():
+        process.ctx[f'node_{len(process.ctx)}'] = Int(len(process.ctx)).store()
+        persister.save_checkpoint(process)
+
+    benchmark.pedantic(step, iterations=1, rounds=20, warmup_rounds=1)
+    benchmark.extra_info['bytes'] = sum(written) / len(written)
+    assert len(persister.load_checkpoint(process.node.pk)['CONTEXT']) == number + 21
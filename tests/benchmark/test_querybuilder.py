@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=unused-argument
+"""Performance benchmark tests for the ``QueryBuilder``.
+
+The purpose of these tests is to compare the number of rows of projected values that are retrieved per second as rows,
+with ``all`` and ``dict``, and as columns, with ``to_columns`` and ``to_numpy``, and to measure the overhead of building
+and compiling a query that is executed many times with different values of its filters. The number of projected
+entities, i.e. ``*``, that are converted to front-end entities per second is compared separately.
+"""
+from collections import OrderedDict
+
+import pytest
+
+from aiida.orm import Dict, QueryBuilder, User, store_many
+from aiida.orm.implementation.sqlalchemy.querybuilder import main
+
+GROUP_NAME = 'querybuilder-results'
+GROUP_NAME_REPEATED = 'querybuilder-repeated'
+GROUP_NAME_ENTITIES = 'querybuilder-entities'
+
+
+def get_query(number):
+    """Return a query that projects the pk and a float attribute of ``number`` stored nodes."""
+    store_many([Dict(dict={'energy': float(index), 'index': index}) for index in range(number)])
+    return QueryBuilder().append(Dict, tag='dict', project=['id', {'attributes.energy': {'cast': 'f'}}])
+
+
+@pytest.mark.parametrize('number', (1000, 10000))
+@pytest.mark.parametrize('method', ('all', 'dict', 'to_columns', 'to_numpy'))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME)
+def test_results(benchmark, method, number):
+    """Benchmark for retrieving the projected values of a large number of nodes, reporting the rows per second."""
+    query = get_query(number)
+
+    results = benchmark.pedantic(getattr(query, method), iterations=1, rounds=5, warmup_rounds=1)
+    benchmark.extra_info['rows_per_second'] = number / benchmark.stats.stats.mean
+
+    if method in ('all', 'dict'):
+        assert len(results) == number
+    else:
+        assert len(results['dict']['attributes.energy']) == number
+
+
+@pytest.mark.parametrize('number', (1000, 10000))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME_ENTITIES)
+def test_entities(benchmark, number):
+    """Benchmark for iterating over the projected entities of a large number of nodes, reporting the rows per second."""
+    store_many([Dict(dict={'energy': float(index)}) for index in range(number)])
+    query = QueryBuilder().append(Dict, project=['*'])
+
+    def iterall():
+        return sum(1 for _ in query.iterall(batch_size=1000))
+
+    result = benchmark.pedantic(iterall, iterations=1, rounds=5, warmup_rounds=1)
+    benchmark.extra_info['rows_per_second'] = number / benchmark.stats.stats.mean
+
+    assert result == number
+
+
+@pytest.mark.parametrize('cache', (True, False))
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group=GROUP_NAME_REPEATED)
+def test_repeated_query(benchmark, monkeypatch, cache):
+    """Benchmark for executing a query with the same structure for different nodes, with and without reusing the query.
+
+    Since the query only returns a single row of a small table, its time is dominated by the building and compiling of
+    the query, which is only done once when the built query is reused.
+    """
+    # Start from an empty cache, since queries cached by other tests are not evicted when its size is reduced
+    monkeypatch.setattr(main, '_QUERY_CACHE', OrderedDict())
+
+    if not cache:
+        monkeypatch.setattr(main, '_QUERY_CACHE_MAXSIZE', 0)
+
+    number = 100
+    pks = [node.pk for node in store_many([Dict(dict={'energy': float(index)}) for index in range(number)])]
+
+    def query():
+        for pk in pks:
+            builder = QueryBuilder().append(Dict, tag='dict', filters={'id': pk, 'attributes.energy': {'>=': 0}})
+            builder.append(User, with_node='dict', project=['email'])
+            builder.first()
+
+    benchmark.pedantic(query, iterations=1, rounds=10, warmup_rounds=1)
+    benchmark.extra_info['queries_per_second'] = number / benchmark.stats.stats.mean
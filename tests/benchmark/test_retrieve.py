@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=unused-argument
+"""Performance benchmark tests for the retrieval of the output files of calculation jobs.
+
+The purpose of these tests is to compare the retrieval of files one by one with the retrieval of a single archive of all
+files, for an increasing number of files.
+"""
+import shutil
+
+import pytest
+
+from aiida.engine.daemon.execmanager import retrieve_files_from_list
+from aiida.transports.plugins.local import LocalTransport
+
+GROUP_NAME = 'retrieve'
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.parametrize('archive', (False, True), ids=('per-file', 'archive'))
+@pytest.mark.parametrize('num_files', (10, 100, 1000))
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=3)
+def test_retrieve_files_from_list(benchmark, tmp_path, generate_calculation_node, num_files, archive):
+    """Benchmark for retrieving the files of a calculation with a ``LocalTransport``."""
+    source = tmp_path / 'source'
+    target = tmp_path / 'target'
+    source.mkdir()
+
+    for index in range(num_files):
+        (source / f'file_{index}.out').write_text(f'output {index}\n' * 100)
+
+    retrieve_list = [f'file_{index}.out' for index in range(num_files)]
+    node = generate_calculation_node()
+
+    def setup():
+        shutil.rmtree(target, ignore_errors=True)
+        target.mkdir()
+
+    # Do not use a login shell, such that the benchmark does not depend on the shell profile of the current user
+    with LocalTransport(use_login_shell=False) as transport:
+        transport.chdir(str(source))
+        benchmark.pedantic(
+            retrieve_files_from_list,
+            args=(node, transport, str(target), retrieve_list),
+            kwargs={'archive': archive},
+            setup=setup,
+            rounds=3
+        )
+
+    assert len(list(target.iterdir())) == num_files
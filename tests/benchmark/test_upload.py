@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=unused-argument
+"""Performance benchmark tests for the upload of the input files of calculation jobs.
+
+The purpose of these tests is to measure the upload rate of the inputs of calculation jobs that share a large input
+file, with and without the deduplication of files that were already uploaded with the same transport.
+"""
+import io
+
+import pytest
+
+from aiida.common.datastructures import CalcInfo, CodeInfo
+from aiida.common.folders import SandboxFolder
+from aiida.engine.daemon import execmanager
+from aiida.orm import CalcJobNode
+from aiida.transports.plugins.local import LocalTransport
+
+GROUP_NAME = 'upload'
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.parametrize('deduplicate', (False, True), ids=('upload', 'deduplicate'))
+@pytest.mark.parametrize('num_files', (10, 100))
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=3)
+def test_upload_calculation(benchmark, aiida_localhost, aiida_local_code_factory, monkeypatch, num_files, deduplicate):
+    """Benchmark for uploading the inputs of a calculation with a ``LocalTransport``, reporting the bytes per second."""
+    size = 16 * 1024 * 1024
+    code = aiida_local_code_factory('core.arithmetic.add', '/bin/bash').store()
+
+    if not deduplicate:
+        monkeypatch.setattr(execmanager, 'UPLOAD_DEDUPLICATION_MINIMUM_SIZE', 2 * size)
+
+    with SandboxFolder() as folder:
+        subfolder = folder.get_subfolder('data', create=True)
+        for index in range(num_files):
+            subfolder.create_file_from_filelike(io.BytesIO(b'input\n' * 100), f'file_{index}.in')
+        folder.create_file_from_filelike(io.BytesIO(b'\0' * size), 'restart.dat')
+
+        def upload(transport):
+            node = CalcJobNode(computer=aiida_localhost).store()
+            code_info = CodeInfo()
+            code_info.code_uuid = code.uuid
+            calc_info = CalcInfo()
+            calc_info.uuid = node.uuid
+            calc_info.codes_info = [code_info]
+            execmanager.upload_calculation(node, transport, calc_info, folder)
+
+        # Do not use a login shell, such that the benchmark does not depend on the shell profile of the current user
+        with LocalTransport(use_login_shell=False) as transport:
+            upload(transport)
+            benchmark.pedantic(upload, args=(transport,), rounds=3)
+
+    benchmark.extra_info['bytes_per_second'] = (size + num_files * 600) / benchmark.stats.stats.mean
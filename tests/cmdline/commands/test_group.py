@@ -8,6 +8,8 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Tests for the `verdi group` command."""
+import tempfile
+
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.cmdline.commands import cmd_group
@@ -309,6 +311,47 @@ class TestVerdiGroup(AiidaTestCase):
         self.assertIn('Aborted', result.output)
         self.assertEqual(group.count(), 1)
 
+    def test_add_remove_nodes_from_query(self):
+        """Test `verdi group add-nodes` and `verdi group remove-nodes` with the `--from-query` option."""
+        from aiida.common import json
+
+        nodes = [orm.CalculationNode().store() for _ in range(3)]
+        group = orm.load_group(label='dummygroup1')
+
+        builder = orm.QueryBuilder().append(orm.CalculationNode, filters={'id': {'in': [node.pk for node in nodes]}})
+        query = json.dumps(builder.as_dict())
+
+        with tempfile.NamedTemporaryFile('w', suffix='.json') as handle:
+            handle.write(query)
+            handle.flush()
+            options = ['--group=dummygroup1', '--from-query', handle.name]
+            result = self.cli_runner.invoke(cmd_group.group_add_nodes, options, input='y')
+
+        self.assertClickResultNoException(result)
+        self.assertIn('add 3 nodes', result.output)
+        self.assertEqual({node.pk for node in nodes}, {node.pk for node in group.nodes})
+
+        builder.add_filter(builder.get_used_tags()[0], {'id': nodes[0].pk})
+        query = json.dumps(builder.as_dict())
+
+        result = self.cli_runner.invoke(
+            cmd_group.group_remove_nodes, ['--force', '--group=dummygroup1', '--from-query', '-'], input=query
+        )
+        self.assertClickResultNoException(result)
+        self.assertEqual({node.pk for node in nodes[1:]}, {node.pk for node in group.nodes})
+
+        # A query that does not project the nodes is rejected
+        query = json.dumps(orm.QueryBuilder().append(orm.CalculationNode, project='uuid').as_dict())
+        result = self.cli_runner.invoke(
+            cmd_group.group_add_nodes, ['--force', '--group=dummygroup1', '--from-query', '-'], input=query
+        )
+        self.assertEqual(result.exit_code, ExitCode.CRITICAL)
+
+        result = self.cli_runner.invoke(
+            cmd_group.group_add_nodes, ['--force', '--group=dummygroup1', '--from-query', '-'], input='invalid'
+        )
+        self.assertEqual(result.exit_code, ExitCode.CRITICAL)
+
     def test_copy_existing_group(self):
         """Test user is prompted to continue if destination group exists and is not empty"""
         source_label = 'source_copy_existing_group'
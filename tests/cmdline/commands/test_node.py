@@ -573,6 +573,34 @@ class TestVerdiRehash(AiidaTestCase):
         self.assertClickResultNoException(result)
         self.assertTrue(f'{expected_node_count} nodes' in result.output)
 
+    def test_rehash_batch_size(self):
+        """Passing a batch size smaller than the number of nodes should still rehash all 5 nodes."""
+        expected_node_count = 5
+        options = ['-f', '--batch-size', '2']
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertClickResultNoException(result)
+        self.assertTrue(f'{expected_node_count} nodes' in result.output)
+
+    def test_rehash_checkpoint(self):
+        """Passing a checkpoint file should resume from it and remove it once all nodes are rehashed."""
+        expected_node_count = 2
+        with tempfile.TemporaryDirectory() as dirpath:
+            checkpoint = os.path.join(dirpath, 'checkpoint')
+            with open(checkpoint, 'w') as handle:
+                handle.write(str(self.node_bool_false.pk))
+
+            options = ['-f', '--checkpoint', checkpoint]
+            result = self.cli_runner.invoke(cmd_node.rehash, options)
+            self.assertClickResultNoException(result)
+            self.assertTrue(f'{expected_node_count} nodes' in result.output)
+            self.assertFalse(os.path.exists(checkpoint))
+
+    def test_rehash_invalid_num_processes(self):
+        """Passing a non-positive number of processes should exit with non-zero status."""
+        options = ['-f', '--num-processes', '0']
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertIsNotNone(result.exception)
+
     def test_rehash_entry_point_no_matches(self):
         """Limiting the queryset by defining explicit entry point, with no nodes should exit with non-zero status."""
         options = ['-f', '-e', 'aiida.data:core.structure']
@@ -358,3 +358,41 @@ class TestDFAD(unittest.TestCase):
         # alpha must be a positive integer
         with self.assertRaises(exceptions.ValidationError):
             dictionary.validate()
+
+
+class TestLazyAttributeDict(unittest.TestCase):
+    """Test for the `LazyAttributeDict` class."""
+
+    def setUp(self):
+        self.loaded = []
+
+        def loader(serialized):
+            self.loaded.extend(serialized)
+            return [int(value) for value in serialized]
+
+        self.dictionary = extendeddicts.LazyAttributeDict({'a': '1', 'b': '2', 'c': '3'}, loader)
+
+    def test_access(self):
+        """Test that only the values that are accessed are loaded."""
+        self.assertEqual(self.dictionary['a'], 1)
+        self.assertEqual(self.dictionary.b, 2)
+        self.assertEqual(self.loaded, ['1', '2'])
+        self.assertEqual(self.dictionary.get_serialized('c'), '3')
+        self.assertIsNone(self.dictionary.get_serialized('a'))
+
+        # Values are only loaded once
+        self.assertEqual(self.dictionary['a'], 1)
+        self.assertEqual(self.loaded, ['1', '2'])
+
+    def test_load(self):
+        """Test that operations on all values load the remaining values at once."""
+        self.assertEqual(self.dictionary['a'], 1)
+        self.assertEqual(dict(self.dictionary), {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(self.loaded, ['1', '2', '3'])
+        self.assertEqual(self.dictionary, {'a': 1, 'b': 2, 'c': 3})
+
+    def test_copy(self):
+        """Test that copies are plain `AttributeDict` instances with loaded values."""
+        for dictionary in [copy.deepcopy(self.dictionary), pickle.loads(pickle.dumps(self.dictionary))]:
+            self.assertIs(type(dictionary), extendeddicts.AttributeDict)
+            self.assertEqual(dictionary, {'a': 1, 'b': 2, 'c': 3})
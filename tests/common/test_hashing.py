@@ -183,6 +183,27 @@ class MakeHashTest(unittest.TestCase):
         )  # pylint: disable=no-member
         self.assertEqual(make_hash(np.int64(42)), '9468692328de958d7a8039e8a2eb05cd6888b7911bbc3794d0dfebd8df3482cd')  # pylint: disable=no-member
 
+    def test_numpy_arrays(self):
+        """Test that NumPy arrays and scalars are hashed as the equivalent (nested) lists and Python scalars."""
+        self.assertEqual(make_hash(np.array([1.5, 2.5, 3.5])), make_hash([1.5, 2.5, 3.5]))
+        self.assertEqual(make_hash(np.array([[1, 2], [3, 4]])), make_hash([[1, 2], [3, 4]]))
+        self.assertEqual(make_hash(np.bool_(True)), make_hash(True))
+        self.assertNotEqual(make_hash(np.array([1, 2])), make_hash(np.array([1.5, 2])))
+
+    def test_homogeneous_sequences(self):
+        """Test that the fast path for sequences of a single basic type gives the same hash as the generic one."""
+        test_data = [
+            ([1, 2, 3], 'b6b13d50e3bee7e58371af2b303f629edf32d1be2f7717c9d14193b4b8b23e04'),
+            ([1, 2, 3.0], 'dec24ce8bb9d66f64e4b74fe64e058feaeedb87a8c0dbc321a2827d1bab290a1'),
+            ([1.5, 2.5, 3.5], '310d86e16d0586656311541c02c73cf97264d40782a61760274f10f582508f38'),
+            (['a', 'b'], '53d09fc9ac7cab0de60ac6d42bdf169ade8ac01041797b355a88f83bb9a75a04'),
+            ([True, False], 'b53b2daae4b5d9cfc97d2a90d6f10eeaaf335ce758a7d2a12b20c0173c697d90'),
+        ]
+
+        for val, digest in test_data:
+            with self.subTest(val=val):
+                self.assertEqual(make_hash(val), digest)
+
     def test_decimal(self):
         self.assertEqual(
             make_hash(Decimal('3.141')), 'b3302aad550413e14fe44d5ead10b3aeda9884055fca77f9368c48517916d4be'
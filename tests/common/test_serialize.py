@@ -146,3 +146,89 @@ class TestSerialize(AiidaTestCase):
         serialized = serialize.serialize(data)
         deserialized = serialize.deserialize_unsafe(serialized)
         assert data == deserialized
+
+
+class TestSerializeCompact(AiidaTestCase):
+    """Tests for the compact serializer and deserializer."""
+
+    def test_round_trip(self):
+        """Test the round trip of a data structure with all the supported types."""
+        from plumpy import Bundle
+        from plumpy.utils import AttributesFrozendict
+
+        from aiida.common.extendeddicts import AttributeDict
+        from aiida.engine.processes.workchains.awaitable import Awaitable, AwaitableAction
+
+        node = orm.Data().store()
+        group = orm.Group(label='test_serialize_compact').store()
+
+        bundle = Bundle.__new__(Bundle)
+        bundle.update({'context': AttributeDict({'node': node, 'nested': {'list': [1, 2.5, None]}})})
+
+        data = {
+            'bundle': bundle,
+            'tuple': (1, 'a', (node,)),
+            'dict': {('Si',): node,
+                     1: 'int',
+                     '!t': 'reserved'},
+            'frozendict': AttributesFrozendict({'node': node}),
+            'awaitable': Awaitable(pk=node.pk, action=AwaitableAction.ASSIGN, outputs=False),
+            'group': group,
+            'computer': self.computer,
+            'string': 'äöü',
+        }
+
+        serialized = serialize.serialize_compact(data)
+        self.assertTrue(serialize.is_compact(serialized))
+        self.assertFalse(serialize.is_compact(serialize.serialize(data)))
+
+        deserialized = serialize.deserialize_compact(serialized)
+
+        # Groups and computers do not implement equality, so they are compared by UUID below
+        for key in ['bundle', 'tuple', 'dict', 'frozendict', 'awaitable', 'string']:
+            self.assertEqual(deserialized[key], data[key])
+
+        self.assertIsInstance(deserialized['bundle'], Bundle)
+        self.assertIsInstance(deserialized['bundle']['context'], AttributeDict)
+        self.assertIsInstance(deserialized['bundle']['context'].nested, AttributeDict)
+        self.assertIsInstance(deserialized['frozendict'], AttributesFrozendict)
+        self.assertIsInstance(deserialized['awaitable'], Awaitable)
+        self.assertIs(deserialized['awaitable'].action, AwaitableAction.ASSIGN)
+        self.assertEqual(deserialized['tuple'][2][0].uuid, node.uuid)
+        self.assertEqual(deserialized['group'].uuid, group.uuid)
+        self.assertEqual(deserialized['computer'].uuid, self.computer.uuid)
+
+    def test_nodes_single_query(self):
+        """Test that the nodes of a deserialized data structure are loaded with a single query."""
+        from unittest.mock import patch
+
+        nodes = [orm.Int(value).store() for value in range(10)]
+        serialized = serialize.serialize_compact({'nodes': nodes})
+
+        with patch.object(orm, 'load_node', side_effect=AssertionError('nodes should not be loaded one by one')):
+            deserialized = serialize.deserialize_compact(serialized)
+
+        self.assertEqual([node.value for node in deserialized['nodes']], list(range(10)))
+
+    def test_unsupported(self):
+        """Test that unsupported types and unstored entities raise."""
+        for data in [np.array([1, 2, 3]), np.float64(1.0), {1, 2}, types.SimpleNamespace(a=1)]:
+            with self.assertRaises(TypeError):
+                serialize.serialize_compact({'data': data})
+
+        with self.assertRaises(ValueError):
+            serialize.serialize_compact(orm.Data())
+
+        with self.assertRaises(ValueError):
+            serialize.deserialize_compact(serialize.serialize({'a': 1}))
+
+    def test_missing_node(self):
+        """Test that deserializing a data structure that references a node that no longer exists raises."""
+        from aiida.common.exceptions import NotExistent
+
+        node = orm.Data().store()
+        serialized = serialize.serialize_compact([node])
+        orm.Node.objects.delete(node.pk)
+
+        with self.assertRaises(NotExistent):
+            serialize.deserialize_compact(serialized)
@@ -333,10 +333,11 @@ def communicator(manager):
 
 
 @pytest.fixture
-def skip_if_not_django(backend):
+def skip_if_not_django(manager):
     """Fixture that will skip any test that uses it when a profile is loaded with any other backend then Django."""
-    from aiida.orm.implementation.django.backend import DjangoBackend
-    if not isinstance(backend, DjangoBackend):
+    # Do not import the Django backend implementation to check the type of the backend, since that requires Django
+    from aiida.backends import BACKEND_DJANGO
+    if manager.get_profile().database_backend != BACKEND_DJANGO:
         pytest.skip('this test should only be run for the Django backend.')
 
 
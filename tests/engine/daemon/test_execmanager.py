@@ -113,8 +113,9 @@ def test_hierarchy_utility(file_hierarchy, tmp_path):
     (['file_a.txt', 'file_u.txt', 'path/file_u.txt', ('path/sub/file_u.txt', '.', 3)], {'file_a.txt': 'file_a'}),
 ))
 # yapf: enable
+@pytest.mark.parametrize('archive', (False, True))
 def test_retrieve_files_from_list(
-    tmp_path_factory, generate_calculation_node, file_hierarchy, retrieve_list, expected_hierarchy
+    tmp_path_factory, generate_calculation_node, file_hierarchy, retrieve_list, expected_hierarchy, archive
 ):
     """Test the `retrieve_files_from_list` function."""
     source = tmp_path_factory.mktemp('source')
@@ -125,9 +126,68 @@ def test_retrieve_files_from_list(
     with LocalTransport() as transport:
         node = generate_calculation_node()
         transport.chdir(source)
-        execmanager.retrieve_files_from_list(node, transport, target, retrieve_list)
+        execmanager.retrieve_files_from_list(node, transport, target, retrieve_list, archive=archive)
 
     assert serialize_file_hierarchy(target) == expected_hierarchy
+    assert serialize_file_hierarchy(source) == file_hierarchy
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_retrieve_files_from_list_archive(tmp_path_factory, generate_calculation_node, file_hierarchy, monkeypatch):
+    """Test that with `archive=True`, the files are retrieved with a single `Transport.get` call of the archive."""
+    source = tmp_path_factory.mktemp('source')
+    target = tmp_path_factory.mktemp('target')
+    retrieved = []
+
+    create_file_hierarchy(file_hierarchy, source)
+
+    def get(self, remotepath, *args, **kwargs):
+        retrieved.append(remotepath)
+        return original_get(self, remotepath, *args, **kwargs)
+
+    original_get = LocalTransport.get
+    monkeypatch.setattr(LocalTransport, 'get', get)
+
+    with LocalTransport() as transport:
+        node = generate_calculation_node()
+        transport.chdir(source)
+        execmanager.retrieve_files_from_list(node, transport, target, ['file_a.txt', 'path/sub/*'], archive=True)
+        remote_retrieved = [path for path in retrieved if not os.path.isabs(path) and path.startswith('.aiida')]
+
+    assert remote_retrieved == ['.aiida_retrieve.tar.gz']
+    assert serialize_file_hierarchy(target) == {'file_a.txt': 'file_a', 'file_c.txt': 'file_c', 'file_d.txt': 'file_d'}
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_retrieve_files_from_list_archive_fallback(
+    tmp_path_factory, generate_calculation_node, file_hierarchy, monkeypatch
+):
+    """Test that files are retrieved one by one if the archive cannot be created on the remote."""
+    source = tmp_path_factory.mktemp('source')
+    target = tmp_path_factory.mktemp('target')
+
+    create_file_hierarchy(file_hierarchy, source)
+    monkeypatch.setattr(LocalTransport, 'exec_command_wait', lambda self, command: (127, '', 'tar: command not found'))
+
+    with LocalTransport() as transport:
+        node = generate_calculation_node()
+        transport.chdir(source)
+        execmanager.retrieve_files_from_list(node, transport, target, ['file_a.txt', 'path/sub/*'], archive=True)
+
+    assert serialize_file_hierarchy(target) == {'file_a.txt': 'file_a', 'file_c.txt': 'file_c', 'file_d.txt': 'file_d'}
+
+
+@pytest.mark.parametrize(
+    'pattern, expected', (
+        ('file.txt', "'file.txt'"),
+        ('path with spaces/*.txt', "'path with spaces/'*'.txt'"),
+        ('out?/file[0-9].dat', "'out'?'/file'[0-9]'.dat'"),
+        ('file[$(ls)]', None),
+    )
+)
+def test_escape_glob_for_bash(pattern, expected):
+    """Test the `_escape_glob_for_bash` function."""
+    assert execmanager._escape_glob_for_bash(pattern) == expected  # pylint: disable=protected-access
 
 
 @pytest.mark.usefixtures('clear_database_before_test')
@@ -179,3 +239,52 @@ def test_upload_local_copy_list(fixture_sandbox, aiida_localhost, aiida_local_co
     expected_hierarchy['files']['file_x'] = 'content_x'
     expected_hierarchy['files']['file_y'] = 'content_y'
     assert expected_hierarchy == written_hierarchy
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_upload_deduplicate(aiida_localhost, aiida_local_code_factory, monkeypatch):
+    """Test that ``upload_calculation`` copies large files that were already uploaded with the same transport."""
+    from aiida.common.datastructures import CalcInfo, CodeInfo
+    from aiida.common.folders import SandboxFolder
+    from aiida.orm import CalcJobNode, SinglefileData
+
+    content = b'x' * 64
+    single_file = SinglefileData(io.BytesIO(content)).store()
+    code = aiida_local_code_factory('core.arithmetic.add', '/bin/bash').store()
+    uploaded = []
+
+    def putfiles(self, files, concurrency=1):
+        files = list(files)
+        uploaded.extend(os.path.basename(remotepath) for _, remotepath in files)
+        LocalTransport.putfiles(self, files, concurrency)
+
+    monkeypatch.setattr(execmanager, 'UPLOAD_DEDUPLICATION_MINIMUM_SIZE', len(content))
+
+    def upload(transport):
+        node = CalcJobNode(computer=aiida_localhost).store()
+        code_info = CodeInfo()
+        code_info.code_uuid = code.uuid
+        calc_info = CalcInfo()
+        calc_info.uuid = node.uuid
+        calc_info.codes_info = [code_info]
+        calc_info.local_copy_list = [(single_file.uuid, single_file.filename, 'file.txt')]
+
+        with SandboxFolder() as folder:
+            folder.create_file_from_filelike(io.BytesIO(b'input'), 'aiida.in')
+            execmanager.upload_calculation(node, transport, calc_info, folder)
+
+        return pathlib.Path(node.get_remote_workdir())
+
+    with LocalTransport() as transport:
+        monkeypatch.setattr(transport, 'putfiles', putfiles.__get__(transport))
+        workdirs = [upload(transport) for _ in range(2)]
+        assert sorted(uploaded) == ['aiida.in', 'aiida.in', 'file.txt']
+
+        # Once the uploaded copy is modified, the file is uploaded again
+        (workdirs[0] / 'file.txt').write_bytes(content + b'y')
+        workdirs.append(upload(transport))
+        assert sorted(uploaded) == ['aiida.in', 'aiida.in', 'aiida.in', 'file.txt', 'file.txt']
+
+    for workdir in workdirs[1:]:
+        assert (workdir / 'file.txt').read_bytes() == content
+        assert (workdir / 'aiida.in').read_bytes() == b'input'
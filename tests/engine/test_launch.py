@@ -144,6 +144,64 @@ class TestLaunchers(AiidaTestCase):
         with self.assertRaises(exceptions.InvalidOperation):
             launch.submit(AddWorkChain, term_a=self.term_a, term_b=self.term_b, metadata={'store_provenance': False})
 
+    def test_submit_many(self):
+        """Test that `submit_many` stores a node with inputs and a checkpoint for each set of inputs."""
+        inputs = [{'term_a': orm.Int(index), 'term_b': self.term_b} for index in range(5)]
+        nodes = launch.submit_many(AddWorkChain, iter(inputs), batch_size=2)
+
+        self.assertEqual(len(nodes), len(inputs))
+
+        for node, node_inputs in zip(nodes, inputs):
+            self.assertIsInstance(node, orm.WorkChainNode)
+            self.assertTrue(node.is_stored)
+            self.assertIsNotNone(node.checkpoint)
+            self.assertEqual(node.inputs.term_a.pk, node_inputs['term_a'].pk)
+
+    def test_submit_many_invalid_inputs(self):
+        """Test that `submit_many` stores none of the processes of a batch if one of them has invalid inputs."""
+        inputs = [{'term_a': self.term_a, 'term_b': self.term_b}, {'term_a': self.term_a}]
+        count = orm.QueryBuilder().append(orm.WorkChainNode).count()
+
+        with self.assertRaises(ValueError):
+            launch.submit_many(AddWorkChain, inputs)
+
+        self.assertEqual(orm.QueryBuilder().append(orm.WorkChainNode).count(), count)
+
+        with self.assertRaises(exceptions.InvalidOperation):
+            launch.submit_many(
+                AddWorkChain, [{
+                    'term_a': self.term_a,
+                    'term_b': self.term_b,
+                    'metadata': {
+                        'store_provenance': False
+                    }
+                }]
+            )
+
+    def test_submit_many_invalid_inputs_close(self):
+        """Test that `submit_many` closes the processes of a batch if one of them cannot be submitted."""
+        from unittest.mock import patch
+
+        from aiida.engine.runners import Runner
+
+        processes = []
+        instantiate_process = Runner.instantiate_process
+
+        def instantiate_and_record(runner, *args, **kwargs):
+            process = instantiate_process(runner, *args, **kwargs)
+            processes.append(process)
+            return process
+
+        inputs = [{'term_a': self.term_a, 'term_b': self.term_b}, {'term_a': self.term_a, 'term_b': self.term_b}]
+        inputs[1]['metadata'] = {'store_provenance': False}
+
+        with patch.object(Runner, 'instantiate_process', instantiate_and_record):
+            with self.assertRaises(exceptions.InvalidOperation):
+                launch.submit_many(AddWorkChain, inputs)
+
+        self.assertEqual(len(processes), 2)
+        self.assertTrue(all(process._closed for process in processes))  # pylint: disable=protected-access
+
 
 @pytest.mark.requires_rmq
 class TestLaunchersDryRun(AiidaTestCase):
@@ -10,10 +10,12 @@
 """Tests for the classes in `aiida.engine.processes.calcjobs.manager`."""
 
 import asyncio
+import contextlib
+import tempfile
 import time
 
 from aiida.backends.testbase import AiidaTestCase
-from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
+from aiida.engine.processes.calcjobs.manager import JobManager, JobsList, SharedJobs, SharedJobsCache
 from aiida.engine.transports import TransportQueue
 from aiida.orm import AuthInfo, User
 
@@ -75,3 +77,211 @@ class TestJobsList(AiidaTestCase):
         last_updated = time.time()
         jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=last_updated)
         self.assertEqual(jobs_list.last_updated, last_updated)
+
+    def test_update_job_info(self):
+        """Test that `JobsList._update_job_info` only resolves requests of jobs whose state has changed."""
+        # pylint: disable=protected-access
+        from aiida.schedulers.datastructures import JobInfo, JobState
+
+        def get_job_info(job_id, job_state):
+            job_info = JobInfo()
+            job_info.job_id = job_id
+            job_info.job_state = job_state
+            return job_info
+
+        async def get_jobs_from_scheduler():
+            return responses.pop(0)
+
+        def request_updates(job_ids):
+            return {
+                job_id: self.jobs_list._job_update_requests.setdefault(job_id, asyncio.Future()) for job_id in job_ids
+            }
+
+        responses = [
+            {
+                '1': get_job_info('1', JobState.QUEUED),
+                '2': get_job_info('2', JobState.QUEUED)
+            },
+            {
+                '1': get_job_info('1', JobState.QUEUED),
+                '2': get_job_info('2', JobState.QUEUED)
+            },
+            {
+                '1': get_job_info('1', JobState.RUNNING),
+                '2': get_job_info('2', JobState.QUEUED)
+            },
+            {
+                '1': get_job_info('1', JobState.RUNNING)
+            },
+        ]
+        minimum_interval = self.jobs_list.get_minimum_update_interval()
+        self.jobs_list._get_jobs_from_scheduler = get_jobs_from_scheduler
+
+        # The first update resolves all requests
+        requests = request_updates(['1', '2'])
+        self.loop.run_until_complete(self.jobs_list._update_job_info())
+        self.assertEqual({job_id: request.result().job_state for job_id, request in requests.items()}, {
+            '1': JobState.QUEUED,
+            '2': JobState.QUEUED
+        })
+        self.assertEqual(self.jobs_list.get_metrics()['update_interval'], minimum_interval)
+
+        # Nothing changed, so the requests remain pending and the interval is increased
+        requests = request_updates(['1', '2'])
+        self.loop.run_until_complete(self.jobs_list._update_job_info())
+        self.assertFalse(any(request.done() for request in requests.values()))
+        self.assertEqual(
+            self.jobs_list.get_metrics()['update_interval'],
+            min(
+                minimum_interval * JobsList.UPDATE_INTERVAL_BACKOFF_FACTOR, self.jobs_list.get_maximum_update_interval()
+            )
+        )
+
+        # Only the job that changed state is resolved and the interval is reset
+        self.loop.run_until_complete(self.jobs_list._update_job_info())
+        self.assertEqual(requests['1'].result().job_state, JobState.RUNNING)
+        self.assertFalse(requests['2'].done())
+        self.assertEqual(self.jobs_list.get_metrics()['update_interval'], minimum_interval)
+
+        # A job that is no longer with the scheduler resolves to `None`
+        self.loop.run_until_complete(self.jobs_list._update_job_info())
+        self.assertIsNone(requests['2'].result())
+
+    def test_request_job_info_update_callback(self):
+        """Test that the callback of a request is called with the job info of updates that do not change the state."""
+        # pylint: disable=protected-access
+        from aiida.schedulers.datastructures import JobInfo, JobState
+
+        def get_job_info(job_state, wallclock_time_seconds):
+            job_info = JobInfo()
+            job_info.job_id = '1'
+            job_info.job_state = job_state
+            job_info.wallclock_time_seconds = wallclock_time_seconds
+            return job_info
+
+        async def get_jobs_from_scheduler():
+            return {'1': responses.pop(0)}
+
+        responses = [
+            get_job_info(JobState.QUEUED, 0),
+            get_job_info(JobState.RUNNING, 10),
+            get_job_info(JobState.RUNNING, 20),
+            get_job_info(JobState.DONE, 30),
+        ]
+        job_infos = []
+        self.jobs_list._get_jobs_from_scheduler = get_jobs_from_scheduler
+        self.jobs_list._ensure_updating = lambda: None
+
+        with self.jobs_list.request_job_info_update('1', job_infos.append) as request:
+            self.loop.run_until_complete(self.jobs_list._update_job_info())
+            self.assertEqual(request.result().job_state, JobState.QUEUED)
+
+        with self.jobs_list.request_job_info_update('1', job_infos.append) as request:
+            self.loop.run_until_complete(self.jobs_list._update_job_info())
+            self.assertEqual(request.result().job_state, JobState.RUNNING)
+
+        # The job info of updates in which the state did not change is passed to the callback of the pending request
+        with self.jobs_list.request_job_info_update('1', job_infos.append) as request:
+            self.loop.run_until_complete(self.jobs_list._update_job_info())
+            self.assertFalse(request.done())
+            self.assertEqual([job_info.wallclock_time_seconds for job_info in job_infos], [20])
+
+            self.loop.run_until_complete(self.jobs_list._update_job_info())
+            self.assertEqual(request.result().job_state, JobState.DONE)
+            self.assertEqual(len(job_infos), 1)
+
+        self.assertEqual(self.jobs_list._job_info_callbacks, {})
+
+    def test_get_next_update_delay(self):
+        """Test that `JobsList._get_next_update_delay` backs off, but is brought forward by the end of running jobs."""
+        # pylint: disable=protected-access
+        from aiida.schedulers.datastructures import JobInfo, JobState
+
+        minimum_interval = self.computer.get_minimum_job_poll_interval()
+        maximum_interval = self.computer.get_maximum_job_poll_interval()
+        self.computer.set_minimum_job_poll_interval(10.)
+        self.computer.set_maximum_job_poll_interval(100.)
+
+        try:
+            jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=time.time())
+            jobs_list._update_interval = 1000.
+            self.assertAlmostEqual(jobs_list._get_next_update_delay(), 100., delta=1.)
+
+            job_info = JobInfo()
+            job_info.job_id = '1'
+            job_info.job_state = JobState.RUNNING
+            job_info.requested_wallclock_time_seconds = 3600
+            job_info.wallclock_time_seconds = 3570
+            jobs_list._jobs_cache = {'1': job_info}
+            jobs_list._job_update_requests = {'1': asyncio.Future()}
+            self.assertAlmostEqual(jobs_list._get_next_update_delay(), 30., delta=1.)
+
+            # The minimum interval is always respected
+            job_info.wallclock_time_seconds = 3599
+            self.assertAlmostEqual(jobs_list._get_next_update_delay(), 10., delta=1.)
+        finally:
+            self.computer.set_minimum_job_poll_interval(minimum_interval)
+            self.computer.set_maximum_job_poll_interval(maximum_interval)
+
+    def test_shared_jobs_cache(self):
+        """Test that the jobs polled by one `JobsList` are read from the `SharedJobsCache` by another one."""
+        # pylint: disable=protected-access
+        from aiida.schedulers.datastructures import JobInfo, JobState
+
+        job_info = JobInfo()
+        job_info.job_id = '1'
+        job_info.job_state = JobState.RUNNING
+
+        def poll_scheduler(scheduler, jobs):  # pylint: disable=unused-argument
+            polled.append(jobs)
+            return {'1': job_info}
+
+        class OpenTransportQueue(TransportQueue):
+            """Transport queue that hands out a transport immediately, without yielding to the event loop."""
+
+            @contextlib.contextmanager
+            def request_transport(self, authinfo):
+                request = self.loop.create_future()
+                request.set_result(None)
+                yield request
+
+        class LeasedJobsCache(SharedJobsCache):
+            """Shared jobs cache that records when its lease is acquired."""
+
+            def lease(self):
+                leases.append(self)
+                return super().lease()
+
+        # Sharing the status of jobs is disabled by default
+        self.assertIsNone(self.jobs_list._get_shared_cache())
+
+        with tempfile.TemporaryDirectory() as dirpath:
+            jobs_lists = [JobsList(self.auth_info, OpenTransportQueue(self.loop)) for _ in range(2)]
+            polled = []
+            leases = []
+
+            for jobs_list in jobs_lists:
+                jobs_list._get_shared_cache = lambda dirpath=dirpath: LeasedJobsCache(self.auth_info, dirpath)
+                jobs_list._poll_scheduler = poll_scheduler
+                jobs_list._job_update_requests = {'1': asyncio.Future()}
+
+            # Only the first jobs list polls the scheduler, the second one reads the response from the shared cache
+            # without acquiring the lease
+            for jobs_list in jobs_lists:
+                self.assertEqual(self.loop.run_until_complete(jobs_list._get_jobs_from_scheduler()), {'1': job_info})
+
+            self.assertEqual(len(polled), 1)
+            self.assertEqual(len(leases), 1)
+            self.assertEqual(jobs_lists[1].get_metrics()['shared_cache_hits'], 1)
+            self.assertEqual(jobs_lists[1].last_updated, SharedJobsCache(self.auth_info, dirpath).read().polled)
+
+            # A new job may not have been with the scheduler when the cache was written, so the scheduler is polled
+            with jobs_lists[1].request_job_info_update('2'):
+                self.loop.run_until_complete(jobs_lists[1]._get_jobs_from_scheduler())
+            self.assertEqual(len(polled), 2)
+
+            # The cache can only be used if all requested jobs were queried, if the scheduler cannot query by user
+            shared_cache = SharedJobsCache(self.auth_info, dirpath)
+            shared_cache.write(SharedJobs(time.time(), {'2'}, {}))
+            self.loop.run_until_complete(jobs_lists[0]._get_jobs_from_scheduler())
+            self.assertEqual(len(polled), 3)
@@ -8,15 +8,31 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Test persisting via the AiiDAPersister."""
+from unittest.mock import patch
+
 import plumpy
 import pytest
 
+from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
-from aiida.engine import Process, run
-from aiida.engine.persistence import AiiDAPersister
+from aiida.common.extendeddicts import LazyAttributeDict
+from aiida.engine import Process, WorkChain, run
+from aiida.engine.persistence import AiiDAPersister, get_checkpoint_codec
 from tests.utils.processes import DummyProcess
 
 
+class ContextWorkChain(WorkChain):
+    """Work chain whose context is set directly by the tests."""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outline(cls.step)
+
+    def step(self):
+        pass
+
+
 @pytest.mark.requires_rmq
 class TestProcess(AiidaTestCase):
     """Test the basic saving and loading of process states."""
@@ -67,3 +83,94 @@ class TestAiiDAPersister(AiidaTestCase):
 
         self.persister.delete_checkpoint(process.pid)
         self.assertEqual(process.node.checkpoint, None)
+
+    def test_checkpoint_codecs(self):
+        """Test that checkpoints are saved with the codec of the persister and loaded with the codec that can."""
+        from aiida.orm.utils import serialize
+
+        process = DummyProcess(inputs={'a': orm.Int(1), 'b': orm.Str('b')})
+
+        yaml_persister = AiiDAPersister(codec=get_checkpoint_codec('yaml'))
+        compact_persister = AiiDAPersister(codec=get_checkpoint_codec('compact'))
+
+        bundle_saved = compact_persister.save_checkpoint(process)
+        self.assertTrue(serialize.is_compact(process.node.checkpoint))
+        self.assertDictEqual(bundle_saved, compact_persister.load_checkpoint(process.node.pk))
+        self.assertDictEqual(bundle_saved, yaml_persister.load_checkpoint(process.node.pk))
+
+        bundle_saved = yaml_persister.save_checkpoint(process)
+        self.assertFalse(serialize.is_compact(process.node.checkpoint))
+        self.assertDictEqual(bundle_saved, compact_persister.load_checkpoint(process.node.pk))
+
+    def test_checkpoint_compact_fallback(self):
+        """Test that the compact codec falls back onto yaml for checkpoints with unsupported objects."""
+        from aiida.orm.utils import serialize
+
+        process = DummyProcess(inputs={'a': orm.Int(1)})
+        persister = AiiDAPersister(codec=get_checkpoint_codec('compact'))
+
+        with patch.object(DummyProcess, 'encode_input_args', lambda self, inputs: {'set': {1, 2}}):
+            persister.save_checkpoint(process)
+
+        self.assertFalse(serialize.is_compact(process.node.checkpoint))
+        self.assertEqual(persister.load_checkpoint(process.node.pk)['INPUTS_RAW'], {'set': {1, 2}})
+
+    def test_checkpoint_context_incremental(self):
+        """Test that only the changes of the context of a work chain are saved, except when it is compacted."""
+        nodes = orm.store_many([orm.Int(index) for index in range(4)])
+        process = ContextWorkChain()
+        persister = AiiDAPersister(compaction_interval=3)
+
+        process.ctx.single = nodes[0]
+        process.ctx.children = [nodes[1]]
+        process.ctx.removed = 'removed'
+        persister.save_checkpoint(process)
+        context, delta = process.node.checkpoint_context
+        self.assertEqual(set(context), {'single', 'children', 'removed'})
+        self.assertEqual(delta, {})
+
+        process.ctx.children.append(nodes[2])
+        del process.ctx.removed
+        persister.save_checkpoint(process)
+        context_delta = process.node.checkpoint_context[1]
+        self.assertEqual(set(context_delta), {'children', 'removed'})
+        self.assertEqual(len(context_delta['children']['extend']), 1)
+        self.assertIsNone(context_delta['removed'])
+
+        # The changes are accumulated with respect to the last compaction
+        process.ctx.single = nodes[3]
+        persister.save_checkpoint(process)
+        self.assertEqual(set(process.node.checkpoint_context[1]), {'single', 'children', 'removed'})
+
+        bundle = persister.load_checkpoint(process.node.pk)
+        self.assertEqual(dict(bundle['CONTEXT']), {'single': nodes[3], 'children': [nodes[1], nodes[2]]})
+
+        # The context is compacted after the configured number of checkpoints
+        persister.save_checkpoint(process)
+        context, delta = process.node.checkpoint_context
+        self.assertEqual(set(context), {'single', 'children'})
+        self.assertEqual(delta, {})
+
+        persister.delete_checkpoint(process.pid)
+        self.assertIsNone(process.node.checkpoint_context)
+
+    def test_checkpoint_context_lazy(self):
+        """Test that the context of a work chain loaded from a checkpoint is only decoded when accessed."""
+        process = ContextWorkChain()
+        process.ctx.node = orm.Int(1).store()
+        process.ctx.value = 2
+        self.persister.save_checkpoint(process)
+
+        context = self.persister.load_checkpoint(process.node.pk)['CONTEXT']
+        self.assertIsInstance(context, LazyAttributeDict)
+        self.assertIsNotNone(context.get_serialized('node'))
+        self.assertEqual(context.value, 2)
+        self.assertIsNotNone(context.get_serialized('node'))
+        self.assertEqual(context.node.pk, process.ctx.node.pk)
+
+        # Entries that were not accessed are saved again without being decoded
+        context = self.persister.load_checkpoint(process.node.pk)['CONTEXT']
+        process._context = context  # pylint: disable=protected-access
+        self.persister.save_checkpoint(process)
+        self.assertIsNotNone(context.get_serialized('node'))
+        self.assertEqual(self.persister.load_checkpoint(process.node.pk)['CONTEXT'].node.pk, context.node.pk)
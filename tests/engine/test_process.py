@@ -95,6 +95,41 @@ class ProcessStackTest(Process):
 
 
 @pytest.mark.requires_rmq
+class CalculationOutputsProcess(Process):
+    """Dummy calculation process with a dynamic output namespace."""
+
+    _node_class = orm.CalculationNode
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.output_namespace('namespace', valid_type=orm.Int, dynamic=True)
+
+
+class WorkflowOutputsProcess(Process):
+    """Dummy workflow process with a dynamic output namespace."""
+
+    _node_class = orm.WorkflowNode
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.output_namespace('namespace', valid_type=orm.Int, dynamic=True)
+
+
+class ReportProcess(Process):
+    """Dummy workflow process that reports a number of messages."""
+
+    _node_class = orm.WorkflowNode
+
+    def run(self):
+        for index in range(5):
+            self.report(f'report {index}')
+
+        # The reports are buffered and should not have been written to the database yet
+        self.node.set_extra('logs_while_running', len(orm.Log.objects.get_logs_for(self.node)))
+
+
 class TestProcess(AiidaTestCase):
     """Test AiiDA process."""
 
@@ -393,3 +428,94 @@ class TestProcess(AiidaTestCase):
             'output': node_output,
         })
         self.assertEqual(exposed_outputs, expected)
+
+    def test_update_outputs(self):
+        """Test that ``Process.update_outputs`` links new outputs without querying for the already linked ones."""
+        from unittest.mock import patch
+
+        from aiida.common.links import LinkType
+        from aiida.engine.utils import instantiate_process
+        from aiida.manage.manager import get_manager
+
+        runner = get_manager().get_runner()
+        process = instantiate_process(runner, CalculationOutputsProcess)
+
+        for index in range(10):
+            process.out(f'namespace.output_{index}', orm.Int(index))
+        process.update_outputs()
+
+        outputs = process.node.get_outgoing(link_type=LinkType.CREATE).nested()['namespace']
+        self.assertEqual({label: node.value for label, node in outputs.items()},
+                         {f'output_{index}': index for index in range(10)})
+
+        # Subsequent calls only link the new outputs and do not query for the outputs that were already linked
+        process.out('namespace.output_10', orm.Int(10))
+        with patch.object(process.node, 'get_outgoing', side_effect=AssertionError('queried the linked outputs')):
+            process.update_outputs()
+            process.update_outputs()
+
+        self.assertEqual(len(process.node.get_outgoing(link_type=LinkType.CREATE).all()), 11)
+
+        # A calculation cannot create a node that was already created by another calculation
+        node = orm.Int(11).store()
+        node.add_incoming(orm.CalculationNode().store(), link_type=LinkType.CREATE, link_label='result')
+        process.out('namespace.created', node)
+        with self.assertRaises(ValueError):
+            process.update_outputs()
+
+    def test_update_outputs_duplicate(self):
+        """Test that ``Process.update_outputs`` raises if an unstored output is attached to multiple labels."""
+        from aiida.common.links import LinkType
+        from aiida.engine.utils import instantiate_process
+        from aiida.manage.manager import get_manager
+
+        runner = get_manager().get_runner()
+        process = instantiate_process(runner, CalculationOutputsProcess)
+        node = orm.Int(1)
+
+        process.out('namespace.output_a', node)
+        process.out('namespace.output_b', node)
+        with self.assertRaises(ValueError):
+            process.update_outputs()
+
+        self.assertFalse(node.is_stored)
+        self.assertEqual(process.node.get_outgoing(link_type=LinkType.CREATE).all(), [])
+
+    def test_update_outputs_return(self):
+        """Test that ``Process.update_outputs`` links stored outputs of a workflow with ``RETURN`` links."""
+        from aiida.common.links import LinkType
+        from aiida.engine.utils import instantiate_process
+        from aiida.manage.manager import get_manager
+
+        runner = get_manager().get_runner()
+        process = instantiate_process(runner, WorkflowOutputsProcess)
+        nodes = orm.store_many([orm.Int(index) for index in range(10)])
+
+        for index, node in enumerate(nodes):
+            process.out(f'namespace.output_{index}', node)
+        process.update_outputs()
+
+        outputs = process.node.get_outgoing(link_type=LinkType.RETURN).nested()['namespace']
+        self.assertEqual({label: node.pk for label, node in outputs.items()},
+                         {f'output_{index}': node.pk for index, node in enumerate(nodes)})
+
+        # A workflow cannot return a node that was not yet stored
+        process.out('namespace.unstored', orm.Int(10))
+        with self.assertRaises(ValueError):
+            process.update_outputs()
+
+    def test_report_buffering(self):
+        """Test that the reports of a running process are buffered and written to the database once it terminates."""
+        from aiida.orm.utils.log import get_dblog_handlers
+
+        handlers = get_dblog_handlers()
+        self.assertTrue(handlers)
+
+        _, node = run_get_node(ReportProcess)
+
+        self.assertTrue(node.is_finished_ok)
+        self.assertEqual(node.get_extra('logs_while_running'), 0)
+        messages = sorted(log.message for log in orm.Log.objects.get_logs_for(node))
+        self.assertEqual(len(messages), 5)
+        self.assertTrue(all(message.endswith(f'report {index}') for index, message in enumerate(messages)))
+        self.assertTrue(all(node.pk not in handler._buffered_nodes for handler in handlers))  # pylint: disable=protected-access
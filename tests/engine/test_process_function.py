@@ -12,6 +12,7 @@ import pytest
 
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
+from aiida.common import exceptions
 from aiida.engine import ExitCode, Process, calcfunction, run, run_get_node, submit, workfunction
 from aiida.orm.nodes.data.bool import get_true_node
 from aiida.workflows.arithmetic.add_multiply import add_multiply
@@ -23,6 +24,12 @@ CUSTOM_LABEL = 'Custom label'
 CUSTOM_DESCRIPTION = 'Custom description'
 
 
+@calcfunction
+def calcfunction_divmod(dividend, divisor):
+    """Calcfunction defined at the top level of the module, such that it can be mapped."""
+    return {'quotient': orm.Int(dividend.value // divisor.value), 'remainder': orm.Int(dividend.value % divisor.value)}
+
+
 @pytest.mark.requires_rmq
 class TestProcessFunction(AiidaTestCase):
     """
@@ -422,3 +429,29 @@ class TestProcessFunction(AiidaTestCase):
         self.assertEqual(node1.get_hash(), node1.get_extra('_aiida_hash'))
         self.assertEqual(node2.get_hash(), node2.get_extra('_aiida_hash'))
         self.assertNotEqual(node1.get_hash(), node2.get_hash())
+
+    def test_map(self):
+        """Test that mapping a calcfunction gives the same results and provenance as calling it for each argument."""
+        dividends = [orm.Int(value) for value in (7, 9, 12)]
+        results = calcfunction_divmod.map(dividends, [orm.Int(4)] * 3, max_workers=2, batch_size=2)
+        quotients_and_remainders = [(result['quotient'].value, result['remainder'].value) for result in results]
+        self.assertEqual(quotients_and_remainders, [(1, 3), (2, 1), (3, 0)])
+
+        for dividend, result in zip(dividends, results):
+            node = result['quotient'].get_incoming().one().node
+            self.assertIsInstance(node, orm.CalcFunctionNode)
+            self.assertTrue(node.is_finished_ok)
+            self.assertEqual(node.get_incoming().get_node_by_label('dividend').pk, dividend.pk)
+            self.assertEqual(sorted(node.get_outgoing().all_link_labels()), ['quotient', 'remainder'])
+
+        # The exception of a function is raised once all functions have terminated
+        with self.assertRaises(ZeroDivisionError):
+            calcfunction_divmod.map([orm.Int(1), orm.Int(2)], [orm.Int(0), orm.Int(1)])
+
+    def test_map_invalid(self):
+        """Test that only calcfunctions defined at the top level of a module can be mapped."""
+        with self.assertRaises(exceptions.InvalidOperation):
+            self.function_return_input.map([orm.Int(1)])
+
+        with self.assertRaises(ValueError):
+            self.function_with_none_default.map([orm.Int(1)], [orm.Int(2)])
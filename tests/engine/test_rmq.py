@@ -65,6 +65,20 @@ class TestProcessControl(AiidaTestCase):
 
         self.runner.loop.run_until_complete(do_launch())
 
+    def test_submit_many(self):
+        """Launch multiple processes with `submit_many`."""
+
+        async def do_submit():
+            inputs = [{'a': Int(index), 'b': Int(10)} for index in range(3)]
+            calc_nodes = self.runner.submit_many(test_processes.AddProcess, inputs, batch_size=2)
+            self.assertEqual(len(calc_nodes), len(inputs))
+
+            for calc_node in calc_nodes:
+                await self.wait_for_process(calc_node)
+                self.assertTrue(calc_node.is_finished_ok)
+
+        self.runner.loop.run_until_complete(do_submit())
+
     def test_submit_bad_input(self):
         with self.assertRaises(ValueError):
             self.runner.submit(test_processes.AddProcess, a=Int(5))
@@ -10,6 +10,7 @@
 # pylint: disable=redefined-outer-name
 """Module to test process runners."""
 import asyncio
+import functools
 import threading
 
 import plumpy
@@ -71,3 +72,32 @@ def test_call_on_process_finish(create_runner):
 
     assert not future.exception()
     assert future.result()
+
+
+@pytest.mark.requires_rmq
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_call_on_process_finish_many(create_runner):
+    """Test that the callbacks for many awaited processes, including already terminated ones, are called once each."""
+    runner = create_runner(poll_interval=0.1)
+    loop = runner.loop
+    terminated = Proc(runner=runner)
+    loop.run_until_complete(terminated.step_until_terminated())
+    processes = [Proc(runner=runner) for _ in range(3)]
+    called = []
+
+    def calc_done(pk):
+        called.append(pk)
+        if len(called) == len(processes) + 1:
+            loop.stop()
+
+    for process in [terminated] + processes:
+        runner.call_on_process_finish(process.node.pk, functools.partial(calc_done, process.node.pk))
+
+    for process in processes:
+        loop.create_task(process.step_until_terminated())
+
+    loop.call_later(5, the_hans_klok_comeback, loop)
+    loop.run_forever()
+
+    assert sorted(called) == sorted(process.node.pk for process in [terminated] + processes)
+    assert not runner._process_callbacks  # pylint: disable=protected-access
@@ -133,3 +133,72 @@ class TestTransportQueue(AiidaTestCase):
 
         finally:
             transport_class._DEFAULT_SAFE_OPEN_INTERVAL = original_interval  # pylint: disable=protected-access
+
+    def test_keep_alive(self):
+        """Test that with a keep-alive interval, an idle transport is reused and only closed once it expires."""
+        queue = TransportQueue(keep_alive=0.2)
+        loop = queue.loop
+
+        async def request():
+            with queue.request_transport(self.authinfo) as request:
+                return await request
+
+        trans1 = loop.run_until_complete(request())
+        self.assertTrue(trans1.is_open)
+
+        trans2 = loop.run_until_complete(request())
+        self.assertIs(trans1, trans2)
+        self.assertTrue(trans2.is_open)
+
+        metrics = queue.get_metrics()
+        self.assertEqual(metrics['open'], 1)
+        self.assertEqual(metrics['opened'], 1)
+        self.assertEqual(metrics['reused'], 1)
+        self.assertGreaterEqual(metrics['wait_time'], 0)
+
+        loop.run_until_complete(asyncio.sleep(0.3))
+        self.assertFalse(trans2.is_open)
+        self.assertEqual(queue.get_metrics()['open'], 0)
+
+    def test_keep_alive_not_alive(self):
+        """Test that a transport that is kept alive is discarded if it is no longer alive when it is requested."""
+        queue = TransportQueue(keep_alive=10)
+        loop = queue.loop
+
+        async def request():
+            with queue.request_transport(self.authinfo) as request:
+                return await request
+
+        trans1 = loop.run_until_complete(request())
+        trans1.is_alive = lambda: False
+
+        trans2 = loop.run_until_complete(request())
+        self.assertIsNot(trans1, trans2)
+        self.assertFalse(trans1.is_open)
+        self.assertTrue(trans2.is_open)
+        self.assertEqual(queue.get_metrics()['opened'], 2)
+        self.assertEqual(queue.get_metrics()['reused'], 0)
+
+        queue.close()
+        self.assertFalse(trans2.is_open)
+        self.assertEqual(queue.get_metrics()['open'], 0)
+
+    def test_metrics(self):
+        """Test the metrics of a transport queue without keep-alive."""
+        queue = TransportQueue()
+        loop = queue.loop
+
+        async def nested():
+            with queue.request_transport(self.authinfo) as request1:
+                await request1
+                with queue.request_transport(self.authinfo) as request2:
+                    await request2
+                    self.assertEqual(queue.get_metrics()['open'], 1)
+
+        loop.run_until_complete(nested())
+        loop.run_until_complete(nested())
+
+        metrics = queue.get_metrics()
+        self.assertEqual(metrics['open'], 0)
+        self.assertEqual(metrics['opened'], 2)
+        self.assertEqual(metrics['reused'], 2)
@@ -280,3 +280,28 @@ def test_enable_disable_invalid(identifier):
     with pytest.raises(ValueError):
         with disable_caching(identifier=identifier):
             pass
+
+
+def test_lookup_cache(configure_caching):
+    """Test the least-recently-used eviction of the lookup cache and that a size of zero disables it."""
+    from aiida.manage.caching import _LookupCache
+
+    lookup_cache = _LookupCache()
+
+    with configure_caching(config_dict={'lookup_cache_size': 2}):
+        lookup_cache.add('a', 1)
+        lookup_cache.add('b', 2)
+        assert lookup_cache.get('a') == 1
+        lookup_cache.add('c', 3)
+        assert len(lookup_cache) == 2
+        assert lookup_cache.get('b') is None
+        assert lookup_cache.get('a') == 1
+        assert lookup_cache.get('c') == 3
+
+        lookup_cache.discard('a')
+        assert lookup_cache.get('a') is None
+
+    with configure_caching(config_dict={'lookup_cache_size': 0}):
+        lookup_cache.add('d', 4)
+        assert len(lookup_cache) == 0
+        assert lookup_cache.get('d') is None
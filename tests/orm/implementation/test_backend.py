@@ -11,6 +11,7 @@
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
+from aiida.common.links import LinkType
 
 
 class TestBackend(AiidaTestCase):
@@ -64,3 +65,25 @@ class TestBackend(AiidaTestCase):
 
         with self.assertRaises(exceptions.NotExistent):
             orm.User.objects.get(email='user_store_fail@email.com')
+
+    def test_store_node_in_transaction(self):
+        """Test that storing and linking nodes inside a transaction is only committed at the end of the transaction."""
+        source = orm.Data().store()
+
+        with self.backend.transaction():
+            node = orm.CalculationNode()
+            node.add_incoming(source, LinkType.INPUT_CALC, 'input')
+            node.store_all()
+            self.assertIsNotNone(node.pk)
+
+        self.assertEqual(orm.load_node(node.pk).get_incoming().one().node.pk, source.pk)
+
+        try:
+            with self.backend.transaction():
+                node_fail = orm.Data().store()
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        with self.assertRaises(exceptions.NotExistent):
+            orm.load_node(node_fail.pk)
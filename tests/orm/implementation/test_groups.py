@@ -151,3 +151,28 @@ def test_remove_nodes_bulk():
     nodes.remove(node_02)
     group.remove_nodes([node_01, node_02], skip_orm=True)
     assert set(_.pk for _ in nodes) == set(_.pk for _ in group.nodes)
+
+
+@pytest.mark.usefixtures('clear_database_before_test', 'skip_if_not_django')
+def test_add_remove_nodes_transaction(backend):
+    """Test adding and removing nodes within an open transaction of the Django backend.
+
+    The statements should see the nodes that are created within the transaction and be rolled back with it.
+    """
+    group = orm.Group(label='test_transaction').store()
+    node = orm.Data().store()
+
+    with backend.transaction():
+        created = orm.Data().store()
+        group.add_nodes([node, created])
+        assert {entry.pk for entry in group.nodes} == {node.pk, created.pk}
+        group.remove_nodes(created)
+        assert {entry.pk for entry in group.nodes} == {node.pk}
+
+    with pytest.raises(RuntimeError):
+        with backend.transaction():
+            group.add_nodes(orm.Data().store())
+            group.remove_nodes(node)
+            raise RuntimeError
+
+    assert {entry.pk for entry in group.nodes} == {node.pk}
@@ -771,3 +771,24 @@ class TestBackendNode(AiidaTestCase):
         # Reload the node yet again and verify that the `attribute_three` attribute is still there
         rereloaded = self.backend.nodes.get(node.pk)
         self.assertIn('attribute_three', rereloaded.attributes.keys())
+
+    def test_bulk_set_extra(self):
+        """Test the `BackendNodeCollection.bulk_set_extra` method."""
+        nodes = [self.create_node().store() for _ in range(5)]
+        nodes[0].set_extra('extra_other', 'value')
+
+        values = {node.pk: index for index, node in enumerate(nodes)}
+        self.backend.nodes.bulk_set_extra('extra_bulk', values, batch_size=2)
+
+        for index, node in enumerate(nodes):
+            self.assertEqual(self.backend.nodes.get(node.pk).get_extra('extra_bulk'), index)
+
+        # Other extras should not be affected
+        self.assertEqual(self.backend.nodes.get(nodes[0].pk).get_extra('extra_other'), 'value')
+
+        # Values should be cleaned and existing values overwritten
+        self.backend.nodes.bulk_set_extra('extra_bulk', {nodes[1].pk: {'nested': [1.0, None]}})
+        self.assertEqual(self.backend.nodes.get(nodes[1].pk).get_extra('extra_bulk'), {'nested': [1.0, None]})
+
+        with self.assertRaises(exceptions.ValidationError):
+            self.backend.nodes.bulk_set_extra('extra_bulk', {nodes[1].pk: object()})
@@ -10,6 +10,8 @@
 """Unit tests for the backend non-specific utility methods."""
 import math
 
+import numpy
+
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
 from aiida.orm.implementation.utils import FIELD_SEPARATOR, clean_value, validate_attribute_extra_key
@@ -39,3 +41,36 @@ class TestOrmImplementationUtils(AiidaTestCase):
 
         with self.assertRaises(exceptions.ValidationError):
             clean_value(inf_value)
+
+        with self.assertRaises(exceptions.ValidationError):
+            clean_value([1.0, inf_value])
+
+        with self.assertRaises(exceptions.ValidationError):
+            clean_value(numpy.array([1.0, nan_value]))
+
+    def test_sequences(self):
+        """Test that sequences are cleaned in bulk with the same result as cleaning each item separately."""
+        values = [0.1 + 0.2, 1e-20, 1e16, -0.0, 2.5e-7, 2.0]
+        expected = [0.3, 1e-20, 10000000000000000, -0.0, 2.5e-7, 2.0]
+
+        self.assertEqual(clean_value(values), expected)
+        self.assertEqual([type(value) for value in clean_value(values)], [type(value) for value in expected])
+        self.assertEqual(clean_value(values), [clean_value(value) for value in values])
+        self.assertEqual(clean_value((1, True, None, 'a')), [1, True, None, 'a'])
+        self.assertEqual(clean_value([numpy.int64(1), 2.5, 'a']), [1, 2.5, 'a'])
+
+    def test_numpy_arrays(self):
+        """Test that numpy arrays of numbers are converted to (nested) lists."""
+        self.assertEqual(clean_value(numpy.arange(3)), [0, 1, 2])
+        self.assertEqual(clean_value(numpy.array([[0.1, 1e16], [2.0, 3.5]])), [[0.1, 10000000000000000], [2.0, 3.5]])
+        self.assertEqual(clean_value(numpy.array([0.1], dtype=numpy.float32)), [clean_value(numpy.float32(0.1))])
+        self.assertEqual(clean_value(numpy.array([True, False])), [True, False])
+
+    def test_trusted(self):
+        """Test that a trusted value is deep copied."""
+        value = {'a': [1, 2.5, {'b': ['c', None]}], 'd': 'e'}
+        copied = clean_value(value, trusted=True)
+
+        self.assertEqual(copied, value)
+        self.assertIsNot(copied['a'], value['a'])
+        self.assertIsNot(copied['a'][2], value['a'][2])
@@ -10,6 +10,7 @@
 # pylint: disable=attribute-defined-outside-init,no-member,no-self-use,too-many-public-methods
 """Tests for the Node ORM class."""
 from decimal import Decimal
+import io
 import logging
 import os
 import tempfile
@@ -17,7 +18,7 @@ import tempfile
 import pytest
 
 from aiida.common import LinkType, exceptions
-from aiida.orm import CalculationNode, Computer, Data, Log, Node, User, WorkflowNode, load_node
+from aiida.orm import CalculationNode, Computer, Data, Int, Log, Node, User, WorkflowNode, load_node, store_many
 from aiida.orm.utils.links import LinkTriple
 
 
@@ -937,6 +938,57 @@ def test_store_from_cache():
     assert data.get_hash() == clone.get_hash()
 
 
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_process_node_input_hashes(monkeypatch):
+    """Test that the hashes of the inputs are reused when computing the hash of a process node."""
+    from aiida.orm.nodes.process import process
+
+    data = Data().store()
+    calculation = CalculationNode()
+    calculation.add_incoming(data, link_type=LinkType.INPUT_CALC, link_label='input')
+    calculation.store()
+
+    node_hash = calculation.get_hash()
+    assert process._INPUT_HASHES[data.uuid] == data.get_hash()  # pylint: disable=protected-access
+
+    def get_hash(*_, **__):
+        raise AssertionError('the hash of the input should not be recomputed')
+
+    monkeypatch.setattr(Data, 'get_hash', get_hash)
+    assert load_node(calculation.pk).get_hash() == node_hash
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_get_same_node_lookup_cache(isolated_config, monkeypatch):
+    """Test that ``_get_same_node`` records hits in the lookup cache and discards entries that are no longer valid."""
+    from aiida.manage.caching import get_lookup_cache
+
+    monkeypatch.setattr(Data, '_cachable', True)
+    isolated_config.set_option('caching.lookup_cache_size', 10)
+    lookup_cache = get_lookup_cache()
+    lookup_cache.clear()
+
+    try:
+        source = Data()
+        source.set_attribute('key', 'value')
+        source.store()
+        node_hash = source.get_hash()
+
+        clone = source.clone()
+        assert clone._get_same_node().pk == source.pk  # pylint: disable=protected-access
+        assert lookup_cache.get((Data, node_hash)) == source.pk
+
+        # A hit in the lookup cache should still return the same node
+        assert clone._get_same_node().pk == source.pk  # pylint: disable=protected-access
+
+        # Once the hash of the source is cleared, the entry is stale and should be discarded
+        source.clear_hash()
+        assert clone._get_same_node() is None  # pylint: disable=protected-access
+        assert lookup_cache.get((Data, node_hash)) is None
+    finally:
+        lookup_cache.clear()
+
+
 @pytest.mark.usefixtures('clear_database_before_test')
 def test_hashing_errors(aiida_caplog):
     """Tests that ``get_hash`` fails in an expected manner."""
@@ -967,3 +1019,97 @@ def test_uuid_equality_fallback():
     assert hash(node_a) == hash(node_b)
     assert hash(node_a) != hash(node_0)
     assert hash(node_b) != hash(node_0)
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+class TestStoreMany:
+    """Tests for the ``store_many`` bulk storage function."""
+
+    def test_store_many(self):
+        """Test that attributes, extras, repository objects and links are stored for all nodes."""
+        source = CalculationNode().store()
+        nodes = []
+
+        for index in range(5):
+            node = Data()
+            node.set_attribute('index', index)
+            node.put_object_from_filelike(io.BytesIO(f'content{index}'.encode()), 'sub/file.txt')
+            node.add_incoming(source, link_type=LinkType.CREATE, link_label=f'link_{index}')
+            nodes.append(node)
+
+        assert store_many(nodes) == nodes
+
+        for index, node in enumerate(nodes):
+            assert node.is_stored
+            assert not node.has_cached_links()
+
+            loaded = load_node(node.pk)
+            assert loaded.get_attribute('index') == index
+            assert loaded.get_object_content('sub/file.txt') == f'content{index}'
+            assert loaded.get_hash() == node.get_hash() == loaded.get_extra('_aiida_hash')
+            assert loaded.get_incoming().one().node.uuid == source.uuid
+
+        assert sorted(source.get_outgoing().all_link_labels()) == [f'link_{index}' for index in range(5)]
+
+    def test_store_many_links_within_batch(self):
+        """Test that links can have a source that is itself being stored in the same call."""
+        calculation = CalculationNode()
+        output = Data()
+        output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+        calculation.add_incoming(Data().store(), link_type=LinkType.INPUT_CALC, link_label='input')
+
+        store_many([output, calculation], batch_size=1)
+
+        assert calculation.is_stored
+        assert output.is_stored
+        assert output.get_incoming().one().node.pk == calculation.pk
+
+    def test_store_many_unstored_input(self):
+        """Test that the hash of a process node is computed if its input is stored in the same call."""
+        data = Int(1)
+        calculation = CalculationNode()
+        calculation.add_incoming(data, link_type=LinkType.INPUT_CALC, link_label='input')
+
+        store_many([data, calculation])
+
+        assert calculation.is_stored
+        assert data.is_stored
+        assert calculation.get_extra('_aiida_hash') == load_node(calculation.pk).get_hash() is not None
+        assert data.get_extra('_aiida_hash') == load_node(data.pk).get_hash() is not None
+
+    def test_store_many_cached(self):
+        """Test that a node with caching enabled is stored after the source of its link in the same call."""
+        from aiida.manage.caching import enable_caching
+
+        data = Int(1)
+        calculation = CalculationNode()
+        calculation.add_incoming(data, link_type=LinkType.INPUT_CALC, link_label='input')
+        output = Int(2)
+        output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+
+        with enable_caching():
+            store_many([output, calculation, data])
+
+        assert all(node.is_stored for node in (data, calculation, output))
+        assert calculation.get_incoming().one().node.pk == data.pk
+        assert output.get_incoming().one().node.pk == calculation.pk
+
+    def test_store_many_unstored_source(self):
+        """Test that an exception is raised if the source of a link is neither stored nor passed."""
+        node = Data()
+        node.add_incoming(CalculationNode(), link_type=LinkType.CREATE, link_label='output')
+
+        with pytest.raises(exceptions.ModificationNotAllowed):
+            store_many([node])
+
+        assert not node.is_stored
+
+    def test_store_many_stored(self):
+        """Test that nodes that are already stored are ignored."""
+        stored = Data().store()
+        unstored = Data()
+
+        store_many([stored, unstored, unstored])
+
+        assert unstored.is_stored
+        assert len({stored.pk, unstored.pk}) == 2
@@ -163,6 +163,58 @@ class TestGroups(AiidaTestCase):
         group.remove_nodes([node_01, node_02])
         self.assertEqual(set(_.pk for _ in nodes), set(_.pk for _ in group.nodes))
 
+    def test_add_remove_nodes_pks(self):
+        """Test adding and removing nodes by their pks."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        group = orm.Group(label='test_add_remove_nodes_pks').store()
+
+        group.add_nodes(nodes[0].pk)
+        group.add_nodes([node.pk for node in nodes])
+        self.assertEqual(set(node.pk for node in nodes), set(_.pk for _ in group.nodes))
+
+        # Pks that are not in the group or do not correspond to any node are ignored
+        group.remove_nodes([nodes[0].pk, nodes[0].pk + 100000])
+        self.assertEqual(set(node.pk for node in nodes[1:]), set(_.pk for _ in group.nodes))
+
+        # Nodes and pks can be mixed
+        group.remove_nodes([nodes[1], nodes[2].pk])
+        self.assertEqual(group.count(), 0)
+
+        with self.assertRaises(TypeError):
+            group.add_nodes(['string'])
+
+    def test_add_remove_nodes_query(self):
+        """Test adding and removing the nodes that are selected by a `QueryBuilder`."""
+        nodes = [orm.Int(value).store() for value in range(4)]
+        pks = [node.pk for node in nodes]
+        group = orm.Group(label='test_add_remove_nodes_query').store()
+
+        builder = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': pks[:2]}}, project='*')
+        group.add_nodes(builder)
+        self.assertEqual(set(pks[:2]), set(_.pk for _ in group.nodes))
+
+        # Adding nodes that are already in the group is fine
+        builder = orm.QueryBuilder().append(orm.Int, filters={'id': {'in': pks}}, project='id')
+        group.add_nodes(builder)
+        self.assertEqual(set(pks), set(_.pk for _ in group.nodes))
+
+        # Use the nodes of another group as the source of the nodes to remove
+        other = orm.Group(label='test_add_remove_nodes_query_other').store()
+        other.add_nodes(nodes[1:3])
+        builder = orm.QueryBuilder().append(orm.Group, filters={'id': other.pk}, tag='group')
+        builder.append(orm.Node, with_group='group', project='id')
+        group.remove_nodes(builder)
+        self.assertEqual({pks[0], pks[3]}, set(_.pk for _ in group.nodes))
+
+        # The query should project a single node vertex
+        for builder in [
+            orm.QueryBuilder().append(orm.Int, project=['id', 'uuid']),
+            orm.QueryBuilder().append(orm.Int, project='uuid'),
+            orm.QueryBuilder().append(orm.Group, project='id'),
+        ]:
+            with self.assertRaises(ValueError):
+                group.add_nodes(builder)
+
     def test_clear(self):
         """Test the `clear` method to remove all nodes."""
         node_01 = orm.Data().store()
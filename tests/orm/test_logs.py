@@ -249,6 +249,95 @@ class TestBackendLog(AiidaTestCase):
         self.assertEqual(logs[0].message, message)
         self.assertEqual(logs[1].message, message2)
 
+    def get_record(self, node, message, level=LOG_LEVEL_REPORT):
+        """Return a log record attached to the given node, as emitted through the logger of the node."""
+        return logging.makeLogRecord({
+            'name': 'aiida.test',
+            'levelno': level,
+            'levelname': logging.getLevelName(level),
+            'msg': message,
+            'dbnode_id': node.id,
+            'backend': node.backend,
+        })
+
+    def test_create_entries_from_records(self):
+        """Test that the log entries of multiple records are created in bulk."""
+        node = orm.CalculationNode().store()
+        records = [self.get_record(node, f'message {index}') for index in range(5)]
+        for record in records:
+            # The backend is removed from the record by the log handler before creating the log entry
+            record.__dict__.pop('backend')
+        records.append(logging.makeLogRecord({'msg': 'not attached to a node'}))
+
+        entries = Log.objects.create_entries_from_records(records, batch_size=2)
+
+        self.assertEqual(len(entries), 5)
+        self.assertTrue(all(entry.is_stored for entry in entries))
+        self.assertEqual(
+            sorted(log.message for log in Log.objects.get_logs_for(node)), [f'message {index}' for index in range(5)]
+        )
+
+    def test_db_log_handler_buffering(self):
+        """Test that the records of nodes that are buffered by the db log handler are written when it is flushed."""
+        from aiida.orm.utils.log import DBLogHandler
+
+        node = orm.CalculationNode().store()
+        handler = DBLogHandler(capacity=3)
+        handler.start_buffering(node.id)
+
+        handler.handle(self.get_record(node, 'first'))
+        handler.handle(self.get_record(node, 'second'))
+        self.assertEqual(len(Log.objects.get_logs_for(node)), 0)
+
+        # Reaching the capacity of the buffer flushes it
+        handler.handle(self.get_record(node, 'third'))
+        self.assertEqual(len(Log.objects.get_logs_for(node)), 3)
+
+        # Records of level ``WARNING`` and higher flush the buffer immediately
+        handler.handle(self.get_record(node, 'fourth'))
+        handler.handle(self.get_record(node, 'warning', logging.WARNING))
+        self.assertEqual(len(Log.objects.get_logs_for(node)), 5)
+
+        handler.handle(self.get_record(node, 'fifth'))
+        self.assertEqual(len(Log.objects.get_logs_for(node)), 5)
+
+        # Stopping the buffering of the node flushes the buffer, after which records are written immediately
+        handler.stop_buffering(node.id)
+        self.assertEqual(len(Log.objects.get_logs_for(node)), 6)
+
+        handler.handle(self.get_record(node, 'sixth'))
+        self.assertEqual(len(Log.objects.get_logs_for(node)), 7)
+
+    def test_db_log_handler_unbuffered(self):
+        """Test that the records of nodes are written immediately if the capacity of the buffer is zero."""
+        from aiida.orm.utils.log import DBLogHandler
+
+        node = orm.CalculationNode().store()
+        handler = DBLogHandler(capacity=0)
+        handler.start_buffering(node.id)
+
+        handler.handle(self.get_record(node, 'message'))
+        self.assertEqual(len(Log.objects.get_logs_for(node)), 1)
+
+    def test_db_log_handler_rate_limit(self):
+        """Test that the db log handler discards the records of a node that exceed the rate limit."""
+        from aiida.orm.logs import ASCENDING, OrderSpecifier
+        from aiida.orm.utils.log import DBLogHandler
+
+        node = orm.CalculationNode().store()
+        handler = DBLogHandler(capacity=100, rate_limit=3)
+        handler.start_buffering(node.id)
+
+        for index in range(10):
+            handler.handle(self.get_record(node, f'message {index}'))
+
+        handler.close()
+
+        messages = [log.message for log in Log.objects.get_logs_for(node, order_by=[OrderSpecifier('id', ASCENDING)])]
+        self.assertEqual(len(messages), 4)
+        self.assertEqual(messages[:3], [f'message {index}' for index in range(3)])
+        self.assertIn('7 log messages were discarded', messages[3])
+
     def test_log_querybuilder(self):
         """ Test querying for logs by joining on nodes in the QueryBuilder """
         from aiida.orm import QueryBuilder
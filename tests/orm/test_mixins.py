@@ -29,6 +29,20 @@ class TestSealable(AiidaTestCase):
             if attr != Sealable.SEALED_KEY:
                 node.set_attribute(attr, 'a')
 
+    def test_set_attribute_many_after_store(self):
+        """Verify that a Sealable node can alter multiple updatable attributes at once, but only before sealing."""
+        node = CalculationNode().store()
+        node.set_attribute_many({'process_state': 'running', 'process_status': 'status'})
+        self.assertEqual(node.get_attribute_many(['process_state', 'process_status']), ['running', 'status'])
+
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            node.set_attribute_many({'process_state': 'finished', 'not_updatable': 'value'})
+
+        node.seal()
+
+        with self.assertRaises(exceptions.ModificationNotAllowed):
+            node.set_attribute_many({'process_state': 'finished'})
+
     def test_validate_incoming_sealed(self):
         """Verify that trying to add a link to a sealed node will raise."""
         data = Int(1).store()
@@ -979,6 +979,283 @@ class TestQueryBuilderLimitOffsets:
         res = next(zip(*qb.all()))
         assert res == tuple(range(4, 1, -1))
 
+    @pytest.mark.parametrize('keys', (('id',), ('ctime', 'id')))
+    @pytest.mark.parametrize('order', ('asc', 'desc'))
+    def test_after(self, keys, order):
+        """Test keyset pagination with the ``after`` method."""
+        for i in range(10):
+            orm.Int(i).store()
+        orm.Float(0).store()
+
+        def get_page(cursor):
+            qb = orm.QueryBuilder().append(orm.Int, project=['attributes.value', *keys])
+            return qb.after(orm.Int, cursor=cursor, keys=keys, order=order).limit(3).all()
+
+        values = []
+        page = get_page(None)
+        while page:
+            values.extend(row[0] for row in page)
+            page = get_page(page[-1][1:])
+
+        assert values == (list(range(10)) if order == 'asc' else list(range(9, -1, -1)))
+
+    def test_after_validation(self):
+        """Test the validation of the arguments of the ``after`` method."""
+        qb = orm.QueryBuilder().append(orm.Node)
+
+        with pytest.raises(ValueError, match='the last key has to be'):
+            qb.after(orm.Node, keys=('ctime',))
+
+        with pytest.raises(ValueError, match='the order has to be'):
+            qb.after(orm.Node, order='random')
+
+        with pytest.raises(ValueError, match='does not have a value for each of the keys'):
+            qb.after(orm.Node, cursor=[1], keys=('ctime', 'id'))
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+class TestColumns:
+    """Tests for returning the results of the query as columns."""
+
+    @staticmethod
+    def get_query():
+        nodes = [orm.Data() for _ in range(5)]
+        for index, node in enumerate(nodes):
+            node.set_attribute('i', index)
+            if index != 2:
+                node.set_attribute('f', index * 0.5)
+            node.store()
+        project = ['id', 'uuid', {'attributes.i': {'cast': 'i'}}, {'attributes.f': {'cast': 'f'}}]
+        return nodes, orm.QueryBuilder().append(orm.Data, tag='data', project=project).order_by({'data': 'id'})
+
+    def test_to_columns(self):
+        """Test that the columns contain the same values as the rows returned by ``all``."""
+        _, qb = self.get_query()
+        columns = qb.to_columns()
+        assert list(columns) == ['data']
+        assert list(columns['data']) == ['id', 'uuid', 'attributes.i', 'attributes.f']
+        assert [list(row) for row in zip(*columns['data'].values())] == qb.all()
+
+    def test_to_columns_entities(self):
+        """Test that projections of entities are returned as front-end entities."""
+        nodes, _ = self.get_query()
+        qb = orm.QueryBuilder().append(orm.Data, tag='data', project=['*']).order_by({'data': 'id'})
+        assert [node.pk for node in qb.to_columns()['data']['*']] == [node.pk for node in nodes]
+
+    def test_to_columns_empty(self):
+        """Test that the projections are returned if the query has no results."""
+        qb = orm.QueryBuilder().append(orm.Data, tag='data', project=['id', 'uuid'])
+        assert qb.to_columns() == {'data': {'id': [], 'uuid': []}}
+
+    def test_itercolumns(self):
+        """Test that the columns are returned in batches."""
+        _, qb = self.get_query()
+        batches = list(qb.itercolumns(batch_size=2))
+        assert [len(batch['data']['id']) for batch in batches] == [2, 2, 1]
+
+    def test_to_numpy(self):
+        """Test the types of the arrays returned by ``to_numpy``."""
+        numpy = pytest.importorskip('numpy')
+        nodes, qb = self.get_query()
+        arrays = qb.to_numpy(batch_size=2)
+
+        assert arrays['data']['id'].dtype == numpy.int64
+        assert arrays['data']['id'].tolist() == [node.pk for node in nodes]
+        assert arrays['data']['uuid'].dtype == object
+        assert arrays['data']['uuid'].tolist() == [node.uuid for node in nodes]
+        assert arrays['data']['attributes.i'].dtype == numpy.int64
+        assert arrays['data']['attributes.i'].tolist() == list(range(5))
+        assert arrays['data']['attributes.f'].dtype == numpy.float64
+        assert numpy.isnan(arrays['data']['attributes.f'][2])
+        assert numpy.delete(arrays['data']['attributes.f'], 2).tolist() == [0.0, 0.5, 1.5, 2.0]
+
+    def test_to_numpy_missing_integers(self):
+        """Test that integer projections with missing values are returned as floats."""
+        numpy = pytest.importorskip('numpy')
+        self.get_query()
+        orm.Data().store()
+        qb = orm.QueryBuilder().append(orm.Data, tag='data', project=[{'attributes.i': {'cast': 'i'}}])
+        array = qb.to_numpy()['data']['attributes.i']
+        assert array.dtype == numpy.float64
+        assert numpy.isnan(array).sum() == 1
+
+    def test_to_numpy_empty(self):
+        """Test that the arrays have the correct type if the query has no results."""
+        numpy = pytest.importorskip('numpy')
+        qb = orm.QueryBuilder().append(orm.Data, tag='data', project=['id', 'uuid'])
+        arrays = qb.to_numpy()
+        assert arrays['data']['id'].dtype == numpy.int64
+        assert arrays['data']['uuid'].dtype == object
+        assert len(arrays['data']['id']) == 0
+
+    def test_to_dataframe(self):
+        """Test that the columns of the data frame are indexed by tag and projection."""
+        pytest.importorskip('pandas')
+        _, qb = self.get_query()
+        dataframe = qb.to_dataframe()
+        assert list(dataframe.columns) == [('data', 'id'), ('data', 'uuid'), ('data', 'attributes.i'),
+                                           ('data', 'attributes.f')]
+        assert len(dataframe) == 5
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+class TestQueryCache:
+    """Tests for the reuse of built queries that only differ in the values of their filters."""
+
+    @staticmethod
+    def get_builds(monkeypatch):
+        """Count the number of calls to the ``_build`` method of the query builder implementation."""
+        builds = []
+        cls = type(orm.QueryBuilder()._impl)  # pylint: disable=protected-access
+        build = cls._build  # pylint: disable=protected-access
+
+        def _build(self):
+            builds.append(self)
+            return build(self)
+
+        monkeypatch.setattr(cls, '_build', _build)
+        return builds
+
+    def test_filter_values(self, monkeypatch):
+        """Test that a query is only built once for different values of its filters."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        builds = self.get_builds(monkeypatch)
+
+        for node in nodes:
+            qb = orm.QueryBuilder().append(orm.Data, filters={'id': node.pk, 'ctime': {'<': node.ctime}}, project='id')
+            assert qb.count() == 0
+            qb = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': [node.pk, -1]}}, project='uuid')
+            assert qb.all(flat=True) == [node.uuid]
+            assert qb.first() == [node.uuid]
+
+        assert len(builds) == 2
+
+    def test_filter_types(self):
+        """Test that queries with filter values of different types are built separately."""
+        node = orm.Data()
+        node.set_attribute('value', 1)
+        node.store()
+
+        for value, count in ((1, 1), ('1', 0), (True, 0), (1.0, 1), (None, 0)):
+            qb = orm.QueryBuilder().append(orm.Data, filters={'attributes.value': value})
+            assert qb.count() == count, value
+
+        for value, count in ((node.uuid, 1), (None, 0)):
+            qb = orm.QueryBuilder().append(orm.Data, filters={'uuid': value})
+            assert qb.count() == count, value
+
+    def test_recursive_join(self):
+        """Test that a query with a recursive join is reused for different values of the filters."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        calculation = orm.CalculationNode()
+        calculation.add_incoming(nodes[0], link_type=LinkType.INPUT_CALC, link_label='input')
+        calculation.store()
+        nodes[1].add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+
+        for node, count in ((nodes[0], 2), (nodes[2], 0)):
+            qb = orm.QueryBuilder().append(orm.Data, filters={'id': node.pk}, tag='parent')
+            qb.append(orm.Node, tag='child', with_ancestors='parent')
+            assert qb.count() == count
+            assert len(qb.all()) == count
+
+    def test_cached_mappings_copied(self):
+        """Test that the mappings of a cached query are not shared with the query builders that use it."""
+        node = orm.Data().store()
+
+        qb = orm.QueryBuilder().append(orm.Data, filters={'id': node.pk}, project='id', tag='node')
+        assert qb.all(flat=True) == [node.pk]
+        qb._impl._tag_to_projected_fields['node']['uuid'] = 0  # pylint: disable=protected-access
+
+        qb = orm.QueryBuilder().append(orm.Data, filters={'id': node.pk}, project='id', tag='node')
+        assert qb.dict() == [{'node': {'id': node.pk}}]
+
+    def test_threads(self, monkeypatch):
+        """Test that queries can be cached and evicted concurrently by multiple threads."""
+        from collections import OrderedDict
+        import threading
+
+        from aiida.orm.implementation.sqlalchemy.querybuilder import main
+
+        monkeypatch.setattr(main, '_QUERY_CACHE', OrderedDict())
+        monkeypatch.setattr(main, '_QUERY_CACHE_MAXSIZE', 2)
+        nodes = [orm.Data().store() for _ in range(5)]
+        projections = ('id', 'uuid', 'ctime', 'node_type')
+        # The nodes are bound to the session of this thread, so their values are retrieved here
+        expected = {(node.pk, projection): getattr(node, projection) for node in nodes for projection in projections}
+        errors = []
+
+        def run_queries():
+            try:
+                for (pk, projection), value in list(expected.items()) * 5:
+                    qb = orm.QueryBuilder().append(orm.Data, filters={'id': pk}, project=projection)
+                    assert qb.one()[0] == value
+            except Exception as exception:  # pylint: disable=broad-except
+                errors.append(exception)
+
+        threads = [threading.Thread(target=run_queries) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert len(main._QUERY_CACHE) <= 2  # pylint: disable=protected-access
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+class TestEntityConversion:
+    """Tests for the conversion of the projected entities to front-end entities in batches."""
+
+    @staticmethod
+    def get_nodes():
+        nodes = [orm.Int(1), orm.Float(2.0), orm.Int(3), orm.Data(), orm.Float(5.0), orm.CalculationNode()]
+        return [node.store() for node in nodes]
+
+    def test_iterall(self, monkeypatch):
+        """Test that the node classes are loaded once for each distinct node type in a batch."""
+        from aiida.orm.utils import node as node_utils
+
+        nodes = self.get_nodes()
+        node_types = []
+        load_node_class = node_utils.load_node_class
+
+        def _load_node_class(type_string):
+            node_types.append(type_string)
+            return load_node_class(type_string)
+
+        monkeypatch.setattr(node_utils, 'load_node_class', _load_node_class)
+
+        qb = orm.QueryBuilder().append(orm.Node, tag='node', project=['*', 'id']).order_by({'node': 'id'})
+        results = list(qb.iterall(batch_size=3))
+
+        assert [(type(node), node.pk) for node, _ in results] == [(type(node), node.pk) for node in nodes]
+        assert [pk for _, pk in results] == [node.pk for node in nodes]
+        assert sorted(node_types) == sorted([
+            orm.Int.class_node_type, orm.Float.class_node_type, orm.Data.class_node_type, orm.Float.class_node_type,
+            orm.CalculationNode.class_node_type
+        ])
+
+    def test_iterdict(self):
+        """Test that the projected entities of all tags are converted."""
+        nodes = self.get_nodes()
+        group = orm.Group(label='group').store()
+        group.add_nodes(nodes)
+
+        qb = orm.QueryBuilder().append(orm.Group, tag='group', project=['*'])
+        qb.append(orm.Node, with_group='group', tag='node', project=['*', 'id']).order_by({'node': 'id'})
+        results = qb.dict(batch_size=4)
+
+        assert [type(result['node']['*']) for result in results] == [type(node) for node in nodes]
+        assert [result['node']['id'] for result in results] == [node.pk for node in nodes]
+        assert all(result['group']['*'].uuid == group.uuid for result in results)
+
+    def test_get_orm_entities(self):
+        """Test that values that are not backend entities are returned unaltered."""
+        from aiida.orm import convert
+
+        node = orm.Int(1).store()
+        assert convert.get_orm_entities([node.backend_entity, 1, None, 'a', {'a': 1}]) == [node, 1, None, 'a', {'a': 1}]
+
 
 @pytest.mark.usefixtures('clear_database_before_test')
 class TestQueryBuilderJoins:
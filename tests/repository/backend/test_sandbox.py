@@ -154,6 +154,25 @@ def test_get_object_hash(repository, generate_directory):
     assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
 
+def test_get_object_hashes(repository, generate_directory):
+    """Test the ``Repository.get_object_hashes`` returns the expected values."""
+    repository.initialise()
+    directory = generate_directory({'file_a': b'content', 'file_b': b'other'})
+
+    with open(directory / 'file_a', 'rb') as handle:
+        key_a = repository.put_object_from_filelike(handle)
+
+    with open(directory / 'file_b', 'rb') as handle:
+        key_b = repository.put_object_from_filelike(handle)
+
+    assert repository.get_object_hashes([key_b, key_a]) == [
+        repository.get_object_hash(key_b), 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
+    ]
+
+    with pytest.raises(FileNotFoundError):
+        repository.get_object_hashes([key_a, 'non_existent'])
+
+
 def test_list_objects(repository, generate_directory):
     """Test the ``Repository.delete_object`` method."""
     repository.initialise()
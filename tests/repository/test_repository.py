@@ -649,6 +649,37 @@ def test_clone_empty_folder(repository, generate_directory):
     assert repository.list_object_names('empty') == ['folder']
 
 
+def test_clone_many(repository, generate_directory):
+    """Test the ``Repository.clone_many`` method."""
+    directory = generate_directory({
+        'a': {
+            'file_a': b'content_a',
+            'empty': {}
+        },
+        'b': {
+            'relative': {
+                'file_b': b'content_b'
+            }
+        },
+        'c': {},
+    })
+
+    sources = []
+    for dirname in ('a', 'b', 'c'):
+        source = Repository(backend=SandboxRepositoryBackend())
+        source.put_object_from_tree(str(directory / dirname))
+        sources.append(source)
+
+    clones = Repository.clone_many(sources, repository.backend)
+
+    assert len(clones) == 3
+    assert all(clone.backend is repository.backend for clone in clones)
+    assert sorted(clones[0].list_object_names()) == ['empty', 'file_a']
+    assert clones[0].get_object_content('file_a') == b'content_a'
+    assert clones[1].get_object_content('relative/file_b') == b'content_b'
+    assert clones[2].is_empty()
+
+
 def test_serialize(repository, generate_directory):
     """Test the ``Repository.serialize`` method."""
     directory = generate_directory({'empty': {}, 'file_a': None, 'relative': {'file_b': b'content_b'}})
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the cache of the responses of the REST API in `aiida.restapi.common.cache`."""
+# pylint: disable=redefined-outer-name
+import time
+
+import pytest
+
+from aiida import orm
+from aiida.restapi.common import cache
+from aiida.restapi.common.config import API_CONFIG
+
+
+@pytest.fixture
+def response_cache():
+    """Return an in-memory response cache."""
+    return cache.MemoryResponseCache(maxsize=16)
+
+
+@pytest.fixture
+def create_app(monkeypatch, response_cache):
+    """Set up Flask App that uses the ``response_cache`` fixture."""
+    from aiida.restapi.run_api import configure_api
+
+    def _create_app():
+        monkeypatch.setattr(cache, 'get_response_cache', lambda *args: response_cache)
+        api = configure_api(catch_internal_server=True)
+        api.app.config['TESTING'] = True
+        return api.app
+
+    return _create_app
+
+
+def get_response(key):
+    return cache.CachedResponse(token=key, etag=key, validated=time.time(), headers={}, results={'key': key})
+
+
+@pytest.mark.parametrize('cache_class', (cache.MemoryResponseCache, cache.FileResponseCache))
+def test_response_cache(tmp_path, cache_class):
+    """Test that the response caches remove the least recently used responses."""
+    kwargs = {'dirpath': tmp_path} if cache_class is cache.FileResponseCache else {}
+    response_cache = cache_class(maxsize=2, **kwargs)
+
+    for key in ('a', 'b'):
+        response_cache.set(key, get_response(key))
+        time.sleep(0.01)
+
+    assert response_cache.get('a').results == {'key': 'a'}
+    time.sleep(0.01)
+    response_cache.set('c', get_response('c'))
+
+    assert response_cache.get('b') is None
+    assert response_cache.get('a') is not None
+    assert response_cache.get('c') is not None
+
+    response_cache.clear()
+    assert response_cache.get('a') is None
+
+
+def test_get_response_cache(tmp_path):
+    """Test the `get_response_cache` function."""
+    assert cache.get_response_cache(None) is None
+    assert cache.get_response_cache({'CACHE_TYPE': None}) is None
+    assert isinstance(cache.get_response_cache({'CACHE_TYPE': 'memory'}), cache.MemoryResponseCache)
+
+    response_cache = cache.get_response_cache({'CACHE_TYPE': 'file', 'CACHE_DIR': tmp_path}, {'nodes': 5})
+    assert isinstance(response_cache, cache.FileResponseCache)
+    assert response_cache.get_timeout('nodes') == 5
+    assert response_cache.get_timeout('users') == cache.ResponseCache.DEFAULT_TIMEOUT
+
+    with pytest.raises(ValueError):
+        cache.get_response_cache({'CACHE_TYPE': 'memcached'})
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_cached_response(create_app, response_cache, monkeypatch):
+    """Test that a response is served from the cache without querying the database, as long as it is valid."""
+    from aiida.restapi.translator.base import BaseTranslator
+
+    orm.Int(1).store()
+    app = create_app()
+    url = f'{API_CONFIG["PREFIX"]}/nodes?orderby=id&attributes=true'
+
+    with app.test_client() as client:
+        response = client.get(url)
+        assert response.status_code == 200
+        assert len(response.json['data']['nodes']) == 1
+
+        # The order of the parameters of the query string does not matter
+        for method in ('count', 'get_cache_token'):
+            monkeypatch.setattr(BaseTranslator, method, lambda self: pytest.fail('the database was queried'))
+        response_cached = client.get(f'{API_CONFIG["PREFIX"]}/nodes?attributes=true&orderby=id')
+        assert response_cached.json['data'] == response.json['data']
+        assert response_cached.headers['X-Total-Count'] == '1'
+
+        # After the timeout, the response is validated against the database
+        monkeypatch.undo()
+        monkeypatch.setattr(response_cache, 'get_timeout', lambda resource_type: 0)
+        assert client.get(url).json['data'] == response.json['data']
+
+        orm.Int(2).store()
+        assert len(client.get(url).json['data']['nodes']) == 2
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_cache_token(monkeypatch):
+    """Test that the cache token of nodes changes when nodes, links or log records are created or modified."""
+    from aiida.common import timezone
+    from aiida.common.links import LinkType
+    from aiida.restapi.translator.nodes.node import NodeTranslator
+
+    translator = NodeTranslator(LIMIT_DEFAULT=API_CONFIG['LIMIT_DEFAULT'])
+
+    def get_cache_token():
+        with monkeypatch.context() as context:
+            context.setattr(orm.QueryBuilder, 'count', lambda self: pytest.fail('the entities were counted'))
+            return translator.get_cache_token()
+
+    calculation = orm.CalculationNode().store()
+    output = orm.Int(1).store()
+    tokens = [get_cache_token()]
+
+    output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='result')
+    tokens.append(get_cache_token())
+
+    orm.Log(timezone.now(), 'loggername', 'REPORT', calculation.pk, 'message').store()
+    tokens.append(get_cache_token())
+
+    calculation.set_extra('key', 'value')
+    tokens.append(get_cache_token())
+
+    orm.Data().store()
+    tokens.append(get_cache_token())
+
+    assert len(set(tokens)) == len(tokens)
+    assert get_cache_token() == tokens[-1]
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_cached_response_links(create_app, response_cache, monkeypatch):
+    """Test that a new link invalidates a cached response of the links of a node after the timeout."""
+    from aiida.common.links import LinkType
+
+    calculation = orm.CalculationNode().store()
+    output = orm.Int(1).store()
+    pks = (calculation.pk, output.pk)
+    uuids = (calculation.uuid, output.uuid)
+    app = create_app()
+    url = f'{API_CONFIG["PREFIX"]}/nodes/{uuids[0]}/links/outgoing'
+
+    with app.test_client() as client:
+        assert client.get(url).json['data']['outgoing'] == []
+
+        calculation, output = (orm.load_node(pk) for pk in pks)
+        output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='result')
+        assert client.get(url).json['data']['outgoing'] == []
+
+        monkeypatch.setattr(response_cache, 'get_timeout', lambda resource_type: 0)
+        assert [link['uuid'] for link in client.get(url).json['data']['outgoing']] == [uuids[1]]
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_etag(create_app, response_cache, monkeypatch):
+    """Test that a response is `Not Modified` if the client sends the entity tag of the current response."""
+    orm.Int(1).store()
+    app = create_app()
+    url = f'{API_CONFIG["PREFIX"]}/nodes'
+
+    with app.test_client() as client:
+        response = client.get(url)
+        etag = response.headers['ETag']
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+        assert not response.data
+
+        monkeypatch.setattr(response_cache, 'get_timeout', lambda resource_type: 0)
+        assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+        orm.Int(2).store()
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
@@ -475,6 +475,73 @@ class RESTApiTestSuite(RESTApiTestCase):
             self, 'computers', '/computers/page/4?perpage=2&orderby=+id', expected_errormsg=expected_error
         )
 
+    def test_computers_list_after(self):
+        """
+        Get the list of computers from database using keyset pagination.
+        A full page returns the cursor of the next page, which is the id of its
+        last computer, and the next page contains the computers after it.
+        """
+        cursor = self._dummy_data['computers'][1]['id']
+
+        with self.app.test_client() as client:
+            response = client.get(f'{self._url_prefix}/computers?limit=2&orderby=+id')
+            self.assertEqual(response.headers['X-Next-Cursor'], str(cursor))
+            self.assertIn(f'after={cursor}>; rel=next', response.headers['Link'])
+            self.assertIn('X-Next-Cursor', response.headers['Access-Control-Expose-Headers'])
+
+            response = client.get(f'{self._url_prefix}/computers?orderby=+id')
+            self.assertNotIn('X-Next-Cursor', response.headers)
+
+        RESTApiTestCase.process_test(
+            self, 'computers', f'/computers?limit=2&orderby=+id&after={cursor}', expected_range=[2, 4]
+        )
+
+    def test_computers_list_after_offset(self):
+        """
+        If we pass the after key with an offset, it would return the error message.
+        """
+        expected_error = 'after key is incompatible with offset and requesting a specific page'
+        RESTApiTestCase.process_test(
+            self, 'computers', '/computers?offset=2&after=1&orderby=+id', expected_errormsg=expected_error
+        )
+
+    def test_computers_list_after_orderby(self):
+        """
+        If we pass the after key with an order that does not support keyset
+        pagination, it would return the error message.
+        """
+        expected_error = 'the after key requires the results to be ordered by one of: id'
+        RESTApiTestCase.process_test(
+            self, 'computers', '/computers?after=1&orderby=+label', expected_errormsg=expected_error
+        )
+
+    def test_nodes_list_after_ctime(self):
+        """
+        Get all nodes ordered by descending creation time by following the cursors
+        of keyset pagination.
+        """
+        expected_ids = [
+            pk for pk, in orm.QueryBuilder().append(orm.Node, tag='node', project='id').order_by({
+                'node': [{
+                    'ctime': 'desc'
+                }, {
+                    'id': 'desc'
+                }]
+            }).all()
+        ]
+
+        ids = []
+        url = f'{self._url_prefix}/nodes?limit=3&orderby=-ctime'
+
+        with self.app.test_client() as client:
+            while url is not None:
+                response = client.get(url)
+                ids.extend(node['id'] for node in response.json['data']['nodes'])
+                cursor = response.headers.get('X-Next-Cursor')
+                url = None if cursor is None else f'{self._url_prefix}/nodes?limit=3&orderby=-ctime&after={cursor}'
+
+        self.assertEqual(ids, expected_ids)
+
     ############### list filters ########################
     def test_computers_filter_id1(self):
         """
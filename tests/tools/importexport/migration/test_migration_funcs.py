@@ -17,7 +17,7 @@ from aiida import get_version
 from aiida.tools.importexport.archive.common import CacheFolder
 from aiida.tools.importexport.archive.migrations import MIGRATE_FUNCTIONS
 from aiida.tools.importexport.archive.migrations.utils import verify_metadata_version
-from tests.utils.archives import get_archive_file, read_json_files
+from tests.utils.archives import get_archive_file, read_data_files, read_json_files
 
 
 @pytest.mark.parametrize(
@@ -33,7 +33,6 @@ def test_migrations(migration_data, tmp_path):
 
     metadata_new = read_json_files(filepath_archive_new, names=['metadata.json'])[0]
     verify_metadata_version(metadata_new, version=version_new)
-    data_new = read_json_files(filepath_archive_new, names=['data.json'])[0]
 
     filepath_archive_old = get_archive_file(f'export_v{version_old}_simple.aiida', filepath='export/migrate')
 
@@ -45,7 +44,14 @@ def test_migrations(migration_data, tmp_path):
     migration_method(folder)
 
     _, metadata_old = folder.load_json('metadata.json')
-    _, data_old = folder.load_json('data.json')
+
+    # From v0.14 onwards, the database data is stored in JSON lines files in the `data` folder
+    if (out_path / 'data.json').exists():
+        _, data_old = folder.load_json('data.json')
+        data_new = read_json_files(filepath_archive_new, names=['data.json'])[0]
+    else:
+        data_old = read_data_files(folder.get_path())
+        data_new = read_data_files(filepath_archive_new)
 
     verify_metadata_version(metadata_old, version=version_new)
 
@@ -44,18 +44,16 @@ class TestLinks(AiidaArchiveTestCase):
         with tarfile.open(filename, 'r:gz', format=tarfile.PAX_FORMAT) as tar:
             tar.extractall(unpack.abspath)
 
-        with open(unpack.get_abs_path('data.json'), 'r', encoding='utf8') as fhandle:
-            data = json.load(fhandle)
-        data['links_uuid'].append({
+        link = {
             'output': struct.uuid,
             # note: this uuid is supposed to not be in the DB:
             'input': get_new_uuid(),
             'label': 'parent',
             'type': LinkType.CREATE.value
-        })
+        }
 
-        with open(unpack.get_abs_path('data.json'), 'wb') as fhandle:
-            json.dump(data, fhandle)
+        with open(unpack.get_abs_path('data/links.jsonl'), 'ab') as fhandle:
+            fhandle.write(json.dumps(link).encode('utf8') + b'\n')
 
         with tarfile.open(filename, 'w:gz', format=tarfile.PAX_FORMAT) as tar:
             tar.add(unpack.abspath, arcname='')
@@ -620,17 +618,10 @@ class TestLinks(AiidaArchiveTestCase):
         with tarfile.open(filename, 'r:gz', format=tarfile.PAX_FORMAT) as tar:
             tar.extractall(unpack.abspath)
 
-        with open(unpack.get_abs_path('data.json'), 'r', encoding='utf8') as fhandle:
-            data = json.load(fhandle)
-        data['links_uuid'].append({
-            'output': calc.uuid,
-            'input': struct.uuid,
-            'label': 'input',
-            'type': LinkType.INPUT_CALC.value
-        })
-
-        with open(unpack.get_abs_path('data.json'), 'wb') as fhandle:
-            json.dump(data, fhandle)
+        link = {'output': calc.uuid, 'input': struct.uuid, 'label': 'input', 'type': LinkType.INPUT_CALC.value}
+
+        with open(unpack.get_abs_path('data/links.jsonl'), 'ab') as fhandle:
+            fhandle.write(json.dumps(link).encode('utf8') + b'\n')
 
         with tarfile.open(filename, 'w:gz', format=tarfile.PAX_FORMAT) as tar:
             tar.add(unpack.abspath, arcname='')
@@ -9,6 +9,7 @@
 ###########################################################################
 """Tests for archive reader."""
 # pylint: disable=pointless-statement,redefined-outer-name
+from archive_path import TarPath, ZipPath
 import pytest
 
 from aiida.common import InvalidOperation
@@ -80,3 +81,44 @@ def test_empty_archive(archive_reader):
     with pytest.raises(CorruptArchive, match='input file cannot be read'):
         with archive_reader('empty.aiida') as archive:
             assert archive.export_version == EXPORT_VERSION
+
+
+@pytest.mark.parametrize('file_format', ('zip', 'tar.gz', 'folder'))
+def test_reader_formats(archive_reader, tmp_path, file_format):
+    """Verify that the data files are read lazily and identically from all archive formats."""
+    with archive_reader() as archive:
+        expected = {
+            'entities': {name: list(archive.iter_entity_fields(name)) for name in archive.entity_names},
+            'groups': sorted(archive.iter_group_uuids()),
+            'links': list(archive.iter_link_data()),
+        }
+
+    folder = tmp_path / 'archive'
+    ZipPath(get_archive_file(f'export_v{EXPORT_VERSION}_simple.aiida', 'export/migrate')).extract_tree(folder)
+
+    if file_format == 'folder':
+        filepath = folder
+    else:
+        filepath = tmp_path / 'archive.aiida'
+        path_cls = ZipPath if file_format == 'zip' else TarPath
+        with path_cls(filepath, mode='w' if file_format == 'zip' else 'w:gz') as archive_path:
+            archive_path.puttree(folder, check_exists=False)
+
+    with get_reader(file_format)(str(filepath)) as archive:
+        assert {name: list(archive.iter_entity_fields(name)) for name in archive.entity_names} == expected['entities']
+        assert sorted(archive.iter_group_uuids()) == expected['groups']
+        assert list(archive.iter_link_data()) == expected['links']
+        assert archive.entity_count('Node') == len(expected['entities']['Node'])
+        assert archive.link_count == len(expected['links'])
+
+
+def test_missing_links_file(tmp_path):
+    """Verify that an archive without a links file raises a `CorruptArchive` exception."""
+    folder = tmp_path / 'archive'
+    ZipPath(get_archive_file(f'export_v{EXPORT_VERSION}_simple.aiida', 'export/migrate')).extract_tree(folder)
+    (folder / 'data' / 'links.jsonl').unlink()
+
+    with get_reader('folder')(str(folder)) as archive:
+        assert archive.entity_count('Node') == 10
+        with pytest.raises(CorruptArchive, match='links.jsonl'):
+            archive.link_count  # pylint: disable=expression-not-assigned
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.tools.rehash` module."""
+import pytest
+
+from aiida import orm
+from aiida.tools import rehash_nodes
+
+
+@pytest.fixture
+def nodes():
+    """Return a list of stored nodes whose hash extra has been cleared."""
+    nodes = [orm.Int(value).store() for value in range(5)] + [orm.Str('string').store()]
+
+    for node in nodes:
+        node.clear_hash()
+
+    return nodes
+
+
+def get_hashes(nodes):
+    """Return the stored hashes of the given nodes, as they are in the database."""
+    return [orm.load_node(node.pk).get_extra('_aiida_hash', None) for node in nodes]
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.parametrize('num_processes', (1, 2))
+def test_rehash_nodes(nodes, num_processes):
+    """Test that ``rehash_nodes`` stores the hash of all selected nodes."""
+    assert get_hashes(nodes) == [None] * len(nodes)
+    assert rehash_nodes(num_processes=num_processes, batch_size=2) == len(nodes)
+    assert get_hashes(nodes) == [node.get_hash() for node in nodes]
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_rehash_nodes_filters(nodes):
+    """Test that ``rehash_nodes`` only rehashes the nodes selected by class and pk."""
+    assert rehash_nodes(orm.Int, [nodes[0].pk, nodes[1].pk, nodes[-1].pk]) == 2
+    assert get_hashes(nodes) == [nodes[0].get_hash(), nodes[1].get_hash()] + [None] * 4
+
+    assert rehash_nodes(orm.Str) == 1
+    assert get_hashes(nodes)[-1] == nodes[-1].get_hash()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_rehash_nodes_no_matches():
+    """Test that ``rehash_nodes`` returns zero if no nodes match."""
+    assert rehash_nodes(orm.StructureData) == 0
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_rehash_nodes_checkpoint(nodes, tmp_path):
+    """Test that ``rehash_nodes`` resumes from an existing checkpoint and removes it when it finishes."""
+    checkpoint = tmp_path / 'checkpoint'
+    checkpoint.write_text(str(nodes[2].pk))
+
+    assert rehash_nodes(batch_size=2, checkpoint=checkpoint) == len(nodes) - 3
+    assert get_hashes(nodes) == [None] * 3 + [node.get_hash() for node in nodes[3:]]
+    assert not checkpoint.exists()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_rehash_nodes_checkpoint_interrupted(nodes, tmp_path, monkeypatch):
+    """Test that the checkpoint records the last pk of the last batch that was written before an interruption."""
+    from aiida.tools import rehash
+
+    checkpoint = tmp_path / 'checkpoint'
+    compute_hashes = rehash._compute_hashes  # pylint: disable=protected-access
+
+    def _compute_hashes(pks):
+        if nodes[4].pk in pks:
+            raise KeyboardInterrupt
+        return compute_hashes(pks)
+
+    monkeypatch.setattr(rehash, '_compute_hashes', _compute_hashes)
+
+    with pytest.raises(KeyboardInterrupt):
+        rehash_nodes(batch_size=2, checkpoint=checkpoint)
+
+    assert checkpoint.read_text() == str(nodes[3].pk)
+    assert get_hashes(nodes)[4:] == [None, None]
+
+    monkeypatch.undo()
+    assert rehash_nodes(batch_size=2, checkpoint=checkpoint) == 2
+    assert get_hashes(nodes) == [node.get_hash() for node in nodes]
+
+
+@pytest.mark.parametrize('kwargs', ({'num_processes': 0}, {'batch_size': 0}))
+def test_rehash_nodes_invalid(kwargs):
+    """Test that ``rehash_nodes`` validates its arguments."""
+    with pytest.raises(ValueError):
+        rehash_nodes(**kwargs)
@@ -9,11 +9,12 @@
 ###########################################################################
 """Test utility to import, inspect, or migrate AiiDA export archives."""
 import os
+from pathlib import Path
 import tarfile
-from typing import List
+from typing import Dict, List
 import zipfile
 
-from archive_path import read_file_in_tar, read_file_in_zip
+from archive_path import TarPath, ZipPath, read_file_in_tar, read_file_in_zip
 
 from aiida.common import json
 from tests.static import STATIC_DIR
@@ -98,3 +99,26 @@ def read_json_files(path, *, names=('metadata.json', 'data.json')) -> List[dict]
         raise ValueError('invalid file format, expected either a zip archive or gzipped tarball')
 
     return jsons
+
+
+def read_data_files(path) -> Dict[str, list]:
+    """Get the entries of the JSON lines files in the ``data`` folder of an exported AiiDA archive
+
+    :param path: the filepath of the archive, or of a folder containing an extracted archive
+    :return: mapping of the file names to the list of parsed lines
+
+    """
+    if os.path.isdir(path):
+        data_path = Path(path) / 'data'
+    elif zipfile.is_zipfile(path):
+        data_path = ZipPath(path) / 'data'
+    elif tarfile.is_tarfile(path):
+        data_path = TarPath(path) / 'data'
+    else:
+        raise ValueError('invalid file format, expected either a zip archive or gzipped tarball')
+
+    files = {}
+    for child in data_path.iterdir():
+        if child.is_file():
+            files[child.name] = [json.loads(line) for line in child.read_text(encoding='utf8').splitlines() if line]
+    return files